@@ -59,6 +59,8 @@ _UNICANVAS_STATE_DISK_CACHE_MAX_BYTES = 1024 * 1024 * 1024
 _DISK_CACHE_TTL_SECONDS = 180 * 24 * 60 * 60
 _SAM3D_MAX_UPLOAD_BYTES = 32 * 1024 * 1024
 _SAM3D_MAX_PIXELS = 4096 * 4096
+_SAM3D_MAX_VIDEO_UPLOAD_BYTES = 512 * 1024 * 1024
+_SAM3D_MAX_VIDEO_FRAMES = 600
 
 
 def _vnccs_content_length_ok(request, max_bytes):
@@ -550,6 +552,134 @@ def _vnccs_register_sam3d_pose_import():
             traceback.print_exc()
             return web.json_response({"error": str(e)}, status=500)
 
+    @PromptServer.instance.routes.post("/vnccs/sam3d/process_video_to_pose_json")
+    async def vnccs_sam3d_process_video_to_pose_json(request):
+        # Multipart body: ``task_id`` plus either repeated same-sized ``frame``
+        # images or one ``video`` file with optional ``start``/``end``/``fps``.
+        # ``track`` echoes the last streamed track so a clip split across
+        # requests keeps skipping BiRefNet. Responds with one NDJSON line per
+        # frame, then a ``status`` line.
+        import asyncio
+        import io
+        import json
+        import threading
+        from PIL import Image
+
+        task_id = ""
+        video_path = None
+
+        def reject(message, status):
+            if video_path and os.path.exists(video_path):
+                os.unlink(video_path)
+            return web.json_response({"error": message}, status=status)
+
+        try:
+            if not _vnccs_content_length_ok(request, _SAM3D_MAX_VIDEO_UPLOAD_BYTES + 1024 * 1024):
+                return reject("video upload is too large", 413)
+            reader = await request.multipart()
+            fields = {}
+            frame_bytes = []
+            while True:
+                part = await reader.next()
+                if part is None:
+                    break
+                if part.name == "frame":
+                    if len(frame_bytes) >= _SAM3D_MAX_VIDEO_FRAMES:
+                        return reject("too many video frames", 413)
+                    data = await part.read()
+                    if len(data) > _SAM3D_MAX_UPLOAD_BYTES:
+                        return reject("video frame is too large", 413)
+                    frame_bytes.append(bytes(data))
+                elif part.name == "video" and video_path is None:
+                    suffix = os.path.splitext(part.filename or "")[1][:8] or ".mp4"
+                    with tempfile.NamedTemporaryFile(prefix="vnccs_sam3d_video_", suffix=suffix, delete=False) as handle:
+                        video_path = handle.name
+                        while True:
+                            chunk = await part.read_chunk()
+                            if not chunk:
+                                break
+                            handle.write(chunk)
+                elif part.name:
+                    fields[part.name] = await part.text()
+            task_id = str(fields.get("task_id") or "")
+            if not frame_bytes and video_path is None:
+                return reject("missing frames or video", 400)
+            track = json.loads(fields["track"]) if fields.get("track") else None
+            start = float(fields.get("start") or 0.0)
+            end = float(fields["end"]) if fields.get("end") else None
+            fps = float(fields["fps"]) if fields.get("fps") else None
+        except Exception as e:
+            return reject(str(e), 400)
+
+        if frame_bytes:
+            count = len(frame_bytes)
+        elif end is not None and fps:
+            count = min(_SAM3D_MAX_VIDEO_FRAMES, max(1, int(np.ceil((end - start) * fps))))
+        else:
+            count = None
+
+        def decoded_frames():
+            for data in frame_bytes:
+                pil_image = Image.open(io.BytesIO(data))
+                if pil_image.width * pil_image.height > _SAM3D_MAX_PIXELS:
+                    raise ValueError("video frame dimensions are too large")
+                yield np.asarray(pil_image.convert("RGB"))
+
+        loop = asyncio.get_running_loop()
+        lines = asyncio.Queue()
+        disconnected = threading.Event()
+
+        def emit(payload):
+            loop.call_soon_threadsafe(lines.put_nowait, payload)
+
+        def run_video_poses():
+            from .vnccs_sam3d import iter_video_pose_data, progress, read_video_frames
+
+            progress.start_task(task_id)
+            with progress.task_context(task_id):
+                reconstructed = 0
+                try:
+                    progress.update("Step 1/6: Video uploaded. Preparing batched SAM 3D Body import...", 2)
+                    source = (
+                        read_video_frames(video_path, start=start, end=end, fps=fps, max_frames=_SAM3D_MAX_VIDEO_FRAMES)
+                        if video_path else decoded_frames()
+                    )
+                    for index, time, pose_data, next_track in iter_video_pose_data(source, count=count, track=track):
+                        if disconnected.is_set():
+                            return
+                        reconstructed += 1
+                        emit({"index": index, "time": time, "pose_data": pose_data, "track": next_track})
+                    emit({"status": "complete", "frames": reconstructed})
+                except Exception as e:
+                    import traceback
+                    traceback.print_exc()
+                    progress.fail(str(e))
+                    emit({"status": "error", "error": str(e), "frames": reconstructed})
+                finally:
+                    if video_path and os.path.exists(video_path):
+                        os.unlink(video_path)
+                    emit(None)
+
+        worker = asyncio.ensure_future(asyncio.to_thread(run_video_poses))
+        response = web.StreamResponse(headers={
+            "Content-Type": "application/x-ndjson",
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        })
+        try:
+            await response.prepare(request)
+            while True:
+                payload = await lines.get()
+                if payload is None:
+                    break
+                await response.write((json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8"))
+            await response.write_eof()
+        except ConnectionResetError:
+            # The browser cancelled the import; stop before the next frame.
+            disconnected.set()
+        await worker
+        return response
+
     @PromptServer.instance.routes.post("/vnccs/sam3d/render_mesh_overlay")
     async def vnccs_sam3d_render_mesh_overlay(request):
         try:
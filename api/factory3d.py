@@ -3,28 +3,40 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import hashlib
 import io
 import json
 import logging
 import math
+import mimetypes
 import os
+import queue
 import re
 import secrets
 import shutil
+import sqlite3
 import threading
 import time
 import traceback
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, BinaryIO, Callable
 
 from PIL import Image, ImageDraw, ImageOps
 
 from .gaussian_scene import (
+    assemble_scene_ply,
     export_gaussian_scene,
+    export_scene_ply,
     inspect_ply,
     normalize_transform,
     ply_to_splat,
+    rewrite_ply_header,
+    splat_prefix,
+    splat_sort_budget,
     validate_ply_payload,
     validate_splat_payload,
 )
@@ -33,10 +45,21 @@ from .gaussian_scene import (
 LOGGER = logging.getLogger("vnccs.3d_factory")
 API_BASE = "/vnccs/3d-factory"
 SCHEMA_VERSION = 7
+DERIVED_CACHE_SUFFIXES = {
+    "splat": ".splat",
+    "export": ".ply",
+    "prepared": ".png",
+    "conditioning": ".safetensors",
+}
+DERIVED_CACHE_STATUS_ENTRIES = 100
+# Percentages of the importance-ordered SPLAT served as coarse levels of detail.
+SPLAT_LOD_LEVELS = (25, 50, 100)
+ASSET_STREAM_CHUNK_BYTES = 1024 * 1024
 EXPORT_FORMAT_VERSION = 8
 UPSTREAM_REPOSITORY = "VAST-AI/TripoSplat"
 UPSTREAM_COMMIT = "a78fa12d06dbf1381ca548bfac32bb68cb8c451d"
 MAX_UPLOAD_BYTES = 32 * 1024 * 1024
+MAX_GENERATION_UPLOAD_BYTES = 128 * 1024 * 1024
 MAX_PLY_UPLOAD_BYTES = 2 * 1024 * 1024 * 1024
 MAX_PREVIEW_BYTES = 64 * 1024 * 1024
 MAX_SCENE_CAMERAS = 32
@@ -48,14 +71,38 @@ SKYDOME_VIEWPORT_SIZE = (2048, 1024)
 OBJECT_THUMBNAIL_SIZE = (256, 256)
 MAX_SCENE_JSON_BYTES = 2 * 1024 * 1024
 MAX_JOB_LOG_LINES = 800
+# Lines the background job log writer appends per batch.
+JOB_LOG_BATCH_LINES = 512
+JOB_EVENT_HEARTBEAT_SECONDS = 15.0
+TERMINAL_JOB_STATUSES = ("completed", "failed", "cancelled")
 MAX_ACTIVE_JOBS = 2
+MAX_QUEUED_GENERATIONS = 16
+MAX_GENERATION_IMAGES = 16
+DEFAULT_GENERATION_BATCH = 4
+MAX_GENERATION_BATCH = 16
+# Per-tile attention budget for the tiled Gaussian decode; 0 keeps full
+# attention over all decoder tokens.
+MIN_DECODE_MEMORY_MB = 64
+MAX_DECODE_MEMORY_MB = 65536
+DEFAULT_IO_WORKERS = 4
+MAX_IO_WORKERS = 32
+ROUTE_LATENCY_SAMPLES = 256
 DEFAULT_SPLAT_CACHE_LIMIT_GB = 32
 MIN_SPLAT_CACHE_LIMIT_GB = 1
 MAX_SPLAT_CACHE_LIMIT_GB = 1024
 GAUSSIAN_COUNTS = (32768, 65536, 131072, 262144, 524288, 1048576)
 EXPERIMENTAL_GAUSSIAN_COUNTS = (524288, 1048576)
+# Job kinds that run TripoSplat and therefore wait in the inference queue.
+INFERENCE_JOB_KINDS = ("generation", "redensify")
 CONDITIONING_RESOLUTIONS = (1024, 1536, 2048)
 EXPERIMENTAL_CONDITIONING_RESOLUTIONS = (1536, 2048)
+FILE_HASH_INDEX_ENTRIES = 65536
+SCENE_CACHE_ENTRIES = 64
+SCENE_INDEX_VERSION = 1
+SCENE_JOURNAL_VERSION = 1
+SCENE_FLUSH_SECONDS = 2.0
+MAX_SCENE_DELTA_OPS = 4096
+FILE_HASH_MEMORY_ENTRIES = 4096
 _ID_RE = re.compile(r"^[a-f0-9]{32}$")
 _SAFE_NAME_RE = re.compile(r"[\x00-\x1f\x7f]+")
 _ASPECT_PRESETS = {"custom", "1:1", "4:3", "3:4", "3:2", "2:3", "16:9", "9:16", "21:9"}
@@ -98,13 +145,57 @@ _WEIGHT_FILES = (
 )
 
 _STATE_LOCK = threading.RLock()
-_INFERENCE_LOCK = threading.Lock()
+# Generation jobs wait here in submission order; the head owns the pipeline.
+_INFERENCE_QUEUE: deque[str] = deque()
+_INFERENCE_TURN = threading.Condition(threading.Lock())
 _SPLAT_CACHE_LOCK = threading.RLock()
-_PLY_HASH_CACHE: dict[tuple[int, int, int, int], str] = {}
+_DERIVED_CACHE_NAME = re.compile(
+    r"^v1-(?P<sha>[a-f0-9]{64})(?:-(?P<kind>[a-z][a-z0-9]*)-(?P<params>[a-f0-9]{16}))?"
+    r"(?P<suffix>\.[a-z0-9]+)$"
+)
+_SCENE_EXPORT_LOCK = threading.RLock()
+# File digests by (device, inode, size, mtime_ns): a small in-process LRU in
+# front of a persistent SQLite index under ``cache/``, so a restart does not
+# rehash every PLY and library package on first use.
+_FILE_HASH_LOCK = threading.Lock()
+_PLY_HASH_CACHE: OrderedDict[tuple[int, int, int, int], str] = OrderedDict()
+_FILE_HASH_INDEX: dict[str, Any] = {"path": None, "connection": None, "writes": 0}
+# In-memory view of the derived-asset cache directory, rebuilt only when the
+# directory itself changes, plus per-entry counters for this process.
+_DERIVED_CACHE_INDEX: dict[str, Any] = {"root": None, "mtime_ns": None, "entries": {}}
+_DERIVED_CACHE_COUNTERS: dict[str, dict[str, int]] = {}
+# Normalized scenes by scene.json path, valid while the file's (inode, size,
+# mtime_ns) is unchanged, plus the list_scenes summaries mirrored in
+# ``scenes/index.json``. Cached scenes are shared: use load_scene() to edit.
+_SCENE_CACHE_LOCK = threading.Lock()
+_SCENE_CACHE: OrderedDict[str, tuple[tuple[int, int, int], dict[str, Any]]] = OrderedDict()
+_SCENE_INDEX: dict[str, Any] = {"path": None, "entries": {}}
+# Delta edits live here ahead of scene.json, each appended to the scene's
+# ``scene.journal``; a writer thread folds them into scene.json
+# SCENE_FLUSH_SECONDS after the first pending edit. Guarded by
+# ``_SCENE_CACHE_LOCK`` and changed only while holding ``_STATE_LOCK``.
+_SCENE_PENDING: dict[str, dict[str, Any]] = {}
+_SCENE_FLUSHER: dict[str, Any] = {"thread": None, "wake": threading.Event()}
 _PIPELINE: Any = None
 _PIPELINE_SIGNATURE: tuple[Any, ...] | None = None
 _JOBS: dict[str, dict[str, Any]] = {}
+# Progress events live in each job's ``logs`` ring buffer. This lock guards
+# only that buffer, the job's progress fields, and the push subscribers, so
+# emitting never waits on ``_STATE_LOCK``; file appends happen on a
+# background writer thread.
+_JOB_EVENT_LOCK = threading.Lock()
+_JOB_SUBSCRIBERS: dict[str, list[tuple[asyncio.AbstractEventLoop, asyncio.Queue[dict[str, Any]]]]] = {}
+_JOB_LOG_QUEUE: queue.Queue[tuple[Path, str, str]] = queue.Queue()
+_JOB_LOG_WRITER: dict[str, Any] = {"thread": None}
 _BACKGROUND_TASKS: set[asyncio.Task[Any]] = set()
+# Blocking route work runs on one bounded pool so a slow export or SPLAT
+# build cannot starve the ComfyUI event loop or its default executor.
+# ``_INFLIGHT`` is only touched from the event loop thread.
+_IO_EXECUTOR_LOCK = threading.Lock()
+_IO_EXECUTOR: dict[str, Any] = {"executor": None, "workers": 0}
+_INFLIGHT: dict[tuple[Any, ...], asyncio.Future[Any]] = {}
+_ROUTE_METRICS_LOCK = threading.Lock()
+_ROUTE_METRICS: dict[str, dict[str, Any]] = {}
 _REGISTERED = False
 
 
@@ -112,6 +203,10 @@ class JobCancelled(RuntimeError):
     pass
 
 
+class SceneConflict(RuntimeError):
+    """A scene delta ``test`` operation did not match the current scene."""
+
+
 def _now() -> float:
     return time.time()
 
@@ -565,10 +660,13 @@ def _atomic_json(path: Path, value: Any) -> None:
             pass
 
 
-def _migrate_scene_to_ply_only(path: Path, scene: dict[str, Any]) -> None:
-    """Keep PLY as the only permanent source and public export asset."""
+def _migrate_scene_to_ply_only(path: Path, scene: dict[str, Any]) -> bool:
+    """Keep PLY as the only permanent source and public export asset.
+
+    Returns whether ``scene`` was migrated; the caller persists it.
+    """
     if int(scene.get("schema_version", 0) or 0) >= SCHEMA_VERSION:
-        return
+        return False
     scene_root = path.parent.resolve()
     changed = True
     for item in scene.get("objects", []):
@@ -596,7 +694,7 @@ def _migrate_scene_to_ply_only(path: Path, scene: dict[str, Any]) -> None:
                     str(item.get("checksums", {}).get("ply_sha256") or ""),
                 )
                 info = inspect_ply(ply_path)
-                cache_path = _splat_cache_root() / f"v1-{digest}.splat"
+                cache_path = _splat_cache_root() / _derived_cache_name(digest, "splat")
                 with _SPLAT_CACHE_LOCK:
                     if (
                         splat_path.stat().st_size == info.vertex_count * 32
@@ -649,6 +747,7 @@ def _migrate_scene_to_ply_only(path: Path, scene: dict[str, Any]) -> None:
             "render_revision",
             "camera_fingerprint",
             "format_version",
+            "body_fingerprint",
             "ply_sha256",
             "created_at",
             "gaussians",
@@ -670,21 +769,90 @@ def _migrate_scene_to_ply_only(path: Path, scene: dict[str, Any]) -> None:
                     changed = True
 
     scene["schema_version"] = SCHEMA_VERSION
-    if changed:
-        _atomic_json(path, scene)
-        _prune_splat_cache()
+    return changed
 
 
-def load_scene(scene_id: str) -> dict[str, Any]:
+def _stat_key(path: Path) -> tuple[int, int, int]:
+    stat = path.stat()
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _clone_json(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _clone_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone_json(item) for item in value]
+    return value
+
+
+def _scene_view(scene_id: str) -> dict[str, Any]:
+    """Return the cached normalized scene; callers must not mutate it.
+
+    ``scene.json`` is parsed, migrated, and normalized only when its stat
+    changes. A migrated scene is written back once, already normalized.
+    """
     path = _scene_path(scene_id)
+    with _SCENE_CACHE_LOCK:
+        pending = _SCENE_PENDING.get(scene_id)
+    if pending is not None:
+        return pending["scene"]
+    try:
+        key = _stat_key(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Factory scene {_validate_id(scene_id, 'scene id')} was not found") from None
+    with _SCENE_CACHE_LOCK:
+        cached = _SCENE_CACHE.get(str(path))
+        if cached is not None and cached[0] == key:
+            _SCENE_CACHE.move_to_end(str(path))
+            return cached[1]
     if not path.is_file():
         raise FileNotFoundError(f"Factory scene {_validate_id(scene_id, 'scene id')} was not found")
-    if path.stat().st_size > MAX_SCENE_JSON_BYTES:
+    if key[1] > MAX_SCENE_JSON_BYTES:
         raise ValueError("scene metadata is too large")
     value = json.loads(path.read_text(encoding="utf-8"))
     if not isinstance(value, dict) or value.get("scene_id") != scene_id:
         raise ValueError("scene metadata is invalid")
-    _migrate_scene_to_ply_only(path, value)
+    migrated = _migrate_scene_to_ply_only(path, value)
+    _normalize_loaded_scene(value)
+    journal = _scene_journal_path(scene_id)
+    if journal.is_file():
+        with _STATE_LOCK:
+            with _SCENE_CACHE_LOCK:
+                pending = _SCENE_PENDING.get(scene_id)
+            if pending is not None:
+                return pending["scene"]
+            if _replay_scene_journal(journal, value):
+                _atomic_json(path, value)
+                key = _stat_key(path)
+            journal.unlink(missing_ok=True)
+    if migrated:
+        _atomic_json(path, value)
+        with _SPLAT_CACHE_LOCK:
+            _prune_splat_cache()
+        key = _stat_key(path)
+    _cache_scene(path, key, value)
+    return value
+
+
+def _cache_scene(path: Path, key: tuple[int, int, int], value: dict[str, Any]) -> None:
+    with _SCENE_CACHE_LOCK:
+        _SCENE_CACHE[str(path)] = (key, value)
+        _SCENE_CACHE.move_to_end(str(path))
+        while len(_SCENE_CACHE) > SCENE_CACHE_ENTRIES:
+            _SCENE_CACHE.popitem(last=False)
+
+
+def load_scene(scene_id: str) -> dict[str, Any]:
+    """Return a private, editable copy of the normalized scene."""
+    return _clone_json(_scene_view(scene_id))
+
+
+def _forget_scene(scene_id: str) -> None:
+    with _SCENE_CACHE_LOCK:
+        _SCENE_CACHE.pop(str(_scene_path(scene_id)), None)
+
+
+def _normalize_loaded_scene(value: dict[str, Any]) -> None:
     if not isinstance(value.get("objects"), list):
         value["objects"] = []
     value["layers"] = _normalize_scene_layers(value)
@@ -702,22 +870,179 @@ def load_scene(scene_id: str) -> dict[str, Any]:
         int(value.get("render_revision", value.get("revision", 0))),
     )
     value["schema_version"] = SCHEMA_VERSION
-    return value
+
+
+def _bump_scene_revision(scene: dict[str, Any]) -> None:
+    scene["revision"] = max(0, int(scene.get("revision", 0))) + 1
+    scene["render_revision"] = max(
+        0,
+        int(scene.get("render_revision", scene["revision"] - 1)),
+    ) + 1
 
 
 def _save_scene(scene: dict[str, Any], *, bump_revision: bool = True) -> dict[str, Any]:
+    """Write the whole scene; this also supersedes any pending delta edits."""
     scene_id = _validate_id(scene.get("scene_id"), "scene id")
     if bump_revision:
-        scene["revision"] = max(0, int(scene.get("revision", 0))) + 1
-        scene["render_revision"] = max(
-            0,
-            int(scene.get("render_revision", scene["revision"] - 1)),
-        ) + 1
+        _bump_scene_revision(scene)
     scene["updated_at"] = _now()
     _atomic_json(_scene_path(scene_id), scene)
+    _drop_pending_scene(scene_id)
+    _forget_scene(scene_id)
     return scene
 
 
+def _scene_journal_path(scene_id: str) -> Path:
+    return resolve_scene_dir(scene_id) / "scene.journal"
+
+
+def _scene_changes(before: dict[str, Any], after: dict[str, Any]) -> list[list[Any]]:
+    """Field-level differences as ``[path, value]`` sets and ``[path]`` removals.
+
+    Objects are addressed by id; deltas never add or remove objects.
+    """
+    changes: list[list[Any]] = []
+    for key in sorted(set(before) | set(after)):
+        if key == "objects":
+            continue
+        if key not in after:
+            changes.append([[key]])
+        elif key not in before or before[key] != after[key]:
+            changes.append([[key], after[key]])
+    previous = {item["object_id"]: item for item in before.get("objects", [])}
+    for item in after.get("objects", []):
+        old = previous.get(item["object_id"], {})
+        for key in sorted(set(old) | set(item)):
+            path = ["objects", item["object_id"], key]
+            if key not in item:
+                changes.append([path])
+            elif key not in old or old[key] != item[key]:
+                changes.append([path, item[key]])
+    return changes
+
+
+def _apply_scene_changes(scene: dict[str, Any], changes: list[list[Any]]) -> None:
+    for change in changes:
+        path, target = change[0], scene
+        if path[0] == "objects":
+            target = next(
+                (item for item in scene.get("objects", []) if item.get("object_id") == path[1]),
+                None,
+            )
+            if target is None:
+                continue
+            path = path[2:]
+        if len(change) > 1:
+            target[path[0]] = change[1]
+        else:
+            target.pop(path[0], None)
+
+
+def _replay_scene_journal(journal: Path, scene: dict[str, Any]) -> bool:
+    """Apply delta edits that a stopped run journaled but never flushed.
+
+    A journal only applies to the scene.json it was started from; after that
+    file was rewritten, it is stale and ignored.
+    """
+    try:
+        lines = journal.read_text(encoding="utf-8").splitlines()
+        header = json.loads(lines[0]) if lines else {}
+    except (OSError, ValueError):
+        LOGGER.warning("Ignoring unreadable Factory scene journal %s", journal, exc_info=True)
+        return False
+    if (
+        not isinstance(header, dict)
+        or header.get("version") != SCENE_JOURNAL_VERSION
+        or header.get("base_updated_at") != scene.get("updated_at")
+    ):
+        return False
+    replayed = False
+    for line in lines[1:]:
+        try:
+            changes = json.loads(line)["set"]
+        except (ValueError, KeyError, TypeError):
+            # A torn final append; everything before it is intact.
+            break
+        _apply_scene_changes(scene, changes)
+        replayed = True
+    return replayed
+
+
+def _journal_scene_edit(scene_id: str, before: dict[str, Any], after: dict[str, Any]) -> None:
+    """Make ``after`` the pending scene and append its changes to the journal."""
+    with _SCENE_CACHE_LOCK:
+        pending = _SCENE_PENDING.get(scene_id)
+    lines = []
+    if pending is None:
+        lines.append({"version": SCENE_JOURNAL_VERSION, "base_updated_at": before.get("updated_at")})
+    lines.append({"set": _scene_changes(before, after)})
+    journal = _scene_journal_path(scene_id)
+    with journal.open("a" if pending is not None else "w", encoding="utf-8") as handle:
+        handle.write("".join(json.dumps(line, separators=(",", ":")) + "\n" for line in lines))
+    with _SCENE_CACHE_LOCK:
+        _SCENE_PENDING[scene_id] = {
+            "scene": after,
+            "since": pending["since"] if pending is not None else time.monotonic(),
+        }
+        thread = _SCENE_FLUSHER["thread"]
+        if thread is None or not thread.is_alive():
+            thread = threading.Thread(
+                target=_scene_flusher_loop,
+                name="vnccs-3d-factory-scene-flush",
+                daemon=True,
+            )
+            _SCENE_FLUSHER["thread"] = thread
+            thread.start()
+    _SCENE_FLUSHER["wake"].set()
+
+
+def _drop_pending_scene(scene_id: str) -> None:
+    with _SCENE_CACHE_LOCK:
+        pending = _SCENE_PENDING.pop(scene_id, None)
+    if pending is not None:
+        _scene_journal_path(scene_id).unlink(missing_ok=True)
+
+
+def _flush_scene(scene_id: str) -> bool:
+    with _STATE_LOCK:
+        with _SCENE_CACHE_LOCK:
+            pending = _SCENE_PENDING.get(scene_id)
+        if pending is None:
+            return False
+        path = _scene_path(scene_id)
+        _atomic_json(path, pending["scene"])
+        _drop_pending_scene(scene_id)
+        _cache_scene(path, _stat_key(path), pending["scene"])
+    return True
+
+
+def flush_scene_journals(scene_id: str = "") -> int:
+    """Write pending delta edits into scene.json now; returns scenes written."""
+    with _SCENE_CACHE_LOCK:
+        scene_ids = [scene_id] if scene_id else list(_SCENE_PENDING)
+    return sum(_flush_scene(item) for item in scene_ids)
+
+
+def _scene_flusher_loop() -> None:
+    wake = _SCENE_FLUSHER["wake"]
+    while True:
+        with _SCENE_CACHE_LOCK:
+            pending = {scene_id: entry for scene_id, entry in _SCENE_PENDING.items()}
+        now = time.monotonic()
+        for scene_id, entry in pending.items():
+            if now - entry["since"] < SCENE_FLUSH_SECONDS:
+                continue
+            try:
+                _flush_scene(scene_id)
+            except Exception:
+                LOGGER.exception("Could not flush Factory scene %s", scene_id)
+                entry["since"] = time.monotonic()
+        with _SCENE_CACHE_LOCK:
+            due = min((entry["since"] for entry in _SCENE_PENDING.values()), default=None)
+        wake.wait(None if due is None else max(0.0, due + SCENE_FLUSH_SECONDS - time.monotonic()))
+        wake.clear()
+
+
 def create_scene(name: Any = "") -> dict[str, Any]:
     scene_id = _new_id()
     timestamp = _now()
@@ -748,29 +1073,82 @@ def create_scene(name: Any = "") -> dict[str, Any]:
     return scene
 
 
+def _scene_summary(scene: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "scene_id": scene["scene_id"],
+        "name": scene.get("name", "Untitled scene"),
+        "updated_at": float(scene.get("updated_at", 0)),
+        "created_at": float(scene.get("created_at", 0)),
+        "revision": int(scene.get("revision", 0)),
+        "object_count": len(scene.get("objects", [])),
+        "camera_count": len(scene.get("cameras", [])),
+    }
+
+
+def _scene_index_entries(index_path: Path) -> dict[str, Any]:
+    """Summaries from ``scenes/index.json``, read once per Factory root."""
+    if _SCENE_INDEX["path"] == index_path:
+        return _SCENE_INDEX["entries"]
+    entries: dict[str, Any] = {}
+    try:
+        value = json.loads(index_path.read_text(encoding="utf-8"))
+        if isinstance(value, dict) and value.get("version") == SCENE_INDEX_VERSION:
+            entries = {
+                scene_id: entry
+                for scene_id, entry in dict(value.get("scenes") or {}).items()
+                if _ID_RE.fullmatch(str(scene_id))
+                and isinstance(entry, dict)
+                and isinstance(entry.get("summary"), dict)
+            }
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError):
+        LOGGER.warning("Rebuilding unreadable Factory scene index %s", index_path, exc_info=True)
+    _SCENE_INDEX["path"] = index_path
+    _SCENE_INDEX["entries"] = entries
+    return entries
+
+
 def list_scenes(limit: int = 100) -> list[dict[str, Any]]:
+    """Summarize scenes from the index; only changed scene files are parsed."""
     root = _factory_root() / "scenes"
     entries = []
     if not root.is_dir():
         return entries
+    index_path = root / "index.json"
+    with _SCENE_CACHE_LOCK:
+        index = dict(_scene_index_entries(index_path))
+        pending = {scene_id: entry["scene"] for scene_id, entry in _SCENE_PENDING.items()}
+    current: dict[str, Any] = {}
     for path in root.iterdir():
-        if not path.is_dir() or not _ID_RE.fullmatch(path.name):
+        if not _ID_RE.fullmatch(path.name) or not path.is_dir():
+            continue
+        if path.name in pending:
+            # The index describes scene.json; unflushed edits are summarized
+            # from memory and indexed once they are written.
+            if path.name in index:
+                current[path.name] = index[path.name]
+            entries.append(_scene_summary(pending[path.name]))
             continue
         try:
-            scene = load_scene(path.name)
-            entries.append(
-                {
-                    "scene_id": scene["scene_id"],
-                    "name": scene.get("name", "Untitled scene"),
-                    "updated_at": float(scene.get("updated_at", 0)),
-                    "created_at": float(scene.get("created_at", 0)),
-                    "revision": int(scene.get("revision", 0)),
-                    "object_count": len(scene.get("objects", [])),
-                    "camera_count": len(scene.get("cameras", [])),
-                }
-            )
+            key = list(_stat_key(path / "scene.json"))
+            entry = index.get(path.name)
+            if entry is None or entry.get("stat") != key:
+                entry = {"stat": key, "summary": _scene_summary(_scene_view(path.name))}
+                # A migration rewrites scene.json; index the stored file.
+                entry["stat"] = list(_stat_key(path / "scene.json"))
+            current[path.name] = entry
+            entries.append(dict(entry["summary"]))
         except (OSError, ValueError, json.JSONDecodeError):
             LOGGER.warning("Skipping invalid Factory scene at %s", path, exc_info=True)
+    if current != index:
+        with _SCENE_CACHE_LOCK:
+            _SCENE_INDEX["path"] = index_path
+            _SCENE_INDEX["entries"] = current
+        try:
+            _atomic_json(index_path, {"version": SCENE_INDEX_VERSION, "scenes": current})
+        except (OSError, ValueError):
+            LOGGER.warning("Could not persist Factory scene index %s", index_path, exc_info=True)
     entries.sort(key=lambda item: item["updated_at"], reverse=True)
     return entries[: max(1, min(500, int(limit)))]
 
@@ -780,7 +1158,7 @@ def delete_scene(scene_id: str) -> dict[str, Any]:
     with _STATE_LOCK:
         # Load the manifest before removing anything so missing or malformed
         # scenes fail without touching the filesystem.
-        load_scene(safe_id)
+        _scene_view(safe_id)
         active_job = next(
             (
                 job
@@ -795,7 +1173,9 @@ def delete_scene(scene_id: str) -> dict[str, Any]:
                 "Scene cannot be deleted while its generation job is active"
             )
         target = resolve_scene_dir(safe_id)
+        _drop_pending_scene(safe_id)
         shutil.rmtree(target)
+        _forget_scene(safe_id)
     return {"scene_id": safe_id, "deleted": True}
 
 
@@ -832,6 +1212,7 @@ def duplicate_object(scene_id: str, object_id: str) -> dict[str, Any]:
         "reference": "reference.png",
         "prepared": "prepared.png",
         "ply": "model.ply",
+        "latent": "latent.safetensors",
     }
     try:
         with _STATE_LOCK:
@@ -859,13 +1240,17 @@ def duplicate_object(scene_id: str, object_id: str) -> dict[str, Any]:
             duplicate["created_at"] = _now()
             duplicate["transform"] = normalize_transform(source_item.get("transform"))
             duplicate["files"] = duplicate_files
+            # Alternate densities stay with the source; the latent is copied,
+            # so the duplicate can be re-densified on its own.
+            duplicate.pop("densities", None)
+            duplicate.pop("revision", None)
             scene["objects"].append(duplicate)
             _insert_duplicate_layer(
                 scene["layers"],
                 source_item["object_id"],
                 duplicate_id,
             )
-            scene["exports"] = {}
+            _invalidate_scene_export(scene)
             _save_scene(scene)
             return {"scene": scene, "object_id": duplicate_id}
     except Exception:
@@ -924,7 +1309,7 @@ def import_ply_object(
     target = object_root / "model.ply"
     try:
         with _STATE_LOCK:
-            load_scene(safe_scene_id)
+            _scene_view(safe_scene_id)
             object_root.mkdir(parents=True, exist_ok=False)
         total = 0
         with temporary.open("wb") as output:
@@ -992,7 +1377,7 @@ def import_ply_object(
             scene = load_scene(safe_scene_id)
             scene["objects"].append(item)
             scene["layers"].append({"type": "object", "object_id": object_id})
-            scene["exports"] = {}
+            _invalidate_scene_export(scene)
             _save_scene(scene)
         return {"scene": scene, "object_id": object_id}
     except Exception:
@@ -1804,25 +2189,146 @@ def _generation_settings(values: Any) -> dict[str, Any]:
         "prevent_upscale": prevent_upscale,
         "remove_background": remove_background,
         "seed": max(-1, min(2**31 - 1, int(data.get("seed", -1)))),
+        "decode_memory_mb": _decode_memory_mb(data.get("decode_memory_mb", 0)),
     }
 
 
+def _decode_memory_mb(value: Any) -> int:
+    """Return the tiled-decode attention budget in MiB (0: full attention)."""
+    try:
+        megabytes = int(value or 0)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("decode_memory_mb must be a whole number of MiB") from exc
+    if megabytes <= 0:
+        return 0
+    return max(MIN_DECODE_MEMORY_MB, min(MAX_DECODE_MEMORY_MB, megabytes))
+
+
+def _decode_detail(num_gaussians: int, decode_memory_mb: int) -> str:
+    detail = f"target {num_gaussians:,} splats"
+    if decode_memory_mb:
+        detail += f" · tiled attention ≤ {decode_memory_mb:,} MiB per tile"
+    return detail
+
+
 def _job_log_path(job: dict[str, Any]) -> Path:
+    cached = job.get("log_path")
+    if isinstance(cached, Path):
+        return cached
     scene_id = job.get("scene_id")
     if isinstance(scene_id, str) and _ID_RE.fullmatch(scene_id):
         root = resolve_scene_dir(scene_id)
     else:
         root = _factory_root()
-    return root / "logs" / f"{job['job_id']}.log"
+    path = root / "logs" / f"{job['job_id']}.log"
+    job["log_path"] = path
+    return path
 
 
 def _job_public(job: dict[str, Any]) -> dict[str, Any]:
-    with _STATE_LOCK:
-        return {
+    with _STATE_LOCK, _JOB_EVENT_LOCK:
+        public = {
             key: value
             for key, value in job.items()
             if key not in {"cancel_event", "log_path"}
         }
+        public["logs"] = list(public.get("logs", ()))
+        return public
+
+
+def _job_event_payload(job: dict[str, Any], entry: dict[str, Any]) -> dict[str, Any]:
+    """Compact push payload: one log entry plus what a client needs to react."""
+    return {
+        **entry,
+        "job_id": job["job_id"],
+        "kind": job.get("kind", ""),
+        "scene_id": job.get("scene_id", ""),
+        "object_count": len(job.get("objects", ())),
+    }
+
+
+def _subscribe_job_events(
+    job: dict[str, Any],
+    loop: asyncio.AbstractEventLoop,
+    after: int = 0,
+) -> tuple[asyncio.Queue[dict[str, Any]], list[dict[str, Any]]]:
+    """Register a push subscriber and return it with the events after ``after``.
+
+    When the job already finished and nothing newer is buffered, the last
+    event is replayed so a late subscriber still learns the final status.
+    """
+    events: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    with _JOB_EVENT_LOCK:
+        logs = list(job.get("logs", ()))
+        backlog = [entry for entry in logs if int(entry.get("seq", 0)) > after]
+        if not backlog and logs and logs[-1].get("status") in TERMINAL_JOB_STATUSES:
+            backlog = logs[-1:]
+        _JOB_SUBSCRIBERS.setdefault(job["job_id"], []).append((loop, events))
+        return events, [_job_event_payload(job, entry) for entry in backlog]
+
+
+def _unsubscribe_job_events(job_id: str, events: asyncio.Queue[dict[str, Any]]) -> None:
+    with _JOB_EVENT_LOCK:
+        subscribers = [item for item in _JOB_SUBSCRIBERS.get(job_id, ()) if item[1] is not events]
+        if subscribers:
+            _JOB_SUBSCRIBERS[job_id] = subscribers
+        else:
+            _JOB_SUBSCRIBERS.pop(job_id, None)
+
+
+def _queue_job_log(path: Path, text: str, console: str = "") -> None:
+    """Hand a log append to the background writer, starting it on first use."""
+    with _JOB_EVENT_LOCK:
+        thread = _JOB_LOG_WRITER["thread"]
+        if thread is None or not thread.is_alive():
+            thread = threading.Thread(
+                target=_job_log_writer_loop,
+                name="vnccs-3d-factory-job-log",
+                daemon=True,
+            )
+            _JOB_LOG_WRITER["thread"] = thread
+            thread.start()
+    _JOB_LOG_QUEUE.put((path, text, console))
+
+
+def _job_log_writer_loop() -> None:
+    while True:
+        batch = [_JOB_LOG_QUEUE.get()]
+        while len(batch) < JOB_LOG_BATCH_LINES:
+            try:
+                batch.append(_JOB_LOG_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _write_job_log_batch(batch)
+        except Exception:
+            LOGGER.exception("Could not persist Factory job log")
+        finally:
+            for _item in batch:
+                _JOB_LOG_QUEUE.task_done()
+
+
+def _write_job_log_batch(batch: list[tuple[Path, str, str]]) -> None:
+    """Print console lines and append each file's lines with one open."""
+    console = [line for _path, _text, line in batch if line]
+    if console:
+        print("\n".join(console), flush=True)
+    grouped: dict[Path, list[str]] = {}
+    for path, text, _line in batch:
+        grouped.setdefault(path, []).append(text)
+    for path, texts in grouped.items():
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write("".join(texts))
+        except OSError:
+            LOGGER.exception("Could not persist Factory job log")
+
+
+def flush_job_logs() -> None:
+    """Block until every queued job log append has reached its file."""
+    if _JOB_LOG_WRITER["thread"] is not None:
+        _JOB_LOG_QUEUE.join()
 
 
 def _emit(
@@ -1844,16 +2350,28 @@ def _emit(
         "message": str(message),
         "detail": str(detail),
     }
-    with _STATE_LOCK:
+    with _JOB_EVENT_LOCK:
+        job["event_seq"] = int(job.get("event_seq", 0)) + 1
+        entry["seq"] = job["event_seq"]
+        entry["status"] = job.get("status", "")
         job["stage"] = stage
         job["progress"] = percent
         job["message"] = str(message)
         job["detail"] = str(detail)
         job["updated_at"] = timestamp
-        logs = job.setdefault("logs", [])
+        logs = job.get("logs")
+        if not isinstance(logs, deque):
+            logs = job["logs"] = deque(logs or (), maxlen=MAX_JOB_LOG_LINES)
         logs.append(entry)
-        if len(logs) > MAX_JOB_LOG_LINES:
-            del logs[: len(logs) - MAX_JOB_LOG_LINES]
+        subscribers = list(_JOB_SUBSCRIBERS.get(job["job_id"], ()))
+    if subscribers:
+        payload = _job_event_payload(job, entry)
+        for loop, events in subscribers:
+            try:
+                loop.call_soon_threadsafe(events.put_nowait, payload)
+            except RuntimeError:
+                # The subscriber's event loop already closed.
+                _unsubscribe_job_events(job["job_id"], events)
     elapsed = max(0.0, timestamp - float(job.get("created_at", timestamp)))
     line = (
         f"[VNCCS 3D Factory][{job['job_id'][:8]}]"
@@ -1861,23 +2379,30 @@ def _emit(
         + (f" — {detail}" if detail else "")
     )
     getattr(LOGGER, level if hasattr(LOGGER, level) else "info")(line)
-    print(line, flush=True)
     try:
         path = _job_log_path(job)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(
-                f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))} "
-                f"{line}\n"
-            )
-    except OSError:
+    except (OSError, ValueError):
         LOGGER.exception("Could not persist Factory job log")
+        return
+    _queue_job_log(
+        path,
+        f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))} {line}\n",
+        line,
+    )
 
 
 def _new_job(kind: str, scene_id: str = "") -> dict[str, Any]:
     with _STATE_LOCK:
-        active = sum(job.get("status") in {"queued", "running"} for job in _JOBS.values())
-        if active >= MAX_ACTIVE_JOBS:
+        # Generation jobs wait in the inference queue; other jobs run at once.
+        generation = kind in INFERENCE_JOB_KINDS
+        active = sum(
+            job.get("status") in {"queued", "running"}
+            and (job.get("kind") in INFERENCE_JOB_KINDS) == generation
+            for job in _JOBS.values()
+        )
+        if generation and active >= MAX_QUEUED_GENERATIONS:
+            raise RuntimeError("3D Factory generation queue is full; wait for a queued job to finish")
+        if not generation and active >= MAX_ACTIVE_JOBS:
             raise RuntimeError("3D Factory job capacity is full; wait for the active job to finish")
         job_id = _new_id()
         timestamp = _now()
@@ -1892,7 +2417,8 @@ def _new_job(kind: str, scene_id: str = "") -> dict[str, Any]:
             "detail": "",
             "created_at": timestamp,
             "updated_at": timestamp,
-            "logs": [],
+            "logs": deque(maxlen=MAX_JOB_LOG_LINES),
+            "event_seq": 0,
             "result": None,
             "error": "",
             "traceback": "",
@@ -1937,12 +2463,8 @@ def _run_job(job: dict[str, Any], function: Callable[[dict[str, Any]], Any]) ->
             job["traceback"] = rendered
         _emit(job, "failed", job.get("progress", 0), "Failed", detail=str(exc), level="error")
         try:
-            path = _job_log_path(job)
-            with path.open("a", encoding="utf-8") as handle:
-                handle.write("\n===== PYTHON TRACEBACK =====\n")
-                handle.write(rendered)
-                handle.write("\n")
-        except OSError:
+            _queue_job_log(_job_log_path(job), f"\n===== PYTHON TRACEBACK =====\n{rendered}\n")
+        except (OSError, ValueError):
             pass
 
 
@@ -2095,15 +2617,109 @@ def _pipeline_for_job(job: dict[str, Any]) -> Any:
     )
     if _PIPELINE is not None and _PIPELINE_SIGNATURE == signature:
         _emit(job, "model", 12, "Using cached TripoSplat pipeline", detail=device)
-        return _PIPELINE
-
-    _emit(job, "model", 5, "Importing the pinned TripoSplat runtime", detail=device)
-    _PIPELINE = _load_pipeline(paths, device, job)
-    _PIPELINE_SIGNATURE = signature
-    _emit(job, "model", 18, "TripoSplat pipeline loaded", detail=device)
+    else:
+        _emit(job, "model", 5, "Importing the pinned TripoSplat runtime", detail=device)
+        _PIPELINE = _load_pipeline(paths, device, job)
+        _PIPELINE_SIGNATURE = signature
+        _emit(job, "model", 18, "TripoSplat pipeline loaded", detail=device)
+    budget = vram_budget_bytes()
+    _PIPELINE.set_vram_budget(budget)
+    if budget:
+        _emit(
+            job,
+            "model",
+            18,
+            "Keeping TripoSplat weights resident between stages",
+            detail=f"VRAM budget {budget / 1024**3:.1f} GiB · next stage prefetched while the current one runs",
+        )
     return _PIPELINE
 
 
+def vram_budget_bytes(value: Any = None) -> int:
+    """Resolve how many bytes of TripoSplat weights may stay on the GPU.
+
+    An explicit value (GiB) wins, then ``VNCCS_3D_FACTORY_VRAM_BUDGET_GB``.
+    The default 0 moves every component back to system memory after its
+    stage, leaving VRAM to the rest of ComfyUI between generations.
+    """
+    if value is None:
+        value = os.environ.get("VNCCS_3D_FACTORY_VRAM_BUDGET_GB", "").strip() or 0
+    try:
+        gigabytes = float(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("VRAM budget must be a number of GiB") from exc
+    if not math.isfinite(gigabytes):
+        raise ValueError("VRAM budget must be a number of GiB")
+    return int(max(0.0, min(1024.0, gigabytes)) * 1024**3)
+
+
+def generation_batch_size(value: Any = None) -> int:
+    """Resolve how many images share one encoder and sampler batch.
+
+    An explicit value wins, then ``VNCCS_3D_FACTORY_GENERATION_BATCH``.  Each
+    extra image adds one row to the DINOv3/Flux VAE and flow-model batches, so
+    lower it when a multi-image request runs out of VRAM.
+    """
+    if value is None:
+        value = os.environ.get("VNCCS_3D_FACTORY_GENERATION_BATCH", "").strip() or DEFAULT_GENERATION_BATCH
+    try:
+        size = int(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("generation batch size must be an integer") from exc
+    return max(1, min(MAX_GENERATION_BATCH, size))
+
+
+def io_worker_count(value: Any = None) -> int:
+    """Resolve how many threads serve blocking Factory route work.
+
+    An explicit value wins, then ``VNCCS_3D_FACTORY_IO_WORKERS``.  The pool
+    is created on first use, so a change takes effect after a restart.
+    """
+    if value is None:
+        value = os.environ.get("VNCCS_3D_FACTORY_IO_WORKERS", "").strip() or DEFAULT_IO_WORKERS
+    try:
+        workers = int(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Factory I/O worker count must be an integer") from exc
+    return max(1, min(MAX_IO_WORKERS, workers))
+
+
+@contextlib.contextmanager
+def _inference_turn(job: dict[str, Any]) -> Any:
+    """Hold the TripoSplat pipeline for ``job`` once earlier jobs finished.
+
+    Jobs are served strictly in submission order and report their queue
+    position while they wait; cancellation is honored before the turn starts.
+    """
+    job_id = job["job_id"]
+    with _INFERENCE_TURN:
+        _INFERENCE_QUEUE.append(job_id)
+    try:
+        reported = 0
+        while True:
+            with _INFERENCE_TURN:
+                position = _INFERENCE_QUEUE.index(job_id)
+                if position and position == reported:
+                    _INFERENCE_TURN.wait(0.5)
+                    position = _INFERENCE_QUEUE.index(job_id)
+            _check_cancel(job)
+            if position == 0:
+                break
+            if position != reported:
+                reported = position
+                _emit(
+                    job,
+                    "queued",
+                    job.get("progress", 0),
+                    f"Waiting for {position} earlier generation job{'s' if position > 1 else ''}",
+                )
+        yield
+    finally:
+        with _INFERENCE_TURN:
+            _INFERENCE_QUEUE.remove(job_id)
+            _INFERENCE_TURN.notify_all()
+
+
 def _decode_image(
     image_bytes: bytes,
     *,
@@ -2138,22 +2754,148 @@ def _ply_file_identity(path: Path) -> tuple[int, int, int, int]:
     )
 
 
+def _file_hash_index_path() -> Path:
+    return _factory_root() / "cache" / "file-hashes.sqlite3"
+
+
+def _file_hash_index() -> sqlite3.Connection | None:
+    """Return the persistent digest index, or ``None`` when it is unusable.
+
+    Callers hold ``_FILE_HASH_LOCK``.  A read-only or corrupt index only
+    disables persistence; digests are then kept in memory for this process.
+    """
+    path = _file_hash_index_path()
+    index = _FILE_HASH_INDEX
+    if index["path"] == path:
+        return index["connection"]
+    if index["connection"] is not None:
+        index["connection"].close()
+    index.update(path=path, connection=None, writes=0)
+    for attempt in range(2):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS file_sha256 ("
+                    "identity TEXT PRIMARY KEY, sha256 TEXT NOT NULL, used_at REAL NOT NULL)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS file_sha256_used ON file_sha256(used_at)"
+                )
+                connection.commit()
+            except sqlite3.Error:
+                connection.close()
+                raise
+            index["connection"] = connection
+            return connection
+        except sqlite3.DatabaseError:
+            if attempt:
+                break
+            LOGGER.warning("Discarding unreadable file hash index %s", path, exc_info=True)
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    Path(f"{path}{suffix}").unlink(missing_ok=True)
+                except OSError:
+                    break
+        except (OSError, sqlite3.Error):
+            break
+    LOGGER.warning("File hash index %s is unavailable; digests will not persist", path, exc_info=True)
+    return None
+
+
+def _file_hash_identity_key(key: tuple[int, int, int, int]) -> str:
+    # Inode numbers may exceed SQLite's signed 64-bit integers.
+    return ":".join(str(part) for part in key)
+
+
+def _remember_file_sha256(key: tuple[int, int, int, int], digest: str) -> None:
+    """Record a digest in the memory LRU and the persistent index.
+
+    Callers hold ``_FILE_HASH_LOCK``.
+    """
+    _PLY_HASH_CACHE[key] = digest
+    _PLY_HASH_CACHE.move_to_end(key)
+    while len(_PLY_HASH_CACHE) > FILE_HASH_MEMORY_ENTRIES:
+        _PLY_HASH_CACHE.popitem(last=False)
+    connection = _file_hash_index()
+    if connection is None:
+        return
+    try:
+        connection.execute(
+            "INSERT OR REPLACE INTO file_sha256 (identity, sha256, used_at) VALUES (?, ?, ?)",
+            (_file_hash_identity_key(key), digest, _now()),
+        )
+        _FILE_HASH_INDEX["writes"] += 1
+        if _FILE_HASH_INDEX["writes"] % 256 == 1:
+            # Least-recently-used rows beyond the budget are dropped; the
+            # used_at index keeps this a short range delete.
+            connection.execute(
+                "DELETE FROM file_sha256 WHERE used_at < ("
+                "SELECT used_at FROM file_sha256 ORDER BY used_at DESC LIMIT 1 OFFSET ?)",
+                (FILE_HASH_INDEX_ENTRIES - 1,),
+            )
+        connection.commit()
+    except sqlite3.Error:
+        LOGGER.debug("Could not persist file digest", exc_info=True)
+
+
+def _cached_file_sha256(key: tuple[int, int, int, int]) -> str | None:
+    """Look a digest up in memory, then in the persistent index.
+
+    Callers hold ``_FILE_HASH_LOCK``.
+    """
+    digest = _PLY_HASH_CACHE.get(key)
+    if digest is not None:
+        _PLY_HASH_CACHE.move_to_end(key)
+        return digest
+    connection = _file_hash_index()
+    if connection is None:
+        return None
+    identity = _file_hash_identity_key(key)
+    try:
+        row = connection.execute(
+            "SELECT sha256 FROM file_sha256 WHERE identity = ?", (identity,)
+        ).fetchone()
+        if row is None or not re.fullmatch(r"[a-f0-9]{64}", str(row[0])):
+            return None
+        connection.execute(
+            "UPDATE file_sha256 SET used_at = ? WHERE identity = ?", (_now(), identity)
+        )
+        connection.commit()
+    except sqlite3.Error:
+        LOGGER.debug("Could not read file digest index", exc_info=True)
+        return None
+    digest = str(row[0])
+    _PLY_HASH_CACHE[key] = digest
+    while len(_PLY_HASH_CACHE) > FILE_HASH_MEMORY_ENTRIES:
+        _PLY_HASH_CACHE.popitem(last=False)
+    return digest
+
+
 def _remember_ply_sha256(path: Path, digest: str) -> None:
     key = _ply_file_identity(path)
-    with _SPLAT_CACHE_LOCK:
-        if len(_PLY_HASH_CACHE) >= 4096:
-            _PLY_HASH_CACHE.clear()
-        _PLY_HASH_CACHE[key] = digest
+    with _FILE_HASH_LOCK:
+        _remember_file_sha256(key, digest)
 
 
-def _verified_ply_sha256(path: Path, claimed: str = "") -> str:
-    """Hash a PLY once per immutable file identity and reject stale metadata."""
+def _indexed_sha256_file(path: Path) -> str:
+    """Hash a file once per immutable file identity, across restarts."""
     key = _ply_file_identity(path)
-    with _SPLAT_CACHE_LOCK:
-        digest = _PLY_HASH_CACHE.get(key)
+    with _FILE_HASH_LOCK:
+        digest = _cached_file_sha256(key)
     if digest is None:
         digest = _sha256_file(path)
-        _remember_ply_sha256(path, digest)
+        with _FILE_HASH_LOCK:
+            _remember_file_sha256(key, digest)
+    return digest
+
+
+def _verified_ply_sha256(path: Path, claimed: str = "") -> str:
+    """Hash a PLY once per immutable file identity and reject stale metadata."""
+    digest = _indexed_sha256_file(path)
     expected = str(claimed or "").lower()
     if re.fullmatch(r"[a-f0-9]{64}", expected) and expected != digest:
         LOGGER.warning(
@@ -2165,48 +2907,148 @@ def _verified_ply_sha256(path: Path, claimed: str = "") -> str:
     return digest
 
 
-def _prune_splat_cache(*, keep: Path | None = None) -> None:
-    """Evict least-recently-used derived SPLAT files above the cache budget."""
+def _derived_cache_name(source_sha256: str, kind: str, params: dict[str, Any] | None = None) -> str:
+    """Name a derived asset by (source sha256, derivation kind, parameters).
+
+    The parameterless SPLAT keeps its historical ``v1-<sha>.splat`` name so
+    existing caches remain valid.
+    """
+    suffix = DERIVED_CACHE_SUFFIXES.get(kind)
+    if suffix is None or not re.fullmatch(r"[a-f0-9]{64}", source_sha256):
+        raise ValueError(f"invalid derived cache key: {kind!r}")
+    if kind == "splat" and not params:
+        return f"v1-{source_sha256}{suffix}"
+    digest = hashlib.sha256(
+        json.dumps(params or {}, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()[:16]
+    return f"v1-{source_sha256}-{kind}-{digest}{suffix}"
+
+
+def _derived_cache_entries() -> dict[str, dict[str, Any]]:
+    """Return the cache index, rescanning only if the directory changed.
+
+    Callers hold ``_SPLAT_CACHE_LOCK``.  Creating, renaming, or deleting a
+    file updates the directory mtime, so externally added or removed files
+    are still noticed without stat-ing every entry on each request.
+    """
     root = _splat_cache_root()
-    entries: list[tuple[float, int, Path]] = []
-    total = 0
-    for path in root.glob("v1-*.splat"):
+    try:
+        mtime_ns = root.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    index = _DERIVED_CACHE_INDEX
+    if index["root"] == root and index["mtime_ns"] == mtime_ns and mtime_ns is not None:
+        return index["entries"]
+    entries: dict[str, dict[str, Any]] = {}
+    for path in root.iterdir():
+        match = _DERIVED_CACHE_NAME.fullmatch(path.name)
+        if match is None:
+            continue
         try:
             stat = path.stat()
         except OSError:
             continue
-        total += stat.st_size
-        entries.append((stat.st_mtime, stat.st_size, path))
+        if not path.is_file():
+            continue
+        entries[path.name] = {
+            "kind": match.group("kind") or "splat",
+            "bytes": int(stat.st_size),
+            "last_used": float(stat.st_mtime),
+        }
+    index.update(root=root, mtime_ns=mtime_ns, entries=entries)
+    return entries
+
+
+def _derived_cache_sync_mtime() -> None:
+    """Accept the directory's current mtime after this process changed it."""
+    try:
+        _DERIVED_CACHE_INDEX["mtime_ns"] = _splat_cache_root().stat().st_mtime_ns
+    except OSError:
+        _DERIVED_CACHE_INDEX["mtime_ns"] = None
+
+
+def _derived_cache_count(name: str, counter: str, amount: int = 1) -> None:
+    counters = _DERIVED_CACHE_COUNTERS.setdefault(
+        name,
+        {"hits": 0, "misses": 0, "hit_bytes": 0, "built_bytes": 0},
+    )
+    counters[counter] += amount
+
+
+def _prune_splat_cache(*, keep: Path | None = None) -> None:
+    """Evict least-recently-used derived assets above the cache budget.
+
+    Callers hold ``_SPLAT_CACHE_LOCK``.
+    """
+    root = _splat_cache_root()
+    entries = _derived_cache_entries()
+    total = sum(entry["bytes"] for entry in entries.values())
     limit = _splat_cache_limit_bytes()
-    for _mtime, size, path in sorted(entries):
+    if total <= limit:
+        return
+    for name, entry in sorted(entries.items(), key=lambda item: item[1]["last_used"]):
         if total <= limit:
             break
+        path = root / name
         if keep is not None and path == keep:
             continue
         try:
-            path.unlink()
-            total -= size
+            path.unlink(missing_ok=True)
         except OSError:
-            LOGGER.debug("Could not evict cached SPLAT %s", path, exc_info=True)
+            LOGGER.debug("Could not evict cached derived asset %s", path, exc_info=True)
+            continue
+        total -= entry["bytes"]
+        entries.pop(name, None)
+    _derived_cache_sync_mtime()
 
 
 def splat_cache_status() -> dict[str, Any]:
     root = _splat_cache_root()
-    files = 0
-    used_bytes = 0
+    kinds: dict[str, dict[str, int]] = {}
+    totals = {"hits": 0, "misses": 0, "hit_bytes": 0, "built_bytes": 0}
     with _SPLAT_CACHE_LOCK:
-        for path in root.glob("v1-*.splat"):
-            try:
-                used_bytes += path.stat().st_size
-                files += 1
-            except OSError:
-                continue
+        entries = _derived_cache_entries()
+        for entry in entries.values():
+            summary = kinds.setdefault(
+                entry["kind"],
+                {"file_count": 0, "used_bytes": 0, "hits": 0, "misses": 0},
+            )
+            summary["file_count"] += 1
+            summary["used_bytes"] += entry["bytes"]
+        for name, counters in _DERIVED_CACHE_COUNTERS.items():
+            match = _DERIVED_CACHE_NAME.fullmatch(name)
+            kind = (match.group("kind") if match else None) or "splat"
+            summary = kinds.setdefault(
+                kind,
+                {"file_count": 0, "used_bytes": 0, "hits": 0, "misses": 0},
+            )
+            summary["hits"] += counters["hits"]
+            summary["misses"] += counters["misses"]
+            for key in totals:
+                totals[key] += counters[key]
+        recent = sorted(entries.items(), key=lambda item: item[1]["last_used"], reverse=True)
+        entry_status = [
+            {
+                "name": name,
+                "kind": entry["kind"],
+                "bytes": entry["bytes"],
+                "last_used": entry["last_used"],
+                **_DERIVED_CACHE_COUNTERS.get(
+                    name,
+                    {"hits": 0, "misses": 0, "hit_bytes": 0, "built_bytes": 0},
+                ),
+            }
+            for name, entry in recent[:DERIVED_CACHE_STATUS_ENTRIES]
+        ]
+        files = len(entries)
+        used_bytes = sum(entry["bytes"] for entry in entries.values())
     limit_gb = _splat_cache_limit_gb()
     limit_bytes = limit_gb * 1024**3
     try:
         disk_free_bytes = shutil.disk_usage(root).free
     except OSError:
         disk_free_bytes = 0
+    requests = totals["hits"] + totals["misses"]
     return {
         "limit_gb": limit_gb,
         "limit_bytes": limit_bytes,
@@ -2214,6 +3056,10 @@ def splat_cache_status() -> dict[str, Any]:
         "file_count": files,
         "usage_ratio": used_bytes / limit_bytes if limit_bytes else 0.0,
         "disk_free_bytes": disk_free_bytes,
+        **totals,
+        "hit_ratio": totals["hits"] / requests if requests else 0.0,
+        "kinds": kinds,
+        "entries": entry_status,
     }
 
 
@@ -2244,16 +3090,19 @@ def clear_splat_cache() -> dict[str, Any]:
     deleted_files = 0
     deleted_bytes = 0
     failed_files = 0
+    root = _splat_cache_root()
     with _SPLAT_CACHE_LOCK:
-        for path in _splat_cache_root().glob("v1-*.splat"):
+        entries = _derived_cache_entries()
+        for name, entry in list(entries.items()):
             try:
-                size = path.stat().st_size
-                path.unlink()
+                (root / name).unlink(missing_ok=True)
                 deleted_files += 1
-                deleted_bytes += size
+                deleted_bytes += entry["bytes"]
+                entries.pop(name, None)
             except OSError:
                 failed_files += 1
-                LOGGER.warning("Could not clear cached SPLAT %s", path, exc_info=True)
+                LOGGER.warning("Could not clear cached derived asset %s", root / name, exc_info=True)
+        _derived_cache_sync_mtime()
     return {
         **splat_cache_status(),
         "deleted_files": deleted_files,
@@ -2262,371 +3111,756 @@ def clear_splat_cache() -> dict[str, Any]:
     }
 
 
-def _ensure_cached_splat(
-    ply_path: str | os.PathLike[str],
+def _ensure_derived_asset(
+    source_sha256: str,
+    kind: str,
+    params: dict[str, Any] | None,
+    build: Callable[[Path], None],
     *,
-    ply_sha256: str = "",
+    expected_bytes: int | None = None,
 ) -> Path:
-    """Materialize a validated compact SPLAT derived from an immutable PLY."""
-    source = Path(ply_path).resolve()
-    if not source.is_file():
-        raise FileNotFoundError(source)
-    digest = _verified_ply_sha256(source, str(ply_sha256 or ""))
-    info = inspect_ply(source)
-    expected_bytes = info.vertex_count * 32
-    target = _splat_cache_root() / f"v1-{digest}.splat"
+    """Return a cached derivative of immutable content, building it on a miss.
+
+    ``build`` writes the complete asset to the given path (atomically); an
+    existing entry is reused when it is present with ``expected_bytes``.
+    """
+    name = _derived_cache_name(source_sha256, kind, params)
+    target = _splat_cache_root() / name
     with _SPLAT_CACHE_LOCK:
-        try:
-            valid_cached_file = (
-                target.is_file()
-                and target.stat().st_size == expected_bytes
-            )
-        except OSError:
-            valid_cached_file = False
-        if not valid_cached_file:
+        if _derived_cache_hit(name, target, expected_bytes):
+            return target
+        build(target)
+        size = target.stat().st_size
+        if expected_bytes is not None and size != expected_bytes:
             target.unlink(missing_ok=True)
-            started = time.monotonic()
-            LOGGER.info(
-                "Building derived SPLAT cache for %s (%s Gaussians, sha256=%s)",
-                source,
-                f"{info.vertex_count:,}",
-                digest[:16],
-            )
-            ply_to_splat(source, target)
-            validation = validate_splat_payload(
-                target,
-                expected_gaussians=info.vertex_count,
-            )
-            LOGGER.info(
-                "Derived SPLAT cache ready: %s (%s bytes, %s invalid values, %.2fs)",
-                target,
-                f"{target.stat().st_size:,}",
-                f"{validation['invalid_values']:,}",
-                time.monotonic() - started,
-            )
-            _prune_splat_cache(keep=target)
-        else:
-            try:
-                os.utime(target, None)
-            except OSError:
-                pass
+            _derived_cache_sync_mtime()
+            raise ValueError(f"{name}: derived {kind} asset has an unexpected size")
+        _derived_cache_added(name, kind, target)
     return target
 
 
-def _ensure_object_splat(scene_id: str, object_id: str) -> Path:
-    with _STATE_LOCK:
-        scene = load_scene(scene_id)
-        item = _object_by_id(scene, object_id)
-        source = _object_file(scene_id, item, "ply")
-        checksum = str(item.get("checksums", {}).get("ply_sha256") or "")
-    return _ensure_cached_splat(source, ply_sha256=checksum)
+def _derived_cache_hit(name: str, target: Path, expected_bytes: int | None = None) -> bool:
+    """Count and touch a reusable entry; drop an unusable one.
 
+    Callers hold ``_SPLAT_CACHE_LOCK``.
+    """
+    entries = _derived_cache_entries()
+    entry = entries.get(name)
+    try:
+        size = target.stat().st_size if entry is not None else -1
+    except OSError:
+        size = -1
+    if size >= 0 and (expected_bytes is None or size == expected_bytes):
+        now = time.time()
+        try:
+            os.utime(target, (now, now))
+        except OSError:
+            pass
+        entry.update(bytes=size, last_used=now)
+        _derived_cache_count(name, "hits")
+        _derived_cache_count(name, "hit_bytes", size)
+        return True
+    target.unlink(missing_ok=True)
+    entries.pop(name, None)
+    return False
 
-def _generate_object(
+
+def _derived_cache_added(name: str, kind: str, target: Path) -> None:
+    """Index a freshly built entry and enforce the cache budget.
+
+    Callers hold ``_SPLAT_CACHE_LOCK``.
+    """
+    size = target.stat().st_size
+    _derived_cache_sync_mtime()
+    entries = _derived_cache_entries()
+    entries[name] = {"kind": kind, "bytes": size, "last_used": time.time()}
+    _derived_cache_count(name, "misses")
+    _derived_cache_count(name, "built_bytes", size)
+    _prune_splat_cache(keep=target)
+
+
+def _cached_derivative(
+    source_sha256: str,
+    kind: str,
+    params: dict[str, Any] | None,
+    *,
+    expected_bytes: int | None = None,
+) -> Path | None:
+    """Return an existing derived asset, or ``None`` on a miss."""
+    name = _derived_cache_name(source_sha256, kind, params)
+    target = _splat_cache_root() / name
+    with _SPLAT_CACHE_LOCK:
+        return target if _derived_cache_hit(name, target, expected_bytes) else None
+
+
+def _store_derivative(
+    source_sha256: str,
+    kind: str,
+    params: dict[str, Any] | None,
+    write: Callable[[Path], None],
+) -> Path:
+    """Add a derived asset that was computed outside the cache lock.
+
+    Used where results are produced in batches (GPU encoders) and building
+    under ``_SPLAT_CACHE_LOCK`` would stall unrelated cache requests.
+    """
+    name = _derived_cache_name(source_sha256, kind, params)
+    target = _splat_cache_root() / name
+    temporary = target.with_name(f".{name}.{secrets.token_hex(6)}.tmp")
+    try:
+        write(temporary)
+        with _SPLAT_CACHE_LOCK:
+            os.replace(temporary, target)
+            _derived_cache_entries().pop(name, None)
+            _derived_cache_added(name, kind, target)
+    finally:
+        temporary.unlink(missing_ok=True)
+    return target
+
+
+def _splat_lod(value: Any) -> int:
+    if value is None or value == "":
+        return 100
+    try:
+        lod = int(value)
+    except (TypeError, ValueError):
+        lod = -1
+    if lod not in SPLAT_LOD_LEVELS:
+        raise ValueError(
+            "SPLAT level of detail must be one of "
+            + ", ".join(str(level) for level in SPLAT_LOD_LEVELS)
+        )
+    return lod
+
+
+def _splat_lod_count(gaussians: int, lod: int) -> int:
+    return max(1, min(gaussians, math.ceil(gaussians * lod / 100)))
+
+
+def _ensure_cached_splat(
+    ply_path: str | os.PathLike[str],
+    *,
+    ply_sha256: str = "",
+    lod: int = 100,
+) -> Path:
+    """Materialize a validated compact SPLAT derived from an immutable PLY.
+
+    ``lod`` below 100 returns that percentage of the most important
+    Gaussians, cut as a prefix of the full importance-ordered SPLAT.
+    """
+    lod = _splat_lod(lod)
+    source = Path(ply_path).resolve()
+    if not source.is_file():
+        raise FileNotFoundError(source)
+    digest = _verified_ply_sha256(source, str(ply_sha256 or ""))
+    info = inspect_ply(source)
+
+    def build(target: Path) -> None:
+        started = time.monotonic()
+        LOGGER.info(
+            "Building derived SPLAT cache for %s (%s Gaussians, sha256=%s)",
+            source,
+            f"{info.vertex_count:,}",
+            digest[:16],
+        )
+        conversion = ply_to_splat(source, target, memory_budget=splat_sort_budget())
+        validation = validate_splat_payload(
+            target,
+            expected_gaussians=info.vertex_count,
+        )
+        LOGGER.info(
+            "Derived SPLAT cache ready: %s (%s bytes, %s invalid values, %s sort, %.2fs)",
+            target,
+            f"{target.stat().st_size:,}",
+            f"{validation['invalid_values']:,}",
+            conversion.get("sort", "memory"),
+            time.monotonic() - started,
+        )
+
+    count = _splat_lod_count(info.vertex_count, lod)
+    # The level is cut from the full SPLAT, so both steps share one hold of
+    # the (reentrant) cache lock; otherwise another request's prune could
+    # evict the full file between materializing it and reading its prefix.
+    with _SPLAT_CACHE_LOCK:
+        if count < info.vertex_count:
+            # A cached coarse level is served without the full SPLAT, which
+            # may have been pruned since the level was cut.
+            cached = _cached_derivative(digest, "splat", {"lod": lod}, expected_bytes=count * 32)
+            if cached is not None:
+                return cached
+        full = _ensure_derived_asset(
+            digest,
+            "splat",
+            None,
+            build,
+            expected_bytes=info.vertex_count * 32,
+        )
+        if count >= info.vertex_count:
+            return full
+        return _ensure_derived_asset(
+            digest,
+            "splat",
+            {"lod": lod},
+            lambda target: splat_prefix(full, target, count),
+            expected_bytes=count * 32,
+        )
+
+
+def _ensure_object_splat(scene_id: str, object_id: str, lod: int = 100) -> Path:
+    with _STATE_LOCK:
+        scene = _scene_view(scene_id)
+        item = _object_by_id(scene, object_id)
+        source = _object_file(scene_id, item, "ply")
+        checksum = str(item.get("checksums", {}).get("ply_sha256") or "")
+    return _ensure_cached_splat(source, ply_sha256=checksum, lod=lod)
+
+
+def _decode_generated_object(
     job: dict[str, Any],
-    image_bytes: bytes,
-    object_id: str,
-    object_name: str,
+    pipeline: Any,
+    latent: Any,
+    generator: Any,
+    object_root: Path,
     settings: dict[str, Any],
+    progress: Callable[[float], float],
+    label: str,
 ) -> dict[str, Any]:
+    """Decode one latent, write ``model.ply``, and validate the stored file.
+
+    ``progress`` maps the single-object percentages (84–97) into this
+    object's share of the job.  The latent and the generator state the decode
+    starts from are saved first, so the object can be re-densified later
+    without sampling again.
+    """
     import torch
 
-    scene_id = job["scene_id"]
-    scene_root = resolve_scene_dir(scene_id)
-    object_root = scene_root / "objects" / object_id
-    object_root.mkdir(parents=True, exist_ok=False)
-    try:
-        _emit(job, "input", 2, "Validating reference image")
-        image = _decode_image(image_bytes)
+    pipeline.save_latent(latent, generator, object_root / "latent.safetensors")
+    if settings["num_gaussians"] in EXPERIMENTAL_GAUSSIAN_COUNTS:
+        decoder_tokens = settings["num_gaussians"] // pipeline.decoder.gaussians_per_point
+        memory_detail = ""
+        if pipeline._device.type == "cuda" and torch.cuda.is_available():
+            free_bytes, total_bytes = torch.cuda.mem_get_info(pipeline._device)
+            torch.cuda.reset_peak_memory_stats(pipeline._device)
+            memory_detail = (
+                f" · CUDA free {free_bytes / 1024**3:.2f} GiB"
+                f" / {total_bytes / 1024**3:.2f} GiB"
+            )
         _emit(
             job,
-            "input",
-            3,
-            "Reference image accepted",
-            detail=f"{image.width}×{image.height} · {image.mode} · {len(image_bytes):,} bytes",
+            "decode",
+            progress(84),
+            label
+            + (
+                "Extreme-density decode enabled"
+                if settings["num_gaussians"] == 1048576
+                else "Experimental high-density decode enabled"
+            ),
+            detail=(
+                f"{settings['num_gaussians']:,} Gaussians · "
+                f"{decoder_tokens:,} decoder tokens · "
+                + (
+                    f"tiled attention ≤ {settings['decode_memory_mb']:,} MiB per tile"
+                    if settings["decode_memory_mb"]
+                    else "elevated VRAM and runtime"
+                )
+                + memory_detail
+            ),
+            level="warning",
         )
-        image.save(object_root / "reference.png", format="PNG")
+    _emit(
+        job,
+        "decode",
+        progress(85),
+        label + "Decoding Gaussian representation",
+        detail=_decode_detail(settings["num_gaussians"], settings["decode_memory_mb"]),
+    )
+
+    gaussian = pipeline.decode_latent(
+        latent,
+        num_gaussians=settings["num_gaussians"],
+        generator=generator,
+        callback=_decode_callback(job, settings["num_gaussians"], progress, label),
+        attention_max_bytes=settings["decode_memory_mb"] * 1024**2,
+    )
+    gaussian_count = int(gaussian.get_xyz.shape[0])
+    if settings["num_gaussians"] in EXPERIMENTAL_GAUSSIAN_COUNTS:
+        peak_detail = f"{gaussian_count:,} Gaussians decoded"
+        if pipeline._device.type == "cuda" and torch.cuda.is_available():
+            peak_bytes = torch.cuda.max_memory_allocated(pipeline._device)
+            peak_detail += f" · CUDA peak allocated {peak_bytes / 1024**3:.2f} GiB"
+        _emit(job, "decode", progress(91.5), label + "High-density decode completed", detail=peak_detail)
+    _check_cancel(job)
+    stored = _write_gaussian_ply(job, gaussian, object_root / "model.ply", progress, label)
+    del gaussian
+    return stored
+
+
+def _decode_callback(
+    job: dict[str, Any],
+    num_gaussians: int,
+    progress: Callable[[float], float],
+    label: str,
+) -> Callable[[str, int, int], None]:
+    def decode_callback(stage: str, step: int, total: int) -> None:
+        _check_cancel(job)
+        ratio = float(step) / max(1, total)
+        if stage == "octree":
+            value = 85.0 + ratio * 3.5
+            message = f"Sampling octree level {step}/{total}"
+            detail = f"target {num_gaussians:,} splats"
+        else:
+            value = 88.5 + ratio * 2.0
+            message = (
+                "Predicting Gaussian attributes"
+                if step == 0
+                else "Gaussian attributes predicted"
+            )
+            detail = f"{num_gaussians // 32:,} decoder tokens"
+        _emit(job, "decode", progress(value), label + message, detail=detail)
+
+    return decode_callback
+
+
+def _write_gaussian_ply(
+    job: dict[str, Any],
+    gaussian: Any,
+    ply_path: Path,
+    progress: Callable[[float], float],
+    label: str,
+) -> dict[str, Any]:
+    """Serialize decoded Gaussians to ``ply_path`` and validate the stored file.
+
+    Tensor validation runs slice by slice inside ``save_ply``, in the same
+    device-to-host pass that writes the records.
+    """
+    gaussian_count = int(gaussian.get_xyz.shape[0])
+    _emit(job, "serialize", progress(92), label + "Writing Gaussian PLY", detail=f"{gaussian_count:,} splats")
+
+    def ply_callback(completed: int, total: int) -> None:
         _check_cancel(job)
+        _emit(
+            job,
+            "serialize",
+            progress(92.0 + (float(completed) / max(1, total)) * 2.0),
+            label + "Writing Gaussian PLY",
+            detail=f"{completed:,}/{total:,} splats",
+        )
+
+    gaussian_report = gaussian.save_ply(ply_path, callback=ply_callback)
+    _check_cancel(job)
+    _emit(
+        job,
+        "validate",
+        progress(94.5),
+        label + "Validated decoded Gaussian tensors",
+        detail=(
+            f"{gaussian_count:,} splats · finite xyz/color/opacity/scale/rotation · "
+            f"rotation norms > 1e-12"
+        ),
+    )
+    ply_info = inspect_ply(ply_path)
+    if ply_info.vertex_count != gaussian_count:
+        raise RuntimeError(
+            f"serialized PLY contains {ply_info.vertex_count:,} splats; "
+            f"decoder reported {gaussian_count:,}"
+        )
+    ply_validation = validate_ply_payload(ply_path)
+    ply_hash = _sha256_file(ply_path)
+    _remember_ply_sha256(ply_path, ply_hash)
+    _emit(
+        job,
+        "validate",
+        progress(96),
+        label + "Validated Gaussian PLY",
+        detail=(
+            f"{ply_info.vertex_count:,} splats · {ply_path.stat().st_size:,} bytes · "
+            f"{ply_validation['invalid_values']} invalid values · "
+            f"{ply_validation['invalid_scales']} invalid scales · "
+            f"{ply_validation['invalid_quaternions']} invalid quaternions · "
+            f"sha256={ply_hash[:16]}"
+        ),
+    )
+    _emit(
+        job,
+        "cache",
+        progress(97),
+        label + "PLY committed as the source asset",
+        detail="Compact SPLAT will be generated once in the shared cache when requested",
+    )
+    return {
+        "gaussians": gaussian_count,
+        "tensor_ranges": gaussian_report["ranges"],
+        "ply_sha256": ply_hash,
+        "ply_validation": ply_validation,
+    }
+
+
+def _commit_generated_object(
+    job: dict[str, Any],
+    object_id: str,
+    object_name: str,
+    seed: int,
+    effective_resolution: int,
+    settings: dict[str, Any],
+    stored: dict[str, Any],
+    progress: float,
+) -> dict[str, Any]:
+    """Append a finished object to the scene and publish it on the job."""
+    scene_id = job["scene_id"]
+    relative_root = Path("objects") / object_id
+    ply_validation = stored["ply_validation"]
+    item = {
+        "object_id": object_id,
+        "name": object_name,
+        "created_at": _now(),
+        "transform": normalize_transform({}),
+        "gaussians": stored["gaussians"],
+        "seed": seed,
+        "checksums": {
+            "ply_sha256": stored["ply_sha256"],
+        },
+        "validation": {
+            "tensor_ranges": stored["tensor_ranges"],
+            "ply": {
+                "invalid_values": ply_validation["invalid_values"],
+                "invalid_scales": ply_validation["invalid_scales"],
+                "invalid_quaternions": ply_validation["invalid_quaternions"],
+            },
+        },
+        "settings": {
+            "steps": settings["steps"],
+            "guidance_scale": settings["guidance_scale"],
+            "num_gaussians": settings["num_gaussians"],
+            "conditioning_resolution": settings["conditioning_resolution"],
+            "effective_conditioning_resolution": effective_resolution,
+            "prevent_upscale": settings["prevent_upscale"],
+            "remove_background": settings["remove_background"],
+        },
+        "files": {
+            "reference": str(relative_root / "reference.png"),
+            "prepared": str(relative_root / "prepared.png"),
+            "ply": str(relative_root / "model.ply"),
+            "latent": str(relative_root / "latent.safetensors"),
+        },
+    }
+    _emit(job, "scene", progress, "Adding object to scene", detail=object_name)
+    with _STATE_LOCK:
+        scene = load_scene(scene_id)
+        scene["objects"].append(item)
+        scene["layers"].append({"type": "object", "object_id": object_id})
+        _invalidate_scene_export(scene)
+        _save_scene(scene)
+        # Clients polling the job pick up each object as soon as it lands.
+        job.setdefault("objects", []).append(
+            {"object_id": object_id, "name": object_name, "scene_revision": scene["revision"]}
+        )
+    return scene
+
+
+def _image_pixels_sha256(image: Image.Image) -> str:
+    """Key a decoded reference by its pixels, so re-encoded uploads still match."""
+    digest = hashlib.sha256(f"{image.mode}:{image.width}x{image.height}:".encode("ascii"))
+    digest.update(image.tobytes())
+    return digest.hexdigest()
 
-        with _INFERENCE_LOCK:
+
+def _conditioning_cache_params(settings: dict[str, Any]) -> dict[str, Any]:
+    """Everything besides the pixels that changes prepared images or features."""
+    return {
+        "resolution": settings["conditioning_resolution"],
+        "prevent_upscale": settings["prevent_upscale"],
+        "remove_background": settings["remove_background"],
+        "weights": hashlib.sha256(repr(_PIPELINE_SIGNATURE).encode("utf-8")).hexdigest()[:16],
+    }
+
+
+def _store_conditioning(key: str, kind: str, params: dict[str, Any], write: Callable[[Path], None]) -> None:
+    try:
+        _store_derivative(key, kind, params, write)
+    except Exception:
+        # The cache only saves work; a full disk must not fail the generation.
+        LOGGER.warning("Could not cache %s for image %s", kind, key[:12], exc_info=True)
+
+
+def _generate_objects(
+    job: dict[str, Any],
+    sources: list[tuple[bytes, str, str]],
+    settings: dict[str, Any],
+) -> dict[str, Any]:
+    """Generate one object per ``(image bytes, object id, name)`` source.
+
+    Sources are processed in batches of :func:`generation_batch_size`: the
+    background remover stays resident for the whole batch, DINOv3/Flux VAE
+    encode the batch together, and the CFG flow sampler advances every latent
+    in one model call per step.  Each object is then decoded, stored, and
+    added to the scene before the next one, so results stream back while the
+    rest of the batch is still decoding.
+    """
+    import torch
+
+    scene_id = job["scene_id"]
+    scene_root = resolve_scene_dir(scene_id)
+    total = len(sources)
+    if not 1 <= total <= MAX_GENERATION_IMAGES:
+        raise ValueError(f"a generation request takes 1 to {MAX_GENERATION_IMAGES} images")
+    pending: list[Path] = []
+    committed: list[str] = []
+    scene: dict[str, Any] | None = None
+    try:
+        images = []
+        keys: list[str] = []
+        for index, (image_bytes, object_id, _name) in enumerate(sources):
+            label = f"[{index + 1}/{total}] " if total > 1 else ""
+            object_root = scene_root / "objects" / object_id
+            object_root.mkdir(parents=True, exist_ok=False)
+            pending.append(object_root)
+            _emit(job, "input", 2, label + "Validating reference image")
+            image = _decode_image(image_bytes)
+            _emit(
+                job,
+                "input",
+                3,
+                label + "Reference image accepted",
+                detail=f"{image.width}×{image.height} · {image.mode} · {len(image_bytes):,} bytes",
+            )
+            image.save(object_root / "reference.png", format="PNG")
+            images.append(image)
+            keys.append(_image_pixels_sha256(image))
             _check_cancel(job)
+
+        with _inference_turn(job):
             pipeline = _pipeline_for_job(job)
+            cache_params = _conditioning_cache_params(settings)
             seed = settings["seed"]
             if seed < 0:
                 seed = secrets.randbelow(2**31 - 1)
+            seeds = [(seed + index) % (2**31 - 1) for index in range(total)]
+            batch_size = generation_batch_size()
             _emit(
                 job,
                 "input",
                 4,
                 "Generation settings fixed",
                 detail=(
-                    f"seed={seed} · steps={settings['steps']} · "
+                    (f"seed={seed}" if total == 1 else f"seeds={seeds[0]}…{seeds[-1]} · images={total} · batch={batch_size}")
+                    + f" · steps={settings['steps']} · "
                     f"guidance={settings['guidance_scale']:.3f} · "
                     f"gaussians={settings['num_gaussians']:,} · "
                     f"conditioning={settings['conditioning_resolution']}² · "
                     f"prevent_upscale={settings['prevent_upscale']} · "
                     f"remove_background={settings['remove_background']}"
+                    + (f" · decode_memory={settings['decode_memory_mb']}MiB" if settings["decode_memory_mb"] else "")
                 ),
             )
-            generator = torch.Generator(device=pipeline._device).manual_seed(seed)
-
-            _emit(
-                job,
-                "preprocess",
-                22,
-                "Removing background and framing subject"
-                if settings["remove_background"]
-                else "Preserving background and framing source",
-            )
-            if settings["conditioning_resolution"] in EXPERIMENTAL_CONDITIONING_RESOLUTIONS:
-                side = settings["conditioning_resolution"] // 16
-                _emit(
-                    job,
-                    "preprocess",
-                    23,
-                    "Experimental high-resolution conditioning enabled",
-                    detail=(
-                        f"requested {settings['conditioning_resolution']}² · "
-                        f"{side * side:,} image tokens per encoder branch · "
-                        "outside the released 1024² inference regime"
-                    ),
-                    level="warning",
-                )
-            prepared = pipeline.preprocess_image(
-                image,
-                canvas_size=settings["conditioning_resolution"],
-                prevent_upscale=settings["prevent_upscale"],
-                remove_background=settings["remove_background"],
-            )
-            prepared.save(object_root / "prepared.png", format="PNG")
-            _emit(
-                job,
-                "preprocess",
-                28,
-                "Prepared inference image",
-                detail=(
-                    f"requested {settings['conditioning_resolution']}×"
-                    f"{settings['conditioning_resolution']} · effective "
-                    f"{prepared.width}×{prepared.height} · {prepared.mode} · "
-                    f"prevent upscale {settings['prevent_upscale']} · "
-                    f"remove background {settings['remove_background']}"
-                ),
-            )
-            _check_cancel(job)
-
-            _emit(job, "encode", 31, "Encoding image features")
-            conditioning = pipeline.encode_image(prepared, generator=generator)
-            _emit(
-                job,
-                "encode",
-                35,
-                "Image conditioning encoded",
-                detail=(
-                    f"DINO {tuple(conditioning['feature1'].shape)} · "
-                    f"Flux VAE {tuple(conditioning['feature2'].shape)}"
-                ),
-            )
-            _check_cancel(job)
+            generators = [
+                torch.Generator(device=pipeline._device).manual_seed(value) for value in seeds
+            ]
 
-            def callback(step: int, total: int) -> None:
-                _check_cancel(job)
-                progress = 40.0 + (float(step) / max(1, total)) * 42.0
-                _emit(
-                    job,
-                    "sample",
-                    progress,
-                    f"Generating Gaussian latent {step}/{total}",
-                    detail=f"guidance {settings['guidance_scale']:.2f}",
+            for start in range(0, total, batch_size):
+                indices = list(range(start, min(total, start + batch_size)))
+                low = 4.0 + 94.0 * start / total
+                high = 4.0 + 94.0 * indices[-1] / total + 94.0 / total
+                batch_label = (
+                    f"[{indices[0] + 1}–{indices[-1] + 1}/{total}] "
+                    if len(indices) > 1
+                    else (f"[{indices[0] + 1}/{total}] " if total > 1 else "")
                 )
 
-            _emit(job, "sample", 39, "Starting TripoSplat diffusion")
-            latent = pipeline.sample_latent(
-                conditioning,
-                steps=settings["steps"],
-                guidance_scale=settings["guidance_scale"],
-                shift=3.0,
-                generator=generator,
-                show_progress=False,
-                callback=callback,
-            )
-            _check_cancel(job)
-            del conditioning
-            if pipeline._device.type == "cuda" and torch.cuda.is_available():
-                torch.cuda.empty_cache()
+                def span(value: float, low: float = low, high: float = high) -> float:
+                    # Map the single-object percentages (4–98) onto this batch.
+                    return low + (float(value) - 4.0) * (high - low) / 94.0
 
-            if settings["num_gaussians"] in EXPERIMENTAL_GAUSSIAN_COUNTS:
-                decoder_tokens = settings["num_gaussians"] // pipeline.decoder.gaussians_per_point
-                memory_detail = ""
-                if pipeline._device.type == "cuda" and torch.cuda.is_available():
-                    free_bytes, total_bytes = torch.cuda.mem_get_info(pipeline._device)
-                    torch.cuda.reset_peak_memory_stats(pipeline._device)
-                    memory_detail = (
-                        f" · CUDA free {free_bytes / 1024**3:.2f} GiB"
-                        f" / {total_bytes / 1024**3:.2f} GiB"
-                    )
                 _emit(
                     job,
-                    "decode",
-                    84,
-                    (
-                        "Extreme-density decode enabled"
-                        if settings["num_gaussians"] == 1048576
-                        else "Experimental high-density decode enabled"
-                    ),
-                    detail=(
-                        f"{settings['num_gaussians']:,} Gaussians · "
-                        f"{decoder_tokens:,} decoder tokens · elevated VRAM and runtime"
-                        f"{memory_detail}"
+                    "preprocess",
+                    span(22),
+                    batch_label
+                    + (
+                        "Removing background and framing subject"
+                        if settings["remove_background"]
+                        else "Preserving background and framing source"
                     ),
-                    level="warning",
                 )
-            _emit(
-                job,
-                "decode",
-                85,
-                "Decoding Gaussian representation",
-                detail=f"target {settings['num_gaussians']:,} splats",
-            )
-
-            def decode_callback(stage: str, step: int, total: int) -> None:
+                if settings["conditioning_resolution"] in EXPERIMENTAL_CONDITIONING_RESOLUTIONS and start == 0:
+                    side = settings["conditioning_resolution"] // 16
+                    _emit(
+                        job,
+                        "preprocess",
+                        span(23),
+                        "Experimental high-resolution conditioning enabled",
+                        detail=(
+                            f"requested {settings['conditioning_resolution']}² · "
+                            f"{side * side:,} image tokens per encoder branch · "
+                            "outside the released 1024² inference regime"
+                        ),
+                        level="warning",
+                    )
+                # Background removal and framing are deterministic, so a
+                # regeneration of the same reference reuses the prepared image.
+                prepared: list[Any] = [None] * len(indices)
+                for position, index in enumerate(indices):
+                    cached = _cached_derivative(keys[index], "prepared", cache_params)
+                    if cached is None:
+                        continue
+                    try:
+                        with Image.open(cached) as stored:
+                            prepared[position] = stored.convert("RGB")
+                    except (OSError, ValueError):
+                        LOGGER.warning("Ignoring unreadable prepared image %s", cached, exc_info=True)
+                misses = [position for position, image in enumerate(prepared) if image is None]
+                if misses:
+                    fresh = pipeline.preprocess_images(
+                        [images[indices[position]] for position in misses],
+                        canvas_size=settings["conditioning_resolution"],
+                        prevent_upscale=settings["prevent_upscale"],
+                        remove_background=settings["remove_background"],
+                    )
+                    for position, image in zip(misses, fresh):
+                        prepared[position] = image
+                        _store_conditioning(
+                            keys[indices[position]],
+                            "prepared",
+                            cache_params,
+                            lambda target, image=image: image.save(target, format="PNG"),
+                        )
+                if len(misses) < len(indices):
+                    _emit(
+                        job,
+                        "preprocess",
+                        span(24),
+                        batch_label + "Reused cached prepared image"
+                        + ("s" if len(indices) - len(misses) > 1 else ""),
+                        detail=f"{len(indices) - len(misses)} of {len(indices)} from the derived cache",
+                    )
+                for index, image in zip(indices, prepared):
+                    image.save(pending[index] / "prepared.png", format="PNG")
+                    _emit(
+                        job,
+                        "preprocess",
+                        span(28),
+                        (f"[{index + 1}/{total}] " if total > 1 else "") + "Prepared inference image",
+                        detail=(
+                            f"requested {settings['conditioning_resolution']}×"
+                            f"{settings['conditioning_resolution']} · effective "
+                            f"{image.width}×{image.height} · {image.mode} · "
+                            f"prevent upscale {settings['prevent_upscale']} · "
+                            f"remove background {settings['remove_background']}"
+                        ),
+                    )
                 _check_cancel(job)
-                ratio = float(step) / max(1, total)
-                if stage == "octree":
-                    progress = 85.0 + ratio * 3.5
-                    message = f"Sampling octree level {step}/{total}"
-                    detail = f"target {settings['num_gaussians']:,} splats"
-                else:
-                    progress = 88.5 + ratio * 2.0
-                    message = (
-                        "Predicting Gaussian attributes"
-                        if step == 0
-                        else "Gaussian attributes predicted"
+
+                # Conditioning canvases only differ when upscaling is capped at
+                # the source size; each distinct size is encoded and sampled
+                # as its own batch.
+                groups: dict[tuple[int, int], list[int]] = {}
+                for position, image in enumerate(prepared):
+                    groups.setdefault(image.size, []).append(position)
+                latents: dict[int, Any] = {}
+                for positions in groups.values():
+                    rows = [indices[position] for position in positions]
+                    # Only the deterministic DINOv3 features and VAE moments
+                    # are cached; the VAE sample is redrawn from each seed.
+                    features: dict[int, Any] = {}
+                    for row in rows:
+                        cached = _cached_derivative(keys[row], "conditioning", cache_params)
+                        if cached is None:
+                            continue
+                        try:
+                            features[row] = pipeline.load_image_features(cached)
+                        except Exception:
+                            LOGGER.warning("Ignoring unreadable image features %s", cached, exc_info=True)
+                    missing = [(position, row) for position, row in zip(positions, rows) if row not in features]
+                    if missing:
+                        _emit(job, "encode", span(31), batch_label + "Encoding image features")
+                        encoded = pipeline.encode_image_features([prepared[position] for position, _row in missing])
+                        for (_position, row), row_features in zip(missing, encoded):
+                            features[row] = row_features
+                            _store_conditioning(
+                                keys[row],
+                                "conditioning",
+                                cache_params,
+                                lambda target, row_features=row_features: pipeline.save_image_features(
+                                    row_features, target
+                                ),
+                            )
+                    conditioning = pipeline.conditioning_from_features(
+                        [features[row] for row in rows],
+                        generators=[generators[row] for row in rows],
                     )
-                    detail = f"{settings['num_gaussians'] // 32:,} decoder tokens"
-                _emit(job, "decode", progress, message, detail=detail)
+                    _emit(
+                        job,
+                        "encode",
+                        span(35),
+                        batch_label
+                        + ("Image conditioning encoded" if missing else "Reused cached image conditioning"),
+                        detail=(
+                            f"DINO {tuple(conditioning['feature1'].shape)} · "
+                            f"Flux VAE {tuple(conditioning['feature2'].shape)}"
+                        ),
+                    )
+                    _check_cancel(job)
+
+                    def callback(step: int, steps: int) -> None:
+                        _check_cancel(job)
+                        _emit(
+                            job,
+                            "sample",
+                            span(40.0 + (float(step) / max(1, steps)) * 42.0),
+                            batch_label + f"Generating Gaussian latent {step}/{steps}",
+                            detail=f"guidance {settings['guidance_scale']:.2f}"
+                            + (f" · {len(rows)} latents per step" if len(rows) > 1 else ""),
+                        )
 
-            gaussian = pipeline.decode_latent(
-                latent["latent"],
-                num_gaussians=settings["num_gaussians"],
-                generator=generator,
-                callback=decode_callback,
-            )
-            gaussian_count = int(gaussian.get_xyz.shape[0])
-            gaussian_report = getattr(gaussian, "last_validation_report", None)
-            if not isinstance(gaussian_report, dict):
-                gaussian_report = gaussian.validate()
-            _emit(
-                job,
-                "validate",
-                91,
-                "Validated decoded Gaussian tensors",
-                detail=(
-                    f"{gaussian_count:,} splats · finite xyz/color/opacity/scale/rotation · "
-                    f"rotation norms > 1e-12"
-                ),
-            )
-            if settings["num_gaussians"] in EXPERIMENTAL_GAUSSIAN_COUNTS:
-                peak_detail = f"{gaussian_count:,} Gaussians decoded"
+                    _emit(job, "sample", span(39), batch_label + "Starting TripoSplat diffusion")
+                    sampled = pipeline.sample_latents(
+                        conditioning,
+                        [generators[row] for row in rows],
+                        steps=settings["steps"],
+                        guidance_scale=settings["guidance_scale"],
+                        shift=3.0,
+                        show_progress=False,
+                        callback=callback,
+                    )
+                    _check_cancel(job)
+                    for offset, row in enumerate(rows):
+                        latents[row] = sampled["latent"][offset : offset + 1]
+                    del conditioning, sampled, features
                 if pipeline._device.type == "cuda" and torch.cuda.is_available():
-                    peak_bytes = torch.cuda.max_memory_allocated(pipeline._device)
-                    peak_detail += f" · CUDA peak allocated {peak_bytes / 1024**3:.2f} GiB"
-                _emit(job, "decode", 91.5, "High-density decode completed", detail=peak_detail)
-            _check_cancel(job)
+                    torch.cuda.empty_cache()
 
-            ply_path = object_root / "model.ply"
-            _emit(job, "serialize", 92, "Writing Gaussian PLY", detail=f"{gaussian_count:,} splats")
+                for order, index in enumerate(indices):
+                    _image_bytes, object_id, object_name = sources[index]
 
-            def ply_callback(completed: int, total: int) -> None:
-                _check_cancel(job)
-                _emit(
-                    job,
-                    "serialize",
-                    92.0 + (float(completed) / max(1, total)) * 2.0,
-                    "Writing Gaussian PLY",
-                    detail=f"{completed:,}/{total:,} splats",
-                )
+                    def progress(value: float, order: int = order, count: int = len(indices)) -> float:
+                        return span(84.0 + (14.0 * order + (float(value) - 84.0)) / count)
 
-            gaussian.save_ply(
-                ply_path,
-                callback=ply_callback,
-                _validated_report=gaussian_report,
-            )
-            _check_cancel(job)
-            ply_info = inspect_ply(ply_path)
-            if ply_info.vertex_count != gaussian_count:
-                raise RuntimeError(
-                    f"serialized PLY contains {ply_info.vertex_count:,} splats; "
-                    f"decoder reported {gaussian_count:,}"
-                )
-            ply_validation = validate_ply_payload(ply_path)
-            ply_hash = _sha256_file(ply_path)
-            _remember_ply_sha256(ply_path, ply_hash)
-            _emit(
-                job,
-                "validate",
-                96,
-                "Validated Gaussian PLY",
-                detail=(
-                    f"{ply_info.vertex_count:,} splats · {ply_path.stat().st_size:,} bytes · "
-                    f"{ply_validation['invalid_values']} invalid values · "
-                    f"{ply_validation['invalid_scales']} invalid scales · "
-                    f"{ply_validation['invalid_quaternions']} invalid quaternions · "
-                    f"sha256={ply_hash[:16]}"
-                ),
-            )
-            _emit(
-                job,
-                "cache",
-                97,
-                "PLY committed as the source asset",
-                detail="Compact SPLAT will be generated once in the shared cache when requested",
-            )
-            del gaussian, latent
+                    stored = _decode_generated_object(
+                        job,
+                        pipeline,
+                        latents.pop(index),
+                        generators[index],
+                        pending[index],
+                        settings,
+                        progress,
+                        f"[{index + 1}/{total}] " if total > 1 else "",
+                    )
+                    scene = _commit_generated_object(
+                        job,
+                        object_id,
+                        object_name,
+                        seeds[index],
+                        prepared[order].width,
+                        settings,
+                        stored,
+                        progress(98),
+                    )
+                    committed.append(object_id)
+                del prepared, latents
 
-        relative_root = Path("objects") / object_id
-        item = {
-            "object_id": object_id,
-            "name": object_name,
-            "created_at": _now(),
-            "transform": normalize_transform({}),
-            "gaussians": gaussian_count,
-            "seed": seed,
-            "checksums": {
-                "ply_sha256": ply_hash,
-            },
-            "validation": {
-                "tensor_ranges": gaussian_report["ranges"],
-                "ply": {
-                    "invalid_values": ply_validation["invalid_values"],
-                    "invalid_scales": ply_validation["invalid_scales"],
-                    "invalid_quaternions": ply_validation["invalid_quaternions"],
-                },
-            },
-            "settings": {
-                "steps": settings["steps"],
-                "guidance_scale": settings["guidance_scale"],
-                "num_gaussians": settings["num_gaussians"],
-                "conditioning_resolution": settings["conditioning_resolution"],
-                "effective_conditioning_resolution": prepared.width,
-                "prevent_upscale": settings["prevent_upscale"],
-                "remove_background": settings["remove_background"],
-            },
-            "files": {
-                "reference": str(relative_root / "reference.png"),
-                "prepared": str(relative_root / "prepared.png"),
-                "ply": str(relative_root / "model.ply"),
-            },
-        }
-        _emit(job, "scene", 98, "Adding object to scene", detail=object_name)
-        with _STATE_LOCK:
-            scene = load_scene(scene_id)
-            scene["objects"].append(item)
-            scene["layers"].append({"type": "object", "object_id": object_id})
-            scene["exports"] = {}
-            _save_scene(scene)
         return {
             "scene_id": scene_id,
-            "object_id": object_id,
+            "object_id": committed[0],
+            "object_ids": committed,
             "scene_revision": scene["revision"],
             # Embed the committed manifest in the terminal job response. The
             # frontend can hydrate it immediately even if another modal was
@@ -2634,13 +3868,214 @@ def _generate_object(
             "scene": _public_scene(scene),
         }
     except Exception:
-        try:
-            shutil.rmtree(object_root)
-        except OSError:
-            pass
+        for object_root in pending:
+            if object_root.name in committed:
+                continue
+            try:
+                shutil.rmtree(object_root)
+            except OSError:
+                pass
         raise
 
 
+def _redensify_counts(value: Any) -> list[int]:
+    values = value if isinstance(value, (list, tuple)) else [value]
+    counts: list[int] = []
+    for item in values:
+        try:
+            count = int(item)
+        except (TypeError, ValueError):
+            count = 0
+        if count not in GAUSSIAN_COUNTS:
+            raise ValueError(
+                "num_gaussians must be one of " + ", ".join(f"{value:,}" for value in GAUSSIAN_COUNTS)
+            )
+        if count not in counts:
+            counts.append(count)
+    if not counts:
+        raise ValueError("num_gaussians is required")
+    return counts
+
+
+def _redensify_source(scene_id: str, item: dict[str, Any]) -> tuple[Path, Path]:
+    """Return an object's ``(latent checkpoint, model.ply)`` paths."""
+    if "latent" not in item.get("files", {}):
+        raise ValueError(
+            "object has no latent checkpoint; only objects generated by this version "
+            "can be re-densified"
+        )
+    return _object_file(scene_id, item, "latent"), _object_file(scene_id, item, "ply")
+
+
+def _density_file(ply_path: Path, count: int) -> Path:
+    return ply_path.with_name(f"density-{count}.ply")
+
+
+def _staged_link(source: Path, target: Path) -> Path:
+    """Hard-link (or, across filesystems, copy) ``source`` to a temporary
+    sibling of ``target`` that a later ``os.replace`` can swap in."""
+    temporary = target.with_name(f".{target.name}.{secrets.token_hex(6)}.tmp")
+    try:
+        os.link(source, temporary)
+    except OSError:
+        try:
+            shutil.copy2(source, temporary)
+        except BaseException:
+            temporary.unlink(missing_ok=True)
+            raise
+    return temporary
+
+
+def _replace_with_link(source: Path, target: Path) -> None:
+    """Atomically point ``target`` at ``source``'s bytes (hard link or copy)."""
+    temporary = _staged_link(source, target)
+    try:
+        os.replace(temporary, target)
+    finally:
+        temporary.unlink(missing_ok=True)
+
+
+def _redensify_object(
+    job: dict[str, Any],
+    scene_id: str,
+    object_id: str,
+    counts: list[int],
+    decode_memory_mb: int = 0,
+) -> dict[str, Any]:
+    """Decode an object's stored latent at other Gaussian counts.
+
+    Only the decoder runs.  Each decoded density is kept next to
+    ``model.ply`` as ``density-<count>.ply``, so switching back later is a
+    file swap; the first requested count becomes the active model.
+    """
+    with _STATE_LOCK:
+        item = _object_by_id(load_scene(scene_id), object_id)
+        latent_path, ply_path = _redensify_source(scene_id, item)
+        seed = item.get("seed")
+        densities: dict[str, Any] = json.loads(json.dumps(item.get("densities") or {}))
+        current = int(item.get("settings", {}).get("num_gaussians", 0))
+        keep_current = current in GAUSSIAN_COUNTS and str(current) not in densities
+        if keep_current:
+            densities[str(current)] = {
+                "gaussians": item.get("gaussians"),
+                "ply_sha256": item.get("checksums", {}).get("ply_sha256"),
+                "validation": item.get("validation", {}),
+            }
+    if keep_current:
+        # Keep the density the object was generated at selectable.  The copy
+        # fallback can move hundreds of MB, so it runs outside the state lock.
+        _replace_with_link(ply_path, _density_file(ply_path, current))
+    missing = [
+        count
+        for count in counts
+        if str(count) not in densities or not _density_file(ply_path, count).is_file()
+    ]
+    if missing:
+        with _inference_turn(job):
+            pipeline = _pipeline_for_job(job)
+            latent, generator = pipeline.load_latent(
+                latent_path,
+                seed=seed if isinstance(seed, int) and seed >= 0 else None,
+            )
+            _emit(
+                job,
+                "decode",
+                20,
+                "Loaded latent checkpoint",
+                detail=f"{len(missing)} density to decode · diffusion skipped"
+                if len(missing) == 1
+                else f"{len(missing)} densities to decode · diffusion skipped",
+            )
+            # decode_latents keeps the decoder resident for the whole pass and
+            # takes one callback; point it at the current density's progress.
+            current_callback: list[Callable[[str, int, int], None]] = []
+            decoded = pipeline.decode_latents(
+                latent,
+                missing,
+                generator=generator,
+                callback=lambda stage, step, total: current_callback[-1](stage, step, total),
+                attention_max_bytes=decode_memory_mb * 1024**2,
+            )
+            with contextlib.closing(decoded):
+                for index, count in enumerate(missing):
+                    low = 20.0 + 76.0 * index / len(missing)
+                    high = 20.0 + 76.0 * (index + 1) / len(missing)
+
+                    def progress(value: float, low: float = low, high: float = high) -> float:
+                        # Map the single-object decode percentages (84–97).
+                        return low + (float(value) - 84.0) * (high - low) / 13.0
+
+                    label = f"[{count:,}] "
+                    _emit(
+                        job,
+                        "decode",
+                        progress(85),
+                        label + "Decoding Gaussian representation",
+                        detail=_decode_detail(count, decode_memory_mb)
+                        + (" · experimental density" if count in EXPERIMENTAL_GAUSSIAN_COUNTS else ""),
+                        level="warning" if count in EXPERIMENTAL_GAUSSIAN_COUNTS else "info",
+                    )
+                    current_callback.append(_decode_callback(job, count, progress, label))
+                    gaussian = next(decoded)
+                    target = _density_file(ply_path, count)
+                    # Never write through a hard link that may be model.ply.
+                    target.unlink(missing_ok=True)
+                    stored = _write_gaussian_ply(job, gaussian, target, progress, label)
+                    del gaussian
+                    densities[str(count)] = {
+                        "gaussians": stored["gaussians"],
+                        "ply_sha256": stored["ply_sha256"],
+                        "validation": {
+                            "tensor_ranges": stored["tensor_ranges"],
+                            "ply": {
+                                key: stored["ply_validation"][key]
+                                for key in ("invalid_values", "invalid_scales", "invalid_quaternions")
+                            },
+                        },
+                    }
+            del latent, generator
+
+    active = counts[0]
+    entry = densities[str(active)]
+    # Link (or copy) the active density beside model.ply first; only the
+    # rename happens under the state lock.
+    staged = _staged_link(_density_file(ply_path, active), ply_path)
+    try:
+        with _STATE_LOCK:
+            scene = load_scene(scene_id)
+            item = _object_by_id(scene, object_id)
+            os.replace(staged, ply_path)
+            _remember_ply_sha256(ply_path, entry["ply_sha256"])
+            item["densities"] = densities
+            item["gaussians"] = entry["gaussians"]
+            item.setdefault("checksums", {})["ply_sha256"] = entry["ply_sha256"]
+            item["validation"] = entry["validation"]
+            item.setdefault("settings", {})["num_gaussians"] = active
+            item["revision"] = max(0, int(item.get("revision", 0))) + 1
+            _invalidate_scene_export(scene, [object_id])
+            _save_scene(scene)
+            public = _public_scene(scene)
+    finally:
+        staged.unlink(missing_ok=True)
+    _emit(
+        job,
+        "scene",
+        98,
+        "Active density updated",
+        detail=(
+            f"{entry['gaussians']:,} splats · decoded {len(missing)} · "
+            f"reused {len(counts) - len(missing)}"
+        ),
+    )
+    return {
+        "scene_id": scene_id,
+        "object_id": object_id,
+        "num_gaussians": active,
+        "densities": sorted(int(count) for count in densities),
+        "scene": public,
+    }
+
+
 def _public_scene(scene: dict[str, Any]) -> dict[str, Any]:
     value = json.loads(json.dumps(scene))
     value.pop("capture_set", None)
@@ -2680,15 +4115,29 @@ def _public_scene(scene: dict[str, Any]) -> dict[str, Any]:
         preview.pop("file", None)
     for item in value.get("objects", []):
         object_id = item["object_id"]
+        # Model assets are served as immutable and re-densifying swaps
+        # model.ply in place, so their URLs carry the PLY checksum.
+        version = str(item.get("checksums", {}).get("ply_sha256", ""))[:16]
+        query = f"?v={version}" if version else ""
+        splat_url = f"{API_BASE}/scenes/{scene_id}/objects/{object_id}/asset/splat{query}"
         item["urls"] = {
-            "splat": f"{API_BASE}/scenes/{scene_id}/objects/{object_id}/asset/splat",
-            "ply": f"{API_BASE}/scenes/{scene_id}/objects/{object_id}/asset/ply",
+            "splat": splat_url,
+            "splat_lod": {
+                str(lod): f"{splat_url}{'&' if query else '?'}lod={lod}"
+                for lod in SPLAT_LOD_LEVELS
+                if lod < 100
+            },
+            "ply": f"{API_BASE}/scenes/{scene_id}/objects/{object_id}/asset/ply{query}",
             "thumbnail": f"{API_BASE}/scenes/{scene_id}/objects/{object_id}/asset/thumbnail",
             "reference": f"{API_BASE}/scenes/{scene_id}/objects/{object_id}/asset/reference",
             "export_ply": f"{API_BASE}/scenes/{scene_id}/objects/{object_id}/export/ply",
         }
+        item["latent_checkpoint"] = "latent" in item.get("files", {})
+        item["densities"] = sorted(int(count) for count in item.get("densities") or {})
         item.pop("files", None)
     exports = value.get("exports")
+    if isinstance(exports, dict):
+        exports.pop("blocks", None)
     if isinstance(exports, dict) and exports.get("revision") is not None:
         exports["urls"] = {
             "ply": f"{API_BASE}/scenes/{scene_id}/exports/ply",
@@ -2697,112 +4146,246 @@ def _public_scene(scene: dict[str, Any]) -> dict[str, Any]:
     return value
 
 
+def _public_scene_delta(scene: dict[str, Any]) -> dict[str, Any]:
+    """The public scene without object assets, for delta responses."""
+    value = _public_scene({**scene, "objects": []})
+    value["objects"] = [
+        {"object_id": item["object_id"], "revision": int(item.get("revision", 0))}
+        for item in scene.get("objects", [])
+    ]
+    with _SCENE_CACHE_LOCK:
+        value["pending"] = scene["scene_id"] in _SCENE_PENDING
+    return value
+
+
 def update_scene(scene_id: str, payload: Any) -> dict[str, Any]:
     if not isinstance(payload, dict):
         raise ValueError("scene update must be an object")
     with _STATE_LOCK:
         scene = load_scene(scene_id)
-        visible_before = _visible_object_ids(scene)
-        changed = False
-        render_changed = False
-        preview_changed = False
-        if "name" in payload:
-            name = _clean_name(payload["name"], scene["name"])
-            if name != scene["name"]:
-                scene["name"] = name
+        edit = _apply_scene_update(scene, payload)
+        if not edit["changed"]:
+            return scene
+        _scope_scene_edit(scene, edit)
+        return _save_scene(scene, bump_revision=edit["render"])
+
+
+def apply_scene_delta(scene_id: str, operations: Any, *, flush: bool = False) -> dict[str, Any]:
+    """Apply JSON-Patch style edits without rewriting scene.json.
+
+    The edit is journaled and written by the scene flusher, or right away
+    with ``flush``. Returns the shared scene view; do not mutate it.
+    """
+    with _STATE_LOCK:
+        before = _scene_view(scene_id)
+        scene = _clone_json(before)
+        edit = _apply_scene_update(scene, _scene_delta_update(scene, operations))
+        if edit["changed"]:
+            _scope_scene_edit(scene, edit)
+            if edit["render"]:
+                _bump_scene_revision(scene)
+            scene["updated_at"] = _now()
+            _journal_scene_edit(scene["scene_id"], before, scene)
+        if flush:
+            _flush_scene(scene["scene_id"])
+        return _scene_view(scene_id)
+
+
+def _scope_scene_edit(scene: dict[str, Any], edit: dict[str, Any]) -> None:
+    if edit["render"]:
+        _invalidate_scene_export(scene, edit["moved"])
+    elif edit["preview"]:
+        scene["render_revision"] = max(
+            0,
+            int(scene.get("render_revision", scene.get("revision", 0))),
+        ) + 1
+
+
+def _invalidate_scene_export(scene: dict[str, Any], object_ids: Any = ()) -> None:
+    """Drop the combined export but keep the blocks of untouched objects."""
+    exports = scene.get("exports")
+    blocks = dict(exports.get("blocks") or {}) if isinstance(exports, dict) else {}
+    for object_id in object_ids:
+        blocks.pop(object_id, None)
+    scene["exports"] = {"blocks": blocks} if blocks else {}
+
+
+def _json_pointer(value: Any) -> list[str]:
+    if not isinstance(value, str) or not value.startswith("/"):
+        raise ValueError("scene delta path must be a JSON pointer")
+    return [part.replace("~1", "/").replace("~0", "~") for part in value[1:].split("/")]
+
+
+def _scene_delta_update(scene: dict[str, Any], operations: Any) -> dict[str, Any]:
+    """Translate JSON-Patch style operations into an update payload.
+
+    ``replace`` and ``add`` set the scene name, render, camera, cameras,
+    lighting, skydome, and layers (or one of their fields) and an object's
+    name, visibility, transform, or one transform component. ``test`` checks
+    the scene or an object ``revision`` and raises :class:`SceneConflict`.
+    """
+    if not isinstance(operations, list) or len(operations) > MAX_SCENE_DELTA_OPS:
+        raise ValueError(f"scene delta must be a list of at most {MAX_SCENE_DELTA_OPS} operations")
+    payload: dict[str, Any] = {}
+    objects: dict[str, dict[str, Any]] = {}
+    for operation in operations:
+        if not isinstance(operation, dict):
+            raise ValueError("scene delta operation must be an object")
+        op = operation.get("op")
+        path = _json_pointer(operation.get("path"))
+        if op == "test":
+            if path in (["revision"], ["render_revision"]):
+                current = int(scene.get(path[0], 0))
+            elif len(path) == 3 and path[0] == "objects" and path[2] == "revision":
+                current = int(_object_by_id(scene, path[1]).get("revision", 0))
+            else:
+                raise ValueError(f"scene delta cannot test {operation['path']}")
+            if current != operation.get("value"):
+                raise SceneConflict(f"{operation['path']} is {current}, not {operation.get('value')}")
+            continue
+        if op not in {"replace", "add"}:
+            raise ValueError(f"unsupported scene delta operation {op!r}")
+        if "value" not in operation:
+            raise ValueError(f"scene delta operation on {operation['path']} has no value")
+        value = operation["value"]
+        head, rest = path[0], path[1:]
+        if head in {"name", "cameras", "layers"} and not rest:
+            payload[head] = value
+        elif head in {"render", "camera", "lighting", "skydome"} and len(rest) <= 1:
+            if rest:
+                section = payload.setdefault(head, dict(scene.get(head) or {}))
+                if not isinstance(section, dict):
+                    raise ValueError(f"scene {head} must be an object")
+                section[rest[0]] = value
+            else:
+                payload[head] = value
+        elif head == "objects" and len(rest) in {2, 3} and rest[1] in {"name", "visible", "transform"}:
+            item = _object_by_id(scene, rest[0])
+            update = objects.setdefault(item["object_id"], {"object_id": item["object_id"]})
+            if len(rest) == 2:
+                update[rest[1]] = value
+            elif rest[1] == "transform" and rest[2] in {"position", "rotation", "scale"}:
+                transform = update.setdefault("transform", dict(item.get("transform") or {}))
+                if not isinstance(transform, dict):
+                    raise ValueError("object transform must be an object")
+                transform[rest[2]] = value
+            else:
+                raise ValueError(f"scene delta cannot change {operation['path']}")
+        else:
+            raise ValueError(f"scene delta cannot change {operation['path']}")
+    if objects:
+        payload["objects"] = list(objects.values())
+    return payload
+
+
+def _apply_scene_update(scene: dict[str, Any], payload: dict[str, Any]) -> dict[str, Any]:
+    """Apply an update payload to ``scene`` in place and describe the edit.
+
+    Every edited object's ``revision`` counter is bumped; ``moved`` holds the
+    objects whose transform changed.
+    """
+    visible_before = _visible_object_ids(scene)
+    changed = False
+    render_changed = False
+    preview_changed = False
+    moved: set[str] = set()
+    if "name" in payload:
+        name = _clean_name(payload["name"], scene["name"])
+        if name != scene["name"]:
+            scene["name"] = name
+            changed = True
+    updates = payload.get("objects")
+    if updates is not None:
+        if not isinstance(updates, list) or len(updates) > len(scene["objects"]):
+            raise ValueError("invalid scene object update")
+        by_id = {
+            str(item.get("object_id")): item
+            for item in updates
+            if isinstance(item, dict)
+        }
+        for item in scene["objects"]:
+            incoming = by_id.get(item["object_id"])
+            if incoming is None:
+                continue
+            edited = False
+            if "name" in incoming:
+                name = _clean_name(incoming["name"], item["name"], 80)
+                if name != item["name"]:
+                    item["name"] = name
+                    edited = True
+            if "transform" in incoming:
+                transform = normalize_transform(incoming["transform"])
+                if transform != item.get("transform"):
+                    item["transform"] = transform
+                    edited = True
+                    render_changed = True
+                    moved.add(item["object_id"])
+            if "visible" in incoming:
+                visible = incoming["visible"] is not False
+                if visible != (item.get("visible") is not False):
+                    item["visible"] = visible
+                    edited = True
+            if edited:
+                item["revision"] = max(0, int(item.get("revision", 0))) + 1
                 changed = True
-        updates = payload.get("objects")
-        if updates is not None:
-            if not isinstance(updates, list) or len(updates) > len(scene["objects"]):
-                raise ValueError("invalid scene object update")
-            by_id = {
-                str(item.get("object_id")): item
-                for item in updates
-                if isinstance(item, dict)
-            }
-            for item in scene["objects"]:
-                incoming = by_id.get(item["object_id"])
-                if incoming is None:
-                    continue
+    if "layers" in payload:
+        layers = _normalize_scene_layers(scene, payload["layers"], strict=True)
+        if layers != scene.get("layers"):
+            scene["layers"] = layers
+            changed = True
+    if "render" in payload:
+        render = _normalize_render_settings(payload["render"])
+        previous_render = _normalize_render_settings(scene.get("render"))
+        if render != previous_render:
+            scene["render"] = render
+            changed = True
+            preview_changed = (
+                render["width"] != previous_render["width"]
+                or render["height"] != previous_render["height"]
+            )
+    if "camera" in payload:
+        camera = _normalize_camera(payload["camera"])
+        if camera != _normalize_camera(scene.get("camera")):
+            scene["camera"] = camera
+            changed = True
+            preview_changed = True
+    if "cameras" in payload:
+        cameras = _normalize_scene_cameras(payload["cameras"], strict=True)
+        if cameras != _normalize_scene_cameras(scene.get("cameras")):
+            scene["cameras"] = cameras
+            changed = True
+            preview_changed = True
+    if "lighting" in payload:
+        lighting = _normalize_lighting(payload["lighting"])
+        if lighting != _normalize_lighting(scene.get("lighting")):
+            scene["lighting"] = lighting
+            changed = True
+            preview_changed = True
+    if "skydome" in payload and isinstance(scene.get("skydome"), dict):
+        incoming = payload.get("skydome")
+        if isinstance(incoming, dict):
+            current = _normalize_scene_skydome(scene["skydome"])
+            if current is not None:
+                updated = {
+                    **current,
+                    **_normalize_skydome_settings({**current, **incoming}),
+                }
                 if "name" in incoming:
-                    name = _clean_name(incoming["name"], item["name"], 80)
-                    if name != item["name"]:
-                        item["name"] = name
-                        changed = True
-                if "transform" in incoming:
-                    transform = normalize_transform(incoming["transform"])
-                    if transform != item.get("transform"):
-                        item["transform"] = transform
-                        changed = True
-                        render_changed = True
-                if "visible" in incoming:
-                    visible = incoming["visible"] is not False
-                    if visible != (item.get("visible") is not False):
-                        item["visible"] = visible
-                        changed = True
-        if "layers" in payload:
-            layers = _normalize_scene_layers(scene, payload["layers"], strict=True)
-            if layers != scene.get("layers"):
-                scene["layers"] = layers
-                changed = True
-        if "render" in payload:
-            render = _normalize_render_settings(payload["render"])
-            previous_render = _normalize_render_settings(scene.get("render"))
-            if render != previous_render:
-                scene["render"] = render
-                changed = True
-                preview_changed = (
-                    render["width"] != previous_render["width"]
-                    or render["height"] != previous_render["height"]
-                )
-        if "camera" in payload:
-            camera = _normalize_camera(payload["camera"])
-            if camera != _normalize_camera(scene.get("camera")):
-                scene["camera"] = camera
-                changed = True
-                preview_changed = True
-        if "cameras" in payload:
-            cameras = _normalize_scene_cameras(payload["cameras"], strict=True)
-            if cameras != _normalize_scene_cameras(scene.get("cameras")):
-                scene["cameras"] = cameras
-                changed = True
-                preview_changed = True
-        if "lighting" in payload:
-            lighting = _normalize_lighting(payload["lighting"])
-            if lighting != _normalize_lighting(scene.get("lighting")):
-                scene["lighting"] = lighting
-                changed = True
-                preview_changed = True
-        if "skydome" in payload and isinstance(scene.get("skydome"), dict):
-            incoming = payload.get("skydome")
-            if isinstance(incoming, dict):
-                current = _normalize_scene_skydome(scene["skydome"])
-                if current is not None:
-                    updated = {
-                        **current,
-                        **_normalize_skydome_settings({**current, **incoming}),
-                    }
-                    if "name" in incoming:
-                        updated["name"] = _clean_name(
-                            incoming.get("name"),
-                            current["name"],
-                            96,
-                        )
-                    if updated != current:
-                        scene["skydome"] = updated
-                        changed = True
-                        preview_changed = True
-        if not changed:
-            return scene
-        render_changed = render_changed or visible_before != _visible_object_ids(scene)
-        if render_changed:
-            scene["exports"] = {}
-        elif preview_changed:
-            scene["render_revision"] = max(
-                0,
-                int(scene.get("render_revision", scene.get("revision", 0))),
-            ) + 1
-        return _save_scene(scene, bump_revision=render_changed)
+                    updated["name"] = _clean_name(
+                        incoming.get("name"),
+                        current["name"],
+                        96,
+                    )
+                if updated != current:
+                    scene["skydome"] = updated
+                    changed = True
+                    preview_changed = True
+    return {
+        "changed": changed,
+        "render": changed and (render_changed or visible_before != _visible_object_ids(scene)),
+        "preview": preview_changed,
+        "moved": moved,
+    }
 
 
 def _scene_sources(scene: dict[str, Any], only_object_id: str = "") -> list[tuple[Path, Any]]:
@@ -2874,6 +4457,68 @@ def _scene_camera_fingerprint(metadata: dict[str, Any]) -> str:
     return hashlib.sha256(encoded).hexdigest()
 
 
+def _scene_block_root(scene_id: str) -> Path:
+    return resolve_scene_dir(scene_id) / "exports" / "blocks"
+
+
+def _scene_block_path(scene_id: str, key: str) -> Path:
+    return _scene_block_root(scene_id) / f"v{EXPORT_FORMAT_VERSION}-{key}.ply"
+
+
+def _scene_block_key(source: Path, transform: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(
+            {
+                "ply_sha256": _verified_ply_sha256(source),
+                "transform": normalize_transform(transform),
+                "format_version": EXPORT_FORMAT_VERSION,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def _scene_body_fingerprint(block_keys: list[str]) -> str:
+    """Identify a combined export payload independently of its header."""
+    return hashlib.sha256("\n".join(block_keys).encode("ascii")).hexdigest()
+
+
+def _ensure_scene_export_block(
+    scene_id: str,
+    source: Path,
+    transform: Any,
+    key: str,
+) -> tuple[Path, dict[str, Any]]:
+    """Return one object's sanitized, transformed scene-export block.
+
+    Blocks are keyed by the source PLY content, the normalized transform, and
+    the export format (see :func:`_scene_block_key`), so editing one object
+    re-exports only that object.
+    """
+    block = _scene_block_path(scene_id, key)
+    report_path = block.with_suffix(".json")
+    try:
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        if inspect_ply(block).vertex_count == int(report["gaussians"]):
+            return block, report
+    except (OSError, ValueError, TypeError, KeyError, json.JSONDecodeError):
+        pass
+    report = export_scene_ply([(source, normalize_transform(transform))], block)
+    _atomic_json(report_path, report)
+    return block, report
+
+
+def _prune_scene_export_blocks(scene_id: str, keep: set[Path]) -> None:
+    for path in _scene_block_root(scene_id).glob("v*-*.*"):
+        if path.with_suffix(".ply") in keep:
+            continue
+        try:
+            path.unlink()
+        except OSError:
+            LOGGER.debug("Could not remove scene export block %s", path, exc_info=True)
+
+
 def ensure_scene_ply_export(scene_id: str) -> dict[str, Any]:
     for attempt in range(2):
         with _STATE_LOCK:
@@ -2900,19 +4545,80 @@ def ensure_scene_ply_export(scene_id: str) -> dict[str, Any]:
                 except (KeyError, FileNotFoundError):
                     pass
             sources = _scene_sources(scene)
+            visible_ids = _visible_object_ids(scene)
+            source_ids = [item["object_id"] for item in scene["objects"] if item["object_id"] in visible_ids]
+            # Blocks of hidden objects survive until the object is moved,
+            # re-densified, or deleted, so showing it again is free.
+            retained = existing.get("blocks") if isinstance(existing, dict) else None
+            object_ids = {item["object_id"] for item in scene["objects"]}
+            retained = {
+                object_id: key
+                for object_id, key in dict(retained or {}).items()
+                if object_id in object_ids
+            }
+            previous_ply: Path | None = None
+            if (
+                isinstance(existing, dict)
+                and existing.get("format_version") == EXPORT_FORMAT_VERSION
+                and existing.get("body_fingerprint")
+            ):
+                try:
+                    previous_ply = _object_file(scene_id, {"files": existing["files"]}, "ply")
+                except (KeyError, FileNotFoundError):
+                    previous_ply = None
 
         export_root = resolve_scene_dir(scene_id) / "exports"
         export_stem = (
             f"scene-v{EXPORT_FORMAT_VERSION}-r{revision}-rr{render_revision}"
         )
         ply = export_root / f"{export_stem}.ply"
-        result = export_gaussian_scene(
-            sources,
-            ply,
-            metadata=camera_metadata,
-        )
-        ply_sha256 = _sha256_file(ply)
-        _remember_ply_sha256(ply, ply_sha256)
+        block_keys = [_scene_block_key(source, transform) for source, transform in sources]
+        block_map = {**retained, **dict(zip(source_ids, block_keys))}
+        body_fingerprint = _scene_body_fingerprint(block_keys)
+        result: dict[str, Any] | None = None
+        if (
+            previous_ply is not None
+            and previous_ply != ply
+            and existing.get("body_fingerprint") == body_fingerprint
+        ):
+            # Only the embedded camera/render metadata changed: keep the
+            # payload and replace the header.
+            try:
+                rewritten = rewrite_ply_header(previous_ply, ply, metadata=camera_metadata)
+            except (OSError, ValueError):
+                LOGGER.warning(
+                    "Could not reuse scene export %s; rebuilding it",
+                    previous_ply,
+                    exc_info=True,
+                )
+            else:
+                result = {
+                    key: existing[key]
+                    for key in ("source_gaussians", "dropped_gaussians", "repaired_values", "objects")
+                    if key in existing
+                }
+                result.update(gaussians=rewritten["gaussians"], objects=len(sources))
+                LOGGER.info(
+                    "Scene %s export header rewritten (%s payload copy)",
+                    scene_id,
+                    rewritten["copy"],
+                )
+        if result is None:
+            with _SCENE_EXPORT_LOCK:
+                blocks = [
+                    _ensure_scene_export_block(scene_id, source, transform, key)
+                    for (source, transform), key in zip(sources, block_keys)
+                ]
+                result = assemble_scene_ply(blocks, ply, metadata=camera_metadata)
+                _prune_scene_export_blocks(
+                    scene_id,
+                    {_scene_block_path(scene_id, key) for key in block_map.values()},
+                )
+        # The full-body hash is only known when the payload was re-read; a
+        # header-only rewrite leaves it to be computed lazily on demand.
+        ply_sha256 = result.get("sha256", "")
+        if ply_sha256:
+            _remember_ply_sha256(ply, ply_sha256)
         relative_ply = str(ply.relative_to(resolve_scene_dir(scene_id)))
         with _STATE_LOCK:
             current = load_scene(scene_id)
@@ -2938,31 +4644,34 @@ def ensure_scene_ply_export(scene_id: str) -> dict[str, Any]:
                 "render_revision": render_revision,
                 "camera_fingerprint": camera_fingerprint,
                 "format_version": EXPORT_FORMAT_VERSION,
-                "ply_sha256": ply_sha256,
+                "body_fingerprint": body_fingerprint,
+                "blocks": block_map,
                 "created_at": _now(),
-                "gaussians": result["ply"]["gaussians"],
-                "source_gaussians": result["ply"].get(
+                "gaussians": result["gaussians"],
+                "source_gaussians": result.get(
                     "source_gaussians",
-                    result["ply"]["gaussians"],
+                    result["gaussians"],
                 ),
-                "dropped_gaussians": result["ply"].get("dropped_gaussians", 0),
-                "repaired_values": result["ply"].get("repaired_values", 0),
-                "objects": result["ply"]["objects"],
+                "dropped_gaussians": result.get("dropped_gaussians", 0),
+                "repaired_values": result.get("repaired_values", 0),
+                "objects": result["objects"],
                 "files": {
                     "ply": relative_ply,
                 },
             }
             if (
-                result["ply"].get("dropped_gaussians", 0)
-                or result["ply"].get("repaired_values", 0)
+                result.get("dropped_gaussians", 0)
+                or result.get("repaired_values", 0)
             ):
                 LOGGER.warning(
                     "Scene %s export sanitized %s optional value(s) and removed "
                     "%s invalid Gaussian record(s)",
                     scene_id,
-                    f"{result['ply'].get('repaired_values', 0):,}",
-                    f"{result['ply'].get('dropped_gaussians', 0):,}",
+                    f"{result.get('repaired_values', 0):,}",
+                    f"{result.get('dropped_gaussians', 0):,}",
                 )
+            if ply_sha256:
+                current["exports"]["ply_sha256"] = ply_sha256
             _save_scene(current, bump_revision=False)
             return {"scene": current, "ply": ply}
     raise RuntimeError("scene export did not stabilize")
@@ -2972,20 +4681,189 @@ def _ensure_object_ply_export(scene_id: str, object_id: str) -> Path:
     with _STATE_LOCK:
         scene = load_scene(scene_id)
         item = _object_by_id(scene, object_id)
-        revision = int(scene.get("revision", 0))
         source = _object_file(scene_id, item, "ply")
-        transform = item.get("transform")
-    root = resolve_scene_dir(scene_id) / "exports" / "objects"
-    ply = root / f"{object_id}-v{EXPORT_FORMAT_VERSION}-r{revision}.ply"
-    if not ply.is_file():
-        export_gaussian_scene([(source, transform)], ply)
-    return ply
+        transform = normalize_transform(item.get("transform"))
+        checksum = str(item.get("checksums", {}).get("ply_sha256") or "")
+    return _ensure_derived_asset(
+        _verified_ply_sha256(source, checksum),
+        "export",
+        {"transform": transform, "format_version": EXPORT_FORMAT_VERSION},
+        lambda target: export_gaussian_scene([(source, transform)], target),
+    )
+
+
+def _open_derived_asset(path: Path, ensure: Callable[..., Path], *args: Any) -> BinaryIO:
+    """Open a derived asset under the cache lock for streaming a response.
+
+    An open handle keeps the bytes readable after a prune unlinks the file,
+    so eviction cannot cut a download short; an entry evicted before it
+    could be opened is rebuilt once through ``ensure(*args)``.
+    """
+    with _SPLAT_CACHE_LOCK:
+        try:
+            return path.open("rb")
+        except FileNotFoundError:
+            pass
+    path = ensure(*args)
+    with _SPLAT_CACHE_LOCK:
+        return path.open("rb")
 
 
 def _json_error(web: Any, exc: Exception, status: int = 400) -> Any:
     return web.json_response({"error": str(exc), "type": type(exc).__name__}, status=status)
 
 
+def _sse_message(payload: dict[str, Any]) -> bytes:
+    return (
+        f"id: {int(payload.get('seq', 0))}\n"
+        f"event: progress\n"
+        f"data: {json.dumps(payload, separators=(',', ':'))}\n\n"
+    ).encode("utf-8")
+
+
+def _last_event_id(value: str | None) -> int:
+    """Parse an EventSource ``Last-Event-ID``; anything else replays all events."""
+    try:
+        return max(0, int(str(value or "0").strip()))
+    except ValueError:
+        return 0
+
+
+def _object_asset(
+    scene_id: str,
+    object_id: str,
+    kind: str,
+    lod: int = 100,
+    if_none_match: str | None = None,
+) -> tuple[Path | None, str]:
+    """Resolve an object asset and its content-derived ETag.
+
+    The path is ``None`` when ``if_none_match`` already matches the ETag, so
+    a revalidation never builds a SPLAT that the client already has.
+    """
+    if kind not in {"ply", "splat", "prepared", "reference", "thumbnail"}:
+        raise FileNotFoundError("unknown object asset")
+    with _STATE_LOCK:
+        scene = _scene_view(scene_id)
+        item = _object_by_id(scene, object_id)
+    if kind == "splat":
+        source = _object_file(scene["scene_id"], item, "ply")
+        digest = _verified_ply_sha256(source, str(item.get("checksums", {}).get("ply_sha256") or ""))
+        etag = f'"v1-{digest}-splat-{lod}"'
+        if _etag_matches(if_none_match, etag):
+            return None, etag
+        return _ensure_cached_splat(source, ply_sha256=digest, lod=lod), etag
+    if kind == "ply":
+        path = _object_file(scene["scene_id"], item, kind)
+        claimed = str(item.get("checksums", {}).get("ply_sha256") or "")
+        etag = f'"{_verified_ply_sha256(path, claimed)}"'
+    else:
+        if kind == "thumbnail":
+            path = _ensure_object_thumbnail(scene["scene_id"], item)
+        else:
+            path = _object_file(scene["scene_id"], item, kind)
+        etag = f'"{_indexed_sha256_file(path)}"'
+    return (None if _etag_matches(if_none_match, etag) else path), etag
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    candidates = {item.strip() for item in header.split(",")}
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def _parse_byte_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Return the inclusive span of a single ``bytes=`` range request.
+
+    ``None`` means the header is absent, malformed, or asks for several
+    ranges, in which case the whole file is sent.  An unsatisfiable range
+    raises ``ValueError``.
+    """
+    if not header:
+        return None
+    unit, _separator, spec = header.partition("=")
+    first, dash, last = spec.strip().partition("-")
+    if unit.strip().lower() != "bytes" or "," in spec or not dash:
+        return None
+    first, last = first.strip(), last.strip()
+    if not first:
+        if not last.isdigit():
+            return None
+        length = int(last)
+        if length <= 0 or size <= 0:
+            raise ValueError("range not satisfiable")
+        return max(0, size - length), size - 1
+    if not first.isdigit() or (last and not last.isdigit()):
+        return None
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError("range not satisfiable")
+    return start, min(int(last) if last else size - 1, size - 1)
+
+
+def _open_sized(path: Path) -> tuple[BinaryIO, int]:
+    """Open ``path`` for reading and return the handle with its size."""
+    handle = path.open("rb")
+    try:
+        return handle, os.fstat(handle.fileno()).st_size
+    except BaseException:
+        handle.close()
+        raise
+
+
+async def _stream_asset(
+    web: Any,
+    request: Any,
+    path: Path,
+    *,
+    etag: str,
+    headers: dict[str, str] | None = None,
+) -> Any:
+    """Stream a file with ETag revalidation and single-range ``206`` support."""
+    base_headers = {"ETag": etag, "Accept-Ranges": "bytes", **(headers or {})}
+    if _etag_matches(request.headers.get("If-None-Match"), etag):
+        return web.Response(status=304, headers=base_headers)
+    handle, size = await _run_blocking(_open_sized, path)
+    try:
+        byte_range = None
+        if_range = request.headers.get("If-Range")
+        if not if_range or if_range.strip() == etag:
+            try:
+                byte_range = _parse_byte_range(request.headers.get("Range"), size)
+            except ValueError:
+                return web.Response(
+                    status=416,
+                    headers={**base_headers, "Content-Range": f"bytes */{size}"},
+                )
+        start, end = byte_range or (0, size - 1)
+        response = web.StreamResponse(status=206 if byte_range else 200, headers=base_headers)
+        if byte_range:
+            response.headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response.content_type = (
+            "application/octet-stream"
+            if path.suffix.lower() in {".ply", ".splat"}
+            else mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        )
+        response.content_length = max(0, end - start + 1)
+        await response.prepare(request)
+        if request.method != "HEAD":
+            await _run_blocking(handle.seek, start)
+            remaining = max(0, end - start + 1)
+            while remaining:
+                chunk = await _run_blocking(handle.read, min(ASSET_STREAM_CHUNK_BYTES, remaining))
+                if not chunk:
+                    break
+                await response.write(chunk)
+                remaining -= len(chunk)
+        await response.write_eof()
+        return response
+    finally:
+        handle.close()
+
+
 def _content_length_ok(request: Any, maximum: int) -> bool:
     raw = request.headers.get("Content-Length")
     if raw is None:
@@ -2996,19 +4874,151 @@ def _content_length_ok(request: Any, maximum: int) -> bool:
         return False
 
 
+def _io_executor() -> ThreadPoolExecutor:
+    with _IO_EXECUTOR_LOCK:
+        executor = _IO_EXECUTOR["executor"]
+        if executor is None:
+            workers = io_worker_count()
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vnccs-3d-factory-io")
+            _IO_EXECUTOR.update(executor=executor, workers=workers)
+        return executor
+
+
+async def _run_blocking(function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run blocking Factory work on the bounded I/O pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_executor(), functools.partial(function, *args, **kwargs))
+
+
+async def _coalesced(key: tuple[Any, ...], function: Callable[..., Any], *args: Any) -> Any:
+    """Share one run of ``function`` between concurrent requests for ``key``.
+
+    A disconnecting client does not cancel the shared run; the others still
+    receive its result.
+    """
+    future = _INFLIGHT.get(key)
+    if future is None:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(_io_executor(), functools.partial(function, *args))
+        _INFLIGHT[key] = future
+
+        def release(done: asyncio.Future[Any]) -> None:
+            if _INFLIGHT.get(key) is done:
+                del _INFLIGHT[key]
+            if not done.cancelled():
+                done.exception()
+
+        future.add_done_callback(release)
+    return await asyncio.shield(future)
+
+
+def _record_route_latency(route: str, seconds: float, status: int) -> None:
+    with _ROUTE_METRICS_LOCK:
+        entry = _ROUTE_METRICS.setdefault(
+            route,
+            {"count": 0, "errors": 0, "samples": deque(maxlen=ROUTE_LATENCY_SAMPLES)},
+        )
+        entry["count"] += 1
+        entry["errors"] += status >= 400
+        entry["samples"].append(seconds)
+
+
+def route_metrics() -> dict[str, dict[str, Any]]:
+    """Per-route request counts and latency over the last samples, in ms."""
+    with _ROUTE_METRICS_LOCK:
+        snapshot = {
+            route: (entry["count"], entry["errors"], sorted(entry["samples"]))
+            for route, entry in _ROUTE_METRICS.items()
+        }
+    result = {}
+    for route, (count, errors, samples) in sorted(snapshot.items()):
+        if not samples:
+            continue
+        result[route] = {
+            "count": count,
+            "errors": errors,
+            "mean_ms": round(1000 * sum(samples) / len(samples), 3),
+            "p50_ms": round(1000 * samples[(len(samples) - 1) // 2], 3),
+            "p95_ms": round(1000 * samples[min(len(samples) - 1, math.ceil(0.95 * len(samples)) - 1)], 3),
+            "max_ms": round(1000 * samples[-1], 3),
+        }
+    return result
+
+
+class _TimedRouteTable:
+    """Route table proxy that records each handler's latency and status."""
+
+    def __init__(self, table: Any) -> None:
+        self._table = table
+
+    def _timed(self, method: str, path: str) -> Callable[[Any], Any]:
+        register = getattr(self._table, method.lower())(path)
+        route = f"{method} {path}"
+
+        def decorator(handler: Any) -> Any:
+            @functools.wraps(handler)
+            async def timed(request: Any) -> Any:
+                started = time.perf_counter()
+                status = 500
+                try:
+                    response = await handler(request)
+                    status = int(getattr(response, "status", 200))
+                    return response
+                except Exception as exc:
+                    status = int(getattr(exc, "status", 500))
+                    raise
+                finally:
+                    _record_route_latency(route, time.perf_counter() - started, status)
+
+            register(timed)
+            return handler
+
+        return decorator
+
+    def get(self, path: str) -> Callable[[Any], Any]:
+        return self._timed("GET", path)
+
+    def post(self, path: str) -> Callable[[Any], Any]:
+        return self._timed("POST", path)
+
+    def patch(self, path: str) -> Callable[[Any], Any]:
+        return self._timed("PATCH", path)
+
+    def put(self, path: str) -> Callable[[Any], Any]:
+        return self._timed("PUT", path)
+
+    def delete(self, path: str) -> Callable[[Any], Any]:
+        return self._timed("DELETE", path)
+
+
 def register_routes(routes: Any) -> None:
     global _REGISTERED
     if _REGISTERED:
         return
     from aiohttp import web
 
+    # Every handler except the long-lived event stream is timed for
+    # ``GET /metrics``.
+    table = routes
+    routes = _TimedRouteTable(table)
+
     @routes.get(f"{API_BASE}/capabilities")
     async def factory_capabilities(_request: Any) -> Any:
-        return web.json_response(capabilities())
+        return web.json_response(await _run_blocking(capabilities))
+
+    @routes.get(f"{API_BASE}/metrics")
+    async def factory_metrics(_request: Any) -> Any:
+        return web.json_response(
+            {
+                "routes": route_metrics(),
+                "io_workers": _IO_EXECUTOR["workers"] or io_worker_count(),
+                "inflight": len(_INFLIGHT),
+            }
+        )
 
     @routes.get(f"{API_BASE}/splat-cache")
     async def factory_splat_cache_status(_request: Any) -> Any:
-        return web.json_response(await asyncio.to_thread(splat_cache_status))
+        return web.json_response(await _run_blocking(splat_cache_status))
 
     @routes.post(f"{API_BASE}/splat-cache/settings")
     async def factory_splat_cache_settings(request: Any) -> Any:
@@ -3016,7 +5026,7 @@ def register_routes(routes: Any) -> None:
             payload = await request.json()
             if not isinstance(payload, dict):
                 raise ValueError("SPLAT cache settings must be an object")
-            status = await asyncio.to_thread(
+            status = await _run_blocking(
                 configure_splat_cache,
                 payload.get("limit_gb"),
             )
@@ -3027,7 +5037,7 @@ def register_routes(routes: Any) -> None:
     @routes.post(f"{API_BASE}/splat-cache/clear")
     async def factory_splat_cache_clear(_request: Any) -> Any:
         try:
-            return web.json_response(await asyncio.to_thread(clear_splat_cache))
+            return web.json_response(await _run_blocking(clear_splat_cache))
         except Exception as exc:
             return _json_error(web, exc)
 
@@ -3044,8 +5054,9 @@ def register_routes(routes: Any) -> None:
     async def factory_scene_create(request: Any) -> Any:
         try:
             payload = await request.json() if request.can_read_body else {}
-            scene = create_scene(payload.get("name") if isinstance(payload, dict) else "")
-            return web.json_response(_public_scene(scene), status=201)
+            name = payload.get("name") if isinstance(payload, dict) else ""
+            scene = await _run_blocking(lambda: _public_scene(create_scene(name)))
+            return web.json_response(scene, status=201)
         except Exception as exc:
             return _json_error(web, exc)
 
@@ -3053,14 +5064,15 @@ def register_routes(routes: Any) -> None:
     async def factory_scene_list(request: Any) -> Any:
         try:
             limit = int(request.query.get("limit", 100))
-            return web.json_response({"scenes": list_scenes(limit)})
+            return web.json_response({"scenes": await _run_blocking(list_scenes, limit)})
         except Exception as exc:
             return _json_error(web, exc)
 
     @routes.get(f"{API_BASE}/scenes/{{scene_id}}")
     async def factory_scene_get(request: Any) -> Any:
         try:
-            return web.json_response(_public_scene(load_scene(request.match_info["scene_id"])))
+            scene_id = request.match_info["scene_id"]
+            return web.json_response(await _run_blocking(lambda: _public_scene(_scene_view(scene_id))))
         except FileNotFoundError as exc:
             return _json_error(web, exc, 404)
         except Exception as exc:
@@ -3072,17 +5084,47 @@ def register_routes(routes: Any) -> None:
             if not _content_length_ok(request, MAX_SCENE_JSON_BYTES):
                 return web.json_response({"error": "scene update is too large"}, status=413)
             payload = await request.json()
-            scene = update_scene(request.match_info["scene_id"], payload)
-            return web.json_response(_public_scene(scene))
+            scene_id = request.match_info["scene_id"]
+            scene = await _run_blocking(lambda: _public_scene(update_scene(scene_id, payload)))
+            return web.json_response(scene)
+        except FileNotFoundError as exc:
+            return _json_error(web, exc, 404)
+        except Exception as exc:
+            return _json_error(web, exc)
+
+    @routes.patch(f"{API_BASE}/scenes/{{scene_id}}/delta")
+    async def factory_scene_delta(request: Any) -> Any:
+        try:
+            if not _content_length_ok(request, MAX_SCENE_JSON_BYTES):
+                return web.json_response({"error": "scene delta is too large"}, status=413)
+            payload = await request.json()
+            operations = payload.get("ops") if isinstance(payload, dict) else payload
+            flush = isinstance(payload, dict) and payload.get("flush") is True
+            scene_id = request.match_info["scene_id"]
+            scene = await _run_blocking(
+                lambda: _public_scene_delta(apply_scene_delta(scene_id, operations, flush=flush))
+            )
+            return web.json_response(scene)
         except FileNotFoundError as exc:
             return _json_error(web, exc, 404)
+        except SceneConflict as exc:
+            return _json_error(web, exc, 409)
+        except Exception as exc:
+            return _json_error(web, exc)
+
+    @routes.post(f"{API_BASE}/scenes/{{scene_id}}/flush")
+    async def factory_scene_flush(request: Any) -> Any:
+        try:
+            scene_id = _validate_id(request.match_info["scene_id"], "scene id")
+            written = await _run_blocking(flush_scene_journals, scene_id)
+            return web.json_response({"scene_id": scene_id, "flushed": bool(written)})
         except Exception as exc:
             return _json_error(web, exc)
 
     @routes.delete(f"{API_BASE}/scenes/{{scene_id}}")
     async def factory_scene_delete(request: Any) -> Any:
         try:
-            result = await asyncio.to_thread(
+            result = await _run_blocking(
                 delete_scene,
                 request.match_info["scene_id"],
             )
@@ -3100,16 +5142,16 @@ def register_routes(routes: Any) -> None:
             if not _content_length_ok(request, MAX_UPLOAD_BYTES + 1024 * 1024):
                 return web.json_response({"error": "image upload is too large"}, status=413)
             scene_id = _validate_id(request.match_info["scene_id"], "scene id")
-            load_scene(scene_id)
+            await _run_blocking(_scene_view, scene_id)
             post = await request.post()
             image_field = post.get("image")
             if image_field is None or not hasattr(image_field, "file"):
                 raise ValueError("missing image")
-            image_bytes = await asyncio.to_thread(
+            image_bytes = await _run_blocking(
                 image_field.file.read,
                 MAX_UPLOAD_BYTES + 1,
             )
-            scene = await asyncio.to_thread(
+            scene = await _run_blocking(
                 store_scene_reference,
                 scene_id,
                 image_bytes,
@@ -3124,8 +5166,8 @@ def register_routes(routes: Any) -> None:
     @routes.get(f"{API_BASE}/scenes/{{scene_id}}/reference")
     async def factory_scene_reference_get(request: Any) -> Any:
         try:
-            scene = load_scene(request.match_info["scene_id"])
-            return web.FileResponse(_scene_reference_file(scene))
+            scene_id = request.match_info["scene_id"]
+            return web.FileResponse(await _run_blocking(lambda: _scene_reference_file(_scene_view(scene_id))))
         except FileNotFoundError as exc:
             return _json_error(web, exc, 404)
         except Exception as exc:
@@ -3134,9 +5176,9 @@ def register_routes(routes: Any) -> None:
     @routes.get(f"{API_BASE}/scenes/{{scene_id}}/reference/preview")
     async def factory_scene_reference_preview_get(request: Any) -> Any:
         try:
-            scene = load_scene(request.match_info["scene_id"])
+            scene_id = request.match_info["scene_id"]
             return web.FileResponse(
-                await asyncio.to_thread(_ensure_scene_reference_preview, scene),
+                await _run_blocking(lambda: _ensure_scene_reference_preview(load_scene(scene_id))),
                 headers={"Cache-Control": "private, max-age=31536000, immutable"},
             )
         except FileNotFoundError as exc:
@@ -3150,16 +5192,16 @@ def register_routes(routes: Any) -> None:
             if not _content_length_ok(request, MAX_SKYDOME_BYTES + 1024 * 1024):
                 return web.json_response({"error": "skydome upload is too large"}, status=413)
             scene_id = _validate_id(request.match_info["scene_id"], "scene id")
-            load_scene(scene_id)
+            await _run_blocking(_scene_view, scene_id)
             post = await request.post()
             image_field = post.get("image")
             if image_field is None or not hasattr(image_field, "file"):
                 raise ValueError("missing skydome image")
-            image_bytes = await asyncio.to_thread(
+            image_bytes = await _run_blocking(
                 image_field.file.read,
                 MAX_SKYDOME_BYTES + 1,
             )
-            scene = await asyncio.to_thread(
+            scene = await _run_blocking(
                 store_scene_skydome,
                 scene_id,
                 image_bytes,
@@ -3174,8 +5216,8 @@ def register_routes(routes: Any) -> None:
     @routes.get(f"{API_BASE}/scenes/{{scene_id}}/skydome")
     async def factory_scene_skydome_get(request: Any) -> Any:
         try:
-            scene = load_scene(request.match_info["scene_id"])
-            return web.FileResponse(_scene_skydome_file(scene))
+            scene_id = request.match_info["scene_id"]
+            return web.FileResponse(await _run_blocking(lambda: _scene_skydome_file(_scene_view(scene_id))))
         except FileNotFoundError as exc:
             return _json_error(web, exc, 404)
         except Exception as exc:
@@ -3184,9 +5226,9 @@ def register_routes(routes: Any) -> None:
     @routes.get(f"{API_BASE}/scenes/{{scene_id}}/skydome/viewport")
     async def factory_scene_skydome_viewport_get(request: Any) -> Any:
         try:
-            scene = load_scene(request.match_info["scene_id"])
+            scene_id = request.match_info["scene_id"]
             return web.FileResponse(
-                await asyncio.to_thread(_ensure_scene_skydome_viewport, scene),
+                await _run_blocking(lambda: _ensure_scene_skydome_viewport(load_scene(scene_id))),
                 headers={"Cache-Control": "private, max-age=31536000, immutable"},
             )
         except FileNotFoundError as exc:
@@ -3197,8 +5239,9 @@ def register_routes(routes: Any) -> None:
     @routes.delete(f"{API_BASE}/scenes/{{scene_id}}/skydome")
     async def factory_scene_skydome_delete(request: Any) -> Any:
         try:
-            scene = remove_scene_skydome(request.match_info["scene_id"])
-            return web.json_response(_public_scene(scene))
+            scene_id = request.match_info["scene_id"]
+            scene = await _run_blocking(lambda: _public_scene(remove_scene_skydome(scene_id)))
+            return web.json_response(scene)
         except FileNotFoundError as exc:
             return _json_error(web, exc, 404)
         except Exception as exc:
@@ -3210,20 +5253,23 @@ def register_routes(routes: Any) -> None:
             if not _content_length_ok(request, MAX_PREVIEW_BYTES + 1024 * 1024):
                 return web.json_response({"error": "preview upload is too large"}, status=413)
             scene_id = _validate_id(request.match_info["scene_id"], "scene id")
-            load_scene(scene_id)
+            await _run_blocking(_scene_view, scene_id)
             post = await request.post()
             image_field = post.get("image")
             if image_field is None or not hasattr(image_field, "file"):
                 raise ValueError("missing scene preview image")
-            image_bytes = image_field.file.read(MAX_PREVIEW_BYTES + 1)
-            scene = store_scene_preview(
-                scene_id,
-                image_bytes,
-                post.get("revision"),
-                post.get("render_revision"),
-                post.get("capture_token"),
+            scene = await _run_blocking(
+                lambda: _public_scene(
+                    store_scene_preview(
+                        scene_id,
+                        image_field.file.read(MAX_PREVIEW_BYTES + 1),
+                        post.get("revision"),
+                        post.get("render_revision"),
+                        post.get("capture_token"),
+                    )
+                )
             )
-            return web.json_response(_public_scene(scene)["preview"], status=201)
+            return web.json_response(scene["preview"], status=201)
         except FileNotFoundError as exc:
             return _json_error(web, exc, 404)
         except Exception as exc:
@@ -3239,7 +5285,7 @@ def register_routes(routes: Any) -> None:
                     status=413,
                 )
             scene_id = _validate_id(request.match_info["scene_id"], "scene id")
-            load_scene(scene_id)
+            await _run_blocking(_scene_view, scene_id)
             post = await request.post()
             current_field = post.get("current")
             if current_field is None or not hasattr(current_field, "file"):
@@ -3259,7 +5305,7 @@ def register_routes(routes: Any) -> None:
                 if image_field is None or not hasattr(image_field, "file"):
                     raise ValueError(f"missing capture for camera {camera_id}")
                 camera_images[camera_id] = image_field.file
-            scene = await asyncio.to_thread(
+            scene = await _run_blocking(
                 store_scene_capture_set,
                 scene_id,
                 current_field.file,
@@ -3286,8 +5332,8 @@ def register_routes(routes: Any) -> None:
     @routes.get(f"{API_BASE}/scenes/{{scene_id}}/preview")
     async def factory_scene_preview_get(request: Any) -> Any:
         try:
-            scene = load_scene(request.match_info["scene_id"])
-            return web.FileResponse(_scene_preview_file(scene))
+            scene_id = request.match_info["scene_id"]
+            return web.FileResponse(await _run_blocking(lambda: _scene_preview_file(_scene_view(scene_id))))
         except FileNotFoundError as exc:
             return _json_error(web, exc, 404)
         except Exception as exc:
@@ -3300,7 +5346,8 @@ def register_routes(routes: Any) -> None:
             payload = await request.json()
             if not isinstance(payload, dict):
                 raise ValueError("scene preview failure payload must be an object")
-            scene = store_scene_preview_error(
+            scene = await _run_blocking(
+                store_scene_preview_error,
                 scene_id,
                 payload.get("capture_token"),
                 payload.get("error"),
@@ -3320,34 +5367,52 @@ def register_routes(routes: Any) -> None:
     @routes.post(f"{API_BASE}/scenes/{{scene_id}}/generate")
     async def factory_generate(request: Any) -> Any:
         try:
-            if not _content_length_ok(request, MAX_UPLOAD_BYTES + 1024 * 1024):
+            if not _content_length_ok(request, MAX_GENERATION_UPLOAD_BYTES + 1024 * 1024):
                 return web.json_response({"error": "image upload is too large"}, status=413)
             scene_id = _validate_id(request.match_info["scene_id"], "scene id")
-            load_scene(scene_id)
+            await _run_blocking(_scene_view, scene_id)
             post = await request.post()
-            image_field = post.get("image")
-            if image_field is not None and hasattr(image_field, "file"):
-                image_bytes = image_field.file.read(MAX_UPLOAD_BYTES + 1)
-            elif str(post.get("use_scene_reference", "")) == "1":
-                image_bytes = _scene_reference_file(load_scene(scene_id)).read_bytes()
-            else:
-                raise ValueError("missing image")
-            _decode_image(image_bytes)
+            # Several ``image`` fields (a character sheet or turnaround set)
+            # become one batched job; ``name`` fields pair up by position.
+            image_fields = [field for field in post.getall("image", []) if hasattr(field, "file")]
+            if len(image_fields) > MAX_GENERATION_IMAGES:
+                raise ValueError(f"a generation request takes at most {MAX_GENERATION_IMAGES} images")
+
+            def read_images() -> list[bytes]:
+                if image_fields:
+                    images = [field.file.read(MAX_UPLOAD_BYTES + 1) for field in image_fields]
+                elif post.get("source_object_id"):
+                    # Regenerate from an existing object's reference; the cached
+                    # prepared image and encoder features make this skip both.
+                    with _STATE_LOCK:
+                        source = _object_by_id(_scene_view(scene_id), str(post.get("source_object_id")))
+                        images = [_object_file(scene_id, source, "reference").read_bytes()]
+                elif str(post.get("use_scene_reference", "")) == "1":
+                    images = [_scene_reference_file(_scene_view(scene_id)).read_bytes()]
+                else:
+                    raise ValueError("missing image")
+                for image_bytes in images:
+                    _decode_image(image_bytes)
+                return images
+
+            images = await _run_blocking(read_images)
             settings = _generation_settings(post)
-            object_id = _new_id()
-            name = _clean_name(post.get("name"), f"Object {object_id[:6]}", 80)
+            names = post.getall("name", [])
+            sources = []
+            for index, image_bytes in enumerate(images):
+                object_id = _new_id()
+                name = _clean_name(
+                    names[index] if index < len(names) else "",
+                    f"Object {object_id[:6]}",
+                    80,
+                )
+                sources.append((image_bytes, object_id, name))
             job = _new_job("generation", scene_id)
             _track_task(
                 asyncio.to_thread(
                     _run_job,
                     job,
-                    lambda current: _generate_object(
-                        current,
-                        image_bytes,
-                        object_id,
-                        name,
-                        settings,
-                    ),
+                    lambda current: _generate_objects(current, sources, settings),
                 )
             )
             return web.json_response(_job_public(job), status=202)
@@ -3370,6 +5435,47 @@ def register_routes(routes: Any) -> None:
         except Exception as exc:
             return _json_error(web, exc)
 
+    @table.get(f"{API_BASE}/jobs/{{job_id}}/events")
+    async def factory_job_events(request: Any) -> Any:
+        try:
+            job_id = _validate_id(request.match_info["job_id"], "job id")
+            with _STATE_LOCK:
+                job = _JOBS.get(job_id)
+            if job is None:
+                raise FileNotFoundError(f"Factory job {job_id} was not found")
+            after = _last_event_id(request.headers.get("Last-Event-ID"))
+        except FileNotFoundError as exc:
+            return _json_error(web, exc, 404)
+        except Exception as exc:
+            return _json_error(web, exc)
+        response = web.StreamResponse(
+            headers={
+                "Content-Type": "text/event-stream",
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",
+            }
+        )
+        await response.prepare(request)
+        events, backlog = _subscribe_job_events(job, asyncio.get_running_loop(), after)
+        try:
+            finished = False
+            for payload in backlog:
+                await response.write(_sse_message(payload))
+                finished = payload.get("status") in TERMINAL_JOB_STATUSES
+            while not finished:
+                try:
+                    payload = await asyncio.wait_for(events.get(), JOB_EVENT_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    await response.write(b": keep-alive\n\n")
+                    continue
+                await response.write(_sse_message(payload))
+                finished = payload.get("status") in TERMINAL_JOB_STATUSES
+        except ConnectionResetError:
+            pass
+        finally:
+            _unsubscribe_job_events(job_id, events)
+        return response
+
     @routes.post(f"{API_BASE}/jobs/{{job_id}}/cancel")
     async def factory_job_cancel(request: Any) -> Any:
         try:
@@ -3394,6 +5500,7 @@ def register_routes(routes: Any) -> None:
                 job = _JOBS.get(job_id)
             if job is None:
                 raise FileNotFoundError(f"Factory job {job_id} was not found")
+            await _run_blocking(flush_job_logs)
             path = _job_log_path(job)
             if not path.is_file():
                 raise FileNotFoundError("job log is not available")
@@ -3407,28 +5514,29 @@ def register_routes(routes: Any) -> None:
     async def factory_object_asset(request: Any) -> Any:
         try:
             kind = request.match_info["kind"]
-            if kind not in {"ply", "splat", "prepared", "reference", "thumbnail"}:
-                raise FileNotFoundError("unknown object asset")
-            scene = load_scene(request.match_info["scene_id"])
-            item = _object_by_id(scene, request.match_info["object_id"])
-            if kind == "splat":
-                path = await asyncio.to_thread(
-                    _ensure_object_splat,
-                    scene["scene_id"],
-                    item["object_id"],
-                )
-            elif kind == "thumbnail":
-                path = await asyncio.to_thread(
-                    _ensure_object_thumbnail,
-                    scene["scene_id"],
-                    item,
-                )
-            else:
-                path = _object_file(scene["scene_id"], item, kind)
-            return web.FileResponse(
-                path,
-                headers={"Cache-Control": "private, max-age=31536000, immutable"},
+            if "lod" in request.query and kind != "splat":
+                raise ValueError("level of detail is only available for SPLAT assets")
+            scene_id = request.match_info["scene_id"]
+            object_id = request.match_info["object_id"]
+            lod = _splat_lod(request.query.get("lod"))
+            if_none_match = request.headers.get("If-None-Match")
+            headers = {"Cache-Control": "private, max-age=31536000, immutable"}
+            # Concurrent viewers of one object share a single SPLAT build.
+            path, etag = await _coalesced(
+                ("asset", scene_id, object_id, kind, lod, if_none_match),
+                _object_asset,
+                scene_id,
+                object_id,
+                kind,
+                lod,
+                if_none_match,
             )
+            if path is None:
+                return web.Response(
+                    status=304,
+                    headers={"ETag": etag, "Accept-Ranges": "bytes", **headers},
+                )
+            return await _stream_asset(web, request, path, etag=etag, headers=headers)
         except FileNotFoundError as exc:
             return _json_error(web, exc, 404)
         except Exception as exc:
@@ -3440,12 +5548,12 @@ def register_routes(routes: Any) -> None:
             if not _content_length_ok(request, MAX_PLY_UPLOAD_BYTES + 1024 * 1024):
                 return web.json_response({"error": "PLY upload is too large"}, status=413)
             scene_id = _validate_id(request.match_info["scene_id"], "scene id")
-            load_scene(scene_id)
+            await _run_blocking(_scene_view, scene_id)
             post = await request.post()
             ply_field = post.get("ply")
             if ply_field is None or not hasattr(ply_field, "file"):
                 raise ValueError("missing PLY file")
-            result = await asyncio.to_thread(
+            result = await _run_blocking(
                 import_ply_object,
                 scene_id,
                 ply_field.file,
@@ -3468,12 +5576,11 @@ def register_routes(routes: Any) -> None:
     async def factory_object_update(request: Any) -> Any:
         try:
             payload = await request.json()
+            scene_id = request.match_info["scene_id"]
             object_id = _validate_id(request.match_info["object_id"], "object id")
-            scene = update_scene(
-                request.match_info["scene_id"],
-                {"objects": [{"object_id": object_id, **(payload if isinstance(payload, dict) else {})}]},
-            )
-            return web.json_response(_public_scene(scene))
+            update = {"objects": [{"object_id": object_id, **(payload if isinstance(payload, dict) else {})}]}
+            scene = await _run_blocking(lambda: _public_scene(update_scene(scene_id, update)))
+            return web.json_response(scene)
         except FileNotFoundError as exc:
             return _json_error(web, exc, 404)
         except Exception as exc:
@@ -3482,7 +5589,7 @@ def register_routes(routes: Any) -> None:
     @routes.post(f"{API_BASE}/scenes/{{scene_id}}/objects/{{object_id}}/duplicate")
     async def factory_object_duplicate(request: Any) -> Any:
         try:
-            result = await asyncio.to_thread(
+            result = await _run_blocking(
                 duplicate_object,
                 request.match_info["scene_id"],
                 request.match_info["object_id"],
@@ -3496,22 +5603,58 @@ def register_routes(routes: Any) -> None:
         except Exception as exc:
             return _json_error(web, exc)
 
+    @routes.post(f"{API_BASE}/scenes/{{scene_id}}/objects/{{object_id}}/redensify")
+    async def factory_object_redensify(request: Any) -> Any:
+        try:
+            scene_id = _validate_id(request.match_info["scene_id"], "scene id")
+            object_id = _validate_id(request.match_info["object_id"], "object id")
+            payload = await request.json()
+            if not isinstance(payload, dict):
+                raise ValueError("re-densify payload must be an object")
+            counts = _redensify_counts(payload.get("num_gaussians"))
+            decode_memory_mb = _decode_memory_mb(payload.get("decode_memory_mb", 0))
+
+            def check_source() -> None:
+                with _STATE_LOCK:
+                    _redensify_source(scene_id, _object_by_id(_scene_view(scene_id), object_id))
+
+            await _run_blocking(check_source)
+            job = _new_job("redensify", scene_id)
+            _track_task(
+                asyncio.to_thread(
+                    _run_job,
+                    job,
+                    lambda current: _redensify_object(
+                        current, scene_id, object_id, counts, decode_memory_mb
+                    ),
+                )
+            )
+            return web.json_response(_job_public(job), status=202)
+        except FileNotFoundError as exc:
+            return _json_error(web, exc, 404)
+        except Exception as exc:
+            return _json_error(web, exc)
+
     @routes.delete(f"{API_BASE}/scenes/{{scene_id}}/objects/{{object_id}}")
     async def factory_object_delete(request: Any) -> Any:
         try:
             scene_id = _validate_id(request.match_info["scene_id"], "scene id")
             object_id = _validate_id(request.match_info["object_id"], "object id")
-            with _STATE_LOCK:
-                scene = load_scene(scene_id)
-                _object_by_id(scene, object_id)
-                scene["objects"] = [item for item in scene["objects"] if item.get("object_id") != object_id]
-                _remove_object_layer(scene["layers"], object_id)
-                scene["exports"] = {}
-                _save_scene(scene)
-            target = resolve_scene_dir(scene_id) / "objects" / object_id
-            if target.is_dir() and target.parent == resolve_scene_dir(scene_id) / "objects":
-                shutil.rmtree(target)
-            return web.json_response(_public_scene(scene))
+
+            def delete_object() -> dict[str, Any]:
+                with _STATE_LOCK:
+                    scene = load_scene(scene_id)
+                    _object_by_id(scene, object_id)
+                    scene["objects"] = [item for item in scene["objects"] if item.get("object_id") != object_id]
+                    _remove_object_layer(scene["layers"], object_id)
+                    _invalidate_scene_export(scene, [object_id])
+                    _save_scene(scene)
+                target = resolve_scene_dir(scene_id) / "objects" / object_id
+                if target.is_dir() and target.parent == resolve_scene_dir(scene_id) / "objects":
+                    shutil.rmtree(target)
+                return _public_scene(scene)
+
+            return web.json_response(await _run_blocking(delete_object))
         except FileNotFoundError as exc:
             return _json_error(web, exc, 404)
         except Exception as exc:
@@ -3520,14 +5663,25 @@ def register_routes(routes: Any) -> None:
     @routes.get(f"{API_BASE}/scenes/{{scene_id}}/objects/{{object_id}}/export/ply")
     async def factory_object_export(request: Any) -> Any:
         try:
-            path = await asyncio.to_thread(
+            scene_id = request.match_info["scene_id"]
+            object_id = request.match_info["object_id"]
+            path = await _coalesced(
+                ("object-export", scene_id, object_id),
                 _ensure_object_ply_export,
-                request.match_info["scene_id"],
-                request.match_info["object_id"],
+                scene_id,
+                object_id,
             )
-            download_name = f"{_validate_id(request.match_info['object_id'], 'object id')}.ply"
-            return web.FileResponse(
+            handle = await _run_blocking(
+                _open_derived_asset,
                 path,
+                _ensure_object_ply_export,
+                scene_id,
+                object_id,
+            )
+            download_name = f"{_validate_id(request.match_info['object_id'], 'object id')}.ply"
+            return web.Response(
+                body=handle,
+                content_type="application/octet-stream",
                 headers={"Content-Disposition": f'attachment; filename="{download_name}"'},
             )
         except FileNotFoundError as exc:
@@ -3539,8 +5693,8 @@ def register_routes(routes: Any) -> None:
     async def factory_scene_export(request: Any) -> Any:
         try:
             scene_id = _validate_id(request.match_info["scene_id"], "scene id")
-            result = await asyncio.to_thread(ensure_scene_ply_export, scene_id)
-            return web.json_response(_public_scene(result["scene"]))
+            result = await _coalesced(("scene-export", scene_id), ensure_scene_ply_export, scene_id)
+            return web.json_response(await _run_blocking(_public_scene, result["scene"]))
         except FileNotFoundError as exc:
             return _json_error(web, exc, 404)
         except Exception as exc:
@@ -3549,12 +5703,9 @@ def register_routes(routes: Any) -> None:
     @routes.get(f"{API_BASE}/scenes/{{scene_id}}/exports/ply")
     async def factory_scene_export_download(request: Any) -> Any:
         try:
-            result = await asyncio.to_thread(
-                ensure_scene_ply_export,
-                request.match_info["scene_id"],
-            )
-            path = result["ply"]
             scene_id = _validate_id(request.match_info["scene_id"], "scene id")
+            result = await _coalesced(("scene-export", scene_id), ensure_scene_ply_export, scene_id)
+            path = result["ply"]
             return web.FileResponse(
                 path,
                 headers={
@@ -13,7 +13,6 @@ from __future__ import annotations
 
 import asyncio
 import base64
-import hashlib
 import io
 import json
 import os
@@ -151,11 +150,16 @@ def _atomic_json(path: Path, value: Any) -> None:
 
 
 def _sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as stream:
-        for chunk in iter(lambda: stream.read(4 * 1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+    # Shares Factory's persistent digest index, so unchanged packages are not
+    # re-read after a restart.  The index trusts (device, inode, size, mtime),
+    # so it is for display and dedup only; integrity checks use
+    # _verified_sha256.
+    return factory._indexed_sha256_file(path)
+
+
+def _verified_sha256(path: Path) -> str:
+    """Hash the file's current bytes, bypassing the digest index."""
+    return factory._sha256_file(path)
 
 
 def _decode_preview(value: Any) -> bytes:
@@ -245,6 +249,8 @@ def _object_payload(
         _zip_write_file(archive, source, target)
         files[key] = target
     output["files"] = files
+    # Packages carry the active PLY only; alternate densities are local.
+    output.pop("densities", None)
     return output
 
 
@@ -925,7 +931,7 @@ def _write_local_manifest() -> Path:
                     if paths["preview"].is_file()
                     else ""
                 ),
-                "package_sha256": _sha256(paths["package"]),
+                "package_sha256": _verified_sha256(paths["package"]),
             }
         )
     manifest = {
@@ -1003,7 +1009,7 @@ def _sync_repository(
                 if (
                     kind == "package"
                     and raw.get("package_sha256")
-                    and _sha256(paths[kind]).lower()
+                    and _verified_sha256(paths[kind]).lower()
                     != str(raw["package_sha256"]).lower()
                 ):
                     paths[kind].unlink(missing_ok=True)
@@ -10,14 +10,19 @@ from __future__ import annotations
 
 import base64
 import binascii
+import hashlib
 import json
 import math
 import logging
 import os
+import re
 import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, BinaryIO, Iterable, Iterator
 
 import numpy as np
 
@@ -26,6 +31,20 @@ LOGGER = logging.getLogger("vnccs.3d_factory.gaussian_scene")
 _MAX_HEADER_BYTES = 64 * 1024
 _MAX_VERTICES = 64 * 1024 * 1024
 _CHUNK = 65_536
+_MAX_EXPORT_WORKERS = 32
+_EXPORT_WORKERS_ENV = "VNCCS_3D_FACTORY_EXPORT_WORKERS"
+_SPLAT_SORT_BUDGET_ENV = "VNCCS_3D_FACTORY_SPLAT_SORT_MB"
+_DEFAULT_SPLAT_SORT_BUDGET_MB = 256
+_MIN_SPLAT_SORT_BUDGET_MB = 16
+# Working bytes per Gaussian of the in-memory SPLAT sort: the packed record,
+# sort key, argsort order, and its temporaries.
+_SPLAT_MEMORY_SORT_BYTES = 64
+# Spilled run record: sort key, source index, packed SPLAT record.
+_SPLAT_RUN_DTYPE = np.dtype([("key", "<f4"), ("index", "<u8"), ("splat", "u1", (32,))])
+# Scene headers are padded to a block-aligned size with room for metadata
+# growth, so camera edits can replace the header without moving the payload.
+_HEADER_ALIGNMENT = 4096
+_HEADER_SLACK = 1024
 _SCENE_METADATA_COMMENT = "comment vnccs_scene_metadata_base64 "
 # TripoSplat's official Three.js viewer applies child yaw +90° around Y,
 # followed by parent pitch 180° around X. Canonical model.ply files and their
@@ -89,6 +108,12 @@ _REQUIRED = {
     "rot_3",
 }
 _CORE_FLOAT_FIELDS = tuple(sorted(_REQUIRED))
+_XYZ_FIELDS = ("x", "y", "z")
+_NORMAL_FIELDS = ("nx", "ny", "nz")
+_SCALE_FIELDS = ("scale_0", "scale_1", "scale_2")
+_ROTATION_FIELDS = ("rot_0", "rot_1", "rot_2", "rot_3")
+_F_DC_FIELDS = ("f_dc_0", "f_dc_1", "f_dc_2")
+_F_REST_RE = re.compile(r"^f_rest_(\d+)$")
 
 
 @dataclass(frozen=True)
@@ -99,6 +124,93 @@ class PlyInfo:
     dtype: np.dtype
 
 
+def _float_block(records: np.ndarray, names: tuple[str, ...]) -> np.ndarray:
+    """Return ``records[names]`` as an ``(N, len(names))`` float32 array.
+
+    Adjacent little-endian float32 fields, which is how TripoSplat lays out
+    every Gaussian attribute, are exposed as a zero-copy strided view of the
+    structured records (including memmaps).  Any other layout is gathered
+    into a new contiguous float32 array.
+    """
+    if not names:
+        return np.empty((len(records), 0), dtype=np.float32)
+    fields = records.dtype.fields or {}
+    first_offset = fields[names[0]][1]
+    if all(
+        fields[name][0] == np.dtype("<f4") and fields[name][1] == first_offset + 4 * index
+        for index, name in enumerate(names)
+    ):
+        block = np.dtype(
+            {
+                "names": ["block"],
+                "formats": [("<f4", (len(names),))],
+                "offsets": [first_offset],
+                "itemsize": records.dtype.itemsize,
+            }
+        )
+        return records.view(block)["block"]
+    return np.column_stack(
+        tuple(np.asarray(records[name], dtype=np.float32) for name in names)
+    ).reshape(len(records), len(names))
+
+
+def _assign_block(records: np.ndarray, names: tuple[str, ...], values: np.ndarray) -> None:
+    block = _float_block(records, names)
+    if np.may_share_memory(block, records):
+        block[...] = values
+        return
+    for index, name in enumerate(names):
+        records[name] = values[:, index]
+
+
+def _f_rest_fields(dtype: np.dtype) -> tuple[str, ...]:
+    matches = [
+        (int(match.group(1)), name)
+        for name in dtype.names or ()
+        if (match := _F_REST_RE.fullmatch(name))
+    ]
+    return tuple(name for _index, name in sorted(matches))
+
+
+@dataclass(frozen=True)
+class GaussianColumns:
+    """Column-major working representation of Gaussian PLY records.
+
+    Every attribute is an ``(N, k)`` float32 array (``opacity`` is ``(N,)``).
+    Built from TripoSplat's all-float layout the arrays are strided views of
+    the structured records, so no per-field gather or copy is made until an
+    operation actually produces new values.
+    """
+
+    xyz: np.ndarray
+    scales: np.ndarray
+    rotations: np.ndarray
+    opacity: np.ndarray
+    f_dc: np.ndarray
+    f_rest: np.ndarray
+    normals: np.ndarray | None = None
+
+    @classmethod
+    def from_records(cls, records: np.ndarray) -> "GaussianColumns":
+        names = set(records.dtype.names or ())
+        return cls(
+            xyz=_float_block(records, _XYZ_FIELDS),
+            scales=_float_block(records, _SCALE_FIELDS),
+            rotations=_float_block(records, _ROTATION_FIELDS),
+            opacity=_float_block(records, ("opacity",))[:, 0],
+            f_dc=_float_block(records, _F_DC_FIELDS),
+            f_rest=_float_block(records, _f_rest_fields(records.dtype)),
+            normals=(
+                _float_block(records, _NORMAL_FIELDS)
+                if names.issuperset(_NORMAL_FIELDS)
+                else None
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.opacity)
+
+
 def _read_header(path: Path) -> tuple[bytes, int]:
     with path.open("rb") as handle:
         data = b""
@@ -167,72 +279,113 @@ def inspect_ply(path: str | os.PathLike[str]) -> PlyInfo:
     return PlyInfo(source, count, offset, dtype)
 
 
+class _PayloadStats:
+    """Accumulate :func:`validate_ply_payload` statistics chunk by chunk."""
+
+    def __init__(self, dtype: np.dtype) -> None:
+        self.float_names = [
+            name
+            for name in dtype.names or ()
+            if dtype.fields[name][0].kind == "f"
+        ]
+        self.records = 0
+        self.invalid_values = 0
+        self.invalid_scales = 0
+        self.invalid_quaternions = 0
+        self.ranges: dict[str, list[float]] = {}
+
+    def update(self, records: np.ndarray) -> None:
+        self.records += len(records)
+        if not len(records):
+            return
+        values = _float_block(records, tuple(self.float_names))
+        finite = np.isfinite(values)
+        self.invalid_values += int(values.size - np.count_nonzero(finite))
+        present = finite.any(axis=0)
+        minimums = np.where(finite, values, np.inf).min(axis=0)
+        maximums = np.where(finite, values, -np.inf).max(axis=0)
+        for index in np.flatnonzero(present):
+            name = self.float_names[index]
+            current = [float(minimums[index]), float(maximums[index])]
+            previous = self.ranges.get(name)
+            self.ranges[name] = (
+                current
+                if previous is None
+                else [min(previous[0], current[0]), max(previous[1], current[1])]
+            )
+        columns = GaussianColumns.from_records(records)
+        with np.errstate(over="ignore", under="ignore", invalid="ignore"):
+            decoded_scales = np.exp(columns.scales.astype(np.float64))
+        self.invalid_scales += int(
+            ((~np.isfinite(decoded_scales)) | (decoded_scales <= 0)).sum()
+        )
+        norms = np.linalg.norm(columns.rotations, axis=1)
+        self.invalid_quaternions += int(((~np.isfinite(norms)) | (norms <= 1e-12)).sum())
+
+    def absorb(self, report: dict[str, Any]) -> None:
+        """Merge a previous :meth:`report` of records with the same layout."""
+        self.records += int(report["gaussians"])
+        self.invalid_values += int(report.get("invalid_values", 0))
+        self.invalid_scales += int(report.get("invalid_scales", 0))
+        self.invalid_quaternions += int(report.get("invalid_quaternions", 0))
+        for name in self.float_names:
+            current = report.get("ranges", {}).get(name)
+            if current is None:
+                continue
+            previous = self.ranges.get(name)
+            self.ranges[name] = (
+                [float(current[0]), float(current[1])]
+                if previous is None
+                else [min(previous[0], float(current[0])), max(previous[1], float(current[1]))]
+            )
+
+    def report(self, path: Path) -> dict[str, Any]:
+        if self.records <= 0:
+            raise ValueError(f"{path.name}: Gaussian PLY contains no vertices")
+        if self.invalid_values or self.invalid_scales or self.invalid_quaternions:
+            raise ValueError(
+                f"{path.name}: invalid Gaussian payload: "
+                f"{self.invalid_values:,} NaN/Inf value(s), "
+                f"{self.invalid_scales:,} invalid scale(s), "
+                f"{self.invalid_quaternions:,} degenerate quaternion(s)"
+            )
+        return {
+            "path": str(path),
+            "gaussians": self.records,
+            "invalid_values": 0,
+            "invalid_scales": 0,
+            "invalid_quaternions": 0,
+            "ranges": self.ranges,
+        }
+
+
+def _iter_ply_records(info: PlyInfo, chunk: int | None = None) -> Iterator[np.ndarray]:
+    """Read the vertex payload front to back in chunks of at most ``chunk`` records.
+
+    Plain sequential reads keep resident memory at one chunk; a whole-file
+    memmap would leave every touched page mapped until it is released.
+    """
+    with info.path.open("rb") as handle:
+        handle.seek(info.data_offset)
+        remaining = info.vertex_count
+        chunk = chunk or _CHUNK
+        while remaining:
+            records = np.fromfile(handle, dtype=info.dtype, count=min(chunk, remaining))
+            if not len(records):
+                raise ValueError(f"{info.path.name}: PLY payload is truncated")
+            remaining -= len(records)
+            yield records
+
+
 def validate_ply_payload(path: str | os.PathLike[str]) -> dict[str, Any]:
     """Read every generated record and reject non-finite or degenerate data."""
     info = inspect_ply(path)
     if info.vertex_count <= 0:
         raise ValueError(f"{info.path.name}: Gaussian PLY contains no vertices")
-    data = np.memmap(
-        info.path,
-        mode="r",
-        dtype=info.dtype,
-        offset=info.data_offset,
-        shape=(info.vertex_count,),
-    )
-    float_names = [
-        name
-        for name in info.dtype.names or ()
-        if info.dtype.fields[name][0].kind == "f"
-    ]
-    invalid_values = 0
-    invalid_scales = 0
-    invalid_quaternions = 0
-    ranges: dict[str, list[float]] = {}
-    try:
-        for start in range(0, info.vertex_count, _CHUNK):
-            records = data[start : start + _CHUNK]
-            for name in float_names:
-                values = np.asarray(records[name], dtype=np.float32)
-                finite = np.isfinite(values)
-                invalid_values += int((~finite).sum())
-                if finite.any():
-                    current = [float(values[finite].min()), float(values[finite].max())]
-                    previous = ranges.get(name)
-                    ranges[name] = (
-                        current
-                        if previous is None
-                        else [min(previous[0], current[0]), max(previous[1], current[1])]
-                    )
-            log_scales = np.column_stack(
-                tuple(np.asarray(records[f"scale_{index}"], dtype=np.float64) for index in range(3))
-            )
-            with np.errstate(over="ignore", under="ignore", invalid="ignore"):
-                decoded_scales = np.exp(log_scales)
-            invalid_scales += int(
-                ((~np.isfinite(decoded_scales)) | (decoded_scales <= 0)).sum()
-            )
-            rotation = np.column_stack(
-                tuple(np.asarray(records[f"rot_{index}"], dtype=np.float32) for index in range(4))
-            )
-            norms = np.linalg.norm(rotation, axis=1)
-            invalid_quaternions += int(((~np.isfinite(norms)) | (norms <= 1e-12)).sum())
-    finally:
-        del data
-    if invalid_values or invalid_scales or invalid_quaternions:
-        raise ValueError(
-            f"{info.path.name}: invalid Gaussian payload: "
-            f"{invalid_values:,} NaN/Inf value(s), "
-            f"{invalid_scales:,} invalid scale(s), "
-            f"{invalid_quaternions:,} degenerate quaternion(s)"
-        )
-    return {
-        "path": str(info.path),
-        "gaussians": info.vertex_count,
-        "invalid_values": 0,
-        "invalid_scales": 0,
-        "invalid_quaternions": 0,
-        "ranges": ranges,
-    }
+    stats = _PayloadStats(info.dtype)
+    for records in _iter_ply_records(info):
+        stats.update(records)
+    return stats.report(info.path)
 
 
 def validate_splat_payload(
@@ -363,33 +516,30 @@ def _compose_quaternion(parent: np.ndarray, child: np.ndarray) -> np.ndarray:
     return result / np.maximum(norm, 1e-12)
 
 
-def _transform_records(records: np.ndarray, transform: Any) -> np.ndarray:
-    normalized = normalize_transform(transform)
-    result = records.copy()
-    xyz = np.column_stack((records["x"], records["y"], records["z"])).astype(np.float32, copy=False)
+def _transform_in_place(records: np.ndarray, normalized: dict[str, Any]) -> None:
+    """Bake a normalized scene transform into writable structured records."""
+    columns = GaussianColumns.from_records(records)
     rotation = _rotation_matrix_xyz(normalized["rotation"])
     position = np.asarray(normalized["position"], dtype=np.float32)
-    xyz = xyz @ _CANONICAL_ORIENTATION.T
+    xyz = columns.xyz @ _CANONICAL_ORIENTATION.T
     xyz = (xyz @ rotation.T) * np.float32(normalized["scale"]) + position
-    result["x"], result["y"], result["z"] = xyz[:, 0], xyz[:, 1], xyz[:, 2]
+    _assign_block(records, _XYZ_FIELDS, xyz)
 
-    if {"nx", "ny", "nz"}.issubset(records.dtype.names or ()):
-        normals = np.column_stack((records["nx"], records["ny"], records["nz"])).astype(np.float32, copy=False)
-        normals = normals @ _CANONICAL_ORIENTATION.T
-        normals = normals @ rotation.T
-        result["nx"], result["ny"], result["nz"] = normals[:, 0], normals[:, 1], normals[:, 2]
+    if columns.normals is not None:
+        normals = columns.normals @ _CANONICAL_ORIENTATION.T
+        _assign_block(records, _NORMAL_FIELDS, normals @ rotation.T)
 
     log_scale = np.float32(math.log(normalized["scale"]))
-    for name in ("scale_0", "scale_1", "scale_2"):
-        result[name] = records[name] + log_scale
+    _assign_block(records, _SCALE_FIELDS, columns.scales + log_scale)
 
-    quaternions = np.column_stack(tuple(records[f"rot_{index}"] for index in range(4))).astype(
-        np.float32, copy=False
-    )
-    quaternions = _compose_quaternion(_CANONICAL_QUATERNION, quaternions)
+    quaternions = _compose_quaternion(_CANONICAL_QUATERNION, columns.rotations)
     quaternions = _compose_quaternion(_rotation_quaternion_xyz(normalized["rotation"]), quaternions)
-    for index in range(4):
-        result[f"rot_{index}"] = quaternions[:, index]
+    _assign_block(records, _ROTATION_FIELDS, quaternions)
+
+
+def _transform_records(records: np.ndarray, transform: Any) -> np.ndarray:
+    result = records.copy()
+    _transform_in_place(result, normalize_transform(transform))
     return result
 
 
@@ -402,28 +552,27 @@ def _core_record_mask(records: np.ndarray) -> tuple[np.ndarray, dict[str, int]]:
     or quaternion makes the complete Gaussian unusable and must remove that
     record from an exported scene.
     """
-    count = len(records)
-    valid = np.ones(count, dtype=bool)
+    columns = GaussianColumns.from_records(records)
+    valid = np.ones(len(columns), dtype=bool)
     invalid_core_values = 0
     with np.errstate(over="ignore", under="ignore", invalid="ignore"):
-        for name in _CORE_FLOAT_FIELDS:
-            values = np.asarray(records[name], dtype=np.float32)
+        for values in (
+            columns.xyz,
+            columns.f_dc,
+            columns.opacity[:, None],
+            columns.scales,
+            columns.rotations,
+        ):
             finite = np.isfinite(values)
-            invalid_core_values += int((~finite).sum())
-            valid &= finite
+            invalid_core_values += int(values.size - np.count_nonzero(finite))
+            valid &= finite.all(axis=1)
 
-        log_scales = np.column_stack(
-            tuple(np.asarray(records[f"scale_{index}"], dtype=np.float64) for index in range(3))
-        )
-        decoded_scales = np.exp(log_scales)
+        decoded_scales = np.exp(columns.scales.astype(np.float64))
         valid_scale_values = np.isfinite(decoded_scales) & (decoded_scales > 0)
         invalid_scales = int((~valid_scale_values).sum())
         valid &= valid_scale_values.all(axis=1)
 
-        rotation = np.column_stack(
-            tuple(np.asarray(records[f"rot_{index}"], dtype=np.float32) for index in range(4))
-        )
-        norms = np.linalg.norm(rotation, axis=1)
+        norms = np.linalg.norm(columns.rotations, axis=1)
         valid_quaternions = np.isfinite(norms) & (norms > 1e-12)
         invalid_quaternions = int((~valid_quaternions).sum())
         valid &= valid_quaternions
@@ -442,26 +591,28 @@ def _prepare_export_records(
     """Sanitize one source chunk and return only strictly valid output rows."""
     source_count = len(records)
     source_mask, source_diagnostics = _core_record_mask(records)
-    prepared = records[source_mask].copy()
+    # Boolean indexing already returns a private copy; the transform is
+    # baked into it in place.
+    prepared = records[source_mask]
 
     repaired_values = 0
-    optional_fields = [
+    optional_fields = tuple(
         name
         for name in records.dtype.names or ()
         if records.dtype.fields[name][0].kind == "f" and name not in _REQUIRED
-    ]
+    )
     with np.errstate(over="ignore", invalid="ignore"):
-        for name in optional_fields:
-            values = np.asarray(prepared[name], dtype=np.float32)
+        if optional_fields and len(prepared):
+            values = _float_block(prepared, optional_fields)
             invalid = ~np.isfinite(values)
-            repaired_values += int(invalid.sum())
-            if invalid.any():
-                prepared[name][invalid] = 0
+            repaired_values = int(invalid.sum())
+            if repaired_values:
+                _assign_block(prepared, optional_fields, np.where(invalid, 0, values))
 
-        transformed = _transform_records(prepared, transform)
+        _transform_in_place(prepared, normalize_transform(transform))
 
-    output_mask, output_diagnostics = _core_record_mask(transformed)
-    output = transformed[output_mask]
+    output_mask, output_diagnostics = _core_record_mask(prepared)
+    output = prepared if output_mask.all() else prepared[output_mask]
     return output, {
         "source_records": source_count,
         "valid_records": len(output),
@@ -482,50 +633,6 @@ def _prepare_export_records(
     }
 
 
-def _scan_export_source(info: PlyInfo, transform: Any) -> dict[str, Any]:
-    data = np.memmap(
-        info.path,
-        mode="r",
-        dtype=info.dtype,
-        offset=info.data_offset,
-        shape=(info.vertex_count,),
-    )
-    diagnostics: dict[str, Any] = {
-        "path": str(info.path),
-        "source_records": 0,
-        "valid_records": 0,
-        "dropped_records": 0,
-        "repaired_optional_values": 0,
-        "invalid_core_values": 0,
-        "invalid_scales": 0,
-        "invalid_quaternions": 0,
-    }
-    try:
-        for start in range(0, info.vertex_count, _CHUNK):
-            _prepared, chunk = _prepare_export_records(
-                data[start : start + _CHUNK],
-                transform,
-            )
-            for key in (
-                "source_records",
-                "valid_records",
-                "dropped_records",
-                "repaired_optional_values",
-                "invalid_core_values",
-                "invalid_scales",
-                "invalid_quaternions",
-            ):
-                diagnostics[key] += int(chunk[key])
-    finally:
-        del data
-    if diagnostics["valid_records"] <= 0:
-        raise ValueError(
-            f"{info.path.name}: no valid Gaussian records remain after sanitization "
-            f"({diagnostics['source_records']:,} source records)"
-        )
-    return diagnostics
-
-
 def _encode_scene_metadata_comment(metadata: Any) -> str | None:
     if metadata is None:
         return None
@@ -572,11 +679,19 @@ def read_ply_scene_metadata(path: str | os.PathLike[str]) -> dict[str, Any] | No
     return value
 
 
-def _ply_header(count: int, dtype: np.dtype, metadata: Any = None) -> bytes:
+def _ply_header(
+    count: int,
+    dtype: np.dtype,
+    metadata: Any = None,
+    *,
+    padding: int = 0,
+) -> bytes:
+    # ``padding`` appends spaces to the fixed scene comment so a header can be
+    # rewritten in place at exactly the length of a previously reserved one.
     lines = [
         "ply",
         "format binary_little_endian 1.0",
-        "comment VNCCS 3D Factory Gaussian scene",
+        "comment VNCCS 3D Factory Gaussian scene" + " " * max(0, int(padding)),
     ]
     metadata_comment = _encode_scene_metadata_comment(metadata)
     if metadata_comment:
@@ -593,53 +708,271 @@ def _ply_header(count: int, dtype: np.dtype, metadata: Any = None) -> bytes:
     return ("\n".join(lines) + "\n").encode("ascii")
 
 
+def _reserved_ply_header(
+    count: int,
+    dtype: np.dtype,
+    metadata: Any = None,
+    *,
+    reserved: int = 0,
+) -> bytes:
+    """Return a scene header padded to ``reserved`` bytes, or to a new reservation.
+
+    When the header no longer fits ``reserved`` it is padded up to the next
+    :data:`_HEADER_ALIGNMENT` boundary with at least :data:`_HEADER_SLACK`
+    spare bytes, keeping the payload block-aligned for in-kernel copies.
+    """
+    header = _ply_header(count, dtype, metadata)
+    if len(header) > reserved:
+        reserved = -(-(len(header) + _HEADER_SLACK) // _HEADER_ALIGNMENT) * _HEADER_ALIGNMENT
+        if reserved > _MAX_HEADER_BYTES:
+            return header
+    return _ply_header(count, dtype, metadata, padding=reserved - len(header))
+
+
+def _append_file_range(source: BinaryIO, target: BinaryIO, offset: int, count: int) -> str:
+    """Append ``count`` bytes of ``source`` starting at ``offset`` to ``target``.
+
+    ``os.copy_file_range`` lets the kernel copy (or share extents on
+    reflink-capable filesystems) without passing data through Python;
+    ``os.sendfile`` and buffered reads are the fallbacks.  Returns the method
+    that completed the copy.
+    """
+    target.flush()
+    start = target.tell()
+    copied = 0
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            while copied < count:
+                step = copy_file_range(
+                    source.fileno(),
+                    target.fileno(),
+                    count - copied,
+                    offset + copied,
+                    start + copied,
+                )
+                if not step:
+                    break
+                copied += step
+        except OSError:
+            pass
+        if copied == count:
+            target.seek(start + count)
+            return "copy_file_range"
+    if hasattr(os, "sendfile"):
+        try:
+            os.lseek(target.fileno(), start + copied, os.SEEK_SET)
+            while copied < count:
+                step = os.sendfile(target.fileno(), source.fileno(), offset + copied, count - copied)
+                if not step:
+                    break
+                copied += step
+        except OSError:
+            pass
+        if copied == count:
+            target.seek(start + count)
+            return "sendfile"
+    source.seek(offset + copied)
+    target.seek(start + copied)
+    while copied < count:
+        block = source.read(min(8 * 1024 * 1024, count - copied))
+        if not block:
+            raise ValueError(f"{Path(source.name).name}: PLY payload is truncated")
+        target.write(block)
+        copied += len(block)
+    return "read"
+
+
 def _atomic_target(target: Path) -> tuple[Path, int]:
     target.parent.mkdir(parents=True, exist_ok=True)
     handle, raw = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=target.parent)
     return Path(raw), handle
 
 
+def _empty_export_diagnostics(info: PlyInfo) -> dict[str, Any]:
+    return {
+        "path": str(info.path),
+        "source_records": 0,
+        "valid_records": 0,
+        "dropped_records": 0,
+        "repaired_optional_values": 0,
+        "invalid_core_values": 0,
+        "invalid_scales": 0,
+        "invalid_quaternions": 0,
+    }
+
+
+def export_workers(value: Any = None) -> int:
+    """Resolve the scene-export worker count.
+
+    An explicit value wins, then ``VNCCS_3D_FACTORY_EXPORT_WORKERS``, then the
+    CPU count; an unparsable environment value falls back to the CPU count
+    with a warning.  NumPy releases the GIL for the per-chunk masking,
+    gathers, and matrix products, so threads scale without copying chunks
+    between processes.
+    """
+    default = max(1, min(8, os.cpu_count() or 1))
+    if value is None:
+        configured = os.environ.get(_EXPORT_WORKERS_ENV, "").strip()
+        if not configured:
+            return default
+        try:
+            value = int(configured)
+        except ValueError:
+            LOGGER.warning(
+                "Ignoring %s=%r: not an integer; using %s export workers",
+                _EXPORT_WORKERS_ENV,
+                configured,
+                default,
+            )
+            return default
+    try:
+        workers = int(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("export worker count must be an integer") from exc
+    return max(1, min(_MAX_EXPORT_WORKERS, workers))
+
+
+def _iter_export_chunks(
+    sources: list[tuple[PlyInfo, dict[str, Any]]],
+    workers: int,
+) -> Iterator[tuple[int, np.ndarray, dict[str, int]]]:
+    """Yield prepared chunks in source order, computing them on ``workers`` threads.
+
+    At most ``2 * workers`` chunks are in flight; completed results wait in the
+    ordered queue until every earlier chunk has been consumed, so the writer
+    always receives exactly the serial sequence.
+    """
+    ranges = [
+        (index, start)
+        for index, (info, _transform) in enumerate(sources)
+        for start in range(0, info.vertex_count, _CHUNK)
+    ]
+
+    def prepare(index: int, start: int) -> tuple[np.ndarray, dict[str, int]]:
+        info, transform = sources[index]
+        # Map only this chunk so its pages are released with the chunk instead
+        # of every source staying resident until the export finishes.
+        records = np.memmap(
+            info.path,
+            mode="r",
+            dtype=info.dtype,
+            offset=info.data_offset + start * info.dtype.itemsize,
+            shape=(min(_CHUNK, info.vertex_count - start),),
+        )
+        try:
+            return _prepare_export_records(records, transform)
+        finally:
+            del records
+
+    if workers <= 1 or len(ranges) <= 1:
+        for index, start in ranges:
+            yield (index, *prepare(index, start))
+        return
+
+    pending: deque[tuple[int, Future[tuple[np.ndarray, dict[str, int]]]]] = deque()
+    executor = ThreadPoolExecutor(
+        max_workers=workers,
+        thread_name_prefix="vnccs-gaussian-export",
+    )
+    try:
+        queued = iter(ranges)
+        for index, start in queued:
+            pending.append((index, executor.submit(prepare, index, start)))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            index, future = pending.popleft()
+            transformed, chunk = future.result()
+            following = next(queued, None)
+            if following is not None:
+                pending.append((following[0], executor.submit(prepare, *following)))
+            yield index, transformed, chunk
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _patch_ply_header(
+    handle: BinaryIO,
+    reserved: int,
+    count: int,
+    dtype: np.dtype,
+    metadata: Any = None,
+) -> None:
+    """Overwrite a reserved header with the final vertex count in place."""
+    header = _ply_header(count, dtype, metadata)
+    if len(header) > reserved:
+        raise ValueError("final PLY header does not fit its reserved space")
+    if len(header) < reserved:
+        header = _ply_header(count, dtype, metadata, padding=reserved - len(header))
+    handle.seek(0)
+    handle.write(header)
+
+
 def export_scene_ply(
     sources: Iterable[tuple[str | os.PathLike[str], Any]],
     target: str | os.PathLike[str],
     *,
     metadata: dict[str, Any] | None = None,
+    workers: int | None = None,
 ) -> dict[str, Any]:
+    """Sanitize, transform, and write a scene PLY in one streaming pass.
+
+    The header is reserved for the upper bound of the vertex count (every
+    source record surviving) and patched in place once the number of records
+    that survived sanitization is known.  Output validation runs on each
+    chunk before it is written instead of re-reading the finished file.
+    Chunks are prepared on ``workers`` threads (see :func:`export_workers`)
+    and written in source order, so the output does not depend on the
+    worker count.
+    """
     entries = []
     for path, transform in sources:
-        info = inspect_ply(path)
-        normalized_transform = normalize_transform(transform)
-        diagnostics = _scan_export_source(info, normalized_transform)
-        entries.append((info, normalized_transform, diagnostics))
+        entries.append((inspect_ply(path), normalize_transform(transform)))
     if not entries:
         raise ValueError("the scene contains no Gaussian objects")
-    names = entries[0][0].dtype.names
-    descriptor = entries[0][0].dtype.descr
-    for info, _transform, _diagnostics in entries[1:]:
+    dtype = entries[0][0].dtype
+    names = dtype.names
+    descriptor = dtype.descr
+    for info, _transform in entries[1:]:
         if info.dtype.names != names or info.dtype.descr != descriptor:
             raise ValueError("scene objects use incompatible Gaussian PLY layouts")
 
-    total = sum(diagnostics["valid_records"] for _info, _transform, diagnostics in entries)
+    upper_bound = sum(info.vertex_count for info, _transform in entries)
     output = Path(target).resolve()
+    stats = _PayloadStats(dtype)
+    diagnostics = [_empty_export_diagnostics(info) for info, _transform in entries]
+
+    def require_valid_records(index: int) -> None:
+        item = diagnostics[index]
+        if item["valid_records"] <= 0:
+            raise ValueError(
+                f"{entries[index][0].path.name}: no valid Gaussian records remain "
+                f"after sanitization ({item['source_records']:,} source records)"
+            )
+
     temporary, descriptor_handle = _atomic_target(output)
     try:
-        with os.fdopen(descriptor_handle, "wb") as handle:
-            handle.write(_ply_header(total, entries[0][0].dtype, metadata))
-            for info, transform, _diagnostics in entries:
-                data = np.memmap(
-                    info.path,
-                    mode="r",
-                    dtype=info.dtype,
-                    offset=info.data_offset,
-                    shape=(info.vertex_count,),
-                )
-                for start in range(0, info.vertex_count, _CHUNK):
-                    transformed, _chunk_diagnostics = _prepare_export_records(
-                        data[start : start + _CHUNK],
-                        transform,
-                    )
-                    handle.write(transformed.tobytes())
-                del data
+        with os.fdopen(descriptor_handle, "w+b") as handle:
+            reserved = handle.write(_ply_header(upper_bound, dtype, metadata))
+            current = 0
+            with closing(_iter_export_chunks(entries, export_workers(workers))) as chunks:
+                for index, transformed, chunk in chunks:
+                    while current < index:
+                        require_valid_records(current)
+                        current += 1
+                    for key, value in chunk.items():
+                        diagnostics[index][key] += int(value)
+                    if len(transformed):
+                        stats.update(transformed)
+                        handle.write(transformed.tobytes())
+            for index in range(current, len(entries)):
+                require_valid_records(index)
+            total = stats.records
+            if total > _MAX_VERTICES:
+                raise ValueError(f"{output.name}: invalid or unsafe vertex count")
+            validation = stats.report(output)
+            _patch_ply_header(handle, reserved, total, dtype, metadata)
             handle.flush()
             os.fsync(handle.fileno())
         os.replace(temporary, output)
@@ -649,8 +982,6 @@ def export_scene_ply(
         except OSError:
             pass
         raise
-    validation = validate_ply_payload(output)
-    diagnostics = [entry[2] for entry in entries]
     dropped = sum(item["dropped_records"] for item in diagnostics)
     repaired = sum(item["repaired_optional_values"] for item in diagnostics)
     if dropped or repaired:
@@ -685,55 +1016,268 @@ def export_scene_ply(
     }
 
 
-def ply_to_splat(source: str | os.PathLike[str], target: str | os.PathLike[str]) -> dict[str, Any]:
-    validate_ply_payload(source)
+def assemble_scene_ply(
+    blocks: Iterable[tuple[str | os.PathLike[str], dict[str, Any]]],
+    target: str | os.PathLike[str],
+    *,
+    metadata: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Concatenate already exported objects into one scene PLY.
+
+    Each block is a PLY written by :func:`export_scene_ply` for a single
+    transformed object together with the result that call returned.  Only a
+    fresh header is generated; payloads are copied verbatim and validation is
+    merged from the blocks' reports, so the cost is one sequential copy.  The
+    header is reserved for :func:`rewrite_ply_header`.  The result matches
+    :func:`export_scene_ply` and adds the output ``sha256``.
+    """
+    entries = [(inspect_ply(path), report) for path, report in blocks]
+    if not entries:
+        raise ValueError("the scene contains no Gaussian objects")
+    dtype = entries[0][0].dtype
+    for info, report in entries:
+        if info.dtype.names != dtype.names or info.dtype.descr != dtype.descr:
+            raise ValueError("scene objects use incompatible Gaussian PLY layouts")
+        if int(report.get("gaussians", -1)) != info.vertex_count:
+            raise ValueError(f"{info.path.name}: export block does not match its report")
+
+    output = Path(target).resolve()
+    stats = _PayloadStats(dtype)
+    for _info, report in entries:
+        stats.absorb(report["validation"])
+    total = stats.records
+    if total > _MAX_VERTICES:
+        raise ValueError(f"{output.name}: invalid or unsafe vertex count")
+    validation = stats.report(output)
+    diagnostics = [dict(item) for _info, report in entries for item in report.get("sources", [])]
+
+    digest = hashlib.sha256()
+    temporary, descriptor_handle = _atomic_target(output)
+    try:
+        with os.fdopen(descriptor_handle, "wb") as handle:
+            header = _reserved_ply_header(total, dtype, metadata)
+            digest.update(header)
+            handle.write(header)
+            for info, _report in entries:
+                with info.path.open("rb") as source:
+                    source.seek(info.data_offset)
+                    remaining = info.vertex_count * dtype.itemsize
+                    while remaining:
+                        block = source.read(min(8 * 1024 * 1024, remaining))
+                        if not block:
+                            raise ValueError(f"{info.path.name}: PLY payload is truncated")
+                        digest.update(block)
+                        handle.write(block)
+                        remaining -= len(block)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, output)
+    except Exception:
+        try:
+            temporary.unlink()
+        except OSError:
+            pass
+        raise
+    return {
+        "path": str(output),
+        "gaussians": total,
+        "source_gaussians": sum(int(item["source_records"]) for item in diagnostics),
+        "dropped_gaussians": sum(int(item["dropped_records"]) for item in diagnostics),
+        "repaired_values": sum(int(item["repaired_optional_values"]) for item in diagnostics),
+        "objects": len(entries),
+        "format": "ply",
+        "validation": validation,
+        "sources": diagnostics,
+        "sha256": digest.hexdigest(),
+    }
+
+
+def rewrite_ply_header(
+    source: str | os.PathLike[str],
+    target: str | os.PathLike[str],
+    *,
+    metadata: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Write ``source`` to ``target`` with new scene metadata and the same payload.
+
+    The new header is padded to the source's reserved header size whenever it
+    fits, so the payload keeps its block-aligned offset and is copied in the
+    kernel (see :func:`_append_file_range`) instead of being re-exported.
+    """
     info = inspect_ply(source)
-    data = np.memmap(
-        info.path,
-        mode="r",
-        dtype=info.dtype,
-        offset=info.data_offset,
-        shape=(info.vertex_count,),
-    )
-    opacity = 1.0 / (1.0 + np.exp(-np.clip(np.asarray(data["opacity"], dtype=np.float32), -60.0, 60.0)))
-    log_scales = np.column_stack(
-        tuple(np.asarray(data[f"scale_{index}"], dtype=np.float32) for index in range(3))
-    )
+    output = Path(target).resolve()
+    if output == info.path:
+        raise ValueError(f"{output.name}: cannot rewrite a PLY header onto its own payload")
+    header = _reserved_ply_header(info.vertex_count, info.dtype, metadata, reserved=info.data_offset)
+    temporary, descriptor_handle = _atomic_target(output)
+    try:
+        with info.path.open("rb") as body, os.fdopen(descriptor_handle, "wb") as handle:
+            handle.write(header)
+            method = _append_file_range(body, handle, info.data_offset, info.vertex_count * info.dtype.itemsize)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, output)
+    except Exception:
+        try:
+            temporary.unlink()
+        except OSError:
+            pass
+        raise
+    return {
+        "path": str(output),
+        "gaussians": info.vertex_count,
+        "format": "ply",
+        "header_bytes": len(header),
+        "header_moved": len(header) != info.data_offset,
+        "copy": method,
+    }
+
+
+def splat_sort_budget(value: Any = None) -> int:
+    """Resolve the SPLAT conversion memory budget in bytes.
+
+    An explicit value (MiB) wins, then ``VNCCS_3D_FACTORY_SPLAT_SORT_MB``.
+    Scenes whose in-memory sort would exceed the budget are sorted out of core.
+    """
+    if value is None:
+        value = os.environ.get(_SPLAT_SORT_BUDGET_ENV, "").strip() or _DEFAULT_SPLAT_SORT_BUDGET_MB
+    try:
+        megabytes = int(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("SPLAT sort memory budget must be an integer number of MiB") from exc
+    return max(_MIN_SPLAT_SORT_BUDGET_MB, megabytes) * 1024 * 1024
+
+
+def _pack_splat_records(records: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return ascending sort keys and packed 32-byte SPLAT rows for ``records``."""
+    columns = GaussianColumns.from_records(records)
+    opacity = 1.0 / (1.0 + np.exp(-np.clip(columns.opacity, -60.0, 60.0)))
     # A malformed Gaussian must not overflow the sort weights or the packed
     # SPLAT payload. The bounds are deliberately much wider than useful scene
     # scales while still remaining finite in float32.
-    scales = np.exp(np.clip(log_scales, -30.0, 30.0))
-    weights = opacity * np.prod(scales, axis=1)
-    order = np.argsort(-weights, kind="stable")
+    scales = np.exp(np.clip(columns.scales, -30.0, 30.0))
+    keys = -(opacity * np.prod(scales, axis=1))
+
+    c0 = np.float32(0.28209479177387814)
+    rgb = np.clip((columns.f_dc * c0 + 0.5) * 255.0, 0, 255).astype(np.uint8)
+    alpha = np.clip(opacity[:, None] * 255.0, 0, 255).astype(np.uint8)
+    rotation = columns.rotations / np.maximum(np.linalg.norm(columns.rotations, axis=1, keepdims=True), 1e-12)
+    rotation = np.clip(rotation * 128.0 + 128.0, 0, 255).astype(np.uint8)
+    packed = np.empty((len(records), 32), dtype=np.uint8)
+    packed[:, 0:12] = np.ascontiguousarray(columns.xyz, dtype="<f4").view(np.uint8)
+    packed[:, 12:24] = scales.astype("<f4", copy=False).view(np.uint8)
+    packed[:, 24:27] = rgb
+    packed[:, 27] = alpha[:, 0]
+    packed[:, 28:32] = rotation
+    return keys, packed
+
 
+def _write_splat_sorted_in_memory(info: PlyInfo, handle: BinaryIO) -> None:
+    keys = np.empty(info.vertex_count, dtype=np.float32)
+    packed = np.empty((info.vertex_count, 32), dtype=np.uint8)
+    start = 0
+    for records in _iter_ply_records(info):
+        stop = start + len(records)
+        keys[start:stop], packed[start:stop] = _pack_splat_records(records)
+        start = stop
+    order = np.argsort(keys, kind="stable")
+    del keys
+    for start in range(0, info.vertex_count, _CHUNK):
+        handle.write(packed[order[start : start + _CHUNK]].tobytes())
+
+
+def _spill_sorted_runs(info: PlyInfo, directory: Path, run_records: int) -> list[Path]:
+    """Sort ``run_records``-sized slices of the source by key and spill each to disk."""
+    runs = []
+    first_index = 0
+    for records in _iter_ply_records(info, run_records):
+        keys, packed = _pack_splat_records(records)
+        run = np.empty(len(records), dtype=_SPLAT_RUN_DTYPE)
+        run["key"] = keys
+        run["index"] = np.arange(first_index, first_index + len(records), dtype=np.uint64)
+        run["splat"] = packed
+        del keys, packed, records
+        path = directory / f"run-{len(runs):05d}.bin"
+        run[np.argsort(run["key"], kind="stable")].tofile(path)
+        runs.append(path)
+        first_index += len(run)
+    return runs
+
+
+def _merge_sorted_runs(runs: list[Path], handle: BinaryIO, block_records: int) -> None:
+    """K-way merge spilled runs into ``handle`` in (key, source index) order.
+
+    Each step emits, from every run's buffered block, all records that do not
+    exceed the smallest block tail. Nothing still on disk can precede those
+    records, so one stable sort of the emitted batch places them exactly.
+    """
+    readers = [path.open("rb") for path in runs]
+    try:
+        buffers = [np.fromfile(reader, dtype=_SPLAT_RUN_DTYPE, count=block_records) for reader in readers]
+        while True:
+            active = [index for index, buffer in enumerate(buffers) if len(buffer)]
+            if not active:
+                return
+            limit_key, limit_index = min(
+                (buffers[index]["key"][-1], buffers[index]["index"][-1]) for index in active
+            )
+            emitted = []
+            for index in active:
+                buffer = buffers[index]
+                keys = buffer["key"]
+                take = int(
+                    np.count_nonzero(
+                        (keys < limit_key) | ((keys == limit_key) & (buffer["index"] <= limit_index))
+                    )
+                )
+                if not take:
+                    continue
+                emitted.append(buffer[:take])
+                buffers[index] = buffer[take:]
+                if not len(buffers[index]):
+                    buffers[index] = np.fromfile(readers[index], dtype=_SPLAT_RUN_DTYPE, count=block_records)
+            batch = np.concatenate(emitted)
+            handle.write(batch["splat"][np.lexsort((batch["index"], batch["key"]))].tobytes())
+    finally:
+        for reader in readers:
+            reader.close()
+
+
+def ply_to_splat(
+    source: str | os.PathLike[str],
+    target: str | os.PathLike[str],
+    *,
+    memory_budget: int | None = None,
+) -> dict[str, Any]:
+    """Convert a Gaussian PLY into the compact 32-byte SPLAT viewer format.
+
+    Records are ordered by descending ``opacity * volume`` for the viewer.
+    When the in-memory sort fits ``memory_budget`` bytes (see
+    :func:`splat_sort_budget`) the source is packed in one sequential pass
+    and permuted in RAM. Larger inputs are split into sorted runs spilled
+    next to ``target`` and k-way merged; both paths read the PLY strictly
+    front to back and produce identical bytes.
+    """
+    validate_ply_payload(source)
+    info = inspect_ply(source)
+    budget = splat_sort_budget() if memory_budget is None else max(1, int(memory_budget))
     output = Path(target).resolve()
+    external = info.vertex_count * _SPLAT_MEMORY_SORT_BYTES > budget
+    runs = 0
     temporary, descriptor_handle = _atomic_target(output)
-    c0 = np.float32(0.28209479177387814)
     try:
         with os.fdopen(descriptor_handle, "wb") as handle:
-            for start in range(0, info.vertex_count, _CHUNK):
-                indices = order[start : start + _CHUNK]
-                xyz = np.column_stack((data["x"][indices], data["y"][indices], data["z"][indices])).astype(
-                    "<f4", copy=False
-                )
-                chunk_scales = scales[indices].astype("<f4", copy=False)
-                rgb = np.column_stack(
-                    tuple(np.asarray(data[f"f_dc_{index}"][indices], dtype=np.float32) for index in range(3))
-                )
-                rgb = np.clip((rgb * c0 + 0.5) * 255.0, 0, 255).astype(np.uint8)
-                alpha = np.clip(opacity[indices, None] * 255.0, 0, 255).astype(np.uint8)
-                rgba = np.concatenate((rgb, alpha), axis=1)
-                rotation = np.column_stack(
-                    tuple(np.asarray(data[f"rot_{index}"][indices], dtype=np.float32) for index in range(4))
-                )
-                rotation /= np.maximum(np.linalg.norm(rotation, axis=1, keepdims=True), 1e-12)
-                rotation = np.clip(rotation * 128.0 + 128.0, 0, 255).astype(np.uint8)
-                packed = np.empty((len(indices), 32), dtype=np.uint8)
-                packed[:, 0:12] = xyz.view(np.uint8).reshape(-1, 12)
-                packed[:, 12:24] = chunk_scales.view(np.uint8).reshape(-1, 12)
-                packed[:, 24:28] = rgba
-                packed[:, 28:32] = rotation
-                handle.write(packed.tobytes())
+            if external:
+                # The run array, its sorted copy, and the source chunk are
+                # resident together while a run is being formed.
+                run_records = max(_CHUNK, budget // (2 * _SPLAT_RUN_DTYPE.itemsize + info.dtype.itemsize + 64))
+                with tempfile.TemporaryDirectory(prefix=f".{output.name}.sort-", dir=output.parent) as directory:
+                    spilled = _spill_sorted_runs(info, Path(directory), run_records)
+                    runs = len(spilled)
+                    block_records = max(1024, budget // (3 * _SPLAT_RUN_DTYPE.itemsize * runs))
+                    _merge_sorted_runs(spilled, handle, block_records)
+            else:
+                _write_splat_sorted_in_memory(info, handle)
             handle.flush()
             os.fsync(handle.fileno())
         os.replace(temporary, output)
@@ -743,9 +1287,46 @@ def ply_to_splat(source: str | os.PathLike[str], target: str | os.PathLike[str])
         except OSError:
             pass
         raise
-    finally:
-        del data
-    return {"path": str(output), "gaussians": info.vertex_count, "format": "splat"}
+    return {
+        "path": str(output),
+        "gaussians": info.vertex_count,
+        "format": "splat",
+        "sort": "external" if external else "memory",
+        "sort_runs": runs,
+    }
+
+
+def splat_prefix(
+    source: str | os.PathLike[str],
+    target: str | os.PathLike[str],
+    gaussians: int,
+) -> dict[str, Any]:
+    """Write the first ``gaussians`` records of a SPLAT file to ``target``.
+
+    :func:`ply_to_splat` orders records by descending opacity × volume, so a
+    prefix is the most important subset and serves as a coarse level of
+    detail.
+    """
+    input_path = Path(source).resolve()
+    available = input_path.stat().st_size // 32
+    count = int(gaussians)
+    if not 0 < count <= available:
+        raise ValueError(f"{input_path.name}: SPLAT prefix must hold 1 to {available:,} Gaussians")
+    output = Path(target).resolve()
+    temporary, descriptor_handle = _atomic_target(output)
+    try:
+        with input_path.open("rb") as body, os.fdopen(descriptor_handle, "wb") as handle:
+            method = _append_file_range(body, handle, 0, count * 32)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, output)
+    except Exception:
+        try:
+            temporary.unlink()
+        except OSError:
+            pass
+        raise
+    return {"path": str(output), "gaussians": count, "format": "splat", "copy": method}
 
 
 def export_gaussian_scene(
@@ -754,8 +1335,14 @@ def export_gaussian_scene(
     splat_target: str | os.PathLike[str] | None = None,
     *,
     metadata: dict[str, Any] | None = None,
+    workers: int | None = None,
 ) -> dict[str, Any]:
-    ply_result = export_scene_ply(sources, ply_target, metadata=metadata)
+    ply_result = export_scene_ply(
+        sources,
+        ply_target,
+        metadata=metadata,
+        workers=workers,
+    )
     result = {"ply": ply_result}
     if splat_target is not None:
         result["splat"] = ply_to_splat(ply_target, splat_target)
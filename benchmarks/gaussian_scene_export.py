@@ -0,0 +1,196 @@
+"""Benchmark VNCCS 3D Factory Gaussian scene export.
+
+Compares the streaming single-pass ``export_scene_ply`` against the previous
+scan → rewrite → re-validate implementation on synthetic scenes.  Every
+measurement runs in a fresh interpreter so peak RSS is attributable to one
+export only.
+
+    python benchmarks/gaussian_scene_export.py --sizes 1M,4M,8M --objects 4
+    python benchmarks/gaussian_scene_export.py --modes streaming --workers 1,2,4,8
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+
+ROOT = Path(__file__).resolve().parents[1]
+_FIELDS = (
+    "x", "y", "z", "nx", "ny", "nz",
+    "f_dc_0", "f_dc_1", "f_dc_2", "opacity",
+    "scale_0", "scale_1", "scale_2",
+    "rot_0", "rot_1", "rot_2", "rot_3",
+)
+
+
+def load_gaussian_scene():
+    spec = importlib.util.spec_from_file_location(
+        "vnccs_benchmark_gaussian_scene",
+        ROOT / "api" / "gaussian_scene.py",
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def parse_size(value: str) -> int:
+    text = value.strip().upper()
+    multiplier = 1
+    if text.endswith("M"):
+        multiplier, text = 1024 * 1024, text[:-1]
+    elif text.endswith("K"):
+        multiplier, text = 1024, text[:-1]
+    return int(float(text) * multiplier)
+
+
+def write_synthetic_scene(module, root: Path, total: int, objects: int, seed: int) -> list[Path]:
+    """Write ``objects`` TripoSplat-layout PLY files holding ``total`` Gaussians."""
+    dtype = np.dtype([(name, "<f4") for name in _FIELDS])
+    rng = np.random.default_rng(seed)
+    paths = []
+    per_object = [total // objects + (index < total % objects) for index in range(objects)]
+    for index, count in enumerate(per_object):
+        path = root / f"object-{index}.ply"
+        with path.open("wb") as handle:
+            handle.write(module._ply_header(count, dtype))
+            for start in range(0, count, module._CHUNK):
+                size = min(module._CHUNK, count - start)
+                records = np.zeros(size, dtype=dtype)
+                for name in _FIELDS:
+                    records[name] = rng.standard_normal(size, dtype=np.float32)
+                for name in ("scale_0", "scale_1", "scale_2"):
+                    records[name] -= 4.0
+                handle.write(records.tobytes())
+        paths.append(path)
+    return paths
+
+
+def legacy_export_scene_ply(module, sources, target, *, metadata=None) -> int:
+    """Reference three-pass exporter kept only for comparison."""
+    entries = []
+    for path, transform in sources:
+        info = module.inspect_ply(path)
+        normalized = module.normalize_transform(transform)
+        data = np.memmap(info.path, mode="r", dtype=info.dtype, offset=info.data_offset, shape=(info.vertex_count,))
+        valid = 0
+        for start in range(0, info.vertex_count, module._CHUNK):
+            _prepared, chunk = module._prepare_export_records(data[start : start + module._CHUNK], normalized)
+            valid += chunk["valid_records"]
+        del data
+        entries.append((info, normalized, valid))
+    total = sum(valid for _info, _transform, valid in entries)
+    with open(target, "wb") as handle:
+        handle.write(module._ply_header(total, entries[0][0].dtype, metadata))
+        for info, transform, _valid in entries:
+            data = np.memmap(info.path, mode="r", dtype=info.dtype, offset=info.data_offset, shape=(info.vertex_count,))
+            for start in range(0, info.vertex_count, module._CHUNK):
+                transformed, _chunk = module._prepare_export_records(data[start : start + module._CHUNK], transform)
+                handle.write(transformed.tobytes())
+            del data
+        handle.flush()
+        os.fsync(handle.fileno())
+    module.validate_ply_payload(target)
+    return total
+
+
+def peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def run_single(mode: str, scene_root: Path) -> dict:
+    module = load_gaussian_scene()
+    sources = [
+        (path, {"position": [index, 0, 0], "rotation": [0, 30 * index, 0], "scale": 1.0 + index * 0.1})
+        for index, path in enumerate(sorted(scene_root.glob("object-*.ply")))
+    ]
+    target = scene_root / f"scene-{mode}.ply"
+    baseline_rss = peak_rss_bytes()
+    started = time.perf_counter()
+    if mode == "legacy":
+        gaussians = legacy_export_scene_ply(module, sources, target, metadata={"benchmark": True})
+    else:
+        gaussians = module.export_scene_ply(sources, target, metadata={"benchmark": True})["gaussians"]
+    elapsed = time.perf_counter() - started
+    size = target.stat().st_size
+    target.unlink()
+    return {
+        "mode": mode,
+        "gaussians": int(gaussians),
+        "seconds": elapsed,
+        "peak_rss_bytes": peak_rss_bytes(),
+        "import_rss_bytes": baseline_rss,
+        "output_bytes": size,
+    }
+
+
+def measure(mode: str, scene_root: Path, workers: int | None = None) -> dict:
+    environment = dict(os.environ)
+    if workers is not None:
+        environment["VNCCS_3D_FACTORY_EXPORT_WORKERS"] = str(workers)
+    completed = subprocess.run(
+        [sys.executable, __file__, "--child", mode, str(scene_root)],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=environment,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1M,4M,8M", help="comma-separated Gaussian counts (K/M suffixes)")
+    parser.add_argument("--objects", type=int, default=4, help="objects per synthetic scene")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per mode; the fastest is reported")
+    parser.add_argument("--modes", default="legacy,streaming")
+    parser.add_argument(
+        "--workers",
+        default="1",
+        help="comma-separated export worker counts for the streaming mode",
+    )
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "SCENE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_single(args.child[0], Path(args.child[1]))))
+        return
+
+    module = load_gaussian_scene()
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    worker_counts = [int(item) for item in args.workers.split(",") if item.strip()]
+    runs_by_mode = [
+        (mode if mode == "legacy" else f"{mode}/{workers}w", mode, workers)
+        for mode in modes
+        for workers in ([None] if mode == "legacy" else worker_counts)
+    ]
+    print(f"{'gaussians':>10} {'mode':>14} {'seconds':>9} {'peak RSS MiB':>13} {'output MiB':>11}")
+    for size in (parse_size(item) for item in args.sizes.split(",")):
+        with tempfile.TemporaryDirectory(prefix="vnccs-export-bench-") as directory:
+            scene_root = Path(directory)
+            write_synthetic_scene(module, scene_root, size, max(1, args.objects), seed=size)
+            for label, mode, workers in runs_by_mode:
+                runs = [measure(mode, scene_root, workers) for _ in range(max(1, args.repeat))]
+                best = min(runs, key=lambda item: item["seconds"])
+                print(
+                    f"{size:>10,} {label:>14} {best['seconds']:>9.2f} "
+                    f"{max(item['peak_rss_bytes'] for item in runs) / 1024**2:>13.1f} "
+                    f"{best['output_bytes'] / 1024**2:>11.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
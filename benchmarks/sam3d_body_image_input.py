@@ -0,0 +1,136 @@
+"""Benchmark the image hand-off into SAM 3D Body pose reconstruction.
+
+``SAM3DBodyProcessToJson`` used to write every ComfyUI frame to a temporary
+JPEG and let ``SAM3DBodyEstimator.process_one_image`` decode it again; it now
+passes the RGB frame in memory.  This times that hand-off per image — from
+the ComfyUI IMAGE tensor to the uint8 RGB array the estimator crops from —
+for both paths, and reports how far the frame drifts from the source pixels.
+Every measurement runs in a fresh interpreter so one mode cannot warm the
+other's caches.
+
+    python benchmarks/sam3d_body_image_input.py --sizes 768x1024,1536x2048
+    python benchmarks/sam3d_body_image_input.py --device cuda --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def parse_resolution(value: str) -> tuple[int, int]:
+    width, _separator, height = value.strip().lower().partition("x")
+    return int(width), int(height)
+
+
+def legacy_handoff(image):
+    """Reference temp-JPEG round trip kept only for comparison."""
+    import cv2
+    import numpy as np
+
+    img_bgr = (image[0].cpu().numpy() * 255).astype(np.uint8)[..., ::-1].copy()
+    with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tmp:
+        cv2.imwrite(tmp.name, img_bgr)
+        tmp_path = tmp.name
+    try:
+        decoded = cv2.imread(tmp_path)
+    finally:
+        os.unlink(tmp_path)
+    return cv2.cvtColor(decoded, cv2.COLOR_BGR2RGB)
+
+
+def in_memory_handoff(image):
+    """Mirror of ``comfy_image_to_rgb_numpy``: quantize on device, copy once."""
+    import numpy as np
+    import torch
+
+    img = (image[0, ..., :3] * 255).to(torch.uint8)
+    return np.ascontiguousarray(img.cpu().numpy())
+
+
+def run_single(config: dict) -> dict:
+    import numpy as np
+    import torch
+
+    device = torch.device(config["device"])
+    generator = torch.Generator(device="cpu").manual_seed(config["seed"])
+    # Smooth gradients plus noise: closer to a photo than pure noise, which
+    # would make the JPEG path look unrealistically slow and lossy.
+    height, width = config["height"], config["width"]
+    ramp_y = torch.linspace(0.0, 1.0, height).view(height, 1, 1)
+    ramp_x = torch.linspace(0.0, 1.0, width).view(1, width, 1)
+    noise = torch.rand((height, width, 3), generator=generator) * 0.1
+    image = ((ramp_y + ramp_x) * 0.45 + noise).clamp(0.0, 1.0).unsqueeze(0).to(device)
+    reference = (image[0].cpu().numpy() * 255).astype(np.uint8)
+    handoff = legacy_handoff if config["mode"] == "tempjpeg" else in_memory_handoff
+
+    handoff(image)
+    timings = []
+    for _ in range(config["iterations"]):
+        if device.type == "cuda":
+            torch.cuda.synchronize(device)
+        started = time.perf_counter()
+        frame = handoff(image)
+        timings.append(time.perf_counter() - started)
+    difference = np.abs(frame.astype(np.int16) - reference.astype(np.int16))
+    return {
+        "mode": config["mode"],
+        "milliseconds": min(timings) * 1000.0,
+        "mean_milliseconds": sum(timings) / len(timings) * 1000.0,
+        "max_abs_difference": int(difference.max()),
+        "mean_abs_difference": float(difference.mean()),
+    }
+
+
+def measure(config: dict) -> dict:
+    completed = subprocess.run(
+        [sys.executable, __file__, "--child", json.dumps(config)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="768x1024,1536x2048", help="comma-separated WIDTHxHEIGHT frames")
+    parser.add_argument("--modes", default="tempjpeg,inmemory")
+    parser.add_argument("--iterations", type=int, default=10, help="timed hand-offs per run")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per mode; the fastest is reported")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_single(json.loads(args.child))))
+        return
+
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    print(f"{'frame':>11} {'mode':>9} {'best ms':>9} {'mean ms':>9} {'max |diff|':>11} {'mean |diff|':>12}")
+    for width, height in (parse_resolution(item) for item in args.sizes.split(",")):
+        for mode in modes:
+            config = {
+                "mode": mode,
+                "width": width,
+                "height": height,
+                "iterations": max(1, args.iterations),
+                "device": args.device,
+                "seed": width * height,
+            }
+            runs = [measure(config) for _ in range(max(1, args.repeat))]
+            best = min(runs, key=lambda item: item["milliseconds"])
+            print(
+                f"{f'{width}x{height}':>11} {mode:>9} {best['milliseconds']:>9.2f} "
+                f"{best['mean_milliseconds']:>9.2f} {best['max_abs_difference']:>11} "
+                f"{best['mean_abs_difference']:>12.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""Benchmark the SAM 3D Body software mesh renderer.
+
+Compares the vectorized z-buffer rasterizer behind ``_render_mesh_software``
+with the previous per-face ``cv2.fillConvexPoly`` painter loop on a synthetic
+sphere with MHR-like face counts.  Every measurement runs in a fresh
+interpreter so one mode cannot warm the other's caches.  The legacy mode
+needs OpenCV; the vectorized one only needs NumPy.
+
+    python benchmarks/sam3d_software_render.py --faces 18K,36K --sizes 512,1024
+    python benchmarks/sam3d_software_render.py --modes vectorized --supersample 1,2,3 --views 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_renderer() -> dict:
+    # process.py imports torch at module level; the renderer is pure NumPy,
+    # so only its functions and constants are compiled.
+    path = ROOT / "vnccs_sam3d" / "processing" / "process.py"
+    tree = ast.parse(path.read_text())
+    selected = [
+        node for node in tree.body
+        if (isinstance(node, ast.FunctionDef) and node.name in {
+            "_project_mesh_view",
+            "_shade_mesh_faces",
+            "_rasterize_faces",
+            "_render_mesh_software_batch",
+            "_render_mesh_software",
+        })
+        or (isinstance(node, (ast.Assign, ast.AugAssign)) and "_SOFTWARE_RENDER_" in ast.unparse(node))
+    ]
+    namespace = {"np": np}
+    exec(compile(ast.Module(body=selected, type_ignores=[]), str(path), "exec"), namespace)
+    return namespace
+
+
+def parse_size(value: str) -> int:
+    text = value.strip().upper()
+    multiplier = 1
+    if text.endswith("K"):
+        multiplier, text = 1024, text[:-1]
+    return int(float(text) * multiplier)
+
+
+def sphere_mesh(faces: int) -> tuple[np.ndarray, np.ndarray]:
+    """UV sphere with roughly ``faces`` triangles, wound to face the camera."""
+    rings = max(3, int(round((faces / 2) ** 0.5)))
+    theta = np.linspace(0.0, np.pi, rings + 1)
+    phi = np.linspace(0.0, 2.0 * np.pi, rings, endpoint=False)
+    vertices = np.stack([
+        np.sin(theta)[:, None] * np.cos(phi)[None],
+        np.cos(theta)[:, None] * np.ones_like(phi)[None],
+        np.sin(theta)[:, None] * np.sin(phi)[None],
+    ], axis=-1).reshape(-1, 3) * 0.5
+    row, column = np.meshgrid(np.arange(rings), np.arange(rings), indexing="ij")
+    row, column = row.ravel(), column.ravel()
+    a = row * rings + column
+    b = row * rings + (column + 1) % rings
+    c = (row + 1) * rings + column
+    d = (row + 1) * rings + (column + 1) % rings
+    triangles = np.concatenate([np.stack([a, c, b], axis=1), np.stack([b, c, d], axis=1)])
+    return vertices.astype(np.float32), triangles.astype(np.int32)
+
+
+def legacy_render(vertices, faces, cam_t, focal_length, image):
+    """Reference per-face painter loop kept only for comparison."""
+    import cv2
+
+    h, w = image.shape[:2]
+    verts = np.asarray(vertices, dtype=np.float32).copy()
+    verts[:, 1] *= -1.0
+    verts[:, 2] *= -1.0
+    verts += np.asarray(cam_t, dtype=np.float32).reshape(3)
+    z = np.maximum(verts[:, 2], 1e-4)
+    pts2d = np.stack([
+        verts[:, 0] * focal_length / z + w * 0.5,
+        verts[:, 1] * focal_length / z + h * 0.5,
+    ], axis=1)
+    out = image.astype(np.float32).copy()
+    light_dir = np.array([0.25, -0.35, 1.0], dtype=np.float32)
+    light_dir /= np.linalg.norm(light_dir) + 1e-8
+    base_color = np.array([198, 214, 220], dtype=np.float32)
+    order = np.argsort(verts[faces][:, :, 2].mean(axis=1))[::-1]
+    for idx in order:
+        tri = faces[idx]
+        tri_3d = verts[tri]
+        tri_2d = pts2d[tri]
+        if np.any(~np.isfinite(tri_2d)):
+            continue
+        normal = np.cross(tri_3d[1] - tri_3d[0], tri_3d[2] - tri_3d[0])
+        n_norm = np.linalg.norm(normal)
+        if n_norm < 1e-8:
+            continue
+        normal /= n_norm
+        if normal[2] >= 0:
+            continue
+        shade = np.clip(-float(np.dot(normal, light_dir)), 0.15, 1.0)
+        color = np.clip(base_color * (0.55 + 0.45 * shade), 0, 255).astype(np.uint8)
+        poly = np.round(tri_2d).astype(np.int32).reshape((-1, 1, 2))
+        if np.all(poly[:, 0, 0] < 0) or np.all(poly[:, 0, 0] >= w) or np.all(poly[:, 0, 1] < 0) or np.all(poly[:, 0, 1] >= h):
+            continue
+        cv2.fillConvexPoly(out, poly, color=tuple(int(c) for c in color.tolist()), lineType=cv2.LINE_AA)
+    return np.clip(out, 0, 255).astype(np.uint8)
+
+
+def run_single(config: dict) -> dict:
+    renderer = load_renderer()
+    vertices, faces = sphere_mesh(config["faces"])
+    size = config["size"]
+    views = config["views"]
+    background = np.full((size, size, 3), 32, dtype=np.uint8)
+    # Orbit the camera a little per view so batched views differ.
+    cameras = np.array([[0.05 * view, 0.0, 2.5] for view in range(views)], dtype=np.float32)
+    focal = size * 1.2
+
+    started = time.perf_counter()
+    if config["mode"] == "legacy":
+        frames = [legacy_render(vertices, faces, camera, focal, background) for camera in cameras]
+    else:
+        frames = list(renderer["_render_mesh_software_batch"](
+            np.broadcast_to(vertices, (views,) + vertices.shape),
+            faces,
+            cameras,
+            focal,
+            background,
+            supersample=config["supersample"],
+        ))
+    elapsed = time.perf_counter() - started
+    return {
+        "faces": int(len(faces)),
+        "seconds_per_view": elapsed / views,
+        "coverage": float(np.mean([(frame != 32).any(axis=-1).mean() for frame in frames])),
+    }
+
+
+def measure(config: dict) -> dict:
+    completed = subprocess.run(
+        [sys.executable, __file__, "--child", json.dumps(config)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--faces", default="18K", help="comma-separated face counts (K suffix)")
+    parser.add_argument("--sizes", default="512,1024", help="comma-separated square output sizes")
+    parser.add_argument("--modes", default="legacy,vectorized")
+    parser.add_argument("--supersample", default="2", help="comma-separated supersample factors (vectorized)")
+    parser.add_argument("--views", type=int, default=1, help="views rendered per call")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per mode; the fastest is reported")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_single(json.loads(args.child))))
+        return
+
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    factors = [int(item) for item in args.supersample.split(",") if item.strip()]
+    runs_by_mode = [
+        (mode if mode == "legacy" else f"{mode}/{factor}x", mode, factor)
+        for mode in modes
+        for factor in ([1] if mode == "legacy" else factors)
+    ]
+    print(f"{'faces':>8} {'size':>6} {'mode':>14} {'s/view':>9} {'coverage':>9}")
+    for faces in (parse_size(item) for item in args.faces.split(",")):
+        for size in (int(item) for item in args.sizes.split(",")):
+            for label, mode, factor in runs_by_mode:
+                config = {
+                    "mode": mode,
+                    "faces": faces,
+                    "size": size,
+                    "supersample": factor,
+                    "views": max(1, args.views),
+                }
+                runs = [measure(config) for _ in range(max(1, args.repeat))]
+                best = min(runs, key=lambda item: item["seconds_per_view"])
+                print(
+                    f"{best['faces']:>8,} {size:>6} {label:>14} "
+                    f"{best['seconds_per_view']:>9.3f} {best['coverage']:>9.3f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Benchmark the low-memory TripoSplat Gaussian decode at decode_memory_mb budgets.
+
+Runs the Gaussian decoder's forward pass at the token counts of the
+experimental 524K/1M Gaussian targets, once with full attention and once per
+``decode_memory_mb`` budget, applied the way a Factory decode applies it
+(``set_attention_budget``).  Every measurement runs in a fresh interpreter so
+peak memory is attributable to one configuration only; the tiled decoder
+features are compared against the full-attention features of the same
+inputs.
+
+Without ``--weights`` the decoder uses seeded random weights, which time and
+size the same as the trained ones; ``--blocks`` trims its depth for quick runs.
+
+    python benchmarks/triposplat_tiled_decode.py --gaussians 512K,1M --budgets 0,2048,512
+    python benchmarks/triposplat_tiled_decode.py --device cuda --dtype float16 --weights decoder.safetensors
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_triposplat():
+    package = ROOT / "data" / "triposplat"
+    spec = importlib.util.spec_from_file_location(
+        "vnccs_benchmark_triposplat",
+        package / "__init__.py",
+        submodule_search_locations=[str(package)],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return sys.modules[f"{spec.name}.triposplat"], sys.modules[f"{spec.name}.model"]
+
+
+def parse_size(value: str) -> int:
+    text = value.strip().upper()
+    multiplier = 1
+    if text.endswith("M"):
+        multiplier, text = 1024 * 1024, text[:-1]
+    elif text.endswith("K"):
+        multiplier, text = 1024, text[:-1]
+    return int(float(text) * multiplier)
+
+
+def peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def build_decoder(pipeline, model, config: dict):
+    import torch
+
+    device = torch.device(config["device"])
+    dtype = getattr(torch, config["dtype"])
+    if config["weights"]:
+        return pipeline.load_decoder(config["weights"], device=device, dtype=dtype)
+    torch.manual_seed(config["seed"])
+    gs_args = {**pipeline.GS_DECODER_ARGS, "num_blocks": config["blocks"]}
+    decoder = model.OctreeGaussianDecoder(pipeline.OCTREE_DECODER_ARGS, gs_args)
+    return decoder.to(device=device, dtype=dtype).eval()
+
+
+def run_single(config: dict) -> dict:
+    import torch
+
+    pipeline, model = load_triposplat()
+    device = torch.device(config["device"])
+    decoder = build_decoder(pipeline, model, config)
+    tokens = max(1, config["gaussians"] // decoder.gaussians_per_point)
+    generator = torch.Generator(device="cpu").manual_seed(config["seed"])
+    points = {"points": torch.rand((1, tokens, 3), generator=generator).to(device)}
+    latent = torch.randn((1, config["latent_tokens"], 16), generator=generator).to(device)
+    max_bytes = config["budget_mb"] * 1024**2
+    heads = decoder.gs.num_heads
+    if device.type == "cuda":
+        torch.cuda.reset_peak_memory_stats(device)
+    with torch.inference_mode():
+        decoder.set_attention_budget(max_bytes)
+        started = time.perf_counter()
+        features = decoder.gs(x=points, cond=latent)["features"]
+        if device.type == "cuda":
+            torch.cuda.synchronize(device)
+        elapsed = time.perf_counter() - started
+        # Peaks are read before the full-attention reference runs.
+        result = {
+            "gaussians": config["gaussians"],
+            "tokens": tokens,
+            "budget_mb": config["budget_mb"],
+            "tile": model.attention_query_tile(1, heads, tokens, tokens, max_bytes),
+            "seconds": elapsed,
+            "peak_rss_bytes": peak_rss_bytes(),
+            "peak_cuda_bytes": int(torch.cuda.max_memory_allocated(device)) if device.type == "cuda" else 0,
+            "max_abs_difference": 0.0,
+        }
+        if max_bytes:
+            decoder.set_attention_budget(0)
+            reference = decoder.gs(x=points, cond=latent)["features"]
+            result["max_abs_difference"] = float((features.float() - reference.float()).abs().max())
+    return result
+
+
+def measure(config: dict) -> dict:
+    completed = subprocess.run(
+        [sys.executable, __file__, "--child", json.dumps(config)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--gaussians", default="512K,1M", help="comma-separated Gaussian targets (K/M suffixes)")
+    parser.add_argument(
+        "--budgets",
+        default="0,2048,512",
+        help="comma-separated decode_memory_mb values in MiB; 0 is full attention",
+    )
+    parser.add_argument("--weights", default="", help="trained decoder safetensors; random weights by default")
+    parser.add_argument("--blocks", type=int, default=16, help="decoder blocks when using random weights")
+    parser.add_argument("--latent-tokens", type=int, default=8192)
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--dtype", default="float32")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per budget; the fastest is reported")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_single(json.loads(args.child))))
+        return
+
+    budgets = [int(item) for item in args.budgets.split(",") if item.strip()]
+    print(
+        f"{'gaussians':>10} {'tokens':>8} {'budget MiB':>11} {'tile':>7} {'seconds':>9} "
+        f"{'peak RSS MiB':>13} {'peak CUDA MiB':>14} {'max |diff|':>11}"
+    )
+    for gaussians in (parse_size(item) for item in args.gaussians.split(",")):
+        for budget in budgets:
+            config = {
+                "gaussians": gaussians,
+                "budget_mb": budget,
+                "weights": args.weights,
+                "blocks": args.blocks,
+                "latent_tokens": args.latent_tokens,
+                "device": args.device,
+                "dtype": args.dtype,
+                "seed": gaussians,
+            }
+            runs = [measure(config) for _ in range(max(1, args.repeat))]
+            best = min(runs, key=lambda item: item["seconds"])
+            print(
+                f"{gaussians:>10,} {best['tokens']:>8,} {budget or 'full':>11} {best['tile']:>7,} "
+                f"{best['seconds']:>9.2f} "
+                f"{max(item['peak_rss_bytes'] for item in runs) / 1024**2:>13.1f} "
+                f"{max(item['peak_cuda_bytes'] for item in runs) / 1024**2:>14.1f} "
+                f"{best['max_abs_difference']:>11.2e}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -294,19 +294,36 @@ class Flux2VAEEncoder(nn.Module):
         if unexpected:
             raise KeyError(f"[VAE] Unexpected keys: {unexpected}")
 
+    def moments(self, images):
+        """Return the deterministic posterior ``(mean, logvar)`` for ``images``."""
+        return self.quant_conv(self.encoder(images)).chunk(2, dim=1)
+
     def encode(self, images, deterministic: bool = True, generator: torch.Generator = None):
-        moments = self.quant_conv(self.encoder(images))
-        mean, logvar = moments.chunk(2, dim=1)
+        mean, logvar = self.moments(images)
+        return self.encode_moments(mean, logvar, deterministic=deterministic, generator=generator)
+
+    def encode_moments(self, mean, logvar, deterministic: bool = True, generator: torch.Generator = None):
         if deterministic:
             latents = mean
         else:
-            noise = torch.randn(mean.shape, dtype=mean.dtype, device=mean.device, generator=generator)
+            if isinstance(generator, (list, tuple)):
+                # One generator per batch row, so a batched encode draws the
+                # same noise as encoding each image on its own.
+                noise = torch.stack([
+                    torch.randn(mean.shape[1:], dtype=mean.dtype, device=mean.device, generator=item)
+                    for item in generator
+                ])
+            else:
+                noise = torch.randn(mean.shape, dtype=mean.dtype, device=mean.device, generator=generator)
             latents = mean + torch.exp(0.5 * logvar) * noise
         B, C, H, W = latents.shape
         latents = latents.view(B, C, H // 2, 2, W // 2, 2).permute(0, 1, 3, 5, 2, 4)
         latents = latents.reshape(B, C * 4, H // 2, W // 2)
+        # The statistics follow the latents, so cached moments can be sampled
+        # while the encoder itself stays offloaded.
         bn_mean = self.bn.running_mean.view(1, -1, 1, 1).to(latents.device, latents.dtype)
-        bn_std = torch.sqrt(self.bn.running_var.view(1, -1, 1, 1) + self.bn.eps).to(latents.device, latents.dtype)
+        bn_var = self.bn.running_var.view(1, -1, 1, 1).to(latents.device)
+        bn_std = torch.sqrt(bn_var + self.bn.eps).to(latents.dtype)
         return ((latents - bn_mean) / bn_std).to(torch.float32).flatten(2).transpose(1, 2).contiguous()
 
         return rgba
@@ -913,13 +930,33 @@ def clamp_mul(x, f):
     return x * f_t + x.detach() * (f - f_t)
 
 
-def scaled_dot_product_attention(qkv=None, q=None, k=None, v=None, kv=None):
+def attention_query_tile(batch: int, heads: int, queries: int, keys: int, max_bytes: int) -> int:
+    """Queries per tile so one tile's attention scores fit in ``max_bytes``.
+
+    Softmax is taken per query row, so splitting the queries is exact; keys
+    and values stay whole.  ``max_bytes <= 0`` disables tiling.
+    """
+    if max_bytes <= 0:
+        return queries
+    # fp32 scores plus the softmax result, per query row.
+    per_query = max(1, batch * heads * keys * 8)
+    return max(1, min(queries, int(max_bytes) // per_query))
+
+
+def scaled_dot_product_attention(qkv=None, q=None, k=None, v=None, kv=None, max_bytes: int = 0):
     if qkv is not None:
         q, k, v = qkv.unbind(dim=2)
     elif kv is not None:
         k, v = kv.unbind(dim=2)
     q, k, v = q.permute(0, 2, 1, 3), k.permute(0, 2, 1, 3), v.permute(0, 2, 1, 3)
-    return F.scaled_dot_product_attention(q, k, v).permute(0, 2, 1, 3)
+    B, H, L, _ = q.shape
+    tile = attention_query_tile(B, H, L, k.shape[2], max_bytes)
+    if tile >= L:
+        return F.scaled_dot_product_attention(q, k, v).permute(0, 2, 1, 3)
+    out = q.new_empty(B, H, L, v.shape[-1])
+    for start in range(0, L, tile):
+        out[:, :, start:start + tile] = F.scaled_dot_product_attention(q[:, :, start:start + tile], k, v)
+    return out.permute(0, 2, 1, 3)
 
 
 # ---------------------------------------------------------------------------
@@ -1047,6 +1084,9 @@ class MLP(nn.Module):
 
 
 class RopeMultiHeadAttention(nn.Module):
+    # Per-tile attention score budget in bytes; 0 runs untiled attention.
+    attention_max_bytes = 0
+
     def __init__(self, channels, num_heads, ctx_channels=None, type="self",
                  attn_mode="full", qkv_bias=True, qk_rms_norm=False, use_rope=False):
         super().__init__()
@@ -1084,11 +1124,14 @@ class RopeMultiHeadAttention(nn.Module):
         if self.qk_rms_norm:
             q = self.q_norm(q)
             k = self.k_norm(k)
-        h = scaled_dot_product_attention(q=q, k=k, v=v)
+        h = scaled_dot_product_attention(q=q, k=k, v=v, max_bytes=self.attention_max_bytes)
         return self.out(h.reshape(B, L, C))
 
 
 class MultiHeadAttention(nn.Module):
+    # Per-tile attention score budget in bytes; 0 runs untiled attention.
+    attention_max_bytes = 0
+
     def __init__(self, channels, num_heads, ctx_channels=None, type="self",
                  attn_mode="full", qkv_bias=True, qk_rms_norm=False):
         super().__init__()
@@ -1120,7 +1163,7 @@ class MultiHeadAttention(nn.Module):
                 q = self.q_rms_norm(q)
                 k = self.k_rms_norm(k)
                 qkv = torch.stack([q, k, v], dim=2)
-            h = scaled_dot_product_attention(qkv=qkv)
+            h = scaled_dot_product_attention(qkv=qkv, max_bytes=self.attention_max_bytes)
         else:
             Lkv = context.shape[1]
             q = self.to_q(x).reshape(B, L, self.num_heads, -1)
@@ -1129,9 +1172,9 @@ class MultiHeadAttention(nn.Module):
                 q = self.q_rms_norm(q)
                 k, v = kv.unbind(dim=2)
                 k = self.k_rms_norm(k)
-                h = scaled_dot_product_attention(q=q, k=k, v=v)
+                h = scaled_dot_product_attention(q=q, k=k, v=v, max_bytes=self.attention_max_bytes)
             else:
-                h = scaled_dot_product_attention(q=q, kv=kv)
+                h = scaled_dot_product_attention(q=q, kv=kv, max_bytes=self.attention_max_bytes)
         return self.to_out(h.reshape(B, L, -1))
 
 
@@ -1757,6 +1800,12 @@ class OctreeGaussianDecoder(nn.Module):
     def gaussians_per_point(self) -> int:
         return self.gs.rep_config['num_gaussians']
 
+    def set_attention_budget(self, max_bytes: int) -> None:
+        """Cap each attention tile's score matrix at ``max_bytes`` (0: untiled)."""
+        for module in self.modules():
+            if isinstance(module, (MultiHeadAttention, RopeMultiHeadAttention)):
+                module.attention_max_bytes = max(0, int(max_bytes))
+
     @torch.no_grad()
     def decode(
         self,
@@ -1764,19 +1813,24 @@ class OctreeGaussianDecoder(nn.Module):
         num_gaussians: int,
         generator: torch.Generator = None,
         callback=None,
+        attention_max_bytes: int = 0,
     ):
         from .triposplat import _build_gaussians  # local import: avoid model.py ↔ triposplat.py cycle
         num_decoder_tokens = max(1, num_gaussians // self.gaussians_per_point)
-        points_pred = OctreeProbabilityFixedlenDecoder.sample(
-            self.octree, latent,
-            num_points=num_decoder_tokens, level=self._MAX_VOXEL_LEVEL,
-            temperature=1.0, algo='systematic',
-            generator=generator,
-            callback=callback,
-        )
-        if callback is not None:
-            callback("gaussian", 0, 1)
-        pred = self.gs(x=points_pred, cond=latent)
-        if callback is not None:
-            callback("gaussian", 1, 1)
+        self.set_attention_budget(attention_max_bytes)
+        try:
+            points_pred = OctreeProbabilityFixedlenDecoder.sample(
+                self.octree, latent,
+                num_points=num_decoder_tokens, level=self._MAX_VOXEL_LEVEL,
+                temperature=1.0, algo='systematic',
+                generator=generator,
+                callback=callback,
+            )
+            if callback is not None:
+                callback("gaussian", 0, 1)
+            pred = self.gs(x=points_pred, cond=latent)
+            if callback is not None:
+                callback("gaussian", 1, 1)
+        finally:
+            self.set_attention_budget(0)
         return _build_gaussians(self.gs, points_pred, pred)[0]
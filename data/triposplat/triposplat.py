@@ -1,6 +1,9 @@
 """Validated, ComfyUI-aware TripoSplat inference runtime."""
 
 import io
+import threading
+from pathlib import Path
+from collections import OrderedDict
 import numpy as np
 import torch
 import torch.nn.functional as F
@@ -132,8 +135,20 @@ class Gaussian:
             l.append(f'rot_{i}')
         return l
 
-    def validation_report(self) -> dict:
-        tensors = {
+    # Tensors covered by validation, in staged column order.  ``features_dc``
+    # is staged in PLY order (coefficients grouped per colour channel).
+    _STAGED_TENSORS = (
+        "xyz",
+        "features_dc",
+        "opacity_logits",
+        "opacity",
+        "scaling_logits",
+        "scaling",
+        "rotation",
+    )
+
+    def _staged_sources(self) -> dict:
+        return {
             "xyz": self.get_xyz,
             "features_dc": self._features_dc,
             "opacity_logits": self._opacity,
@@ -142,11 +157,13 @@ class Gaussian:
             "scaling": self.get_scaling,
             "rotation": self._rotation,
         }
+
+    def _structure_report(self) -> dict:
+        """Check presence and row counts without touching tensor values."""
         errors = []
         counts = {}
         expected = None
-        ranges = {}
-        for name, value in tensors.items():
+        for name, value in self._staged_sources().items():
             if value is None or not isinstance(value, torch.Tensor):
                 errors.append(f"{name} is missing")
                 continue
@@ -156,35 +173,83 @@ class Gaussian:
                 expected = count
             elif count != expected:
                 errors.append(f"{name} has {count:,} rows; expected {expected:,}")
-            finite = torch.isfinite(value)
-            invalid = int((~finite).sum().item())
-            if invalid:
-                errors.append(f"{name} contains {invalid:,} NaN/Inf value(s)")
-            elif value.numel():
-                as_float = value.detach().float()
-                ranges[name] = [float(as_float.min().item()), float(as_float.max().item())]
-
         if not expected:
             errors.append("Gaussian contains no splats")
-        if self.get_scaling is not None:
-            non_positive = int((self.get_scaling <= 0).sum().item())
-            if non_positive:
-                errors.append(f"scaling contains {non_positive:,} non-positive value(s)")
-        if self._rotation is not None:
-            rotation = self._rotation.detach().float() + self.rots_bias.detach().float()[None, :]
-            norms = torch.linalg.vector_norm(rotation, dim=-1)
-            invalid_norms = int(((~torch.isfinite(norms)) | (norms <= _QUATERNION_EPSILON)).sum().item())
-            if invalid_norms:
-                errors.append(f"rotation contains {invalid_norms:,} invalid quaternion(s)")
-
         return {
             "valid": not errors,
             "gaussians": int(expected or 0),
             "errors": errors,
-            "ranges": ranges,
+            "ranges": {},
             "counts": counts,
         }
 
+    def _staged_layout(self) -> dict:
+        layout = {}
+        column = 0
+        for name, value in self._staged_sources().items():
+            width = int(np.prod(value.shape[1:], dtype=np.int64))
+            layout[name] = slice(column, column + width)
+            column += width
+        return layout
+
+    def _gather_rows(self, rows) -> torch.Tensor:
+        """One float32 ``(rows, columns)`` device tensor in staged layout."""
+        columns = []
+        for name, value in self._staged_sources().items():
+            value = value[rows].detach()
+            if name == "features_dc":
+                value = value.transpose(1, 2)
+            columns.append(value.float().reshape(value.shape[0], -1))
+        return torch.cat(columns, dim=1)
+
+    def _iter_staged(self, selections, chunk_size=_SERIALIZE_CHUNK_SIZE):
+        """Yield ``(rows, columns)`` float32 host slices for ``selections``.
+
+        Each selection (a slice or an index tensor of at most ``chunk_size``
+        rows) is gathered on the device and copied to the host on its own, so
+        host memory holds two slices rather than the model.  On CUDA the copy
+        lands in one of two pinned buffers without blocking, and the next
+        slice's copy overlaps with serializing the current one.  A yielded
+        array is only valid until the next iteration.
+        """
+        width = max(span.stop for span in self._staged_layout().values())
+        device = self.get_xyz.device
+        if device.type != "cuda":
+            for rows in selections:
+                yield self._gather_rows(rows).cpu().numpy()
+            return
+        buffers = [
+            torch.empty((chunk_size, width), dtype=torch.float32, pin_memory=True)
+            for _ in range(2)
+        ]
+        pending = None
+        for index, rows in enumerate(selections):
+            staged = self._gather_rows(rows)
+            target = buffers[index % 2][: staged.shape[0]]
+            target.copy_(staged, non_blocking=True)
+            event = torch.cuda.Event()
+            event.record(torch.cuda.current_stream(device))
+            if pending is not None:
+                pending[1].synchronize()
+                yield pending[0].numpy()
+            pending = (target, event)
+        if pending is not None:
+            pending[1].synchronize()
+            yield pending[0].numpy()
+
+    def _row_slices(self, count, chunk_size=_SERIALIZE_CHUNK_SIZE):
+        return (slice(start, min(count, start + chunk_size)) for start in range(0, count, chunk_size))
+
+    def validation_report(self) -> dict:
+        """Validate every tensor, one staged slice at a time."""
+        report = self._structure_report()
+        if not report["valid"]:
+            return report
+        stats = _GaussianStats(self._staged_layout(), self.rots_bias)
+        for columns in self._iter_staged(self._row_slices(report["gaussians"])):
+            stats.update(columns)
+        return stats.report(report)
+
     def validate(self) -> dict:
         report = self.validation_report()
         if not report["valid"]:
@@ -217,83 +282,93 @@ class Gaussian:
         rotation = _matrix_to_quat(R_mat)
         return xyz, rotation
 
+    def _checked_report(self, _validated_report=None):
+        """Return ``(report, stats)``; ``stats`` is None when already validated."""
+        if _validated_report is not None:
+            return _validated_report, None
+        report = self._structure_report()
+        if not report["valid"]:
+            raise GaussianValidationError("invalid Gaussian output: " + "; ".join(report["errors"]))
+        return report, _GaussianStats(self._staged_layout(), self.rots_bias)
+
     def _iter_ply_payload(
         self,
         transform=None,
         callback=None,
         chunk_size=_SERIALIZE_CHUNK_SIZE,
         _validated_report=None,
+        _report_out=None,
     ):
-        report = _validated_report or self.validate()
+        """Yield PLY vertex bytes, validating each slice in the same pass.
+
+        Without ``_validated_report`` a slice with invalid values raises
+        :class:`GaussianValidationError` before its bytes are yielded.  The
+        final report is stored in ``_report_out["report"]`` when given.
+        """
+        report, stats = self._checked_report(_validated_report)
         transform = self._transform(transform)
+        layout = self._staged_layout()
         names = self.construct_list_of_attributes()
-        dtype_full = [(name, "<f4") for name in names]
         count = report["gaussians"]
-        for start in range(0, count, chunk_size):
-            end = min(count, start + chunk_size)
-            xyz = self.get_xyz[start:end].detach().float().cpu().numpy()
-            rotation = (
-                self._rotation[start:end].detach().float()
-                + self.rots_bias.detach().float()[None, :]
-            ).cpu().numpy()
-            xyz, rotation = self._transformed_xyz_rot(xyz, rotation, transform)
-            arrays = (
-                xyz,
-                np.zeros_like(xyz),
-                self._features_dc[start:end]
-                .detach()
-                .float()
-                .transpose(1, 2)
-                .flatten(start_dim=1)
-                .contiguous()
-                .cpu()
-                .numpy(),
-                (
-                    self._opacity[start:end].detach().float()
-                    + self.opacity_bias_val.detach().float()
-                ).cpu().numpy(),
-                torch.log(self.get_scaling[start:end].detach().float()).cpu().numpy(),
-                rotation,
+        rots_bias = self.rots_bias.detach().float().cpu().numpy()
+        opacity_bias = float(self.opacity_bias_val.detach().float().cpu())
+        end = 0
+        for columns in self._iter_staged(self._row_slices(count, chunk_size), chunk_size):
+            rows = columns.shape[0]
+            end += rows
+            if stats is not None:
+                stats.update(columns)
+                if stats.errors:
+                    raise GaussianValidationError("invalid Gaussian output: " + "; ".join(stats.errors))
+            xyz, rotation = self._transformed_xyz_rot(
+                columns[:, layout["xyz"]],
+                columns[:, layout["rotation"]] + rots_bias[None, :],
+                transform,
             )
-            elements = np.empty(end - start, dtype=np.dtype(dtype_full))
-            column = 0
-            for array in arrays:
-                array = np.asarray(array, dtype=np.float32).reshape(end - start, -1)
-                for index in range(array.shape[1]):
-                    elements[names[column]] = array[:, index]
-                    column += 1
+            # torch's log keeps the bytes identical to the former tensor path.
+            scaling = np.ascontiguousarray(columns[:, layout["scaling"]])
+            log_scale = torch.log(torch.from_numpy(scaling)).numpy()
+            elements = np.empty((rows, len(names)), dtype="<f4")
+            elements[:, 0:3] = xyz
+            elements[:, 3:6] = 0.0
+            column = 6
+            for block in (
+                columns[:, layout["features_dc"]],
+                columns[:, layout["opacity_logits"]] + np.float32(opacity_bias),
+                log_scale,
+                rotation,
+            ):
+                elements[:, column : column + block.shape[1]] = block
+                column += block.shape[1]
             yield elements.tobytes()
             if callback is not None:
                 callback(end, count)
+        if _report_out is not None:
+            _report_out["report"] = report if stats is None else stats.report(report)
 
     def to_ply_bytes(self, transform=None, callback=None) -> bytes:
-        report = self.validate()
-        count = report["gaussians"]
+        report, _stats = self._checked_report()
         output = io.BytesIO()
-        output.write(_binary_ply_header(count, self.construct_list_of_attributes()))
-        for payload in self._iter_ply_payload(
-            transform=transform,
-            callback=callback,
-            _validated_report=report,
-        ):
+        output.write(_binary_ply_header(report["gaussians"], self.construct_list_of_attributes()))
+        for payload in self._iter_ply_payload(transform=transform, callback=callback):
             output.write(payload)
         return output.getvalue()
 
-    def _splat_arrays(self, transform=None, _validated_report=None):
-        if _validated_report is None:
-            self.validate()
-        transform = self._transform(transform)
-        xyz = self.get_xyz.detach().float().cpu().numpy()
-        rotation = (
-            self._rotation.detach().float() + self.rots_bias.detach().float()[None, :]
-        ).cpu().numpy()
-        xyz, rotation = self._transformed_xyz_rot(xyz, rotation, transform)
-        scale = self.get_scaling.detach().float().cpu().numpy()
-        opacity = self.get_opacity.detach().float().cpu().numpy()
-        f_dc = self._features_dc.detach().float().cpu().numpy()
-        rotation = _normalize_quaternions(rotation, "SPLAT rotation")
-        order = np.argsort(-opacity[:, 0] * np.prod(scale, axis=-1), kind="stable")
-        return xyz, rotation, scale, opacity, f_dc, order
+    def _splat_order(self, count, stats=None, chunk_size=_SERIALIZE_CHUNK_SIZE):
+        """Stable importance order, computed from staged slices."""
+        layout = self._staged_layout()
+        keys = np.empty(count, dtype=np.float32)
+        start = 0
+        for columns in self._iter_staged(self._row_slices(count, chunk_size), chunk_size):
+            if stats is not None:
+                stats.update(columns)
+                if stats.errors:
+                    raise GaussianValidationError("invalid Gaussian output: " + "; ".join(stats.errors))
+            opacity = columns[:, layout["opacity"]]
+            scale = columns[:, layout["scaling"]]
+            keys[start : start + len(columns)] = -opacity[:, 0] * np.prod(scale, axis=-1)
+            start += len(columns)
+        return np.argsort(keys, kind="stable")
 
     def _iter_splat_payload(
         self,
@@ -302,22 +377,42 @@ class Gaussian:
         chunk_size=_SERIALIZE_CHUNK_SIZE,
         _validated_report=None,
     ):
-        xyz, rotation, scale, opacity, f_dc, order = self._splat_arrays(
-            transform=transform,
-            _validated_report=_validated_report,
+        report, stats = self._checked_report(_validated_report)
+        transform = self._transform(transform)
+        layout = self._staged_layout()
+        count = report["gaussians"]
+        # SPLAT viewers expect the most visible splats first, so the order
+        # needs one pass over every row; it also carries the validation.
+        order = self._splat_order(count, stats, chunk_size)
+        rots_bias = self.rots_bias.detach().float().cpu().numpy()
+        device = self.get_xyz.device
+        selections = (
+            torch.from_numpy(order[start : start + chunk_size]).to(device)
+            for start in range(0, count, chunk_size)
         )
-        count = len(order)
+        features = layout["features_dc"]
+        # Staged features are channel-major; the DC term of each channel
+        # is the first coefficient in its group.
+        coefficients = (features.stop - features.start) // 3
         C0 = 0.28209479177387814
-        for start in range(0, count, chunk_size):
-            end = min(count, start + chunk_size)
-            indices = order[start:end]
-            chunk_xyz = xyz[indices].astype("<f4", copy=False)
-            chunk_scale = scale[indices].astype("<f4", copy=False)
-            rgb = np.clip((f_dc[indices, 0, :] * C0 + 0.5) * 255, 0, 255).astype(np.uint8)
-            alpha = np.clip(opacity[indices, 0:1] * 255, 0, 255).astype(np.uint8)
+        end = 0
+        for columns in self._iter_staged(selections, chunk_size):
+            rows = columns.shape[0]
+            end += rows
+            xyz, rotation = self._transformed_xyz_rot(
+                columns[:, layout["xyz"]],
+                columns[:, layout["rotation"]] + rots_bias[None, :],
+                transform,
+            )
+            rotation = _normalize_quaternions(rotation, "SPLAT rotation")
+            chunk_xyz = np.ascontiguousarray(xyz, dtype="<f4")
+            chunk_scale = np.ascontiguousarray(columns[:, layout["scaling"]], dtype="<f4")
+            f_dc = columns[:, features.start : features.stop : coefficients]
+            rgb = np.clip((f_dc * C0 + 0.5) * 255, 0, 255).astype(np.uint8)
+            alpha = np.clip(columns[:, layout["opacity"]][:, 0:1] * 255, 0, 255).astype(np.uint8)
             rgba = np.concatenate([rgb, alpha], axis=1)
-            rot_u8 = np.clip(rotation[indices] * 128 + 128, 0, 255).astype(np.uint8)
-            packed = np.empty((end - start, 32), dtype=np.uint8)
+            rot_u8 = np.clip(rotation * 128 + 128, 0, 255).astype(np.uint8)
+            packed = np.empty((rows, 32), dtype=np.uint8)
             packed[:, 0:12] = chunk_xyz.view(np.uint8).reshape(-1, 12)
             packed[:, 12:24] = chunk_scale.view(np.uint8).reshape(-1, 12)
             packed[:, 24:28] = rgba
@@ -332,17 +427,28 @@ class Gaussian:
             output.write(payload)
         return output.getvalue()
 
-    def save_ply(self, path, transform=None, callback=None, _validated_report=None):
-        report = _validated_report or self.validate()
-        count = report["gaussians"]
-        with open(path, 'wb') as handle:
-            handle.write(_binary_ply_header(count, self.construct_list_of_attributes()))
-            for payload in self._iter_ply_payload(
-                transform=transform,
-                callback=callback,
-                _validated_report=report,
-            ):
-                handle.write(payload)
+    def save_ply(self, path, transform=None, callback=None, _validated_report=None) -> dict:
+        """Write a binary PLY in one validating pass and return the report.
+
+        A partially written file is removed when validation fails.
+        """
+        report, _stats = self._checked_report(_validated_report)
+        result = {}
+        try:
+            with open(path, 'wb') as handle:
+                handle.write(_binary_ply_header(report["gaussians"], self.construct_list_of_attributes()))
+                for payload in self._iter_ply_payload(
+                    transform=transform,
+                    callback=callback,
+                    _validated_report=_validated_report,
+                    _report_out=result,
+                ):
+                    handle.write(payload)
+        except GaussianValidationError:
+            Path(path).unlink(missing_ok=True)
+            raise
+        self.last_validation_report = result["report"]
+        return result["report"]
 
     def save_splat(self, path, transform=None, callback=None, _validated_report=None):
         with open(path, 'wb') as handle:
@@ -354,6 +460,59 @@ class Gaussian:
                 handle.write(payload)
 
 
+class _GaussianStats:
+    """Accumulate :meth:`Gaussian.validation_report` results slice by slice."""
+
+    def __init__(self, layout: dict, rots_bias: torch.Tensor) -> None:
+        self.layout = layout
+        self.rots_bias = rots_bias.detach().float().cpu().numpy()
+        self.invalid = dict.fromkeys(layout, 0)
+        self.ranges = {}
+        self.non_positive = 0
+        self.invalid_norms = 0
+
+    def update(self, columns: np.ndarray) -> None:
+        for name, span in self.layout.items():
+            values = columns[:, span]
+            finite = np.isfinite(values)
+            invalid = int(values.size - np.count_nonzero(finite))
+            self.invalid[name] += invalid
+            if not invalid and values.size:
+                low, high = float(values.min()), float(values.max())
+                previous = self.ranges.get(name)
+                self.ranges[name] = (
+                    [low, high] if previous is None else [min(previous[0], low), max(previous[1], high)]
+                )
+        self.non_positive += int((columns[:, self.layout["scaling"]] <= 0).sum())
+        rotation = columns[:, self.layout["rotation"]] + self.rots_bias[None, :]
+        norms = np.linalg.norm(rotation, axis=-1)
+        self.invalid_norms += int(((~np.isfinite(norms)) | (norms <= _QUATERNION_EPSILON)).sum())
+
+    @property
+    def errors(self) -> list:
+        errors = [
+            f"{name} contains {count:,} NaN/Inf value(s)"
+            for name, count in self.invalid.items()
+            if count
+        ]
+        if self.non_positive:
+            errors.append(f"scaling contains {self.non_positive:,} non-positive value(s)")
+        if self.invalid_norms:
+            errors.append(f"rotation contains {self.invalid_norms:,} invalid quaternion(s)")
+        return errors
+
+    def report(self, structure: dict) -> dict:
+        errors = self.errors
+        return {
+            **structure,
+            "valid": not errors,
+            "errors": errors,
+            "ranges": {
+                name: values for name, values in self.ranges.items() if not self.invalid[name]
+            },
+        }
+
+
 def _binary_ply_header(num_vertices, attributes) -> bytes:
     header = "ply\nformat binary_little_endian 1.0\n"
     header += f"element vertex {num_vertices}\n"
@@ -746,15 +905,60 @@ _DINOV3_NORMALIZE = transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229,
 @torch.no_grad()
 def encode_image(image: Image.Image, dinov3: DinoV3ViT, vae_encoder: Flux2VAEEncoder,
                  generator: torch.Generator = None) -> dict:
+    return encode_images([image], dinov3, vae_encoder, generators=[generator])
+
+
+@torch.no_grad()
+def encode_images(images: list, dinov3: DinoV3ViT, vae_encoder: Flux2VAEEncoder,
+                  generators: list = None) -> dict:
+    """Encode equally sized prepared images in one batch; row i is image i.
+
+    Each image draws its VAE noise from its own generator, so a batched encode
+    matches encoding the images one at a time with the same seeds.
+    """
+    return conditioning_from_features(
+        encode_image_features(images, dinov3, vae_encoder),
+        vae_encoder,
+        generators=generators,
+    )
+
+
+@torch.no_grad()
+def encode_image_features(images: list, dinov3: DinoV3ViT, vae_encoder: Flux2VAEEncoder) -> dict:
+    """Run the deterministic part of :func:`encode_images`.
+
+    Returns layer-normed DINOv3 tokens and the Flux VAE posterior moments.
+    These depend only on the prepared image and the weights, so they can be
+    cached and reused with any seed.
+    """
+    if not images:
+        raise ValueError("at least one image is required")
+    if len({image.size for image in images}) != 1:
+        raise ValueError("batched conditioning images must share one size")
     device = next(dinov3.parameters()).device
-    img_tensor   = transforms.ToTensor()(image).unsqueeze(0).to(device=device, dtype=torch.float32)
+    to_tensor = transforms.ToTensor()
+    img_tensor   = torch.stack([to_tensor(image) for image in images]).to(device=device, dtype=torch.float32)
     img_normed   = _DINOV3_NORMALIZE(img_tensor)
     dinov3_dtype = next(dinov3.parameters()).dtype
     vae_dtype    = next(vae_encoder.parameters()).dtype
     dinov3_feat = dinov3(pixel_values=img_normed.to(dinov3_dtype))
     dinov3_feat = F.layer_norm(dinov3_feat.float(), dinov3_feat.shape[-1:])
-    vae_feat = vae_encoder.encode(img_tensor.to(vae_dtype) * 2 - 1,
-                                  deterministic=False, generator=generator)
+    vae_mean, vae_logvar = vae_encoder.moments(img_tensor.to(vae_dtype) * 2 - 1)
+    return {"feature1": dinov3_feat, "vae_mean": vae_mean, "vae_logvar": vae_logvar}
+
+
+@torch.no_grad()
+def conditioning_from_features(features: dict, vae_encoder: Flux2VAEEncoder,
+                               generators: list = None) -> dict:
+    """Draw the seeded Flux VAE sample and assemble the flow conditioning."""
+    batch = int(features["feature1"].shape[0])
+    if generators is None:
+        generators = [None] * batch
+    if len(generators) != batch:
+        raise ValueError("one generator is required per image")
+    dinov3_feat = features["feature1"]
+    vae_feat = vae_encoder.encode_moments(features["vae_mean"], features["vae_logvar"],
+                                          deterministic=False, generator=list(generators))
     # pad 5 zero tokens so feature2's token length matches feature1's (cls + 4 registers + patches)
     zero_reg = torch.zeros(vae_feat.shape[0], 5, vae_feat.shape[2],
                            dtype=vae_feat.dtype, device=vae_feat.device)
@@ -769,12 +973,89 @@ def encode_image(image: Image.Image, dinov3: DinoV3ViT, vae_encoder: Flux2VAEEnc
     return result
 
 
+def save_image_features(features: dict, path) -> None:
+    """Write one image's :func:`encode_image_features` row as safetensors."""
+    safetensors.torch.save_file(
+        {key: value.detach().to("cpu").contiguous() for key, value in features.items()},
+        str(path),
+    )
+
+
+def load_image_features(path, device=None) -> dict:
+    features = safetensors.torch.load_file(str(path), device="cpu")
+    missing = {"feature1", "vae_mean", "vae_logvar"}.difference(features)
+    if missing:
+        raise ValueError(f"cached image features are missing {', '.join(sorted(missing))}")
+    return {key: value.to(device) if device is not None else value for key, value in features.items()}
+
+
+def save_latent_checkpoint(latent: torch.Tensor, generator: torch.Generator, path) -> None:
+    """Persist a sampled latent and the RNG state its decode starts from."""
+    tensors = {"latent": latent.detach().to("cpu").contiguous()}
+    metadata = {"format": "triposplat-latent/1"}
+    if generator is not None:
+        tensors["generator_state"] = generator.get_state().contiguous()
+        metadata["generator_device"] = generator.device.type
+    safetensors.torch.save_file(tensors, str(path), metadata=metadata)
+
+
+def load_latent_checkpoint(path, device, seed: int = None) -> tuple:
+    """Return ``(latent, generator)`` restored by :func:`save_latent_checkpoint`.
+
+    RNG states are only portable within one device type.  When the
+    checkpoint's generator came from another device type, or its state does
+    not load, the generator is freshly seeded from ``seed`` instead, so the
+    decode is reproducible but not identical to the original one.
+    """
+    tensors = safetensors.torch.load_file(str(path), device="cpu")
+    if "latent" not in tensors:
+        raise ValueError("latent checkpoint has no latent tensor")
+    with safetensors.safe_open(str(path), framework="pt", device="cpu") as handle:
+        metadata = handle.metadata() or {}
+    device = torch.device(device)
+    state = tensors.get("generator_state")
+    saved_type = metadata.get("generator_device", device.type)
+    generator = torch.Generator(device=device)
+    if state is not None and saved_type == device.type:
+        try:
+            generator.set_state(state)
+            return tensors["latent"].to(device), generator
+        except (RuntimeError, ValueError) as exc:
+            problem = f"its generator state does not load ({exc})"
+    else:
+        problem = f"its generator state was saved on {saved_type}, not {device.type}"
+    if state is not None:
+        print(f"[TripoSplatPipeline] latent checkpoint {Path(path).name}: {problem}; "
+              f"reseeding the decode generator with seed={seed}")
+    if seed is not None:
+        generator.manual_seed(int(seed))
+    return tensors["latent"].to(device), generator
+
+
 @torch.no_grad()
 def sample_latent(flow_model: LatentSeqMMFlowModel, cond: dict,
                   steps: int = 50, guidance_scale: float = 7.0, shift: float = 3.0,
                   generator: torch.Generator = None,
                   show_progress: bool = False, callback=None) -> dict:
+    return sample_latents(flow_model, cond, generators=[generator], steps=steps,
+                          guidance_scale=guidance_scale, shift=shift,
+                          show_progress=show_progress, callback=callback)
+
+
+@torch.no_grad()
+def sample_latents(flow_model: LatentSeqMMFlowModel, cond: dict, generators: list,
+                   steps: int = 50, guidance_scale: float = 7.0, shift: float = 3.0,
+                   show_progress: bool = False, callback=None) -> dict:
+    """Run the CFG flow sampler for a batch of conditionings at once.
+
+    ``cond`` holds one row per image (see :func:`encode_images`). Initial noise
+    for row i is drawn from ``generators[i]`` in the same order as a single
+    :func:`sample_latent` call, so batching does not change per-image seeds.
+    """
     device = flow_model.device
+    batch = int(cond["feature1"].shape[0])
+    if len(generators) != batch:
+        raise ValueError("one generator is required per conditioning row")
     if isinstance(guidance_scale, dict):
         cfg_enabled = any(float(value) > 1 for value in guidance_scale.values())
     else:
@@ -786,11 +1067,16 @@ def sample_latent(flow_model: LatentSeqMMFlowModel, cond: dict,
         neg_cond = {k: torch.zeros_like(v) for k, v in cond.items()}
         prepared_neg_cond = {"prepared_context": flow_model.prepare_condition(neg_cond)}
         _ensure_finite_mapping("prepared negative context", prepared_neg_cond)
-    noise = {'latent': torch.randn(1, flow_model.q_token_length, flow_model.in_channels,
-                                   device=device, generator=generator)}
-    if flow_model.cam_channels is not None:
-        noise['camera'] = torch.randn(1, 1, flow_model.cam_channels,
-                                      device=device, generator=generator)
+    latents, cameras = [], []
+    for generator in generators:
+        latents.append(torch.randn(1, flow_model.q_token_length, flow_model.in_channels,
+                                   device=device, generator=generator))
+        if flow_model.cam_channels is not None:
+            cameras.append(torch.randn(1, 1, flow_model.cam_channels,
+                                       device=device, generator=generator))
+    noise = {'latent': torch.cat(latents)}
+    if cameras:
+        noise['camera'] = torch.cat(cameras)
     sampler = FlowEulerCfgSampler()
     result = sampler.sample(
         flow_model,
@@ -849,22 +1135,167 @@ class TripoSplatPipeline:
         self.flow_model  = load_flow_model  (ckpt_path,               device=self._load_device, dtype=dtypes["flow_model"])
         self.decoder     = load_decoder     (decoder_path,            device=self._load_device, dtype=dtypes["decoder"])
 
+    # Inference order of the components.  While one stage computes, the next
+    # stage's weights are copied to the device if the VRAM budget allows it.
+    _STAGES = (("rmbg",), ("dinov3", "vae_encoder"), ("flow_model",), ("decoder",))
+    # Bytes of component weights allowed to stay on the inference device
+    # between stages and jobs.  0 restores strict one-stage-at-a-time swapping.
+    vram_budget = 0
+
+    def set_vram_budget(self, budget_bytes: int) -> None:
+        self.vram_budget = max(0, int(budget_bytes or 0))
+        with self._residency_lock():
+            self._await_prefetch()
+            self._evict_to_budget(keep=())
+
+    def _residency_lock(self) -> threading.RLock:
+        # Pipelines may be assembled with __new__ by the Factory loader, so
+        # residency state is created on first use rather than in __init__.
+        lock = self.__dict__.get("_residency_lock_object")
+        if lock is None:
+            lock = self.__dict__.setdefault("_residency_lock_object", threading.RLock())
+        return lock
+
+    def _resident(self) -> "OrderedDict[str, None]":
+        """Components on the inference device, least recently used first."""
+        return self.__dict__.setdefault("_resident_components", OrderedDict())
+
+    def _component_bytes(self, name: str) -> int:
+        sizes = self.__dict__.setdefault("_component_sizes", {})
+        if name not in sizes:
+            module = getattr(self, name)
+            sizes[name] = sum(
+                tensor.numel() * tensor.element_size()
+                for tensors in (module.parameters(), module.buffers())
+                for tensor in tensors
+            )
+        return sizes[name]
+
+    def _on_device(self, name: str) -> bool:
+        device = next(getattr(self, name).parameters()).device
+        return device.type == self._device.type and (
+            device.index is None or self._device.index is None or device.index == self._device.index
+        )
+
+    def _move(self, name: str, target: torch.device) -> None:
+        if target == self._load_device and self._load_device != self._device:
+            getattr(self, name).to(device=target)
+            self._resident().pop(name, None)
+            return
+        if not self._on_device(name):
+            getattr(self, name).to(device=target)
+        self._resident()[name] = None
+        self._resident().move_to_end(name)
+
+    def _evict_to_budget(self, keep, extra: int = 0) -> bool:
+        """Offload idle components, least recently used first, until the
+        resident weights plus ``extra`` bytes fit the budget."""
+        if self._load_device == self._device:
+            return False
+        resident = self._resident()
+        for name in self._COMPONENT_NAMES:
+            if name not in resident and self._on_device(name):
+                resident[name] = None
+        used = sum(self._component_bytes(name) for name in resident) + extra
+        evicted = False
+        for name in list(resident):
+            if used <= self.vram_budget:
+                break
+            if name in keep:
+                continue
+            self._move(name, self._load_device)
+            used -= self._component_bytes(name)
+            evicted = True
+        return evicted
+
+    def _await_prefetch(self) -> None:
+        """Join an in-flight prefetch; callers hold the residency lock."""
+        pending = self.__dict__.pop("_prefetch_thread", None)
+        if pending is None:
+            return
+        thread, names = pending
+        thread.join()
+        failure = self.__dict__.pop("_prefetch_error", None)
+        if failure is not None:
+            print(f"[TripoSplatPipeline] weight prefetch failed; loading synchronously: {failure}")
+            # A failed copy can leave a module split across devices, and
+            # _on_device() only looks at its first parameter, so move every
+            # prefetched module as a whole.
+            for name in names:
+                getattr(self, name).to(device=self._device)
+        for name in names:
+            if self._on_device(name):
+                self._resident()[name] = None
+
+    def _prefetch(self, names: tuple, stream) -> None:
+        try:
+            with torch.cuda.stream(stream):
+                for name in names:
+                    getattr(self, name).to(device=self._device, non_blocking=True)
+            stream.synchronize()
+        except Exception as exc:  # the stage then loads synchronously
+            self.__dict__["_prefetch_error"] = exc
+
+    def _prefetch_next(self, active: set) -> None:
+        """Start copying the stage after ``active`` while ``active`` computes."""
+        if self._device.type != "cuda" or self._load_device == self._device or not self.vram_budget:
+            return
+        following = None
+        for index, stage in enumerate(self._STAGES):
+            if active.intersection(stage):
+                following = self._STAGES[index + 1] if index + 1 < len(self._STAGES) else None
+        if following is None:
+            return
+        names = tuple(name for name in following if not self._on_device(name))
+        if not names:
+            return
+        incoming = sum(self._component_bytes(name) for name in names)
+        idle = sum(
+            self._component_bytes(name) for name in self._resident() if name not in active
+        )
+        active_bytes = sum(self._component_bytes(name) for name in active)
+        if active_bytes + incoming > self.vram_budget:
+            return
+        if active_bytes + idle + incoming > self.vram_budget:
+            self._evict_to_budget(keep=active, extra=incoming)
+        stream = self.__dict__.get("_prefetch_stream")
+        if stream is None:
+            stream = self.__dict__.setdefault("_prefetch_stream", torch.cuda.Stream(device=self._device))
+        # Order the copies after work already queued on the compute stream,
+        # so memory released by evicted components is not reused early.
+        stream.wait_stream(torch.cuda.current_stream(self._device))
+        thread = threading.Thread(
+            target=self._prefetch,
+            args=(names, stream),
+            name="triposplat-prefetch",
+            daemon=True,
+        )
+        self.__dict__["_prefetch_thread"] = (thread, names)
+        thread.start()
+
     def _activate(self, *names: str) -> None:
         active = set(names)
         unknown = active.difference(self._COMPONENT_NAMES)
         if unknown:
             raise ValueError(f"unknown TripoSplat component(s): {', '.join(sorted(unknown))}")
-        for name in self._COMPONENT_NAMES:
-            module = getattr(self, name)
-            target = self._device if name in active else self._load_device
-            if next(module.parameters()).device != target:
-                module.to(device=target)
+        with self._residency_lock():
+            self._await_prefetch()
+            incoming = sum(
+                self._component_bytes(name) for name in active if not self._on_device(name)
+            )
+            self._evict_to_budget(keep=active, extra=incoming)
+            for name in self._COMPONENT_NAMES:
+                if name in active:
+                    self._move(name, self._device)
+            self._prefetch_next(active)
 
     def _offload(self, *names: str) -> None:
         if self._load_device == self._device:
             return
-        for name in names:
-            getattr(self, name).to(device=self._load_device)
+        with self._residency_lock():
+            self._await_prefetch()
+            if not self._evict_to_budget(keep=()):
+                return
         if self._device.type == "cuda":
             torch.cuda.empty_cache()
         elif self._device.type == "mps" and hasattr(torch, "mps"):
@@ -893,6 +1324,20 @@ class TripoSplatPipeline:
             if remove_background:
                 self._offload("rmbg")
 
+    def preprocess_images(self, images: list, **kwargs) -> list:
+        """Prepare several source images while BiRefNet stays resident."""
+        remove_background = kwargs.get("remove_background", True)
+        if remove_background:
+            self._activate("rmbg")
+        try:
+            return [
+                preprocess_image(image, self.rmbg if remove_background else None, **kwargs)
+                for image in images
+            ]
+        finally:
+            if remove_background:
+                self._offload("rmbg")
+
     def encode_image(self, image: Image.Image, generator: torch.Generator = None) -> dict:
         self._activate("dinov3", "vae_encoder")
         try:
@@ -900,6 +1345,43 @@ class TripoSplatPipeline:
         finally:
             self._offload("dinov3", "vae_encoder")
 
+    def encode_images(self, images: list, generators: list = None) -> dict:
+        self._activate("dinov3", "vae_encoder")
+        try:
+            return encode_images(images, self.dinov3, self.vae_encoder, generators=generators)
+        finally:
+            self._offload("dinov3", "vae_encoder")
+
+    def encode_image_features(self, images: list) -> list:
+        """Return the seed-independent encoder outputs, one dict per image."""
+        self._activate("dinov3", "vae_encoder")
+        try:
+            features = encode_image_features(images, self.dinov3, self.vae_encoder)
+        finally:
+            self._offload("dinov3", "vae_encoder")
+        return [
+            {key: value[index : index + 1] for key, value in features.items()}
+            for index in range(len(images))
+        ]
+
+    def conditioning_from_features(self, rows: list, generators: list = None) -> dict:
+        """Assemble seeded conditioning from per-image feature rows.
+
+        Only the Flux VAE normalization statistics are used here, so cached
+        rows skip both encoders entirely.
+        """
+        features = {
+            key: torch.cat([row[key].to(self._device) for row in rows])
+            for key in ("feature1", "vae_mean", "vae_logvar")
+        }
+        return conditioning_from_features(features, self.vae_encoder, generators=generators)
+
+    def save_image_features(self, row: dict, path) -> None:
+        save_image_features(row, path)
+
+    def load_image_features(self, path) -> dict:
+        return load_image_features(path, device=self._device)
+
     def sample_latent(self, cond: dict, steps: int = 50, guidance_scale: float = 7.0,
                       shift: float = 3.0, generator: torch.Generator = None,
                       show_progress: bool = False, callback=None) -> dict:
@@ -911,13 +1393,31 @@ class TripoSplatPipeline:
         finally:
             self._offload("flow_model")
 
+    def sample_latents(self, cond: dict, generators: list, steps: int = 50,
+                       guidance_scale: float = 7.0, shift: float = 3.0,
+                       show_progress: bool = False, callback=None) -> dict:
+        self._activate("flow_model")
+        try:
+            return sample_latents(self.flow_model, cond, generators, steps=steps,
+                                  guidance_scale=guidance_scale, shift=shift,
+                                  show_progress=show_progress, callback=callback)
+        finally:
+            self._offload("flow_model")
+
     def decode_latent(
         self,
         latent: torch.Tensor,
         num_gaussians: int = 262144,
         generator: torch.Generator = None,
         callback=None,
+        attention_max_bytes: int = 0,
     ):
+        """Decode a latent into Gaussians.
+
+        ``attention_max_bytes`` > 0 splits decoder attention into query tiles
+        whose score matrices stay under that size.  The result is the same;
+        peak memory no longer grows with the square of the decoder tokens.
+        """
         count = self._validate_num_gaussians(int(num_gaussians))
         self._activate("decoder")
         try:
@@ -926,12 +1426,42 @@ class TripoSplatPipeline:
                 num_gaussians=count,
                 generator=generator,
                 callback=callback,
+                attention_max_bytes=attention_max_bytes,
             )
-            result.last_validation_report = result.validate()
             return result
         finally:
             self._offload("decoder")
 
+    def decode_latents(self, latent: torch.Tensor, counts, generator: torch.Generator = None,
+                       callback=None, attention_max_bytes: int = 0):
+        """Decode one latent at several Gaussian counts, yielding one result each.
+
+        The decoder is moved to the device once for the whole pass.  Every
+        count restarts from the generator's state on entry, so each result
+        equals a single :meth:`decode_latent` call at that count.  Close the
+        iterator (``contextlib.closing``) when stopping early.
+        """
+        counts = [self._validate_num_gaussians(int(n)) for n in counts]
+        state = generator.get_state() if generator is not None else None
+        self._activate("decoder")
+        try:
+            for count in counts:
+                if state is not None:
+                    generator.set_state(state)
+                result = self.decoder.decode(latent, num_gaussians=count,
+                                             generator=generator, callback=callback,
+                                             attention_max_bytes=attention_max_bytes)
+                yield result
+                del result
+        finally:
+            self._offload("decoder")
+
+    def save_latent(self, latent: torch.Tensor, generator: torch.Generator, path) -> None:
+        save_latent_checkpoint(latent, generator, path)
+
+    def load_latent(self, path, seed: int = None) -> tuple:
+        return load_latent_checkpoint(path, self._device, seed=seed)
+
     _NUM_GAUSSIANS_MIN = 32768
     # 524K and 1.05M are experimental extensions above the upstream 262K
     # ceiling. The decoder is shape-dynamic, but 16K/32K decoder tokens
@@ -390,6 +390,9 @@ class VNCCS_3DFactory:
             state = _parse_state(factory_data)
             scene_id = str(state.get("scene_id") or "")
             if scene_id:
+                # Pending editor deltas must reach scene.json before its stat
+                # decides whether the node re-executes.
+                _backend().flush_scene_journals(scene_id)
                 path = _backend().resolve_scene_dir(scene_id) / "scene.json"
                 if path.is_file():
                     stat = path.stat()
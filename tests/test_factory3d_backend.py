@@ -1,9 +1,11 @@
 import ast
+import asyncio
 import importlib.util
 import io
 import json
 import sys
 import tempfile
+import threading
 import types
 import unittest
 from pathlib import Path
@@ -58,6 +60,8 @@ class FactoryBackendTests(unittest.TestCase):
         self.factory._category_roots = lambda _category: []
 
     def tearDown(self):
+        self.factory.flush_job_logs()
+        self.factory.flush_scene_journals()
         self.factory._factory_root = self.original_root
         self.factory._model_root = self.original_model_root
         self.factory._category_roots = self.original_category_roots
@@ -106,6 +110,49 @@ class FactoryBackendTests(unittest.TestCase):
         unchanged = self.factory.update_scene(scene["scene_id"], {"name": "Renamed", "objects": []})
         self.assertEqual(unchanged["revision"], 0)
 
+    def test_scenes_are_parsed_once_per_file_change_and_listed_from_the_index(self):
+        first = self.factory.create_scene("Indexed")
+        second = self.factory.create_scene("Second")
+        with mock.patch.object(
+            self.factory,
+            "_normalize_loaded_scene",
+            wraps=self.factory._normalize_loaded_scene,
+        ) as normalize:
+            self.assertEqual({item["name"] for item in self.factory.list_scenes()}, {"Indexed", "Second"})
+            self.assertEqual(normalize.call_count, 2)
+            loaded = self.factory.load_scene(first["scene_id"])
+            loaded["objects"].append({"object_id": "f" * 32})
+            self.assertEqual(self.factory.load_scene(first["scene_id"])["objects"], [])
+            self.assertEqual(normalize.call_count, 2)
+
+            # A restarted process lists from scenes/index.json without parsing.
+            self.factory._SCENE_CACHE.clear()
+            self.factory._SCENE_INDEX.update(path=None, entries={})
+            self.assertEqual(len(self.factory.list_scenes()), 2)
+            self.assertEqual(normalize.call_count, 2)
+            index = json.loads((self.root / "scenes" / "index.json").read_text(encoding="utf-8"))
+            self.assertEqual(set(index["scenes"]), {first["scene_id"], second["scene_id"]})
+
+            self.factory.update_scene(first["scene_id"], {"name": "Renamed"})
+            self.assertEqual(
+                {item["name"] for item in self.factory.list_scenes()},
+                {"Renamed", "Second"},
+            )
+            # One parse for the edit, one for the rewritten file; not Second.
+            self.assertEqual(normalize.call_count, 4)
+
+            # Files replaced behind the cache's back are detected by stat.
+            raw = json.loads(self.factory._scene_path(second["scene_id"]).read_text(encoding="utf-8"))
+            raw["name"] = "Edited on disk"
+            self.factory._atomic_json(self.factory._scene_path(second["scene_id"]), raw)
+            self.assertEqual(self.factory.load_scene(second["scene_id"])["name"], "Edited on disk")
+            self.assertEqual(normalize.call_count, 5)
+
+        self.factory.delete_scene(second["scene_id"])
+        self.assertEqual([item["name"] for item in self.factory.list_scenes()], ["Renamed"])
+        index = json.loads((self.root / "scenes" / "index.json").read_text(encoding="utf-8"))
+        self.assertEqual(set(index["scenes"]), {first["scene_id"]})
+
     def test_saved_cameras_are_normalized_and_invalidate_capture_revision(self):
         scene = self.factory.create_scene("Camera scene")
         camera_id = "c" * 32
@@ -327,6 +374,316 @@ class FactoryBackendTests(unittest.TestCase):
         scale = namespace["_safe_preprocess_scale"](1, 20_000_000, 2048)
         self.assertLessEqual(round(20_000_000 * scale), 16384)
 
+    def test_tiled_decode_attention_tiles_fit_the_memory_budget(self):
+        source = (ROOT / "data" / "triposplat" / "model.py").read_text(encoding="utf-8")
+        helper = next(
+            item
+            for item in ast.parse(source).body
+            if isinstance(item, ast.FunctionDef) and item.name == "attention_query_tile"
+        )
+        namespace = {}
+        exec(compile(ast.Module(body=[helper], type_ignores=[]), "<attention-tile>", "exec"), namespace)
+        tile = namespace["attention_query_tile"]
+
+        # 1.05M Gaussians: 32,768 decoder tokens attending to each other.
+        self.assertEqual(tile(1, 16, 32768, 32768, 0), 32768)
+        queries = tile(1, 16, 32768, 32768, 512 * 1024**2)
+        self.assertEqual(queries, 128)
+        self.assertLessEqual(queries * 16 * 32768 * 8, 512 * 1024**2)
+        self.assertEqual(tile(1, 16, 100, 64, 512 * 1024**2), 100)
+        self.assertEqual(tile(1, 16, 32768, 32768, 1), 1)
+
+        self.assertEqual(self.factory._generation_settings({})["decode_memory_mb"], 0)
+        self.assertEqual(self.factory._generation_settings({"decode_memory_mb": "2048"})["decode_memory_mb"], 2048)
+        self.assertEqual(self.factory._decode_memory_mb(1), self.factory.MIN_DECODE_MEMORY_MB)
+        self.assertEqual(self.factory._decode_memory_mb(-5), 0)
+        with self.assertRaisesRegex(ValueError, "decode_memory_mb"):
+            self.factory._decode_memory_mb("lots")
+
+    def test_gaussian_validation_accumulates_across_serialization_slices(self):
+        source = (ROOT / "data" / "triposplat" / "triposplat.py").read_text(encoding="utf-8")
+        module = ast.parse(source)
+        selected = [
+            item
+            for item in module.body
+            if (isinstance(item, ast.ClassDef) and item.name == "_GaussianStats")
+            or (
+                isinstance(item, ast.Assign)
+                and any(getattr(target, "id", "") == "_QUATERNION_EPSILON" for target in item.targets)
+            )
+        ]
+        namespace = {"np": np, "torch": types.SimpleNamespace(Tensor=object)}
+        exec(compile(ast.Module(body=selected, type_ignores=[]), "<gaussian-stats>", "exec"), namespace)
+        stats_class = namespace["_GaussianStats"]
+
+        class Bias:
+            def detach(self):
+                return self
+
+            def float(self):
+                return self
+
+            def cpu(self):
+                return self
+
+            def numpy(self):
+                return np.array([1.0, 0.0, 0.0, 0.0], dtype=np.float32)
+
+        layout = {"xyz": slice(0, 3), "scaling": slice(3, 6), "rotation": slice(6, 10)}
+        rng = np.random.default_rng(3)
+        columns = rng.standard_normal((1000, 10)).astype(np.float32)
+        columns[:, 3:6] = np.abs(columns[:, 3:6]) + 0.01
+        whole = stats_class(layout, Bias())
+        whole.update(columns)
+        sliced = stats_class(layout, Bias())
+        for start in range(0, len(columns), 300):
+            sliced.update(columns[start : start + 300])
+        structure = {"valid": True, "gaussians": 1000, "errors": [], "ranges": {}, "counts": {}}
+        self.assertEqual(sliced.report(structure), whole.report(structure))
+        self.assertEqual(
+            whole.report(structure)["ranges"]["xyz"],
+            [float(columns[:, 0:3].min()), float(columns[:, 0:3].max())],
+        )
+
+        columns[700, 1] = np.nan
+        columns[900, 4] = 0.0
+        columns[950, 6:10] = [-1.0, 0.0, 0.0, 0.0]
+        invalid = stats_class(layout, Bias())
+        invalid.update(columns[:500])
+        self.assertEqual(invalid.errors, [])
+        invalid.update(columns[500:])
+        report = invalid.report(structure)
+        self.assertFalse(report["valid"])
+        self.assertEqual(
+            report["errors"],
+            [
+                "xyz contains 1 NaN/Inf value(s)",
+                "scaling contains 1 non-positive value(s)",
+                "rotation contains 1 invalid quaternion(s)",
+            ],
+        )
+        self.assertNotIn("xyz", report["ranges"])
+        self.assertIn("scaling", report["ranges"])
+
+    @unittest.skipUnless(importlib.util.find_spec("torch"), "requires torch")
+    def test_staged_gaussian_writers_match_the_whole_model_serialization(self):
+        import torch
+
+        path = ROOT / "data" / "triposplat" / "triposplat.py"
+        module = ast.parse(path.read_text(encoding="utf-8"))
+        wanted = {
+            "Gaussian",
+            "GaussianValidationError",
+            "_GaussianStats",
+            "_binary_ply_header",
+            "_normalize_quaternions",
+            "_quat_to_matrix",
+            "_matrix_to_quat",
+        }
+        selected = [
+            item
+            for item in module.body
+            if (isinstance(item, (ast.ClassDef, ast.FunctionDef)) and item.name in wanted)
+            or (
+                isinstance(item, ast.Assign)
+                and any(
+                    getattr(target, "id", "") in {"_SERIALIZE_CHUNK_SIZE", "_QUATERNION_EPSILON"}
+                    for target in item.targets
+                )
+            )
+        ]
+        namespace = {"np": np, "io": io, "Path": Path, "torch": torch, "F": torch.nn.functional}
+        exec(compile(ast.Module(body=selected, type_ignores=[]), str(path), "exec"), namespace)
+
+        count, chunk = 1000, 96
+        generator = torch.Generator().manual_seed(11)
+        gaussian = namespace["Gaussian"]([-1.0, -1.0, -1.0, 2.0, 2.0, 2.0], device="cpu")
+        gaussian._xyz = torch.rand((count, 3), generator=generator)
+        gaussian._features_dc = torch.randn((count, 1, 3), generator=generator)
+        gaussian._opacity = torch.randn((count, 1), generator=generator)
+        gaussian._scaling = torch.randn((count, 3), generator=generator) * 0.5
+        gaussian._rotation = torch.randn((count, 4), generator=generator) * 0.3
+        transform = np.array(gaussian._DEFAULT_TRANSFORM, dtype=np.float32)
+
+        # Reference: the whole-model path the staged writers replaced.
+        names = gaussian.construct_list_of_attributes()
+        xyz = gaussian.get_xyz.float().numpy()
+        rotation = (gaussian._rotation.float() + gaussian.rots_bias.float()[None, :]).numpy()
+        xyz, rotation = gaussian._transformed_xyz_rot(xyz, rotation, transform)
+        elements = np.empty(count, dtype=np.dtype([(name, "<f4") for name in names]))
+        arrays = (
+            xyz,
+            np.zeros_like(xyz),
+            gaussian._features_dc.float().transpose(1, 2).flatten(start_dim=1).numpy(),
+            (gaussian._opacity.float() + gaussian.opacity_bias_val.float()).numpy(),
+            torch.log(gaussian.get_scaling.float()).numpy(),
+            rotation,
+        )
+        column = 0
+        for array in arrays:
+            array = np.asarray(array, dtype=np.float32).reshape(count, -1)
+            for index in range(array.shape[1]):
+                elements[names[column]] = array[:, index]
+                column += 1
+        expected_ply = namespace["_binary_ply_header"](count, names) + elements.tobytes()
+
+        scale = gaussian.get_scaling.float().numpy()
+        opacity = gaussian.get_opacity.float().numpy()
+        f_dc = gaussian._features_dc.float().numpy()
+        rotation = namespace["_normalize_quaternions"](rotation, "SPLAT rotation")
+        order = np.argsort(-opacity[:, 0] * np.prod(scale, axis=-1), kind="stable")
+        packed = np.empty((count, 32), dtype=np.uint8)
+        packed[:, 0:12] = xyz[order].astype("<f4").view(np.uint8).reshape(-1, 12)
+        packed[:, 12:24] = scale[order].astype("<f4").view(np.uint8).reshape(-1, 12)
+        packed[:, 24:27] = np.clip((f_dc[order, 0, :] * 0.28209479177387814 + 0.5) * 255, 0, 255).astype(np.uint8)
+        packed[:, 27:28] = np.clip(opacity[order, 0:1] * 255, 0, 255).astype(np.uint8)
+        packed[:, 28:32] = np.clip(rotation[order] * 128 + 128, 0, 255).astype(np.uint8)
+
+        ply_path = self.root / "staged.ply"
+        with open(ply_path, "wb") as handle:
+            handle.write(namespace["_binary_ply_header"](count, names))
+            for payload in gaussian._iter_ply_payload(chunk_size=chunk):
+                handle.write(payload)
+        splat = b"".join(gaussian._iter_splat_payload(chunk_size=chunk))
+        self.assertEqual(ply_path.read_bytes(), expected_ply)
+        self.assertEqual(splat, packed.tobytes())
+
+        report = gaussian.save_ply(self.root / "saved.ply")
+        self.assertTrue(report["valid"])
+        self.assertEqual((self.root / "saved.ply").read_bytes(), expected_ply)
+
+    def test_triposplat_components_stay_resident_within_the_vram_budget(self):
+        import collections
+        import contextlib
+        import threading
+
+        source = (ROOT / "data" / "triposplat" / "triposplat.py").read_text(encoding="utf-8")
+        tree = ast.parse(source)
+        pipeline_class = next(
+            item
+            for item in tree.body
+            if isinstance(item, ast.ClassDef) and item.name == "TripoSplatPipeline"
+        )
+        moves = []
+
+        class Device:
+            def __init__(self, kind):
+                self.type, _, index = str(kind).partition(":")
+                self.index = int(index) if index else None
+
+            def __eq__(self, other):
+                return (self.type, self.index) == (other.type, other.index)
+
+        class Weight:
+            def __init__(self, size):
+                self.device = Device("cpu")
+                self.size = size
+
+            def numel(self):
+                return self.size
+
+            def element_size(self):
+                return 1
+
+        class Component:
+            def __init__(self, name, size):
+                self.name = name
+                self.weight = Weight(size)
+
+            def parameters(self):
+                return iter([self.weight])
+
+            def buffers(self):
+                return iter([])
+
+            def to(self, device, non_blocking=False):
+                moves.append((self.name, device.type, non_blocking))
+                self.weight.device = Device("cuda:0") if device.type == "cuda" else device
+
+        class Stream:
+            def __init__(self, device=None):
+                pass
+
+            def wait_stream(self, _other):
+                pass
+
+            def synchronize(self):
+                pass
+
+        fake_torch = types.SimpleNamespace(
+            device=Device,
+            no_grad=lambda: (lambda function: function),
+            Generator=object,
+            Tensor=object,
+            cuda=types.SimpleNamespace(
+                Stream=Stream,
+                stream=lambda _stream: contextlib.nullcontext(),
+                current_stream=lambda _device=None: Stream(),
+                empty_cache=lambda: None,
+            ),
+        )
+        namespace = {
+            "torch": fake_torch,
+            "threading": threading,
+            "OrderedDict": collections.OrderedDict,
+            "Image": types.SimpleNamespace(Image=object),
+            "_CANVAS_SIZE": 1024,
+        }
+        exec(compile(ast.Module(body=[pipeline_class], type_ignores=[]), "<pipeline>", "exec"), namespace)
+        Pipeline = namespace["TripoSplatPipeline"]
+
+        def build(budget):
+            pipeline = Pipeline.__new__(Pipeline)
+            pipeline._device = Device("cuda")
+            pipeline._load_device = Device("cpu")
+            for name, size in (("rmbg", 2), ("dinov3", 3), ("vae_encoder", 1), ("flow_model", 8), ("decoder", 4)):
+                setattr(pipeline, name, Component(name, size))
+            pipeline.set_vram_budget(budget)
+            return pipeline
+
+        def run(pipeline):
+            for stage in Pipeline._STAGES:
+                pipeline._activate(*stage)
+                pipeline._offload(*stage)
+
+        strict = build(0)
+        run(strict)
+        self.assertEqual(
+            [(name, device) for name, device, _async in moves],
+            [
+                ("rmbg", "cuda"), ("rmbg", "cpu"),
+                ("dinov3", "cuda"), ("vae_encoder", "cuda"), ("dinov3", "cpu"), ("vae_encoder", "cpu"),
+                ("flow_model", "cuda"), ("flow_model", "cpu"),
+                ("decoder", "cuda"), ("decoder", "cpu"),
+            ],
+        )
+
+        moves.clear()
+        roomy = build(64)
+        run(roomy)
+        self.assertNotIn("cpu", [device for _name, device, _async in moves])
+        prefetched = {name for name, _device, non_blocking in moves if non_blocking}
+        self.assertEqual(prefetched, {"dinov3", "vae_encoder", "flow_model", "decoder"})
+        moves.clear()
+        run(roomy)
+        self.assertEqual(moves, [])
+
+        # Twelve bytes hold the flow model plus the decoder, so the earlier
+        # stages are evicted least recently used first.
+        moves.clear()
+        tight = build(12)
+        run(tight)
+        self.assertEqual(set(tight._resident()), {"flow_model", "decoder"})
+        self.assertIn(("decoder", "cuda", True), moves)
+        tight.set_vram_budget(0)
+        self.assertEqual(set(tight._resident()), set())
+
+        self.assertEqual(self.factory.vram_budget_bytes(None), 0)
+        self.assertEqual(self.factory.vram_budget_bytes("1.5"), int(1.5 * 1024**3))
+        self.assertEqual(self.factory.vram_budget_bytes(-3), 0)
+        with self.assertRaisesRegex(ValueError, "VRAM budget"):
+            self.factory.vram_budget_bytes("nan")
+
     def test_quaternion_conversion_handles_half_turns_and_rejects_zero_norm(self):
         source = (ROOT / "data" / "triposplat" / "triposplat.py").read_text(encoding="utf-8")
         tree = ast.parse(source)
@@ -450,6 +807,214 @@ class FactoryBackendTests(unittest.TestCase):
             [first_cache],
         )
 
+    def test_derived_cache_counts_hits_and_misses_per_entry_and_kind(self):
+        scene = self.factory.create_scene("Derived")
+        source_path = self.root / "model.ply"
+        self._write_valid_ply(source_path, 3)
+        imported = self.factory.import_ply_object(
+            scene["scene_id"],
+            io.BytesIO(source_path.read_bytes()),
+            "model.ply",
+        )
+        self.factory._ensure_object_splat(scene["scene_id"], imported["object_id"])
+        splat = self.factory._ensure_object_splat(scene["scene_id"], imported["object_id"])
+        first_export = self.factory._ensure_object_ply_export(scene["scene_id"], imported["object_id"])
+        second_export = self.factory._ensure_object_ply_export(scene["scene_id"], imported["object_id"])
+        self.assertEqual(first_export, second_export)
+        self.assertEqual(first_export.parent, splat.parent)
+        self.assertEqual(self.gaussian.inspect_ply(first_export).vertex_count, 3)
+
+        status = self.factory.splat_cache_status()
+        self.assertEqual(status["file_count"], 2)
+        self.assertEqual(status["kinds"]["splat"]["file_count"], 1)
+        self.assertEqual(status["kinds"]["export"]["file_count"], 1)
+        by_name = {entry["name"]: entry for entry in status["entries"]}
+        self.assertEqual(by_name[splat.name]["hits"], by_name[splat.name]["misses"])
+        self.assertEqual(by_name[splat.name]["hit_bytes"], 3 * 32)
+        self.assertEqual(by_name[first_export.name]["kind"], "export")
+        self.assertEqual(by_name[first_export.name]["hits"], 1)
+        self.assertGreaterEqual(status["hits"], 2)
+        self.assertGreater(status["hit_ratio"], 0)
+
+        self.factory.update_scene(
+            scene["scene_id"],
+            {"objects": [{"object_id": imported["object_id"], "transform": {"scale": 2}}]},
+        )
+        moved = self.factory._ensure_object_ply_export(scene["scene_id"], imported["object_id"])
+        self.assertNotEqual(moved, first_export)
+        self.assertEqual(self.factory.splat_cache_status()["kinds"]["export"]["file_count"], 2)
+
+        # A download keeps reading after a prune evicts the open export, and
+        # an export evicted before it is opened is rebuilt.
+        expected = moved.read_bytes()
+        with self.factory._open_derived_asset(
+            moved,
+            self.factory._ensure_object_ply_export,
+            scene["scene_id"],
+            imported["object_id"],
+        ) as handle:
+            with mock.patch.object(self.factory, "_splat_cache_limit_bytes", return_value=0):
+                with self.factory._SPLAT_CACHE_LOCK:
+                    self.factory._prune_splat_cache()
+            self.assertFalse(moved.exists())
+            self.assertEqual(handle.read(), expected)
+        with self.factory._open_derived_asset(
+            moved,
+            self.factory._ensure_object_ply_export,
+            scene["scene_id"],
+            imported["object_id"],
+        ) as handle:
+            self.assertEqual(handle.read(), expected)
+
+    def test_splat_levels_of_detail_are_prefixes_of_the_importance_order(self):
+        source = self.root / "model.ply"
+        self._write_valid_ply(source, 10)
+        info = self.gaussian.inspect_ply(source)
+        records = np.memmap(source, mode="r+", dtype=info.dtype, offset=info.data_offset, shape=(10,))
+        records["opacity"] = np.arange(10, dtype=np.float32)
+        records.flush()
+        del records
+
+        full = self.factory._ensure_cached_splat(source)
+        quarter = self.factory._ensure_cached_splat(source, lod=25)
+        half = self.factory._ensure_cached_splat(source, lod="50")
+        self.assertEqual(self.factory._ensure_cached_splat(source, lod=100), full)
+        self.assertEqual(quarter.stat().st_size, 3 * 32)
+        self.assertEqual(half.stat().st_size, 5 * 32)
+        self.assertEqual(half.read_bytes(), full.read_bytes()[: 5 * 32])
+        self.assertEqual(quarter.read_bytes(), full.read_bytes()[: 3 * 32])
+        # The most opaque Gaussian leads the coarse level.
+        self.assertEqual(quarter.read_bytes()[27], max(full.read_bytes()[27::32]))
+        self.assertEqual(self.factory._ensure_cached_splat(source, lod=25), quarter)
+        # A cached level is served even after the full SPLAT was pruned.
+        full.unlink()
+        with mock.patch.object(self.factory, "ply_to_splat", side_effect=AssertionError("rebuilt")):
+            self.assertEqual(self.factory._ensure_cached_splat(source, lod=25), quarter)
+        self.assertFalse(full.exists())
+        for invalid in (0, 33, "coarse"):
+            with self.assertRaisesRegex(ValueError, "level of detail"):
+                self.factory._ensure_cached_splat(source, lod=invalid)
+
+    def test_object_assets_have_content_etags_and_byte_range_parsing(self):
+        scene = self.factory.create_scene("Ranges")
+        source_path = self.root / "model.ply"
+        self._write_valid_ply(source_path, 4)
+        object_id = self.factory.import_ply_object(
+            scene["scene_id"],
+            io.BytesIO(source_path.read_bytes()),
+            "model.ply",
+        )["object_id"]
+        ply, ply_etag = self.factory._object_asset(scene["scene_id"], object_id, "ply")
+        digest = self.factory._sha256_file(ply)
+        splat, splat_etag = self.factory._object_asset(scene["scene_id"], object_id, "splat", 50)
+        self.assertEqual(ply_etag, f'"{digest}"')
+        self.assertEqual(splat_etag, f'"v1-{digest}-splat-50"')
+        self.assertEqual(splat.stat().st_size, 2 * 32)
+        with self.assertRaises(FileNotFoundError):
+            self.factory._object_asset(scene["scene_id"], object_id, "mesh")
+        # Revalidating answers from the PLY digest without building a SPLAT.
+        with mock.patch.object(self.factory, "_ensure_cached_splat", side_effect=AssertionError("built")):
+            etag = f'"v1-{digest}-splat-25"'
+            self.assertEqual(
+                self.factory._object_asset(scene["scene_id"], object_id, "splat", 25, etag),
+                (None, etag),
+            )
+        thumbnail, thumbnail_etag = self.factory._object_asset(scene["scene_id"], object_id, "thumbnail")
+        self.assertEqual(thumbnail_etag, f'"{self.factory._sha256_file(thumbnail)}"')
+        self.assertIsNone(
+            self.factory._object_asset(scene["scene_id"], object_id, "thumbnail", if_none_match=thumbnail_etag)[0]
+        )
+
+        self.assertTrue(self.factory._etag_matches(f'W/{ply_etag}, "other"', ply_etag))
+        self.assertTrue(self.factory._etag_matches("*", ply_etag))
+        self.assertFalse(self.factory._etag_matches('"other"', ply_etag))
+
+        parse = self.factory._parse_byte_range
+        self.assertEqual(parse("bytes=0-31", 100), (0, 31))
+        self.assertEqual(parse("bytes=32-", 100), (32, 99))
+        self.assertEqual(parse("bytes=-10", 100), (90, 99))
+        self.assertEqual(parse("bytes=90-500", 100), (90, 99))
+        for ignored in (None, "", "items=0-1", "bytes=0-1,4-5", "bytes=5-1", "bytes=a-b"):
+            self.assertIsNone(parse(ignored, 100))
+        for unsatisfiable in ("bytes=100-", "bytes=-0"):
+            with self.assertRaisesRegex(ValueError, "not satisfiable"):
+                parse(unsatisfiable, 100)
+
+    def test_asset_streams_read_through_the_factory_io_pool(self):
+        path = self.root / "asset.splat"
+        path.write_bytes(bytes(range(200)))
+        calls = []
+        run_blocking = self.factory._run_blocking
+
+        async def tracked(function, *args, **kwargs):
+            calls.append(function.__name__)
+            return await run_blocking(function, *args, **kwargs)
+
+        class Response:
+            def __init__(self, status=200, headers=None):
+                self.status = status
+                self.headers = dict(headers or {})
+                self.body = b""
+
+            async def prepare(self, request):
+                pass
+
+            async def write(self, chunk):
+                self.body += chunk
+
+            async def write_eof(self):
+                pass
+
+        web = types.SimpleNamespace(Response=Response, StreamResponse=Response)
+        request = types.SimpleNamespace(method="GET", headers={"Range": "bytes=10-149"})
+        with mock.patch.object(self.factory, "_run_blocking", tracked), mock.patch.object(
+            self.factory, "ASSET_STREAM_CHUNK_BYTES", 64
+        ), mock.patch.object(asyncio, "to_thread", side_effect=AssertionError("default executor")):
+            response = asyncio.run(self.factory._stream_asset(web, request, path, etag='"asset"'))
+        self.assertEqual(response.status, 206)
+        self.assertEqual(response.headers["Content-Range"], "bytes 10-149/200")
+        self.assertEqual(response.body, bytes(range(10, 150)))
+        self.assertEqual(calls, ["_open_sized", "seek", "read", "read", "read"])
+
+    def test_file_digests_persist_across_restarts_with_lru_eviction(self):
+        first = self.root / "first.ply"
+        second = self.root / "second.ply"
+        self._write_valid_ply(first, 2)
+        self._write_valid_ply(second, 3)
+        digest = self.factory._verified_ply_sha256(first)
+        self.assertEqual(digest, self.factory._sha256_file(first))
+        self.assertTrue(self.factory._file_hash_index_path().is_file())
+
+        # A new process starts with an empty memory cache and no connection.
+        self.factory._PLY_HASH_CACHE.clear()
+        self.factory._FILE_HASH_INDEX.update(path=None, connection=None, writes=0)
+        with mock.patch.object(self.factory, "_sha256_file", side_effect=AssertionError("rehashed")):
+            self.assertEqual(self.factory._verified_ply_sha256(first), digest)
+            self.assertEqual(self.factory._indexed_sha256_file(first), digest)
+
+        with mock.patch.object(self.factory, "FILE_HASH_MEMORY_ENTRIES", 1):
+            self.factory._indexed_sha256_file(second)
+            self.assertEqual(len(self.factory._PLY_HASH_CACHE), 1)
+            self.assertIn(self.factory._ply_file_identity(second), self.factory._PLY_HASH_CACHE)
+
+        self._write_valid_ply(first, 5)
+        self.assertEqual(self.factory._indexed_sha256_file(first), self.factory._sha256_file(first))
+        self.assertNotEqual(self.factory._indexed_sha256_file(first), digest)
+
+        with mock.patch.object(self.factory, "FILE_HASH_INDEX_ENTRIES", 1):
+            self.factory._FILE_HASH_INDEX["writes"] = 0
+            self.factory._remember_ply_sha256(second, self.factory._sha256_file(second))
+            rows = self.factory._FILE_HASH_INDEX["connection"].execute(
+                "SELECT COUNT(*) FROM file_sha256"
+            ).fetchone()[0]
+        self.assertEqual(rows, 1)
+
+        self.factory._FILE_HASH_INDEX["connection"].close()
+        self.factory._FILE_HASH_INDEX.update(path=None, connection=None, writes=0)
+        self.factory._file_hash_index_path().write_bytes(b"not a database" * 512)
+        self.factory._PLY_HASH_CACHE.clear()
+        self.assertEqual(self.factory._indexed_sha256_file(second), self.factory._sha256_file(second))
+
     def test_splat_cache_limit_is_persisted_and_cache_can_be_cleared(self):
         initial = self.factory.splat_cache_status()
         self.assertEqual(initial["limit_gb"], 32)
@@ -539,6 +1104,8 @@ class FactoryBackendTests(unittest.TestCase):
         self.factory._atomic_json(self.factory._scene_path(scene["scene_id"]), scene)
 
         migrated = self.factory.load_scene(scene["scene_id"])
+        stored = json.loads(self.factory._scene_path(scene["scene_id"]).read_text(encoding="utf-8"))
+        self.assertEqual(stored, migrated)
         item = migrated["objects"][0]
         self.assertNotIn("splat", item["files"])
         self.assertNotIn("splat_sha256", item["checksums"])
@@ -551,6 +1118,305 @@ class FactoryBackendTests(unittest.TestCase):
         self.assertTrue(cached.is_file())
         self.assertEqual(cached.stat().st_size, 2 * 32)
 
+    def test_multi_image_generation_batches_encoding_and_streams_objects(self):
+        scene = self.factory.create_scene("Turnaround")
+        calls = []
+        test = self
+
+        class FakeGaussian:
+            def __init__(self, count):
+                self.get_xyz = np.zeros((count, 3), dtype=np.float32)
+
+            def save_ply(self, path, callback=None):
+                test._write_valid_ply(Path(path), self.get_xyz.shape[0])
+                return {"valid": True, "gaussians": self.get_xyz.shape[0], "ranges": {}}
+
+        class FakePipeline:
+            _device = types.SimpleNamespace(type="cpu")
+            decoder = types.SimpleNamespace(gaussians_per_point=32)
+
+            def preprocess_images(self, images, **_kwargs):
+                calls.append(("preprocess", len(images)))
+                return [Image.new("RGB", (32, 32)) for _ in images]
+
+            def encode_image_features(self, images):
+                calls.append(("encode", len(images)))
+                return [{"feature1": np.zeros((1, 5, 2)), "vae_mean": np.zeros((1, 4, 2))} for _ in images]
+
+            def save_image_features(self, row, path):
+                with open(path, "wb") as handle:
+                    np.savez(handle, **row)
+
+            def load_image_features(self, path):
+                with np.load(path) as stored:
+                    return dict(stored)
+
+            def conditioning_from_features(self, rows, generators=None):
+                calls.append(("condition", [item.seed for item in generators]))
+                return {
+                    "feature1": np.concatenate([row["feature1"] for row in rows]),
+                    "feature2": np.concatenate([row["feature1"] for row in rows]),
+                }
+
+            def save_latent(self, latent, generator, path):
+                Path(path).write_bytes(b"latent")
+
+            def sample_latents(self, cond, generators, steps, guidance_scale, shift, show_progress, callback):
+                calls.append(("sample", len(generators)))
+                callback(steps, steps)
+                return {"latent": np.arange(len(generators))[:, None]}
+
+            def decode_latent(self, latent, num_gaussians, generator, callback, attention_max_bytes=0):
+                calls.append(("decode", generator.seed, len(job.get("objects", []))))
+                return FakeGaussian(2)
+
+        class FakeGenerator:
+            def __init__(self, device=None):
+                self.seed = None
+
+            def manual_seed(self, seed):
+                self.seed = seed
+                return self
+
+        fake_torch = types.ModuleType("torch")
+        fake_torch.Generator = FakeGenerator
+        fake_torch.cuda = types.SimpleNamespace(is_available=lambda: False)
+
+        def png(color):
+            buffer = io.BytesIO()
+            Image.new("RGB", (24, 24), color).save(buffer, format="PNG")
+            return buffer.getvalue()
+
+        sources = [
+            (png(color), self.factory._new_id(), f"View {index}")
+            for index, color in enumerate(("red", "green", "blue"))
+        ]
+        settings = self.factory._generation_settings({"num_gaussians": "32768", "seed": "7"})
+        job = self.factory._new_job("generation", scene["scene_id"])
+        with mock.patch.dict(sys.modules, {"torch": fake_torch}), \
+                mock.patch.object(self.factory, "_pipeline_for_job", return_value=FakePipeline()), \
+                mock.patch.dict("os.environ", {"VNCCS_3D_FACTORY_GENERATION_BATCH": "2"}):
+            result = self.factory._generate_objects(job, sources, settings)
+
+        self.assertEqual(
+            calls,
+            [
+                ("preprocess", 2), ("encode", 2), ("condition", [7, 8]), ("sample", 2),
+                ("decode", 7, 0), ("decode", 8, 1),
+                ("preprocess", 1), ("encode", 1), ("condition", [9]), ("sample", 1),
+                ("decode", 9, 2),
+            ],
+        )
+        object_ids = [object_id for _bytes, object_id, _name in sources]
+        self.assertEqual(result["object_ids"], object_ids)
+        self.assertEqual(result["object_id"], object_ids[0])
+        self.assertEqual([item["object_id"] for item in job["objects"]], object_ids)
+        stored = self.factory.load_scene(scene["scene_id"])
+        self.assertEqual([item["seed"] for item in stored["objects"]], [7, 8, 9])
+        self.assertEqual([item["name"] for item in stored["objects"]], ["View 0", "View 1", "View 2"])
+        self.assertLessEqual(max(entry["progress"] for entry in job["logs"]), 98.0)
+        self.assertEqual(self.factory._INFERENCE_QUEUE, self.factory.deque())
+
+        # Regenerating the same references with new seeds reuses the cached
+        # prepared images and encoder features; only seeded work reruns.
+        calls.clear()
+        regenerated = [(image_bytes, self.factory._new_id(), name) for image_bytes, _object_id, name in sources]
+        settings = self.factory._generation_settings({"num_gaussians": "32768", "seed": "20"})
+        job = self.factory._new_job("generation", scene["scene_id"])
+        with mock.patch.dict(sys.modules, {"torch": fake_torch}), \
+                mock.patch.object(self.factory, "_pipeline_for_job", return_value=FakePipeline()), \
+                mock.patch.dict("os.environ", {"VNCCS_3D_FACTORY_GENERATION_BATCH": "2"}):
+            self.factory._generate_objects(job, regenerated, settings)
+        self.assertEqual(
+            calls,
+            [
+                ("condition", [20, 21]), ("sample", 2), ("decode", 20, 0), ("decode", 21, 1),
+                ("condition", [22]), ("sample", 1), ("decode", 22, 2),
+            ],
+        )
+        messages = [entry["message"] for entry in job["logs"]]
+        self.assertIn("[1–2/3] Reused cached prepared images", messages)
+        self.assertIn("[3/3] Reused cached image conditioning", messages)
+        usage = self.factory.splat_cache_status()["kinds"]
+        self.assertEqual((usage["prepared"]["file_count"], usage["prepared"]["hits"]), (3, 3))
+        self.assertEqual((usage["conditioning"]["file_count"], usage["conditioning"]["hits"]), (3, 3))
+
+        self.assertEqual(self.factory.generation_batch_size(0), 1)
+        self.assertEqual(self.factory.generation_batch_size(99), self.factory.MAX_GENERATION_BATCH)
+        with self.assertRaisesRegex(ValueError, "batch size"):
+            self.factory.generation_batch_size("many")
+
+    def test_redensify_decodes_the_stored_latent_and_swaps_densities(self):
+        scene = self.factory.create_scene("Densities")
+        calls = []
+        test = self
+
+        class FakeGaussian:
+            def __init__(self, count):
+                self.get_xyz = np.zeros((count // 16384, 3), dtype=np.float32)
+
+            def save_ply(self, path, callback=None):
+                test._write_valid_ply(Path(path), self.get_xyz.shape[0])
+                return {"valid": True, "gaussians": self.get_xyz.shape[0], "ranges": {}}
+
+        class FakeGenerator:
+            def __init__(self, device=None):
+                self.seed = None
+
+            def manual_seed(self, seed):
+                self.seed = seed
+                return self
+
+        class FakePipeline:
+            _device = types.SimpleNamespace(type="cpu")
+            decoder = types.SimpleNamespace(gaussians_per_point=32)
+
+            def preprocess_images(self, images, **_kwargs):
+                return [Image.new("RGB", (32, 32)) for _ in images]
+
+            def encode_image_features(self, images):
+                return [{"feature1": np.zeros((1, 5, 2))} for _ in images]
+
+            def save_image_features(self, row, path):
+                with open(path, "wb") as handle:
+                    np.savez(handle, **row)
+
+            def conditioning_from_features(self, rows, generators=None):
+                return {"feature1": np.zeros((1, 5, 2)), "feature2": np.zeros((1, 5, 2))}
+
+            def sample_latents(self, cond, generators, **_kwargs):
+                calls.append("sample")
+                return {"latent": np.zeros((1, 1))}
+
+            def save_latent(self, latent, generator, path):
+                Path(path).write_text(f"seed {generator.seed}", encoding="utf-8")
+
+            def load_latent(self, path, seed=None):
+                calls.append(("load", Path(path).read_text(encoding="utf-8"), seed))
+                return np.zeros((1, 1)), FakeGenerator()
+
+            def decode_latent(self, latent, num_gaussians, generator, callback, attention_max_bytes=0):
+                return FakeGaussian(num_gaussians)
+
+            def decode_latents(self, latent, counts, generator=None, callback=None, attention_max_bytes=0):
+                calls.append(("decode", list(counts), attention_max_bytes))
+                for count in counts:
+                    callback("octree", 1, 1)
+                    yield FakeGaussian(count)
+
+        fake_torch = types.ModuleType("torch")
+        fake_torch.Generator = FakeGenerator
+        fake_torch.cuda = types.SimpleNamespace(is_available=lambda: False)
+        buffer = io.BytesIO()
+        Image.new("RGB", (24, 24), "red").save(buffer, format="PNG")
+        object_id = self.factory._new_id()
+        settings = self.factory._generation_settings({"num_gaussians": "32768", "seed": "5"})
+        with mock.patch.dict(sys.modules, {"torch": fake_torch}), \
+                mock.patch.object(self.factory, "_pipeline_for_job", return_value=FakePipeline()):
+            self.factory._generate_objects(
+                self.factory._new_job("generation", scene["scene_id"]),
+                [(buffer.getvalue(), object_id, "Chair")],
+                settings,
+            )
+            original = self.factory._object_by_id(self.factory.load_scene(scene["scene_id"]), object_id)
+            calls.clear()
+            staged_link = self.factory._staged_link
+            lock_free = []
+
+            def probe_lock():
+                acquired = self.factory._STATE_LOCK.acquire(timeout=1)
+                lock_free.append(acquired)
+                if acquired:
+                    self.factory._STATE_LOCK.release()
+
+            def probed_link(source, target):
+                # Copies of large PLYs must not hold the global state lock.
+                probe = threading.Thread(target=probe_lock)
+                probe.start()
+                probe.join()
+                return staged_link(source, target)
+
+            # A filesystem without hard links falls back to copying.
+            with mock.patch.object(self.factory, "_staged_link", probed_link), \
+                    mock.patch.object(self.factory.os, "link", side_effect=OSError("no links")):
+                result = self.factory._redensify_object(
+                    self.factory._new_job("redensify", scene["scene_id"]),
+                    scene["scene_id"],
+                    object_id,
+                    self.factory._redensify_counts([131072, 262144, 131072]),
+                    decode_memory_mb=512,
+                )
+
+        self.assertEqual(lock_free, [True, True])
+        self.assertEqual(calls, [("load", "seed 5", 5), ("decode", [131072, 262144], 512 * 1024**2)])
+        self.assertEqual(result["densities"], [32768, 131072, 262144])
+        stored = self.factory.load_scene(scene["scene_id"])
+        item = self.factory._object_by_id(stored, object_id)
+        ply = self.factory._object_file(scene["scene_id"], item, "ply")
+        self.assertEqual((item["gaussians"], item["settings"]["num_gaussians"]), (8, 131072))
+        self.assertEqual(self.gaussian.inspect_ply(ply).vertex_count, 8)
+        self.assertEqual(item["checksums"]["ply_sha256"], self.factory._sha256_file(ply))
+        public = self.factory._public_scene(stored)["objects"][0]
+        self.assertTrue(public["latent_checkpoint"])
+        self.assertEqual(public["densities"], [32768, 131072, 262144])
+        self.assertTrue(public["urls"]["splat"].endswith(f"?v={item['checksums']['ply_sha256'][:16]}"))
+
+        # Densities decoded before are swapped in without touching the pipeline.
+        with mock.patch.object(self.factory, "_pipeline_for_job", side_effect=AssertionError("no decode")):
+            self.factory._redensify_object(
+                self.factory._new_job("redensify", scene["scene_id"]), scene["scene_id"], object_id, [32768]
+            )
+        item = self.factory._object_by_id(self.factory.load_scene(scene["scene_id"]), object_id)
+        self.assertEqual(item["checksums"]["ply_sha256"], original["checksums"]["ply_sha256"])
+        self.assertEqual(self.gaussian.inspect_ply(ply).vertex_count, 2)
+
+        duplicate = self.factory.duplicate_object(scene["scene_id"], object_id)
+        copied = self.factory._object_by_id(duplicate["scene"], duplicate["object_id"])
+        self.assertNotIn("densities", copied)
+        self.assertIn("latent", copied["files"])
+        with self.assertRaisesRegex(ValueError, "num_gaussians must be one of"):
+            self.factory._redensify_counts(1000)
+        with self.assertRaisesRegex(ValueError, "no latent checkpoint"):
+            self.factory._redensify_source(scene["scene_id"], {"files": {}})
+
+    def test_generation_jobs_queue_in_order_beyond_the_active_job_limit(self):
+        scene = self.factory.create_scene("Queue")
+        with mock.patch.dict(self.factory._JOBS, {}, clear=True):
+            jobs = [
+                self.factory._new_job("generation", scene["scene_id"])
+                for _ in range(self.factory.MAX_ACTIVE_JOBS + 1)
+            ]
+            with mock.patch.object(self.factory, "MAX_QUEUED_GENERATIONS", len(jobs)):
+                with self.assertRaisesRegex(RuntimeError, "generation queue is full"):
+                    self.factory._new_job("generation", scene["scene_id"])
+            self.factory._new_job("weights")
+
+            order = []
+            first_running = self.factory.threading.Event()
+            release_first = self.factory.threading.Event()
+
+            def hold(job, wait_for=None):
+                with self.factory._inference_turn(job):
+                    order.append(job["job_id"])
+                    if wait_for is not None:
+                        first_running.set()
+                        wait_for.wait(5)
+
+            first = self.factory.threading.Thread(target=hold, args=(jobs[0], release_first))
+            first.start()
+            self.assertTrue(first_running.wait(5))
+            second = self.factory.threading.Thread(target=hold, args=(jobs[1],))
+            second.start()
+            jobs[2]["cancel_event"].set()
+            with self.assertRaises(self.factory.JobCancelled):
+                hold(jobs[2])
+            release_first.set()
+            first.join(5)
+            second.join(5)
+        self.assertEqual(order, [jobs[0]["job_id"], jobs[1]["job_id"]])
+        self.assertIn("Waiting for 1 earlier generation job", [entry["message"] for entry in jobs[1]["logs"]])
+        self.assertEqual(len(self.factory._INFERENCE_QUEUE), 0)
+
     def test_generation_result_embeds_committed_public_scene_for_frontend_hydration(self):
         source = (ROOT / "api" / "factory3d.py").read_text(encoding="utf-8")
         self.assertIn('"scene": _public_scene(scene)', source)
@@ -717,6 +1583,10 @@ class FactoryBackendTests(unittest.TestCase):
         public = self.factory._public_scene(restored)
         public_item = self.factory._object_by_id(public, imported["object_id"])
         self.assertIn("/asset/splat", public_item["urls"]["splat"])
+        self.assertEqual(
+            public_item["urls"]["splat_lod"]["25"],
+            public_item["urls"]["splat"] + "&lod=25",
+        )
         self.assertIn("/asset/thumbnail", public_item["urls"]["thumbnail"])
 
     def test_invalid_or_oversized_ply_import_does_not_add_partial_object(self):
@@ -850,8 +1720,7 @@ class FactoryBackendTests(unittest.TestCase):
         scene = self.factory.create_scene("Scene")
         object_id = self.factory._new_id()
         source = self.factory.resolve_scene_dir(scene["scene_id"]) / "objects" / object_id / "model.ply"
-        source.parent.mkdir(parents=True, exist_ok=True)
-        source.write_bytes(b"source")
+        self._write_valid_ply(source)
         stale_ply = self.factory.resolve_scene_dir(scene["scene_id"]) / "exports" / "scene-r0.ply"
         stale_splat = stale_ply.with_suffix(".splat")
         stale_ply.parent.mkdir(parents=True, exist_ok=True)
@@ -891,17 +1760,15 @@ class FactoryBackendTests(unittest.TestCase):
 
         captured_metadata = {}
 
-        def fake_export(_sources, ply, *, metadata=None):
+        def fake_export(_blocks, ply, *, metadata=None):
             captured_metadata.update(metadata or {})
             Path(ply).parent.mkdir(parents=True, exist_ok=True)
             Path(ply).write_bytes(b"upright")
-            return {
-                "ply": {"gaussians": 1, "objects": 1},
-            }
+            return {"gaussians": 1, "objects": 1, "sha256": "0" * 64}
 
         with mock.patch.object(
             self.factory,
-            "export_gaussian_scene",
+            "assemble_scene_ply",
             side_effect=fake_export,
         ) as export:
             result = self.factory.ensure_scene_ply_export(scene["scene_id"])
@@ -939,7 +1806,7 @@ class FactoryBackendTests(unittest.TestCase):
         )
         with mock.patch.object(
             self.factory,
-            "export_gaussian_scene",
+            "assemble_scene_ply",
             side_effect=fake_export,
         ) as camera_export:
             self.factory.ensure_scene_ply_export(scene["scene_id"])
@@ -954,6 +1821,181 @@ class FactoryBackendTests(unittest.TestCase):
             updated["render_revision"],
         )
 
+    def test_scene_export_reuses_transformed_blocks_of_unchanged_objects(self):
+        scene = self.factory.create_scene("Blocks")
+        object_ids = []
+        for index in range(2):
+            source_path = self.root / f"model-{index}.ply"
+            self._write_valid_ply(source_path, count=3 + index)
+            result = self.factory.import_ply_object(
+                scene["scene_id"],
+                io.BytesIO(source_path.read_bytes()),
+                f"model-{index}.ply",
+            )
+            object_ids.append(result["object_id"])
+
+        with mock.patch.object(
+            self.factory,
+            "export_scene_ply",
+            wraps=self.factory.export_scene_ply,
+        ) as block_export:
+            first = self.factory.ensure_scene_ply_export(scene["scene_id"])
+            self.assertEqual(block_export.call_count, 2)
+            self.factory.update_scene(
+                scene["scene_id"],
+                {"objects": [{"object_id": object_ids[1], "transform": {"position": [1, 2, 3]}}]},
+            )
+            moved = self.factory.ensure_scene_ply_export(scene["scene_id"])
+            self.assertEqual(block_export.call_count, 3)
+
+        self.assertNotEqual(first["ply"], moved["ply"])
+        loaded = self.factory.load_scene(scene["scene_id"])
+        reference = self.root / "reference.ply"
+        self.gaussian.export_scene_ply(
+            self.factory._scene_sources(loaded),
+            reference,
+            metadata=self.gaussian.read_ply_scene_metadata(moved["ply"]),
+        )
+        moved_info = self.gaussian.inspect_ply(moved["ply"])
+        reference_info = self.gaussian.inspect_ply(reference)
+        self.assertEqual(
+            moved["ply"].read_bytes()[moved_info.data_offset :],
+            reference.read_bytes()[reference_info.data_offset :],
+        )
+        self.assertEqual(loaded["exports"]["gaussians"], 7)
+        self.assertEqual(loaded["exports"]["ply_sha256"], self.factory._sha256_file(moved["ply"]))
+        blocks = self.factory._scene_block_root(scene["scene_id"])
+        self.assertEqual(len(list(blocks.glob("*.ply"))), 2)
+        self.assertEqual(len(list(blocks.glob("*.json"))), 2)
+
+    def test_scene_deltas_are_journaled_and_invalidate_only_touched_export_blocks(self):
+        scene_id = self.factory.create_scene("Delta")["scene_id"]
+        object_ids = []
+        for index in range(2):
+            source_path = self.root / f"model-{index}.ply"
+            self._write_valid_ply(source_path, count=3 + index)
+            result = self.factory.import_ply_object(
+                scene_id,
+                io.BytesIO(source_path.read_bytes()),
+                f"model-{index}.ply",
+            )
+            object_ids.append(result["object_id"])
+        exported = self.factory.ensure_scene_ply_export(scene_id)["scene"]
+        blocks = exported["exports"]["blocks"]
+        self.assertEqual(set(blocks), set(object_ids))
+        scene_path = self.factory._scene_path(scene_id)
+        journal = self.factory._scene_journal_path(scene_id)
+        stored = scene_path.read_bytes()
+
+        with mock.patch.object(self.factory, "SCENE_FLUSH_SECONDS", 3600):
+            updated = self.factory.apply_scene_delta(
+                scene_id,
+                [
+                    {"op": "test", "path": f"/objects/{object_ids[1]}/revision", "value": 0},
+                    {"op": "replace", "path": f"/objects/{object_ids[1]}/transform/position", "value": [1, 2, 3]},
+                    {"op": "replace", "path": "/lighting/preset", "value": "night"},
+                    {"op": "replace", "path": "/name", "value": "Moved"},
+                ],
+            )
+            self.assertEqual(scene_path.read_bytes(), stored)
+            self.assertEqual(len(journal.read_text(encoding="utf-8").splitlines()), 2)
+            self.assertEqual(updated["revision"], exported["revision"] + 1)
+            self.assertEqual(updated["objects"][1]["revision"], 1)
+            self.assertEqual(updated["objects"][1]["transform"]["position"], [1.0, 2.0, 3.0])
+            self.assertNotIn("revision", updated["objects"][0])
+            self.assertEqual(updated["lighting"]["preset"], "night")
+            self.assertEqual(updated["exports"], {"blocks": {object_ids[0]: blocks[object_ids[0]]}})
+            self.assertEqual(self.factory.load_scene(scene_id)["name"], "Moved")
+            self.assertEqual(self.factory.list_scenes()[0]["name"], "Moved")
+            public = self.factory._public_scene_delta(updated)
+            self.assertTrue(public["pending"])
+            self.assertNotIn("blocks", public["exports"])
+            with self.assertRaises(self.factory.SceneConflict):
+                self.factory.apply_scene_delta(
+                    scene_id,
+                    [{"op": "test", "path": f"/objects/{object_ids[1]}/revision", "value": 0}],
+                )
+            with self.assertRaises(ValueError):
+                self.factory.apply_scene_delta(scene_id, [{"op": "replace", "path": "/objects", "value": []}])
+
+            # A restart before the flush replays the journal onto scene.json.
+            with self.factory._SCENE_CACHE_LOCK:
+                self.factory._SCENE_PENDING.pop(scene_id)
+            self.factory._forget_scene(scene_id)
+            replayed = self.factory.load_scene(scene_id)
+            self.assertEqual(replayed["name"], "Moved")
+            self.assertEqual(replayed["objects"][1]["transform"]["position"], [1.0, 2.0, 3.0])
+            self.assertFalse(journal.exists())
+            self.assertEqual(json.loads(scene_path.read_text(encoding="utf-8"))["name"], "Moved")
+
+            hidden = self.factory.apply_scene_delta(
+                scene_id,
+                [{"op": "replace", "path": f"/objects/{object_ids[0]}/visible", "value": False}],
+                flush=True,
+            )
+        self.assertFalse(journal.exists())
+        self.assertEqual(hidden["objects"][0]["revision"], 1)
+        self.assertIs(json.loads(scene_path.read_text(encoding="utf-8"))["objects"][0]["visible"], False)
+
+        with mock.patch.object(
+            self.factory,
+            "export_scene_ply",
+            wraps=self.factory.export_scene_ply,
+        ) as block_export:
+            self.factory.ensure_scene_ply_export(scene_id)
+            self.assertEqual(block_export.call_count, 1)
+            self.factory.apply_scene_delta(
+                scene_id,
+                [{"op": "replace", "path": f"/objects/{object_ids[0]}/visible", "value": True}],
+            )
+            shown = self.factory.ensure_scene_ply_export(scene_id)
+            self.assertEqual(block_export.call_count, 1)
+        self.assertEqual(shown["scene"]["exports"]["gaussians"], 7)
+
+        # A journal left behind by an already-flushed scene is ignored.
+        journal.write_text(
+            json.dumps({"version": 1, "base_updated_at": 0}) + "\n" + json.dumps({"set": [[["name"], "Stale"]]}) + "\n",
+            encoding="utf-8",
+        )
+        self.factory._forget_scene(scene_id)
+        self.assertEqual(self.factory.load_scene(scene_id)["name"], "Moved")
+        self.assertFalse(journal.exists())
+
+    def test_camera_only_change_rewrites_scene_export_header_without_reexport(self):
+        scene = self.factory.create_scene("Camera tweak")
+        source_path = self.root / "model.ply"
+        self._write_valid_ply(source_path, count=5)
+        self.factory.import_ply_object(scene["scene_id"], io.BytesIO(source_path.read_bytes()), "model.ply")
+        first = self.factory.ensure_scene_ply_export(scene["scene_id"])["ply"]
+        first_info = self.gaussian.inspect_ply(first)
+
+        self.factory.update_scene(
+            scene["scene_id"],
+            {"camera": {"position": [7, 6, 5], "target": [1, 2, 3], "fov": 61}},
+        )
+        with mock.patch.object(self.factory, "assemble_scene_ply") as assemble, mock.patch.object(
+            self.factory,
+            "export_scene_ply",
+        ) as block_export:
+            result = self.factory.ensure_scene_ply_export(scene["scene_id"])
+        assemble.assert_not_called()
+        block_export.assert_not_called()
+
+        second = result["ply"]
+        second_info = self.gaussian.inspect_ply(second)
+        self.assertNotEqual(first, second)
+        self.assertEqual(second_info.data_offset, first_info.data_offset)
+        self.assertEqual(
+            second.read_bytes()[second_info.data_offset :],
+            first.read_bytes()[first_info.data_offset :],
+        )
+        metadata = self.gaussian.read_ply_scene_metadata(second)
+        self.assertEqual(metadata["camera"]["position"], [7.0, 6.0, 5.0])
+        exports = result["scene"]["exports"]
+        self.assertEqual(exports["gaussians"], 5)
+        self.assertEqual(exports["render_revision"], result["scene"]["render_revision"])
+        self.assertNotIn("ply_sha256", exports)
+
     def test_invalid_scene_identifier_is_rejected(self):
         with self.assertRaises(ValueError):
             self.factory.resolve_scene_dir("../../outside")
@@ -1315,6 +2357,122 @@ class FactoryBackendTests(unittest.TestCase):
         self.assertEqual(paths, expected)
         self.assertTrue(self.factory._weights_status()["ready"])
 
+    def test_job_events_push_to_subscribers_and_batch_log_appends(self):
+        job = self.factory._new_job("weights")
+        try:
+            self.factory._emit(job, "weights", 5, "Downloading 1/5")
+            loop = asyncio.new_event_loop()
+            try:
+                events, backlog = self.factory._subscribe_job_events(job, loop, after=0)
+                self.assertEqual([payload["seq"] for payload in backlog], [1])
+                self.assertEqual(backlog[0]["kind"], "weights")
+                self.assertEqual(self.factory._subscribe_job_events(job, loop, after=1)[1], [])
+
+                def emit_from_worker():
+                    for step in range(2, 5):
+                        self.factory._emit(job, "weights", step * 10, f"Downloading {step}/5")
+                    with self.factory._STATE_LOCK:
+                        job["status"] = "completed"
+                    self.factory._emit(job, "complete", 100.0, "Completed")
+
+                worker = threading.Thread(target=emit_from_worker)
+                worker.start()
+
+                async def collect():
+                    received = []
+                    while not received or received[-1]["status"] != "completed":
+                        received.append(await asyncio.wait_for(events.get(), 5))
+                    return received
+
+                received = loop.run_until_complete(collect())
+                worker.join()
+            finally:
+                loop.close()
+            self.assertEqual([payload["seq"] for payload in received], [2, 3, 4, 5])
+            self.assertEqual(received[-1]["progress"], 100.0)
+            self.assertIn(b"id: 5\nevent: progress\ndata: {", self.factory._sse_message(received[-1]))
+            self.assertEqual(self.factory._last_event_id("3"), 3)
+            self.assertEqual(self.factory._last_event_id("x"), 0)
+
+            # A subscriber arriving after completion still gets the final event.
+            _events, late = self.factory._subscribe_job_events(job, loop, after=5)
+            self.assertEqual([payload["status"] for payload in late], ["completed"])
+
+            public = self.factory._job_public(job)
+            self.assertIsInstance(public["logs"], list)
+            self.assertEqual(json.loads(json.dumps(public))["logs"][-1]["message"], "Completed")
+
+            self.factory.flush_job_logs()
+            lines = self.factory._job_log_path(job).read_text(encoding="utf-8").splitlines()
+            self.assertEqual(len(lines), 5)
+            self.assertIn("Downloading 1/5", lines[0])
+            self.assertIn("Completed", lines[-1])
+        finally:
+            with self.factory._STATE_LOCK:
+                self.factory._JOBS.pop(job["job_id"], None)
+            self.factory._JOB_SUBSCRIBERS.pop(job["job_id"], None)
+
+    def test_blocking_route_work_is_coalesced_on_the_io_pool_and_timed(self):
+        self.assertEqual(self.factory.io_worker_count("8"), 8)
+        self.assertEqual(self.factory.io_worker_count(0), 1)
+        self.assertEqual(self.factory.io_worker_count(999), self.factory.MAX_IO_WORKERS)
+        with mock.patch.dict("os.environ", {"VNCCS_3D_FACTORY_IO_WORKERS": "3"}):
+            self.assertEqual(self.factory.io_worker_count(), 3)
+        with self.assertRaises(ValueError):
+            self.factory.io_worker_count("many")
+
+        calls = []
+        release = threading.Event()
+
+        def build(value):
+            calls.append(threading.current_thread().name)
+            release.wait(5)
+            if value == "broken":
+                raise ValueError("build failed")
+            return {"built": value}
+
+        async def concurrent(key, value):
+            asyncio.get_running_loop().call_later(0.05, release.set)
+            return await asyncio.gather(
+                *(self.factory._coalesced(key, build, value) for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        loop = asyncio.new_event_loop()
+        try:
+            results = loop.run_until_complete(concurrent(("asset", "scene"), "splat"))
+            self.assertEqual(results, [{"built": "splat"}] * 3)
+            self.assertEqual(len(calls), 1)
+            self.assertTrue(calls[0].startswith("vnccs-3d-factory-io"))
+            self.assertEqual(self.factory._INFLIGHT, {})
+            release.clear()
+            failures = loop.run_until_complete(concurrent(("asset", "scene"), "broken"))
+            self.assertEqual(len(calls), 2)
+            self.assertTrue(all(isinstance(item, ValueError) for item in failures))
+
+            registered = {}
+
+            class Table:
+                def get(self, path):
+                    return lambda handler: registered.setdefault(path, handler)
+
+            timed = self.factory._TimedRouteTable(Table())
+
+            @timed.get("/missing")
+            async def missing(_request):
+                return types.SimpleNamespace(status=404)
+
+            self.factory._ROUTE_METRICS.clear()
+            for _ in range(3):
+                loop.run_until_complete(registered["/missing"](None))
+        finally:
+            loop.close()
+        metrics = self.factory.route_metrics()["GET /missing"]
+        self.assertEqual((metrics["count"], metrics["errors"]), (3, 3))
+        self.assertLessEqual(metrics["p50_ms"], metrics["p95_ms"])
+        self.assertLessEqual(metrics["p95_ms"], metrics["max_ms"])
+        self.factory._ROUTE_METRICS.clear()
+
     def test_all_factory_api_routes_are_registered_on_the_comfy_route_table(self):
         class RouteTableStub:
             def __init__(self):
@@ -1354,6 +2512,7 @@ class FactoryBackendTests(unittest.TestCase):
         registered = {(method, path) for method, path, _handler in routes.definitions}
         expected = {
             ("GET", "/vnccs/3d-factory/capabilities"),
+            ("GET", "/vnccs/3d-factory/metrics"),
             ("GET", "/vnccs/3d-factory/splat-cache"),
             ("POST", "/vnccs/3d-factory/splat-cache/settings"),
             ("POST", "/vnccs/3d-factory/splat-cache/clear"),
@@ -1362,6 +2521,8 @@ class FactoryBackendTests(unittest.TestCase):
             ("POST", "/vnccs/3d-factory/scenes"),
             ("GET", "/vnccs/3d-factory/scenes/{scene_id}"),
             ("PATCH", "/vnccs/3d-factory/scenes/{scene_id}"),
+            ("PATCH", "/vnccs/3d-factory/scenes/{scene_id}/delta"),
+            ("POST", "/vnccs/3d-factory/scenes/{scene_id}/flush"),
             ("DELETE", "/vnccs/3d-factory/scenes/{scene_id}"),
             ("POST", "/vnccs/3d-factory/scenes/{scene_id}/reference"),
             ("GET", "/vnccs/3d-factory/scenes/{scene_id}/reference"),
@@ -1374,6 +2535,7 @@ class FactoryBackendTests(unittest.TestCase):
             ("GET", "/vnccs/3d-factory/scenes/{scene_id}/preview"),
             ("POST", "/vnccs/3d-factory/scenes/{scene_id}/generate"),
             ("GET", "/vnccs/3d-factory/jobs/{job_id}"),
+            ("GET", "/vnccs/3d-factory/jobs/{job_id}/events"),
             ("POST", "/vnccs/3d-factory/jobs/{job_id}/cancel"),
             ("GET", "/vnccs/3d-factory/jobs/{job_id}/log"),
             ("PATCH", "/vnccs/3d-factory/scenes/{scene_id}/objects/{object_id}"),
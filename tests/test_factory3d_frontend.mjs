@@ -87,6 +87,24 @@ test("Factory exposes scenes, generation, transforms, and PLY export", () => {
     assert.match(studio, /download\(scene\.exports\.urls\.ply\)/);
 });
 
+test("Job progress is pushed over server-sent events with a polling fallback", () => {
+    assert.match(studio, /jobEvents: jobId => `\$\{API_BASE\}\/jobs\/\$\{encodeURIComponent\(jobId\)\}\/events`/);
+    assert.match(studio, /new EventSource\(url\)/);
+    assert.match(studio, /const events = openJobEvents\(ENDPOINTS\.jobEvents\(jobId\)\)/);
+    assert.match(studio, /!TERMINAL\.has\(update\.status\)/);
+    assert.match(studio, /if \(!events \|\| events\.failed\) await sleep\(600\)/);
+    assert.match(studio, /events\?\.close\(\)/);
+});
+
+test("Scene autosave sends JSON-Patch deltas after the first full save", () => {
+    assert.match(studio, /sceneDelta: sceneId => `\$\{API_BASE\}\/scenes\/\$\{encodeURIComponent\(sceneId\)\}\/delta`/);
+    assert.match(studio, /function sceneDeltaOps\(previous, next\)/);
+    assert.match(studio, /path: `\/objects\/\$\{item\.object_id\}\/\$\{field\}`/);
+    assert.match(studio, /saved\?\.sceneId === sceneId && saved\.scene === this\.scene/);
+    assert.match(studio, /ops \? ENDPOINTS\.sceneDelta\(sceneId\) : ENDPOINTS\.scene\(sceneId\)/);
+    assert.match(studio, /this\._savedScenePayload = \{ sceneId, scene: this\.scene, payload \}/);
+});
+
 test("Factory imports an existing Gaussian PLY into the scene and viewport", () => {
     assert.match(studio, />Import PLY</);
     assert.match(studio, /accept="\.ply,application\/octet-stream"/);
@@ -285,6 +303,11 @@ test("TripoSplat setup separates models, inference, and persisted SPLAT cache se
     assert.doesNotMatch(studio, /No API, CLI, or external inference server/);
     assert.match(studio, /form\.append\("prevent_upscale", this\.settings\.prevent_upscale \? "1" : "0"\)/);
     assert.match(studio, /this\.settings\.prevent_upscale \? "native cap" : ""/);
+    assert.match(studio, /Gaussian decoder memory/);
+    assert.match(studio, /decode_memory_mb: 0/);
+    assert.match(studio, /this\.settings\.decode_memory_mb = draft\.decode_memory_mb/);
+    assert.match(studio, /"decode_memory_mb",\n\s+"seed"/);
+    assert.match(studio, /decode_memory_mb: this\.settings\.decode_memory_mb/);
     assert.match(styles, /\.vnccs-i3s__setup-grid/);
     assert.match(styles, /\.vnccs-i3s__setup-block--cache/);
     assert.match(styles, /\.vnccs-i3s__cache-limit-controls/);
@@ -471,7 +494,12 @@ test("Canvas transforms are the only transform UI and object actions live on car
     assert.doesNotMatch(studio, /vnccs-i3s__selected-name/);
     assert.match(studio, /Duplicate object/);
     assert.match(studio, /confirmDeleteObject\(item\.object_id\)/);
-    assert.match(studio, /actions\.append\(visibility, exportObject, duplicate, remove\)/);
+    assert.match(studio, /\[visibility, exportObject, regenerate, redensify, duplicate, remove\]\.filter\(Boolean\)/);
+    assert.match(studio, /const redensify = item\.latent_checkpoint/);
+    assert.match(studio, /\/redensify`/);
+    assert.match(studio, /actions\.append\(\.\.\.controls\)/);
+    assert.match(studio, /Regenerate with new seed/);
+    assert.match(studio, /form\.append\("source_object_id", item\.object_id\)/);
     assert.match(styles, /\.vnccs-i3s \[hidden\] \{ display: none !important; \}/);
     assert.match(studio, /W\/E\/R: move\/rotate\/scale/);
 });
@@ -1,8 +1,11 @@
+import hashlib
 import importlib.util
 import math
+import os
 import sys
 import tempfile
 import unittest
+import unittest.mock
 from pathlib import Path
 
 import numpy as np
@@ -200,6 +203,259 @@ class GaussianSceneTests(unittest.TestCase):
             self.assertEqual(float(output["f_rest_0"][0]), 0.0)
             del output
 
+    def test_single_pass_export_patches_a_shorter_vertex_count_in_place(self):
+        names = [
+            "x", "y", "z",
+            "f_dc_0", "f_dc_1", "f_dc_2", "opacity",
+            "scale_0", "scale_1", "scale_2",
+            "rot_0", "rot_1", "rot_2", "rot_3",
+        ]
+        dtype = np.dtype([(name, "<f4") for name in names])
+        records = np.zeros(10, dtype=dtype)
+        records["rot_0"] = 1
+        records["x"] = np.arange(10, dtype=np.float32)
+        records["opacity"][3] = np.inf
+        metadata = {"camera": {"fov": 42.0}}
+
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            source = root / "source.ply"
+            target = root / "scene.ply"
+            source.write_bytes(self.module._ply_header(10, dtype) + records.tobytes())
+
+            result = self.module.export_scene_ply([(source, {})], target, metadata=metadata)
+
+            self.assertEqual(result["gaussians"], 9)
+            self.assertEqual(result["validation"]["gaussians"], 9)
+            self.assertEqual(result["sources"][0]["dropped_records"], 1)
+            info = self.module.inspect_ply(target)
+            self.assertEqual(info.vertex_count, 9)
+            self.assertEqual(
+                info.data_offset,
+                len(self.module._ply_header(10, dtype, metadata)),
+            )
+            self.assertEqual(self.module.read_ply_scene_metadata(target), metadata)
+            self.assertEqual(self.module.validate_ply_payload(target), {
+                **result["validation"],
+                "path": str(info.path),
+            })
+
+    def test_export_without_any_valid_record_leaves_no_partial_file(self):
+        names = [
+            "x", "y", "z",
+            "f_dc_0", "f_dc_1", "f_dc_2", "opacity",
+            "scale_0", "scale_1", "scale_2",
+            "rot_0", "rot_1", "rot_2", "rot_3",
+        ]
+        dtype = np.dtype([(name, "<f4") for name in names])
+        records = np.zeros(2, dtype=dtype)
+
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            source = root / "degenerate.ply"
+            target = root / "scene.ply"
+            source.write_bytes(self.module._ply_header(2, dtype) + records.tobytes())
+
+            with self.assertRaisesRegex(ValueError, "no valid Gaussian records"):
+                self.module.export_scene_ply([(source, {})], target)
+            self.assertEqual(sorted(path.name for path in root.iterdir()), ["degenerate.ply"])
+
+    def test_parallel_export_is_byte_identical_to_the_serial_path(self):
+        names = [
+            "x", "y", "z", "nx", "ny", "nz",
+            "f_dc_0", "f_dc_1", "f_dc_2", "opacity",
+            "scale_0", "scale_1", "scale_2",
+            "rot_0", "rot_1", "rot_2", "rot_3",
+        ]
+        dtype = np.dtype([(name, "<f4") for name in names])
+        rng = np.random.default_rng(3)
+        original_chunk = self.module._CHUNK
+        self.module._CHUNK = 7
+        try:
+            with tempfile.TemporaryDirectory() as directory:
+                root = Path(directory)
+                sources = []
+                for index, count in enumerate((40, 3, 61)):
+                    records = np.zeros(count, dtype=dtype)
+                    for name in names:
+                        records[name] = rng.standard_normal(count).astype(np.float32)
+                    records["x"][::9] = np.nan
+                    source = root / f"source-{index}.ply"
+                    source.write_bytes(self.module._ply_header(count, dtype) + records.tobytes())
+                    sources.append((source, {"position": [index, 0, 0], "rotation": [0, 15 * index, 5]}))
+
+                serial = self.module.export_scene_ply(sources, root / "serial.ply", workers=1)
+                parallel = self.module.export_scene_ply(sources, root / "parallel.ply", workers=4)
+
+                self.assertEqual((root / "serial.ply").read_bytes(), (root / "parallel.ply").read_bytes())
+                self.assertEqual(serial["sources"], parallel["sources"])
+                self.assertEqual(serial["validation"]["ranges"], parallel["validation"]["ranges"])
+        finally:
+            self.module._CHUNK = original_chunk
+
+    def test_export_worker_count_setting_is_bounded(self):
+        self.assertEqual(self.module.export_workers(3), 3)
+        self.assertEqual(self.module.export_workers(0), 1)
+        self.assertEqual(self.module.export_workers(10_000), self.module._MAX_EXPORT_WORKERS)
+        with unittest.mock.patch.dict("os.environ", {"VNCCS_3D_FACTORY_EXPORT_WORKERS": "2"}):
+            self.assertEqual(self.module.export_workers(), 2)
+        with unittest.mock.patch.dict("os.environ", {"VNCCS_3D_FACTORY_EXPORT_WORKERS": "lots"}):
+            with self.assertLogs(self.module.LOGGER, "WARNING"):
+                self.assertEqual(self.module.export_workers(), max(1, min(8, os.cpu_count() or 1)))
+        with self.assertRaisesRegex(ValueError, "worker count"):
+            self.module.export_workers("many")
+
+    def test_gaussian_columns_view_memmapped_records_without_copying(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = Path(directory) / "source.ply"
+            self._write_ply(source, xyz=(1.0, 2.0, 3.0))
+            info = self.module.inspect_ply(source)
+            data = np.memmap(source, mode="r", dtype=info.dtype, offset=info.data_offset, shape=(1,))
+            columns = self.module.GaussianColumns.from_records(data)
+            self.assertEqual(len(columns), 1)
+            for values in (columns.xyz, columns.scales, columns.rotations, columns.f_dc, columns.normals):
+                self.assertTrue(np.shares_memory(values, data))
+            self.assertEqual(columns.xyz.tolist(), [[1.0, 2.0, 3.0]])
+            self.assertEqual(columns.rotations.tolist(), [[1.0, 0.0, 0.0, 0.0]])
+            self.assertEqual(columns.f_rest.shape, (1, 0))
+            del columns, data
+
+        mixed = np.zeros(
+            2,
+            dtype=[
+                ("x", "<f4"), ("y", "<f8"), ("z", "<f4"),
+                ("f_dc_0", "<f4"), ("f_dc_1", "<f4"), ("f_dc_2", "<f4"), ("opacity", "<f4"),
+                ("scale_0", "<f4"), ("scale_1", "<f4"), ("scale_2", "<f4"),
+                ("rot_0", "<f4"), ("rot_1", "<f4"), ("rot_2", "<f4"), ("rot_3", "<f4"),
+                ("f_rest_10", "<f4"), ("f_rest_2", "<f4"),
+            ],
+        )
+        mixed["y"] = [4.0, 5.0]
+        mixed["f_rest_2"] = 7.0
+        columns = self.module.GaussianColumns.from_records(mixed)
+        self.assertFalse(np.shares_memory(columns.xyz, mixed))
+        self.assertEqual(columns.xyz.dtype, np.float32)
+        self.assertEqual(columns.xyz[:, 1].tolist(), [4.0, 5.0])
+        self.assertEqual(columns.f_rest[:, 0].tolist(), [7.0, 7.0])
+        self.assertIsNone(columns.normals)
+
+    def test_out_of_core_splat_sort_matches_the_in_memory_order(self):
+        names = [
+            "x", "y", "z", "f_dc_0", "f_dc_1", "f_dc_2", "opacity",
+            "scale_0", "scale_1", "scale_2", "rot_0", "rot_1", "rot_2", "rot_3",
+        ]
+        dtype = np.dtype([(name, "<f4") for name in names])
+        rng = np.random.default_rng(4)
+        records = np.zeros(503, dtype=dtype)
+        for name in names:
+            records[name] = rng.standard_normal(len(records))
+        # Few distinct weights force many ties across run boundaries.
+        records["opacity"] = rng.integers(0, 3, len(records))
+        for name in ("scale_0", "scale_1", "scale_2"):
+            records[name] = rng.integers(-1, 1, len(records))
+        records["rot_0"] += 3
+        original_chunk = self.module._CHUNK
+        self.module._CHUNK = 17
+        try:
+            with tempfile.TemporaryDirectory() as directory:
+                root = Path(directory)
+                source = root / "source.ply"
+                source.write_bytes(self.module._ply_header(len(records), dtype) + records.tobytes())
+                in_memory = self.module.ply_to_splat(source, root / "memory.splat")
+                external = self.module.ply_to_splat(source, root / "external.splat", memory_budget=1)
+                self.assertEqual(in_memory["sort"], "memory")
+                self.assertEqual(external["sort"], "external")
+                self.assertGreater(external["sort_runs"], 1)
+                self.assertEqual((root / "memory.splat").read_bytes(), (root / "external.splat").read_bytes())
+                self.assertEqual(
+                    sorted(path.name for path in root.iterdir()),
+                    ["external.splat", "memory.splat", "source.ply"],
+                )
+        finally:
+            self.module._CHUNK = original_chunk
+
+    def test_splat_sort_budget_setting_is_bounded(self):
+        self.assertEqual(self.module.splat_sort_budget(64), 64 * 1024 * 1024)
+        self.assertEqual(self.module.splat_sort_budget(1), 16 * 1024 * 1024)
+        with unittest.mock.patch.dict("os.environ", {"VNCCS_3D_FACTORY_SPLAT_SORT_MB": "32"}):
+            self.assertEqual(self.module.splat_sort_budget(), 32 * 1024 * 1024)
+        with self.assertRaisesRegex(ValueError, "memory budget"):
+            self.module.splat_sort_budget("lots")
+
+    def test_assembled_scene_matches_a_single_export_of_all_objects(self):
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            sources = []
+            for index, xyz in enumerate(((1.0, 0.0, 0.0), (0.0, 2.0, 0.0))):
+                source = root / f"source-{index}.ply"
+                self._write_ply(source, xyz=xyz)
+                sources.append((source, {"position": [index, 0, 0], "rotation": [0, 45 * index, 0]}))
+            blocks = []
+            for index, source in enumerate(sources):
+                block = root / f"block-{index}.ply"
+                blocks.append((block, self.module.export_scene_ply([source], block)))
+            metadata = {"schema": "test"}
+            assembled = self.module.assemble_scene_ply(blocks, root / "assembled.ply", metadata=metadata)
+            exported = self.module.export_scene_ply(sources, root / "exported.ply", metadata=metadata)
+
+            assembled_info = self.module.inspect_ply(root / "assembled.ply")
+            exported_info = self.module.inspect_ply(root / "exported.ply")
+            self.assertEqual(assembled_info.data_offset % 4096, 0)
+            self.assertEqual(
+                (root / "assembled.ply").read_bytes()[assembled_info.data_offset :],
+                (root / "exported.ply").read_bytes()[exported_info.data_offset :],
+            )
+            self.assertEqual(self.module.read_ply_scene_metadata(root / "assembled.ply"), metadata)
+            self.assertEqual(assembled["gaussians"], exported["gaussians"])
+            self.assertEqual(assembled["validation"]["ranges"], exported["validation"]["ranges"])
+            self.assertEqual(assembled["sources"], exported["sources"])
+            self.assertEqual(
+                assembled["sha256"],
+                hashlib.sha256((root / "assembled.ply").read_bytes()).hexdigest(),
+            )
+            with self.assertRaisesRegex(ValueError, "does not match its report"):
+                self.module.assemble_scene_ply(
+                    [(blocks[0][0], {**blocks[0][1], "gaussians": 2})],
+                    root / "broken.ply",
+                )
+
+    def test_header_rewrite_keeps_the_payload_and_its_reserved_offset(self):
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            source = root / "source.ply"
+            self._write_ply(source)
+            block = root / "block.ply"
+            report = self.module.export_scene_ply([(source, {})], block)
+            scene = root / "scene.ply"
+            self.module.assemble_scene_ply([(block, report)], scene, metadata={"camera": 1})
+            original = self.module.inspect_ply(scene)
+
+            rewritten = root / "rewritten.ply"
+            result = self.module.rewrite_ply_header(scene, rewritten, metadata={"camera": 2})
+            info = self.module.inspect_ply(rewritten)
+            self.assertFalse(result["header_moved"])
+            self.assertIn(result["copy"], {"copy_file_range", "sendfile", "read"})
+            self.assertEqual(info.data_offset, original.data_offset)
+            self.assertEqual(
+                rewritten.read_bytes()[info.data_offset :],
+                scene.read_bytes()[original.data_offset :],
+            )
+            self.assertEqual(self.module.read_ply_scene_metadata(rewritten), {"camera": 2})
+
+            grown = root / "grown.ply"
+            result = self.module.rewrite_ply_header(scene, grown, metadata={"camera": "x" * 8000})
+            info = self.module.inspect_ply(grown)
+            self.assertTrue(result["header_moved"])
+            self.assertEqual(info.data_offset % 4096, 0)
+            self.assertEqual(grown.read_bytes()[info.data_offset :], scene.read_bytes()[original.data_offset :])
+
+            with unittest.mock.patch.object(self.module.os, "copy_file_range", side_effect=OSError, create=True):
+                with unittest.mock.patch.object(self.module.os, "sendfile", side_effect=OSError, create=True):
+                    fallback = root / "fallback.ply"
+                    result = self.module.rewrite_ply_header(scene, fallback, metadata={"camera": 2})
+            self.assertEqual(result["copy"], "read")
+            self.assertEqual(fallback.read_bytes(), rewritten.read_bytes())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -338,6 +338,34 @@ class FactoryLibraryTests(unittest.TestCase):
             migrated = json.loads(archive.read("manifest.json"))
             self.assertNotIn("splat", migrated["payload"]["object"]["files"])
 
+    def test_published_package_digest_ignores_the_stat_keyed_index(self):
+        scene, object_id = self.make_scene()
+        record = self.library.save_asset(
+            {
+                "scene_id": scene["scene_id"],
+                "object_id": object_id,
+                "asset_type": "object",
+                "name": "Tampered object",
+            }
+        )
+        package = self.library._paths(
+            record["repository"],
+            record["category"],
+            record["asset_id"],
+        )["package"]
+        indexed = self.library._sha256(package)
+        # Same size, same mtime: the stat-keyed index cannot tell.
+        stat = package.stat()
+        payload = bytearray(package.read_bytes())
+        payload[-1] ^= 0xFF
+        package.write_bytes(bytes(payload))
+        self.library.os.utime(package, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(self.library._sha256(package), indexed)
+
+        manifest = json.loads(self.library._write_local_manifest().read_text(encoding="utf-8"))
+        self.assertEqual(manifest["assets"][0]["package_sha256"], self.factory._sha256_file(package))
+        self.assertNotEqual(manifest["assets"][0]["package_sha256"], indexed)
+
     def test_pose_or_foreign_records_can_never_enter_factory_library(self):
         foreign_id = "a" * 24
         root = self.library._root()
@@ -0,0 +1,111 @@
+import ast
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import unittest
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load_render_cache():
+    # process.py imports torch/cv2 at module level; the render-node caches
+    # are plain Python, so only they and their constants are compiled here.
+    path = ROOT / "vnccs_sam3d" / "processing" / "process.py"
+    tree = ast.parse(path.read_text())
+    wanted = {
+        "_render_digest",
+        "_render_cache_lookup",
+        "_render_cache_store",
+        "render_cache_stats",
+        "clear_render_cache",
+        "_preset_signature",
+    }
+    selected = [
+        node for node in tree.body
+        if (isinstance(node, ast.FunctionDef) and node.name in wanted)
+        or (isinstance(node, ast.Assign) and any(
+            getattr(target, "id", "").startswith("_RENDER_") for target in node.targets
+        ))
+    ]
+    namespace = {
+        "np": np,
+        "os": os,
+        "json": json,
+        "hashlib": hashlib,
+        "threading": threading,
+        "OrderedDict": OrderedDict,
+    }
+    exec(compile(ast.Module(body=selected, type_ignores=[]), str(path), "exec"), namespace)
+    return namespace
+
+
+CACHE = _load_render_cache()
+
+
+class RenderCacheTests(unittest.TestCase):
+    def setUp(self):
+        CACHE["clear_render_cache"]()
+
+    def test_layers_count_hits_and_evict_least_recently_used_by_bytes(self):
+        CACHE["_RENDER_CACHE"]["image"]["max_bytes"] = 3000
+        frames = {name: np.full((10, 10, 10), index, dtype=np.uint8) for index, name in enumerate("abcd")}
+        for name in "abc":
+            CACHE["_render_cache_store"]("image", name, (frames[name],))
+        self.assertIs(CACHE["_render_cache_lookup"]("image", "a")[0], frames["a"])
+        CACHE["_render_cache_store"]("image", "d", (frames["d"],))
+
+        self.assertIsNone(CACHE["_render_cache_lookup"]("image", "b"))
+        self.assertIsNotNone(CACHE["_render_cache_lookup"]("image", "a"))
+        # Cached arrays are frozen so a consumer cannot corrupt a later hit.
+        self.assertFalse(frames["a"].flags.writeable)
+
+        # Oversized values and disabled (None) keys bypass the cache.
+        CACHE["_render_cache_store"]("image", "huge", (np.zeros(4000, dtype=np.uint8),))
+        self.assertIsNone(CACHE["_render_cache_lookup"]("image", None))
+        stats = CACHE["render_cache_stats"]()
+        self.assertEqual(stats["image"]["entries"], 3)
+        self.assertEqual(stats["image"]["bytes"], 3000)
+        self.assertEqual((stats["image"]["hits"], stats["image"]["misses"]), (2, 1))
+        self.assertAlmostEqual(stats["image"]["hit_rate"], 2 / 3)
+        self.assertEqual(stats["mesh"]["hits"] + stats["mesh"]["misses"], 0)
+        CACHE["_RENDER_CACHE"]["image"]["max_bytes"] = CACHE["_RENDER_IMAGE_CACHE_MAX_BYTES"]
+
+    def test_digest_tracks_array_content_shape_and_settings(self):
+        digest = CACHE["_render_digest"]
+        background = np.zeros((4, 6, 3), dtype=np.uint8)
+        settings = {"body_params": {"fat": 0.5}, "bone_lengths": {"arm": 1.0}}
+        base = digest("mesh", settings, background)
+        self.assertEqual(base, digest("mesh", dict(reversed(list(settings.items()))), background.copy()))
+        changed = background.copy()
+        changed[0, 0, 0] = 1
+        self.assertNotEqual(base, digest("mesh", settings, changed))
+        self.assertNotEqual(base, digest("mesh", settings, background.reshape(6, 4, 3)))
+        self.assertNotEqual(base, digest("mesh", {**settings, "bone_lengths": {"arm": 1.1}}, background))
+
+    def test_preset_signature_changes_when_a_preset_file_is_edited(self):
+        signature = CACHE["_preset_signature"]
+        with tempfile.TemporaryDirectory() as directory:
+            region = Path(directory) / "Head_vertices.json"
+            region.write_text("[1, 2, 3]")
+            (Path(directory) / "body_preset_settings").mkdir()
+            before = signature(directory)
+            self.assertEqual([entry[0] for entry in before], ["Head_vertices.json"])
+            self.assertEqual(before, signature(directory))
+            region.write_text("[1, 2, 4]")
+            os.utime(region, ns=(before[0][2] + 10**9, before[0][2] + 10**9))
+            self.assertNotEqual(
+                CACHE["_render_digest"]("mesh", before),
+                CACHE["_render_digest"]("mesh", signature(directory)),
+            )
+        self.assertEqual(signature(directory), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import ast
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load_software_renderer():
+    # process.py imports torch/cv2 at module level; the renderer itself is
+    # pure NumPy, so only its functions and constants are compiled here.
+    path = ROOT / "vnccs_sam3d" / "processing" / "process.py"
+    tree = ast.parse(path.read_text())
+    wanted = {
+        "_project_mesh_view",
+        "_shade_mesh_faces",
+        "_rasterize_faces",
+        "_render_mesh_software_batch",
+        "_render_mesh_software",
+    }
+    selected = [
+        node for node in tree.body
+        if (isinstance(node, ast.FunctionDef) and node.name in wanted)
+        or (isinstance(node, (ast.Assign, ast.AugAssign)) and "_SOFTWARE_RENDER_" in ast.unparse(node))
+    ]
+    namespace = {"np": np}
+    exec(compile(ast.Module(body=selected, type_ignores=[]), str(path), "exec"), namespace)
+    return namespace
+
+
+RENDER = _load_software_renderer()
+BACKGROUND = 7
+
+
+def _triangle(depth, size=0.5, shift=0.0):
+    return np.array(
+        [[-size + shift, -size, depth], [size + shift, -size, depth], [shift, size, depth]],
+        dtype=np.float32,
+    )
+
+
+class SoftwareRenderTests(unittest.TestCase):
+    def setUp(self):
+        self.background = np.full((48, 48, 3), BACKGROUND, dtype=np.uint8)
+
+    def covered(self, image):
+        return (image != BACKGROUND).any(axis=-1)
+
+    def test_back_faces_are_culled_and_nearest_face_wins(self):
+        front = RENDER["_render_mesh_software"](_triangle(0.0), [[0, 1, 2]], [0, 0, 2], 48, self.background)
+        back = RENDER["_render_mesh_software"](_triangle(0.0), [[0, 2, 1]], [0, 0, 2], 48, self.background)
+        self.assertGreater(self.covered(front).sum(), 100)
+        self.assertFalse(self.covered(back).any())
+
+        # A small tilted triangle in front of a large flat one must stay
+        # visible whichever order the faces are listed in.
+        near = _triangle(0.5, size=0.2)
+        near[2, 2] = 0.7
+        vertices = np.concatenate([_triangle(0.0, size=0.9), near])
+        renders = [
+            RENDER["_render_mesh_software"](vertices, faces, [0, 0, 3], 48, self.background)
+            for faces in ([[0, 1, 2], [3, 4, 5]], [[3, 4, 5], [0, 1, 2]])
+        ]
+        np.testing.assert_array_equal(renders[0], renders[1])
+        far_only = RENDER["_render_mesh_software"](vertices, [[0, 1, 2]], [0, 0, 3], 48, self.background)
+        self.assertFalse(np.array_equal(renders[0], far_only))
+
+    def test_batch_mode_matches_single_views_and_skips_degenerate_faces(self):
+        vertices = np.stack([_triangle(0.0), _triangle(0.0, shift=0.3)])
+        cameras = np.array([[0, 0, 2], [0.1, 0, 2.5]], dtype=np.float32)
+        batch = RENDER["_render_mesh_software_batch"](vertices, [[0, 1, 2]], cameras, [48, 60], self.background)
+        self.assertEqual(batch.shape, (2, 48, 48, 3))
+        for view in range(2):
+            single = RENDER["_render_mesh_software"](vertices[view], [[0, 1, 2]], cameras[view], [48, 60][view], self.background)
+            np.testing.assert_array_equal(batch[view], single)
+
+        degenerate = np.array([[0, 0, 0], [0, 0, 0], [np.nan, 0, 0]], dtype=np.float32)
+        image = RENDER["_render_mesh_software"](degenerate, [[0, 1, 2]], [0, 0, 2], 48, self.background)
+        np.testing.assert_array_equal(image, self.background)
+
+    def test_chunked_rasterization_matches_a_single_pass(self):
+        theta = np.linspace(0.0, 2.0 * np.pi, 25)[:-1]
+        ring = np.stack([np.cos(theta), np.sin(theta), np.zeros_like(theta)], axis=1) * 0.8
+        vertices = np.concatenate([[[0.0, 0.0, 0.2]], ring]).astype(np.float32)
+        faces = [[0, 1 + index, 1 + (index + 1) % 24] for index in range(24)]
+        reference = RENDER["_render_mesh_software"](vertices, faces, [0, 0, 2], 40, self.background)
+        previous = RENDER["_SOFTWARE_RENDER_MAX_CANDIDATES"]
+        RENDER["_SOFTWARE_RENDER_MAX_CANDIDATES"] = 64
+        try:
+            chunked = RENDER["_render_mesh_software"](vertices, faces, [0, 0, 2], 40, self.background)
+        finally:
+            RENDER["_SOFTWARE_RENDER_MAX_CANDIDATES"] = previous
+        self.assertGreater(self.covered(reference).sum(), 300)
+        np.testing.assert_array_equal(chunked, reference)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,238 @@
+import ast
+import math
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load_skinning_kernels():
+    # process.py imports torch/cv2 at module level; the skinning kernels are
+    # pure NumPy, so only they and their constants are compiled here.
+    path = ROOT / "vnccs_sam3d" / "processing" / "process.py"
+    tree = ast.parse(path.read_text())
+    wanted = {
+        "_build_sparse_lbs",
+        "_sparse_lbs_blend",
+        "_invert_rest_rotations",
+        "_relative_joint_rotations",
+        "_normalize_bone_lengths",
+        "_subtree_indices",
+        "apply_pose_lean_correction_mesh",
+        "_apply_face_blendshapes",
+        "_compute_bone_chain_categories",
+        "_apply_bone_length_scales",
+    }
+    constants = {
+        "_LBS_MAX_INFLUENCES",
+        "_LEAN_CHAIN_DEFAULT",
+        "_TORSO_JOINT_IDS",
+        "_NECK_JOINT_IDS",
+        "_ARM_BRANCH_IDS",
+        "_LEG_BRANCH_IDS",
+        "_MESH_SCALE_STRENGTH",
+    }
+    selected = [
+        node for node in tree.body
+        if (isinstance(node, ast.FunctionDef) and node.name in wanted)
+        or (isinstance(node, ast.Assign) and any(getattr(target, "id", None) in constants for target in node.targets))
+    ]
+    namespace = {"np": np, "math": math, "_FACE_BS_CACHE": {}}
+    exec(compile(ast.Module(body=selected, type_ignores=[]), str(path), "exec"), namespace)
+    return namespace
+
+
+LBS = _load_skinning_kernels()
+
+
+def _random_weights(rng, verts=300, joints=20, influences=4):
+    weights = np.zeros((verts, joints), dtype=np.float32)
+    for vertex in range(verts):
+        chosen = rng.choice(joints, influences, replace=False)
+        weights[vertex, chosen] = rng.random(influences) + 0.05
+    weights[:3] = 0.0
+    return weights
+
+
+def _dense_normalized(weights):
+    total = weights.sum(axis=1, keepdims=True)
+    return weights / np.where(total > 1e-6, total, 1.0)
+
+
+def _random_rotations(rng, count):
+    q, r = np.linalg.qr(rng.normal(size=(count, 3, 3)))
+    q *= np.sign(np.diagonal(r, axis1=1, axis2=2))[:, None, :]
+    q[np.linalg.det(q) < 0, :, 0] *= -1
+    return q.astype(np.float32)
+
+
+def _random_rig(rng, verts=240, joints=127):
+    """MHR-sized random skeleton; the first vertices are face-dominant so
+    the rigid neck rebinding is exercised."""
+    parents = np.array([-1] + [int(rng.integers(0, j)) for j in range(1, joints)], dtype=np.int32)
+    weights = _random_weights(rng, verts=verts, joints=joints)
+    weights[3:40] = 0.0
+    for vertex in range(3, 40):
+        weights[vertex, rng.choice(np.arange(113, joints), 3, replace=False)] = rng.random(3) + 0.2
+        weights[vertex, int(rng.integers(0, 113))] = 0.2 * rng.random()
+    rest_rots = _random_rotations(rng, joints)
+    joints_k, topk = LBS["_build_sparse_lbs"](weights)
+    LBS["_FACE_BS_CACHE"].update({
+        "lbs_topk_joints": joints_k,
+        "lbs_topk_weights": topk,
+        "rest_joint_rots_inv": LBS["_invert_rest_rotations"](rest_rots),
+        "rest_joint_coords": rng.normal(size=(joints, 3)).astype(np.float32),
+        "rest_verts": rng.normal(size=(verts, 3)).astype(np.float32),
+        "joint_parents": parents,
+        "joint_chain_cats": LBS["_compute_bone_chain_categories"](parents),
+    })
+    return weights, rest_rots, _random_rotations(rng, joints)
+
+
+def _dense_bone_length_shift(weights, rest_rots, posed_rots, scales):
+    # The former dense formulation: every vertex blends every joint.
+    cache = LBS["_FACE_BS_CACHE"]
+    parents, cats = cache["joint_parents"], cache["joint_chain_cats"]
+    rest_coords, rest_verts = cache["rest_joint_coords"], cache["rest_verts"]
+    dense = _dense_normalized(weights)
+    num_joints = len(parents)
+    relative = np.stack([posed_rots[j] @ np.linalg.inv(rest_rots[j]) for j in range(num_joints)])
+    joint_scale = np.array([1.0, *scales], dtype=np.float32)[cats]
+    mesh_scale = np.ones(num_joints, dtype=np.float32)
+    for j in range(num_joints):
+        p = int(parents[j])
+        if cats[j] == 2:
+            mesh_scale[j] = 1.0
+        elif cats[j]:
+            mesh_scale[j] = joint_scale[j] if j == 1 else 1.0 + LBS["_MESH_SCALE_STRENGTH"] * (joint_scale[j] - 1.0)
+        elif p >= 0:
+            inherit = cats[p] != 2 and abs(joint_scale[p] - 1.0) > 1e-6
+            mesh_scale[j] = joint_scale[p] if inherit else mesh_scale[p]
+    no_neck = np.where(cats == 2, 1.0, joint_scale)
+    posed_delta = np.zeros_like(rest_coords)
+    posed_delta_no_neck = np.zeros_like(rest_coords)
+    for j in range(num_joints):
+        p = int(parents[j])
+        if p >= 0:
+            link = relative[p] @ (rest_coords[j] - rest_coords[p])
+            posed_delta[j] = posed_delta[p] + (joint_scale[j] - 1.0) * link
+            posed_delta_no_neck[j] = posed_delta_no_neck[p] + (no_neck[j] - 1.0) * link
+    mesh_delta = np.zeros_like(rest_verts)
+    for j in range(num_joints):
+        if abs(mesh_scale[j] - 1.0) >= 1e-6:
+            local = (rest_verts - rest_coords[j]) @ relative[j].T
+            mesh_delta += (mesh_scale[j] - 1.0) * dense[:, j : j + 1] * local
+    neck = posed_delta - posed_delta_no_neck
+    t = np.clip((dense[:, 113:].sum(axis=1) - 0.5) / 0.4, 0.0, 1.0)
+    face = (t * t * (3.0 - 2.0 * t))[:, None]
+    return mesh_delta + dense @ posed_delta_no_neck + (1.0 - face) * (dense @ neck) + face * neck[113]
+
+
+class SparseLbsTests(unittest.TestCase):
+    def test_top_k_blend_matches_dense_weights_and_truncates_by_strength(self):
+        rng = np.random.default_rng(3)
+        weights = _random_weights(rng)
+        joints, topk = LBS["_build_sparse_lbs"](weights)
+        self.assertEqual(joints.shape, (300, 4))
+        dense = _dense_normalized(weights)
+        vectors = rng.normal(size=(20, 3)).astype(np.float32)
+        matrices = rng.normal(size=(20, 3, 3)).astype(np.float32)
+        np.testing.assert_allclose(LBS["_sparse_lbs_blend"](joints, topk, vectors), dense @ vectors, atol=1e-5)
+        np.testing.assert_allclose(
+            LBS["_sparse_lbs_blend"](joints, topk, matrices),
+            np.einsum("vj,jab->vab", dense, matrices),
+            atol=1e-5,
+        )
+        # Unskinned vertices blend to zero instead of dividing by zero.
+        np.testing.assert_array_equal(topk[:3], 0.0)
+
+        joints, topk = LBS["_build_sparse_lbs"](weights, max_influences=2)
+        self.assertEqual(joints.shape, (300, 2))
+        row = weights[10]
+        np.testing.assert_array_equal(joints[10], np.argsort(-row, kind="stable")[:2])
+        self.assertAlmostEqual(float(topk[10].sum()), 1.0, places=5)
+
+        rotations = np.stack([np.eye(3), np.diag([1.0, 2.0, 0.0])]).astype(np.float32)
+        inverse = LBS["_invert_rest_rotations"](rotations)
+        np.testing.assert_allclose(inverse[1], rotations[1].T)
+        relative = LBS["_relative_joint_rotations"](np.stack([rotations[1], np.eye(3)]), inverse)
+        np.testing.assert_allclose(relative[0], rotations[1])
+
+    def test_deformations_match_the_dense_formulation(self):
+        rng = np.random.default_rng(7)
+        weights = _random_weights(rng, verts=200, joints=12)
+        dense = _dense_normalized(weights)
+        joints, topk = LBS["_build_sparse_lbs"](weights)
+        vertices = rng.normal(size=(200, 3)).astype(np.float32)
+        posed_coords = rng.normal(size=(12, 3)).astype(np.float32)
+        rest_len = rng.random(200).astype(np.float32)
+        strength = rng.random(200).astype(np.float32)
+        LBS["_FACE_BS_CACHE"].update({
+            "lbs_topk_joints": joints,
+            "lbs_topk_weights": topk,
+            "rest_offset_len": rest_len,
+            "normalize_mask": strength,
+            "joint_parents": np.array([-1, 0, 1, 2, 3, 4, 5, 2, 7, 8, 1, 10], dtype=np.int32),
+        })
+
+        anchor = dense @ posed_coords
+        offset = vertices - anchor
+        length = np.linalg.norm(offset, axis=1)
+        scale = rest_len / np.where(length > 1e-6, length, 1.0)
+        scale = np.clip(np.where(np.abs(scale - 1.0) < 0.003, 1.0, scale), 0.7, 1.3)
+        expected = anchor + offset * (1.0 + (scale - 1.0) * strength)[:, None]
+        np.testing.assert_allclose(LBS["_normalize_bone_lengths"](vertices, posed_coords), expected, atol=1e-5)
+
+        # One joint rotating its subtree: vertices turn by the share of
+        # their weight that belongs to that subtree.
+        theta = 0.3
+        leaned = LBS["apply_pose_lean_correction_mesh"](vertices, posed_coords, 1.0, chain=((7, theta),))
+        share = dense[:, [7, 8, 9]].sum(axis=1)
+        angle = -theta * share
+        dy = vertices[:, 1] - posed_coords[7, 1]
+        dz = vertices[:, 2] - posed_coords[7, 2]
+        np.testing.assert_allclose(leaned[:, 1], posed_coords[7, 1] + dy * np.cos(angle) - dz * np.sin(angle), atol=1e-5)
+        np.testing.assert_allclose(leaned[:, 2], posed_coords[7, 2] + dy * np.sin(angle) + dz * np.cos(angle), atol=1e-5)
+        np.testing.assert_array_equal(leaned[:, 0], vertices[:, 0])
+
+    def test_bone_length_scales_match_the_dense_per_joint_loop(self):
+        rng = np.random.default_rng(11)
+        weights, rest_rots, posed_rots = _random_rig(rng)
+        vertices = rng.normal(size=(240, 3)).astype(np.float32)
+        scales = (0.7, 1.4, 0.85, 1.2)  # torso, neck, arm, leg
+        torso, neck, arm, leg = scales
+        result = LBS["_apply_bone_length_scales"](vertices, arm, leg, torso, neck, posed_rots)
+        expected = vertices + _dense_bone_length_shift(weights, rest_rots, posed_rots, scales)
+        np.testing.assert_allclose(result, expected, atol=1e-4)
+        self.assertIs(LBS["_apply_bone_length_scales"](vertices, 1.0, 1.0, 1.0, 1.0, posed_rots), vertices)
+
+    def test_face_blendshapes_match_the_dense_rotation_blend(self):
+        rng = np.random.default_rng(13)
+        weights, rest_rots, posed_rots = _random_rig(rng)
+        vertices = rng.normal(size=(240, 3)).astype(np.float32)
+        region_ids = {"Head": np.arange(0, 120, 2, dtype=np.int64), "Body": np.arange(150, 240, dtype=np.int64)}
+        region_deltas = {
+            name: {shape: rng.normal(size=(len(ids), 3)).astype(np.float32) for shape in ("wide", "tall")}
+            for name, ids in region_ids.items()
+        }
+        LBS["_load_face_blendshapes"] = lambda *_args: (region_ids, region_deltas)
+        sliders = {"wide": 0.6, "tall": -0.3}
+        result = LBS["_apply_face_blendshapes"](vertices, None, sliders, posed_rots, "", "")
+
+        dense = _dense_normalized(weights)
+        relative = np.stack([posed_rots[j] @ np.linalg.inv(rest_rots[j]) for j in range(len(rest_rots))])
+        expected = vertices.copy()
+        for name, ids in region_ids.items():
+            accum = sum(value * region_deltas[name][shape] for shape, value in sliders.items())
+            u, _s, vt = np.linalg.svd(np.einsum("vj,jab->vab", dense[ids], relative))
+            vt[np.linalg.det(u @ vt) < 0, -1, :] *= -1
+            expected[ids] += np.einsum("vab,vb->va", u @ vt, accum)
+        np.testing.assert_allclose(result, expected, atol=1e-4)
+        self.assertIs(LBS["_apply_face_blendshapes"](vertices, None, {"wide": 0.0}, posed_rots, "", ""), vertices)
+
+
+if __name__ == "__main__":
+    unittest.main()
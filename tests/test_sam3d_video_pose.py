@@ -0,0 +1,112 @@
+import importlib.util
+import sys
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+
+ROOT = Path(__file__).resolve().parents[1]
+PACKAGE = "vnccs_sam3d_video_testpkg"
+
+
+def _load_pose_import_module():
+    package = types.ModuleType(PACKAGE)
+    package.__path__ = [str(ROOT / "vnccs_sam3d")]
+    sys.modules[PACKAGE] = package
+    for name in ("progress", "pose_import"):
+        spec = importlib.util.spec_from_file_location(f"{PACKAGE}.{name}", ROOT / "vnccs_sam3d" / f"{name}.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        setattr(package, name, module)
+    return package.pose_import
+
+
+POSE_IMPORT = _load_pose_import_module()
+
+
+class _FakeEstimator:
+    batches = []
+
+    def __init__(self, **_kwargs):
+        pass
+
+    def process_frames(self, frames, bboxes, masks, inference_type="full"):
+        self.batches.append({"frames": len(frames), "boxes": bboxes.copy(), "masked": [m is not None for m in masks]})
+        # The person stays in the middle of a 200x100 frame.
+        keypoints = np.array([[80.0, 20.0], [120.0, 20.0], [100.0, 90.0]], dtype=np.float32)
+        return [{"pred_keypoints_2d": keypoints, "frame": int(frame[0, 0, 0])} for frame in frames]
+
+
+def _fake_runtime(mask_calls):
+    def auto_mask_bgr(image):
+        mask_calls.append(int(image[0, 0, 0]))
+        return np.ones(image.shape[:2], dtype=np.uint8), np.array([[10.0, 5.0, 190.0, 95.0]], dtype=np.float32)
+
+    fakes = {
+        "cv2": types.SimpleNamespace(COLOR_RGB2BGR=4, cvtColor=lambda image, _code: image),
+        "torch": types.SimpleNamespace(device=lambda name: name),
+        f"{PACKAGE}.processing": types.ModuleType(f"{PACKAGE}.processing"),
+        f"{PACKAGE}.processing.birefnet_mask": types.SimpleNamespace(auto_mask_bgr=auto_mask_bgr),
+        f"{PACKAGE}.processing.load_model": types.SimpleNamespace(
+            LoadSAM3DBodyModel=lambda: types.SimpleNamespace(load_model=lambda _name: ({},)),
+        ),
+        f"{PACKAGE}.processing.process": types.SimpleNamespace(
+            _load_sam3d_model=lambda _model: {"model": object(), "model_cfg": object(), "device": "cpu"},
+            _pose_data_from_output=lambda output, height, width: {"frame": output["frame"], "size": [width, height]},
+        ),
+        f"{PACKAGE}.sam_3d_body": types.SimpleNamespace(SAM3DBodyEstimator=_FakeEstimator),
+    }
+    return mock.patch.dict(sys.modules, fakes)
+
+
+class VideoPoseTrackingTests(unittest.TestCase):
+    def test_track_box_pads_keypoints_and_drops_lost_tracks(self):
+        keypoints = np.array([[50.0, 40.0, 1.0], [150.0, 240.0, 1.0]], dtype=np.float32)
+        box = POSE_IMPORT._track_box_from_keypoints(keypoints, 400, 300)
+        np.testing.assert_allclose(box, [30.0, 0.0, 170.0, 280.0])
+
+        outside = np.array([[-20.0, 10.0], [-5.0, 40.0], [10.0, 20.0]], dtype=np.float32)
+        self.assertIsNone(POSE_IMPORT._track_box_from_keypoints(outside, 400, 300))
+        tiny = np.array([[10.0, 10.0], [12.0, 14.0]], dtype=np.float32)
+        self.assertIsNone(POSE_IMPORT._track_box_from_keypoints(tiny, 400, 300))
+
+        self.assertEqual(POSE_IMPORT._video_track_state({"bbox": [1, 2, 30, 40], "age": 3})[1], 3)
+        self.assertIsNone(POSE_IMPORT._video_track_state({"bbox": [30, 2, 1, 40]})[0])
+        self.assertIsNone(POSE_IMPORT._video_track_state("junk")[0])
+        with mock.patch.dict("os.environ", {"VNCCS_SAM3D_VIDEO_BATCH": "500", "VNCCS_SAM3D_VIDEO_REMASK": "-4"}):
+            self.assertEqual(POSE_IMPORT.video_pose_batch_size(), POSE_IMPORT.MAX_VIDEO_POSE_BATCH)
+            self.assertEqual(POSE_IMPORT.video_remask_interval(), 0)
+        with self.assertRaisesRegex(ValueError, "batch size"):
+            POSE_IMPORT.video_pose_batch_size("many")
+
+    def test_clip_frames_run_in_mini_batches_and_skip_masking_while_tracked(self):
+        frames = [np.full((100, 200, 3), index, dtype=np.uint8) for index in range(7)]
+        mask_calls = []
+        _FakeEstimator.batches = []
+        with _fake_runtime(mask_calls), mock.patch.object(POSE_IMPORT, "_attach_canonical_skeletons"):
+            results = list(POSE_IMPORT.iter_video_pose_data(frames, batch_size=3, remask_interval=4))
+
+        self.assertEqual([index for index, _time, _pose, _track in results], list(range(7)))
+        self.assertEqual([pose["frame"] for _index, _time, pose, _track in results], list(range(7)))
+        self.assertEqual([batch["frames"] for batch in _FakeEstimator.batches], [3, 3, 1])
+        # Frame 0 seeds the track; frames 1-4 reuse boxes; frame 5 re-masks.
+        self.assertEqual(mask_calls, [0, 5])
+        self.assertEqual(
+            [masked for batch in _FakeEstimator.batches for masked in batch["masked"]],
+            [True, False, False, False, False, True, False],
+        )
+        np.testing.assert_allclose(_FakeEstimator.batches[1]["boxes"][0], [72.0, 6.0, 128.0, 99.0])
+        self.assertEqual(results[-1][3]["age"], 1)
+
+        mask_calls.clear()
+        with _fake_runtime(mask_calls), mock.patch.object(POSE_IMPORT, "_attach_canonical_skeletons"):
+            list(POSE_IMPORT.iter_video_pose_data(frames[:2], batch_size=2, track=results[-1][3]))
+        self.assertEqual(mask_calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ import test from "node:test";
 
 import {
     MAX_VIDEO_POSE_SAMPLES,
+    chunkVideoCaptureSchedule,
     clampVideoCaptureFps,
     clampVideoTimelineViewport,
     computeVideoCaptureSchedule,
@@ -11,6 +12,7 @@ import {
     estimateVideoFrameRate,
     fitVideoTimelineSelection,
     isLikelyVideoFile,
+    readNdjsonStream,
     reduceVideoPoseKeyframes,
     stabilizeVideoPoseSequence,
     videoKeyedFrameIndices,
@@ -315,3 +317,29 @@ test("adaptive key reduction omits static joints and simplifies each moving join
         assert.ok(quaternionDistanceDegrees(evaluated.bones.wrist_l, poses[frame].bones.wrist_l) <= 1.000001);
     }
 });
+
+test("batched video pose capture keeps schedule order and parses streamed NDJSON frames", async () => {
+    const plan = computeVideoSamplePlan({ inTime: 0, outTime: 3, targetFps: 12 });
+    const schedule = computeVideoCaptureSchedule(plan, 2);
+    const chunks = chunkVideoCaptureSchedule(schedule, 5);
+    assert.deepEqual(chunks.map(chunk => chunk.start), [0, 5, 10, 15]);
+    assert.deepEqual(chunks.flatMap(chunk => chunk.frameIndices), schedule.frameIndices);
+    assert.deepEqual(chunks.flatMap(chunk => chunk.times), schedule.times);
+    assert.deepEqual(chunkVideoCaptureSchedule({ times: [] }, 4), []);
+
+    const encoder = new TextEncoder();
+    const pieces = ['{"index":0,"pose_data":{"a":1}}\n{"ind', 'ex":1,"pose_data":{"a":2}}\n\n', '{"status":"complete","frames":2}'];
+    const body = new ReadableStream({
+        start(controller) {
+            for (const piece of pieces) controller.enqueue(encoder.encode(piece));
+            controller.close();
+        },
+    });
+    const lines = [];
+    for await (const line of readNdjsonStream(body)) lines.push(line);
+    assert.deepEqual(lines, [
+        { index: 0, pose_data: { a: 1 } },
+        { index: 1, pose_data: { a: 2 } },
+        { status: "complete", frames: 2 },
+    ]);
+});
@@ -5,6 +5,6 @@ Studio. It intentionally does not register the original SAM3DBody ComfyUI
 nodes and does not use comfy-env.
 """
 
-from .pose_import import process_image_to_pose_json
+from .pose_import import iter_video_pose_data, process_image_to_pose_json, read_video_frames
 
-__all__ = ["process_image_to_pose_json"]
+__all__ = ["iter_video_pose_data", "process_image_to_pose_json", "read_video_frames"]
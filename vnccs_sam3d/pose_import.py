@@ -8,6 +8,8 @@ shape while loading the vendored inference code directly.
 from __future__ import annotations
 
 import json
+import os
+from contextlib import nullcontext
 
 import numpy as np
 
@@ -23,18 +25,163 @@ def _dependency_error(exc: Exception) -> RuntimeError:
     )
 
 
+# Pose Studio names for the MHR joints its retargeting relies on; every other
+# joint is exported as ``joint_NNN``.
+_KNOWN_JOINT_NAMES = {
+    1: "pelvis",
+    2: "thigh_l", 3: "calf_l", 4: "foot_l",
+    18: "thigh_r", 19: "calf_r", 20: "foot_r",
+    35: "spine_01", 36: "spine_02", 37: "spine_03",
+    38: "clavicle_r", 39: "upperarm_r", 40: "lowerarm_r", 42: "hand_r",
+    74: "clavicle_l", 75: "upperarm_l", 76: "lowerarm_l", 78: "hand_l",
+    110: "neck_01", 113: "head",
+}
+
+DEFAULT_VIDEO_POSE_BATCH = 8
+MAX_VIDEO_POSE_BATCH = 32
+DEFAULT_VIDEO_REMASK_INTERVAL = 24
+MAX_VIDEO_POSE_FRAMES = 600
+VIDEO_FRAME_MAX_SIDE = 1280
+# Tracked boxes pad the previous frame's keypoint extent by this fraction per
+# side: keypoints stop short of the silhouette (hair, shoes) and the person
+# keeps moving for up to one mini-batch before the box is refreshed.
+_TRACK_MARGIN = 0.2
+_TRACK_MIN_SIDE = 32
+_TRACK_MIN_VISIBLE = 0.5
+
+
+def video_pose_batch_size(value=None) -> int:
+    """Resolve how many clip frames share one SAM 3D Body forward pass.
+
+    An explicit value wins, then ``VNCCS_SAM3D_VIDEO_BATCH``.  Every frame
+    adds one person crop to the backbone and both hand-decoder batches, so
+    lower it when long imports run out of VRAM.
+    """
+    if value is None:
+        value = os.environ.get("VNCCS_SAM3D_VIDEO_BATCH", "").strip() or DEFAULT_VIDEO_POSE_BATCH
+    try:
+        size = int(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("video pose batch size must be an integer") from exc
+    return max(1, min(MAX_VIDEO_POSE_BATCH, size))
+
+
+def video_remask_interval(value=None) -> int:
+    """Resolve how many tracked frames may pass between BiRefNet masks.
+
+    An explicit value wins, then ``VNCCS_SAM3D_VIDEO_REMASK``.  ``0`` masks
+    every frame, which is the single-image behaviour and the slowest.
+    """
+    if value is None:
+        value = os.environ.get("VNCCS_SAM3D_VIDEO_REMASK", "").strip() or DEFAULT_VIDEO_REMASK_INTERVAL
+    try:
+        interval = int(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("video remask interval must be an integer") from exc
+    return max(0, interval)
+
+
+def _split_forward_outputs(outputs, *, keypoints=False):
+    """Pick (joint rotations, joint coords, keypoints) out of an ``mhr_forward`` tuple."""
+    rotations = coords = points = None
+    for tensor in outputs[1:]:
+        if tensor.ndim == 4 and tensor.shape[-1] == 3 and tensor.shape[-2] == 3:
+            rotations = tensor.detach().cpu().numpy()
+        elif keypoints and tensor.ndim == 3 and tensor.shape[-1] == 3 and tensor.shape[-2] > 127:
+            points = tensor.detach().cpu().numpy()
+        elif tensor.ndim == 3 and tensor.shape[-1] == 3 and tensor.shape[-2] != 3:
+            coords = tensor.detach().cpu().numpy()
+    return rotations, coords, points
+
+
+def _attach_canonical_skeletons(poses, sam_3d_model, device):
+    """Add Pose Studio's canonical MHR skeleton fields to each pose dict.
+
+    All poses share one posed ``mhr_forward``.  The rest skeleton uses zero
+    shape/scale parameters, so it is evaluated once for the whole list.
+    """
+    import torch
+
+    from .processing.process import _FACE_BS_CACHE, _get_mhr_rest_verts, _to_batched_tensor
+
+    mhr_head = sam_3d_model.head_pose
+
+    def zeros(width, rows=len(poses)):
+        return torch.zeros((rows, width), dtype=torch.float32, device=device)
+
+    def stacked(key, width):
+        return torch.cat([_to_batched_tensor(pose.get(key), device, width=width) for pose in poses])
+
+    with torch.no_grad():
+        posed_out = mhr_head.mhr_forward(
+            global_trans=zeros(3),
+            global_rot=stacked("global_rot", 3),
+            body_pose_params=stacked("body_pose_params", 133),
+            hand_pose_params=stacked("hand_pose_params", 108),
+            scale_params=zeros(mhr_head.num_scale_comps),
+            shape_params=zeros(mhr_head.num_shape_comps),
+            expr_params=zeros(mhr_head.num_face_comps),
+            return_keypoints=True,
+            return_joint_rotations=True,
+            return_joint_coords=True,
+        )
+        rest_out = mhr_head.mhr_forward(
+            global_trans=zeros(3, 1),
+            global_rot=zeros(3, 1),
+            body_pose_params=zeros(133, 1),
+            hand_pose_params=zeros(108, 1),
+            scale_params=zeros(mhr_head.num_scale_comps, 1),
+            shape_params=zeros(mhr_head.num_shape_comps, 1),
+            expr_params=zeros(mhr_head.num_face_comps, 1),
+            return_joint_rotations=True,
+            return_joint_coords=True,
+        )
+
+    posed_rots, posed_coords, posed_keypoints = _split_forward_outputs(posed_out, keypoints=True)
+    rest_rots, rest_coords, _ = _split_forward_outputs(rest_out)
+    parents = None
+    try:
+        _get_mhr_rest_verts(mhr_head, device)
+        parents = _FACE_BS_CACHE.get("joint_parents")
+    except Exception:
+        pass
+
+    for index, pose_data in enumerate(poses):
+        if posed_rots is not None:
+            pose_data["joint_rotations"] = posed_rots[index].tolist()
+        if posed_coords is not None:
+            pose_data["joint_coords"] = posed_coords[index].tolist()
+        if posed_keypoints is not None:
+            pose_data["canonical_keypoints_3d"] = posed_keypoints[index][:70].tolist()
+        if rest_rots is not None:
+            pose_data["rest_joint_rotations"] = rest_rots[0].tolist()
+        if rest_coords is not None:
+            pose_data["rest_joint_coords"] = rest_coords[0].tolist()
+        if parents is not None:
+            pose_data["joint_parents"] = np.asarray(parents, dtype=np.int32).tolist()
+
+        num_joints = 0
+        for candidate in (
+            pose_data.get("joint_rotations"),
+            pose_data.get("rest_joint_rotations"),
+            pose_data.get("joint_coords"),
+        ):
+            if isinstance(candidate, list):
+                num_joints = max(num_joints, len(candidate))
+        pose_data["joint_names"] = [
+            _KNOWN_JOINT_NAMES.get(joint, f"joint_{joint:03d}")
+            for joint in range(num_joints)
+        ]
+        pose_data["sam3d_pose_space"] = "mhr_forward_canonical"
+    return poses
+
+
 def process_image_to_pose_json(image_tensor):
     try:
         import torch
 
         from .processing.load_model import LoadSAM3DBodyModel
-        from .processing.process import (
-            SAM3DBodyProcessToJson,
-            _FACE_BS_CACHE,
-            _get_mhr_rest_verts,
-            _load_sam3d_model,
-            _to_batched_tensor,
-        )
+        from .processing.process import SAM3DBodyProcessToJson, _load_sam3d_model
     except Exception as exc:
         raise _dependency_error(exc) from exc
 
@@ -56,113 +203,7 @@ def process_image_to_pose_json(image_tensor):
 
     try:
         loaded = _load_sam3d_model(model)
-        sam_3d_model = loaded["model"]
-        device = torch.device(loaded["device"])
-        mhr_head = sam_3d_model.head_pose
-
-        global_trans = torch.zeros((1, 3), dtype=torch.float32, device=device)
-        rest_global_rot = torch.zeros((1, 3), dtype=torch.float32, device=device)
-        rest_body_pose = torch.zeros((1, 133), dtype=torch.float32, device=device)
-        rest_hand_pose = torch.zeros((1, 108), dtype=torch.float32, device=device)
-        scale_params = torch.zeros((1, mhr_head.num_scale_comps), dtype=torch.float32, device=device)
-        shape_params = torch.zeros((1, mhr_head.num_shape_comps), dtype=torch.float32, device=device)
-        expr_params = torch.zeros((1, mhr_head.num_face_comps), dtype=torch.float32, device=device)
-
-        with torch.no_grad():
-            posed_out = mhr_head.mhr_forward(
-                global_trans=global_trans,
-                global_rot=_to_batched_tensor(pose_data.get("global_rot"), device, width=3),
-                body_pose_params=_to_batched_tensor(pose_data.get("body_pose_params"), device, width=133),
-                hand_pose_params=_to_batched_tensor(pose_data.get("hand_pose_params"), device, width=108),
-                scale_params=scale_params,
-                shape_params=shape_params,
-                expr_params=expr_params,
-                return_keypoints=True,
-                return_joint_rotations=True,
-                return_joint_coords=True,
-            )
-            rest_out = mhr_head.mhr_forward(
-                global_trans=global_trans,
-                global_rot=rest_global_rot,
-                body_pose_params=rest_body_pose,
-                hand_pose_params=rest_hand_pose,
-                scale_params=scale_params,
-                shape_params=shape_params,
-                expr_params=expr_params,
-                return_joint_rotations=True,
-                return_joint_coords=True,
-            )
-
-        posed_rots = None
-        posed_coords = None
-        posed_keypoints = None
-        for tensor in posed_out[1:]:
-            if tensor.ndim == 4 and tensor.shape[-1] == 3 and tensor.shape[-2] == 3:
-                posed_rots = tensor.detach().cpu().numpy()
-            elif tensor.ndim == 3 and tensor.shape[-1] == 3 and tensor.shape[-2] > 127:
-                posed_keypoints = tensor.detach().cpu().numpy()
-            elif tensor.ndim == 3 and tensor.shape[-1] == 3 and tensor.shape[-2] != 3:
-                posed_coords = tensor.detach().cpu().numpy()
-
-        if posed_rots is not None:
-            if posed_rots.ndim == 4:
-                posed_rots = posed_rots[0]
-            pose_data["joint_rotations"] = posed_rots.tolist()
-        if posed_coords is not None:
-            if posed_coords.ndim == 3:
-                posed_coords = posed_coords[0]
-            pose_data["joint_coords"] = posed_coords.tolist()
-        if posed_keypoints is not None:
-            if posed_keypoints.ndim == 3:
-                posed_keypoints = posed_keypoints[0]
-            pose_data["canonical_keypoints_3d"] = posed_keypoints[:70].tolist()
-
-        rest_rots = None
-        rest_coords = None
-        for tensor in rest_out[1:]:
-            if tensor.ndim == 4 and tensor.shape[-1] == 3 and tensor.shape[-2] == 3:
-                rest_rots = tensor.detach().cpu().numpy()
-            elif tensor.ndim == 3 and tensor.shape[-1] == 3 and tensor.shape[-2] != 3:
-                rest_coords = tensor.detach().cpu().numpy()
-        if rest_rots is not None:
-            if rest_rots.ndim == 4:
-                rest_rots = rest_rots[0]
-            pose_data["rest_joint_rotations"] = rest_rots.tolist()
-        if rest_coords is not None:
-            if rest_coords.ndim == 3:
-                rest_coords = rest_coords[0]
-            pose_data["rest_joint_coords"] = rest_coords.tolist()
-
-        try:
-            _get_mhr_rest_verts(mhr_head, device)
-            parents = _FACE_BS_CACHE.get("joint_parents")
-            if parents is not None:
-                pose_data["joint_parents"] = np.asarray(parents, dtype=np.int32).tolist()
-        except Exception:
-            pass
-
-        num_joints = 0
-        for candidate in (
-            pose_data.get("joint_rotations"),
-            pose_data.get("rest_joint_rotations"),
-            pose_data.get("joint_coords"),
-        ):
-            if isinstance(candidate, list):
-                num_joints = max(num_joints, len(candidate))
-        known_joint_names = {
-            1: "pelvis",
-            2: "thigh_l", 3: "calf_l", 4: "foot_l",
-            18: "thigh_r", 19: "calf_r", 20: "foot_r",
-            35: "spine_01", 36: "spine_02", 37: "spine_03",
-            38: "clavicle_r", 39: "upperarm_r", 40: "lowerarm_r", 42: "hand_r",
-            74: "clavicle_l", 75: "upperarm_l", 76: "lowerarm_l", 78: "hand_l",
-            110: "neck_01", 113: "head",
-        }
-        pose_data["joint_names"] = [
-            known_joint_names.get(index, f"joint_{index:03d}")
-            for index in range(num_joints)
-        ]
-        pose_data["sam3d_pose_space"] = "mhr_forward_canonical"
+        _attach_canonical_skeletons([pose_data], loaded["model"], torch.device(loaded["device"]))
         progress.finish("Step 6/6: SAM 3D Body import complete.")
         return json.dumps(pose_data, ensure_ascii=False, indent=2)
     except Exception as exc:
@@ -171,6 +212,213 @@ def process_image_to_pose_json(image_tensor):
         return pose_json
 
 
+def _track_box_from_keypoints(keypoints_2d, width, height, margin=_TRACK_MARGIN):
+    """Person box for the next frames from this frame's 2D keypoints.
+
+    Returns ``None`` once the track is lost — fewer than half the keypoints
+    inside the frame, or a box too small to crop — so the caller re-masks.
+    """
+    points = np.asarray(keypoints_2d, dtype=np.float32)
+    if points.ndim != 2 or points.shape[0] == 0 or points.shape[1] < 2:
+        return None
+    points = points[:, :2]
+    inside = (
+        np.isfinite(points).all(axis=1)
+        & (points[:, 0] >= 0) & (points[:, 0] < width)
+        & (points[:, 1] >= 0) & (points[:, 1] < height)
+    )
+    if inside.mean() < _TRACK_MIN_VISIBLE:
+        return None
+    low = points[inside].min(axis=0)
+    high = points[inside].max(axis=0)
+    pad = (high - low) * float(margin)
+    low = np.maximum(low - pad, 0.0)
+    high = np.minimum(high + pad, (width - 1, height - 1))
+    if float((high - low).min()) < _TRACK_MIN_SIDE:
+        return None
+    return np.array([low[0], low[1], high[0], high[1]], dtype=np.float32)
+
+
+def _video_track_state(track):
+    """Validate a client-echoed ``{"bbox": [x1, y1, x2, y2], "age": n}`` track."""
+    if not isinstance(track, dict):
+        return None, 0
+    try:
+        bbox = np.asarray(track.get("bbox"), dtype=np.float32).reshape(4)
+        age = max(0, int(track.get("age") or 0))
+    except (TypeError, ValueError):
+        return None, 0
+    if not np.isfinite(bbox).all() or bbox[2] <= bbox[0] or bbox[3] <= bbox[1]:
+        return None, 0
+    return bbox, age
+
+
+def _video_frame_rgb(frame):
+    """HxWx3 uint8 RGB from a decoded frame or one ComfyUI IMAGE row."""
+    if hasattr(frame, "detach"):
+        import torch
+
+        frame = frame[..., :3]
+        if frame.dtype != torch.uint8:
+            frame = (frame.clamp(0.0, 1.0) * 255.0).to(torch.uint8)
+        return np.ascontiguousarray(frame.cpu().numpy())
+    frame = np.asarray(frame)[..., :3]
+    if frame.dtype != np.uint8:
+        frame = np.clip(frame * 255.0, 0, 255).astype(np.uint8)
+    return np.ascontiguousarray(frame)
+
+
+def read_video_frames(path, *, start=0.0, end=None, fps=None, max_frames=MAX_VIDEO_POSE_FRAMES):
+    """Yield ``(time, rgb_uint8)`` samples from a video file.
+
+    Frames are read sequentially and kept whenever the decoder passes the
+    next sample time, which is far cheaper than seeking for every sample.
+    Frames are downscaled to ``VIDEO_FRAME_MAX_SIDE`` like the browser capture.
+    """
+    try:
+        import cv2
+    except Exception as exc:
+        raise _dependency_error(exc) from exc
+
+    capture = cv2.VideoCapture(str(path))
+    if not capture.isOpened():
+        raise ValueError(f"{path}: could not open video")
+    try:
+        source_fps = float(capture.get(cv2.CAP_PROP_FPS) or 0.0)
+        if source_fps <= 0:
+            source_fps = 30.0
+        step = 1.0 / float(fps) if fps else 1.0 / source_fps
+        start = max(0.0, float(start or 0.0))
+        if start > 0:
+            capture.set(cv2.CAP_PROP_POS_MSEC, start * 1000.0)
+        next_time = start
+        emitted = 0
+        frame_index = int(round(start * source_fps))
+        while emitted < max_frames:
+            ok, frame = capture.read()
+            if not ok:
+                break
+            position = capture.get(cv2.CAP_PROP_POS_MSEC)
+            time = position / 1000.0 if position and position > 0 else frame_index / source_fps
+            frame_index += 1
+            if end is not None and time >= float(end):
+                break
+            if time + 0.5 / source_fps < next_time:
+                continue
+            height, width = frame.shape[:2]
+            scale = min(1.0, VIDEO_FRAME_MAX_SIDE / float(max(width, height)))
+            if scale < 1.0:
+                frame = cv2.resize(
+                    frame,
+                    (max(2, round(width * scale)), max(2, round(height * scale))),
+                    interpolation=cv2.INTER_AREA,
+                )
+            yield time, cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            emitted += 1
+            next_time += step
+            while next_time <= time:
+                next_time += step
+    finally:
+        capture.release()
+
+
+def iter_video_pose_data(frames, *, count=None, batch_size=None, remask_interval=None,
+                         track=None, inference_type="full"):
+    """Reconstruct one SAM 3D Body pose per clip frame, in order.
+
+    ``frames`` yields HxWx3 RGB arrays/tensors (or ``(time, frame)`` pairs
+    from ``read_video_frames``) of one size.  The model and estimator are
+    loaded once; frames run through the estimator in mini-batches, and
+    BiRefNet only masks the first frame and every ``remask_interval``-th
+    tracked frame — the others reuse a box grown from the previous frame's
+    2D keypoints.
+
+    Yields ``(index, time, pose_data, track)``; ``track`` can be passed back
+    as ``track=`` to continue tracking across requests.
+    """
+    try:
+        import cv2
+        import torch
+
+        from .processing.birefnet_mask import auto_mask_bgr
+        from .processing.load_model import LoadSAM3DBodyModel
+        from .processing.process import _load_sam3d_model, _pose_data_from_output
+        from .sam_3d_body import SAM3DBodyEstimator
+    except Exception as exc:
+        raise _dependency_error(exc) from exc
+
+    size = video_pose_batch_size(batch_size)
+    interval = video_remask_interval(remask_interval)
+    progress.update("Step 2/6: Checking SAM 3D Body model files...", 4)
+    model = LoadSAM3DBodyModel().load_model("Auto")[0]
+    loaded = _load_sam3d_model(model)
+    device = torch.device(loaded["device"])
+    estimator = SAM3DBodyEstimator(
+        sam_3d_body_model=loaded["model"],
+        model_cfg=loaded["model_cfg"],
+        human_detector=None,
+        human_segmentor=None,
+        fov_estimator=None,
+    )
+    box, age = _video_track_state(track)
+    index = 0
+
+    def reconstruct(chunk):
+        nonlocal box, age
+        boxes, masks = [], []
+        for _time, frame in chunk:
+            if box is None or interval == 0 or age >= interval:
+                # Only the first mask may report progress (it covers the
+                # BiRefNet download); later ones would rewind the clip's bar.
+                with progress.task_context(None) if index else nullcontext():
+                    mask, bboxes = auto_mask_bgr(cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
+                box, age = bboxes[0], 0
+                masks.append(mask)
+            else:
+                age += 1
+                masks.append(None)
+            boxes.append(box)
+        outputs = estimator.process_frames(
+            [frame for _time, frame in chunk],
+            np.stack(boxes),
+            masks,
+            inference_type=inference_type,
+        )
+        height, width = chunk[0][1].shape[:2]
+        poses = [_pose_data_from_output(output, height, width) for output in outputs]
+        try:
+            _attach_canonical_skeletons(poses, loaded["model"], device)
+        except Exception as exc:
+            print(f"[VNCCS] SAM3D rest skeleton export failed: {exc}")
+        # The mini-batch's last frame seeds the box for the next one.
+        box = _track_box_from_keypoints(outputs[-1]["pred_keypoints_2d"], width, height)
+        return poses
+
+    chunk = []
+    for item in frames:
+        time, frame = item if isinstance(item, tuple) else (None, item)
+        chunk.append((time, _video_frame_rgb(frame)))
+        if len(chunk) < size:
+            continue
+        for (time, _frame), pose_data in zip(chunk, reconstruct(chunk)):
+            yield index, time, pose_data, _public_track(box, age)
+            index += 1
+        chunk = []
+        if count:
+            progress.update(f"Reconstructed {index}/{count} video frames...", 5 + 90 * index / count)
+    if chunk:
+        for (time, _frame), pose_data in zip(chunk, reconstruct(chunk)):
+            yield index, time, pose_data, _public_track(box, age)
+            index += 1
+    progress.finish(f"Reconstructed {index} video frames.")
+
+
+def _public_track(box, age):
+    if box is None:
+        return None
+    return {"bbox": [float(value) for value in box], "age": int(age)}
+
+
 def process_pose_json_to_overlay_mesh(pose_data, body_preset=None, pose_adjust=0.0):
     """Build the same postprocessed MHR mesh used by the SAM render node.
 
@@ -1,7 +1,9 @@
 import os
 import json
-import tempfile
 import math
+import hashlib
+import threading
+from collections import OrderedDict
 import torch
 import numpy as np
 import cv2
@@ -20,6 +22,16 @@ def comfy_image_to_numpy(image):
     return img_np[..., ::-1].copy()  # RGB -> BGR
 
 
+def comfy_image_to_rgb_numpy(image):
+    """Convert ComfyUI image tensor [B,H,W,C] to contiguous uint8 RGB [H,W,3].
+
+    Quantizes on the tensor's device so only the uint8 frame is copied to
+    the host; truncation matches ``comfy_image_to_numpy``.
+    """
+    img = (image[0, ..., :3] * 255).to(torch.uint8)
+    return np.ascontiguousarray(img.cpu().numpy())
+
+
 def comfy_mask_to_numpy(mask):
     """Convert ComfyUI mask tensor [N,H,W] to numpy [N,H,W]."""
     return mask.cpu().numpy()
@@ -282,8 +294,12 @@ _FACE_BS_CACHE = {
     "rest_verts": None,              # np.float32 [V, 3]
     "rest_joint_rots": None,         # np.float32 [127, 3, 3]
     "rest_joint_coords": None,       # np.float32 [127, 3]
+    "rest_joint_rots_inv": None,     # np.float32 [127, 3, 3]  inverse rest rotations
     "dominant_joint": None,          # np.int32  [V]  per-vertex dominant MHR joint idx
     "lbs_weights": None,             # np.float32 [V, J]  full MHR LBS weight matrix
+    "lbs_topk_joints": None,         # np.int32   [V, K]  strongest K joints per vertex
+    "lbs_topk_weights": None,        # np.float32 [V, K]  their row-normalized weights;
+                                     #   what the deformation kernels skin with
     "rest_weighted_joint_pos": None, # np.float32 [V, 3]  per-vertex LBS-weighted
                                      #   joint-anchor position at rest
     "rest_offset_len": None,         # np.float32 [V]  |rest_verts - rest_weighted_joint|
@@ -350,15 +366,12 @@ def apply_pose_lean_correction_mesh(
     if not math.isfinite(s) or s <= 1e-6:
         return vertices
 
-    lbs_weights = _FACE_BS_CACHE.get("lbs_weights")
+    topk_joints = _FACE_BS_CACHE.get("lbs_topk_joints")
+    topk_weights = _FACE_BS_CACHE.get("lbs_topk_weights")
     parents = _FACE_BS_CACHE.get("joint_parents")
-    if lbs_weights is None or parents is None or joint_coords_posed is None:
+    if topk_joints is None or topk_weights is None or parents is None or joint_coords_posed is None:
         return vertices
 
-    w_sum = lbs_weights.sum(axis=1, keepdims=True).astype(np.float32)
-    w_sum_safe = np.where(w_sum > 1e-6, w_sum, 1.0)
-    w_norm = (lbs_weights / w_sum_safe).astype(np.float32)
-
     verts = vertices.astype(np.float32, copy=True)
     coords = joint_coords_posed.astype(np.float32, copy=True)
     active_chain = chain if chain is not None else _LEAN_CHAIN_DEFAULT
@@ -374,7 +387,8 @@ def apply_pose_lean_correction_mesh(
             continue
 
         pivot = coords[joint_id].copy()
-        sub_w = w_norm[:, subtree].sum(axis=1).astype(np.float32)
+        in_subtree = np.isin(topk_joints, subtree)
+        sub_w = (topk_weights * in_subtree).sum(axis=1).astype(np.float32)
         eff = (-theta) * sub_w
         c = np.cos(eff)
         sn = np.sin(eff)
@@ -478,6 +492,61 @@ def _compute_rest_lbs_anchors(
     return rest_anchor.astype(np.float32), rest_len, Wsum_safe
 
 
+# Each MHR vertex is skinned to a handful of joints, so the dense [V, J]
+# weight matrix is almost entirely zeros. The deformation kernels skin
+# with a per-vertex top-K view of it instead, K being the largest
+# influence count in the model (capped here), which turns every
+# O(V·J) blend into O(V·K).
+_LBS_MAX_INFLUENCES = 16
+
+
+def _build_sparse_lbs(W: np.ndarray, max_influences: int = _LBS_MAX_INFLUENCES) -> tuple:
+    """Return ``(joints [V, K] int32, weights [V, K] float32)``: each
+    vertex's strongest joints, strongest first, with weights normalized to
+    sum to 1. Exact whenever no vertex has more than ``max_influences``
+    non-zero weights; otherwise the weakest ones are dropped and the rest
+    renormalized."""
+    influences = int((W > 0).sum(axis=1).max(initial=0))
+    k = max(1, min(influences, int(max_influences), W.shape[1]))
+    joints = np.argsort(-W, axis=1, kind="stable")[:, :k]
+    weights = np.maximum(np.take_along_axis(W, joints, axis=1), 0.0).astype(np.float32)
+    total = weights.sum(axis=1, keepdims=True)
+    weights /= np.where(total > 1e-6, total, 1.0)
+    return joints.astype(np.int32), weights
+
+
+def _sparse_lbs_blend(joints: np.ndarray, weights: np.ndarray, per_joint: np.ndarray) -> np.ndarray:
+    """Σ_k weights[v, k] · per_joint[joints[v, k]] for a per-joint array of
+    any trailing shape ([J], [J, 3], [J, 3, 3]): one gather into
+    [V, K, D] and one batched [1, K] @ [K, D] product per vertex."""
+    per_joint = np.asarray(per_joint, dtype=np.float32)
+    flat = per_joint.reshape(per_joint.shape[0], -1)
+    gathered = np.take(flat, joints, axis=0)                     # [V, K, D]
+    out = np.matmul(weights[:, None, :], gathered)[:, 0]         # [V, D]
+    return out.reshape((joints.shape[0],) + per_joint.shape[1:])
+
+
+def _invert_rest_rotations(rest_rots: np.ndarray) -> np.ndarray:
+    """Inverse rest rotations, falling back to the transpose for any
+    singular joint."""
+    try:
+        return np.linalg.inv(rest_rots).astype(np.float32)
+    except np.linalg.LinAlgError:
+        inv = np.empty_like(rest_rots, dtype=np.float32)
+        for j in range(rest_rots.shape[0]):
+            try:
+                inv[j] = np.linalg.inv(rest_rots[j])
+            except np.linalg.LinAlgError:
+                inv[j] = rest_rots[j].T
+        return inv
+
+
+def _relative_joint_rotations(joint_rots_posed: np.ndarray, rest_rots_inv: np.ndarray) -> np.ndarray:
+    """Per-joint rest->posed relative rotation R_posed · R_rest⁻¹, [J, 3, 3]."""
+    posed = np.asarray(joint_rots_posed, dtype=np.float32)[:rest_rots_inv.shape[0]]
+    return np.matmul(posed, rest_rots_inv).astype(np.float32)
+
+
 def _compute_dominant_joints(mhr_head, num_verts: int, num_joints: int = 127):
     """Reconstruct per-vertex dominant joint index from MHR's sparse LBS
     buffers. MHR stores skinning as three flattened arrays:
@@ -550,6 +619,9 @@ def _get_mhr_rest_verts(mhr_head, device):
     _FACE_BS_CACHE["rest_verts"] = v
     _FACE_BS_CACHE["rest_joint_rots"] = r.astype(np.float32) if r is not None else None
     _FACE_BS_CACHE["rest_joint_coords"] = c.astype(np.float32) if c is not None else None
+    _FACE_BS_CACHE["rest_joint_rots_inv"] = (
+        _invert_rest_rotations(r.astype(np.float32)) if r is not None else None
+    )
     dom = _compute_dominant_joints(
         mhr_head, num_verts=v.shape[0],
         num_joints=r.shape[0] if r is not None else 127,
@@ -567,6 +639,9 @@ def _get_mhr_rest_verts(mhr_head, device):
         num_joints = r.shape[0] if r is not None else 127
         W = _build_lbs_weights(mhr_head, num_verts=v.shape[0], num_joints=num_joints)
         _FACE_BS_CACHE["lbs_weights"] = W
+        topk_joints, topk_weights = _build_sparse_lbs(W)
+        _FACE_BS_CACHE["lbs_topk_joints"] = topk_joints
+        _FACE_BS_CACHE["lbs_topk_weights"] = topk_weights
         anchor, rest_len, _ = _compute_rest_lbs_anchors(v, c, W)
         _FACE_BS_CACHE["rest_weighted_joint_pos"] = anchor
         _FACE_BS_CACHE["rest_offset_len"] = rest_len
@@ -583,6 +658,8 @@ def _get_mhr_rest_verts(mhr_head, device):
         _FACE_BS_CACHE["normalize_mask"] = strength  # now a [V] float in [0,1]
     else:
         _FACE_BS_CACHE["lbs_weights"] = None
+        _FACE_BS_CACHE["lbs_topk_joints"] = None
+        _FACE_BS_CACHE["lbs_topk_weights"] = None
         _FACE_BS_CACHE["rest_weighted_joint_pos"] = None
         _FACE_BS_CACHE["rest_offset_len"] = None
         _FACE_BS_CACHE["normalize_mask"] = None
@@ -630,14 +707,14 @@ def _normalize_bone_lengths(vertices: np.ndarray,
     corrected to rest bone lengths; knee/elbow/wrist crease regions stay
     as pure LBS output.
     """
-    W = _FACE_BS_CACHE.get("lbs_weights")
+    topk_joints = _FACE_BS_CACHE.get("lbs_topk_joints")
+    topk_weights = _FACE_BS_CACHE.get("lbs_topk_weights")
     rest_len = _FACE_BS_CACHE.get("rest_offset_len")
     strength = _FACE_BS_CACHE.get("normalize_mask")  # [V] float in [0, 1]
-    if W is None or rest_len is None or strength is None or not np.any(strength):
+    if (topk_joints is None or topk_weights is None or rest_len is None
+            or strength is None or not np.any(strength)):
         return vertices
-    Wsum = W.sum(axis=1)
-    Wsum_safe = np.where(Wsum > 1e-6, Wsum, 1.0).astype(np.float32)
-    posed_anchor = (W @ posed_joint_coords) / Wsum_safe[:, None]  # [V, 3]
+    posed_anchor = _sparse_lbs_blend(topk_joints, topk_weights, posed_joint_coords)  # [V, 3]
     posed_offset = vertices - posed_anchor                        # [V, 3]
     posed_len = np.linalg.norm(posed_offset, axis=1).astype(np.float32)
     safe_posed = np.where(posed_len > 1e-6, posed_len, 1.0)
@@ -754,9 +831,10 @@ def _apply_face_blendshapes(vertices: np.ndarray,
     """
     if not any(float(v) != 0.0 for v in sliders.values()):
         return vertices
-    rest_rots = _FACE_BS_CACHE.get("rest_joint_rots")
-    W = _FACE_BS_CACHE.get("lbs_weights")
-    if rest_rots is None or W is None:
+    rest_rots_inv = _FACE_BS_CACHE.get("rest_joint_rots_inv")
+    topk_joints = _FACE_BS_CACHE.get("lbs_topk_joints")
+    topk_weights = _FACE_BS_CACHE.get("lbs_topk_weights")
+    if rest_rots_inv is None or topk_joints is None or topk_weights is None:
         return vertices
 
     region_ids, region_deltas = _load_face_blendshapes(
@@ -765,21 +843,7 @@ def _apply_face_blendshapes(vertices: np.ndarray,
     if not region_deltas:
         return vertices
 
-    # Precompute rest->posed relative rotation per joint.
-    R_rel_all = np.zeros_like(rest_rots)              # [J, 3, 3]
-    for j in range(rest_rots.shape[0]):
-        R_posed = joint_rots_posed[j].astype(np.float32)
-        R_rest  = rest_rots[j]
-        try:
-            R_rest_inv = np.linalg.inv(R_rest).astype(np.float32)
-        except np.linalg.LinAlgError:
-            R_rest_inv = R_rest.T.astype(np.float32)
-        R_rel_all[j] = (R_posed @ R_rest_inv).astype(np.float32)
-
-    # Normalize LBS weights once.
-    Wsum = W.sum(axis=1, keepdims=True)
-    Wsum_safe = np.where(Wsum > 1e-6, Wsum, 1.0).astype(np.float32)
-    W_norm = (W / Wsum_safe).astype(np.float32)        # [V, J]
+    R_rel_all = _relative_joint_rotations(joint_rots_posed, rest_rots_inv)  # [J, 3, 3]
 
     out = vertices.copy()
     for obj_name, shape_dict in region_deltas.items():
@@ -804,8 +868,9 @@ def _apply_face_blendshapes(vertices: np.ndarray,
         # nearest rotation via SVD: U, Σ, Vᵀ = SVD(R_eff), R_ortho = U·Vᵀ.
         # With the mirror-reflection correction this guarantees det=+1 and
         # columns unit-length, so deltas rotate without scale compression.
-        region_W = W_norm[mhr_ids]                                      # [N, J]
-        R_eff = np.einsum("vj,jab->vab", region_W, R_rel_all)            # [N, 3, 3]
+        R_eff = _sparse_lbs_blend(
+            topk_joints[mhr_ids], topk_weights[mhr_ids], R_rel_all,
+        )                                                                # [N, 3, 3]
         U, _S, Vt = np.linalg.svd(R_eff)                                 # batched 3×3 SVD
         # Detect reflections (det = -1) and flip last right-singular row.
         det_uvt = np.linalg.det(np.einsum("vij,vjk->vik", U, Vt))
@@ -944,28 +1009,21 @@ def _apply_bone_length_scales(vertices: np.ndarray,
     if (arm_scale == 1.0 and leg_scale == 1.0
             and torso_scale == 1.0 and neck_scale == 1.0):
         return vertices
-    W = _FACE_BS_CACHE.get("lbs_weights")
-    rest_rots = _FACE_BS_CACHE.get("rest_joint_rots")
+    topk_joints = _FACE_BS_CACHE.get("lbs_topk_joints")
+    topk_weights = _FACE_BS_CACHE.get("lbs_topk_weights")
+    rest_rots_inv = _FACE_BS_CACHE.get("rest_joint_rots_inv")
     rest_coords = _FACE_BS_CACHE.get("rest_joint_coords")
     rest_verts = _FACE_BS_CACHE.get("rest_verts")
     parents = _FACE_BS_CACHE.get("joint_parents")
     cats = _FACE_BS_CACHE.get("joint_chain_cats")
-    if (W is None or rest_rots is None or rest_coords is None
-            or rest_verts is None or parents is None or cats is None
-            or joint_rots_posed is None):
+    if (topk_joints is None or topk_weights is None or rest_rots_inv is None
+            or rest_coords is None or rest_verts is None or parents is None
+            or cats is None or joint_rots_posed is None):
         return vertices
-    num_joints = rest_rots.shape[0]
+    num_joints = rest_rots_inv.shape[0]
 
     # Per-joint rest->posed relative rotation.
-    R_rel_all = np.zeros_like(rest_rots)
-    for j in range(num_joints):
-        R_posed = joint_rots_posed[j].astype(np.float32)
-        R_rest = rest_rots[j]
-        try:
-            R_rest_inv = np.linalg.inv(R_rest).astype(np.float32)
-        except np.linalg.LinAlgError:
-            R_rest_inv = R_rest.T.astype(np.float32)
-        R_rel_all[j] = (R_posed @ R_rest_inv).astype(np.float32)
+    R_rel_all = _relative_joint_rotations(joint_rots_posed, rest_rots_inv)
 
     scale_by_cat = np.array(
         [1.0, float(torso_scale), float(neck_scale),
@@ -1044,20 +1102,20 @@ def _apply_bone_length_scales(vertices: np.ndarray,
         posed_delta[j]         = posed_delta[p]         + (float(joint_scale[j])         - 1.0) * link
         posed_delta_no_neck[j] = posed_delta_no_neck[p] + (float(joint_scale_no_neck[j]) - 1.0) * link
 
-    Wsum = W.sum(axis=1, keepdims=True)
-    Wsum_safe = np.where(Wsum > 1e-6, Wsum, 1.0).astype(np.float32)
-    W_norm = (W / Wsum_safe).astype(np.float32)  # [V, J]
-
-    # Mesh isotropic scaling term using mesh_scale (not joint_scale).
-    # Per-joint loop keeps memory bounded (no [V, J, 3] temporary).
-    mesh_delta = np.zeros_like(rest_verts, dtype=np.float32)
-    for j in range(num_joints):
-        ms = float(mesh_scale[j])
-        if abs(ms - 1.0) < 1e-6:
-            continue
-        local = (rest_verts - rest_coords[j]).astype(np.float32)
-        rotated = local @ R_rel_all[j].T
-        mesh_delta += (ms - 1.0) * W_norm[:, j:j+1] * rotated
+    # Mesh isotropic scaling term using mesh_scale (not joint_scale):
+    #   Σ_j w_j (ms_j - 1) R_rel[j] (rest_V - rest_joint[j])
+    #     = A_V · rest_V - Σ_j w_j (ms_j - 1) R_rel[j] rest_joint[j]
+    # with A_V the per-vertex blend of (ms_j - 1) R_rel[j], so only the
+    # vertex's own top-K joints are touched.
+    mesh_excess = mesh_scale - 1.0
+    mesh_excess[np.abs(mesh_excess) < 1e-6] = 0.0
+    scaled_rot = mesh_excess[:, None, None] * R_rel_all                    # [J, 3, 3]
+    scaled_anchor = np.einsum("jab,jb->ja", scaled_rot, rest_coords)        # [J, 3]
+    A = _sparse_lbs_blend(topk_joints, topk_weights, scaled_rot)            # [V, 3, 3]
+    mesh_delta = (
+        np.einsum("vab,vb->va", A, rest_verts.astype(np.float32))
+        - _sparse_lbs_blend(topk_joints, topk_weights, scaled_anchor)
+    ).astype(np.float32)
 
     # Compose term_C. For face-dominant vertices (heavily skinned to
     # head + face sub-joints), replace the LBS-blended NECK contribution
@@ -1067,10 +1125,12 @@ def _apply_bone_length_scales(vertices: np.ndarray,
     _HEAD_ID = 113
     _FACE_JOINT_RANGE = np.arange(113, min(127, num_joints), dtype=np.int64)
     posed_delta_neck = posed_delta - posed_delta_no_neck  # [J, 3]
-    term_C_no_neck   = (W_norm @ posed_delta_no_neck).astype(np.float32)
-    term_C_neck_lbs  = (W_norm @ posed_delta_neck).astype(np.float32)
+    term_C_no_neck   = _sparse_lbs_blend(topk_joints, topk_weights, posed_delta_no_neck)
+    term_C_neck_lbs  = _sparse_lbs_blend(topk_joints, topk_weights, posed_delta_neck)
 
-    face_weight = W_norm[:, _FACE_JOINT_RANGE].sum(axis=1).astype(np.float32)
+    face_weight = (
+        topk_weights * np.isin(topk_joints, _FACE_JOINT_RANGE)
+    ).sum(axis=1).astype(np.float32)
     LOW, HIGH = 0.5, 0.9
     t = np.clip((face_weight - LOW) / (HIGH - LOW), 0.0, 1.0)
     # smoothstep fade: 3t^2 - 2t^3
@@ -1161,6 +1221,8 @@ def _load_sam3d_model(model_config):
     )
 
     print(f"[SAM3DBody] Model loaded successfully on {device}")
+    # Posed meshes cached by the render node belong to the previous model.
+    clear_render_cache()
     progress.update("Step 2/6: SAM 3D Body model loaded.", 36)
 
     # Cache for reuse
@@ -1168,6 +1230,7 @@ def _load_sam3d_model(model_config):
         "model": sam_3d_model,
         "model_cfg": model_cfg,
         "device": device,
+        "ckpt_path": ckpt_path,
         "mhr_path": mhr_path,
     }
     _MODEL_CACHE[cache_key] = result
@@ -1296,7 +1359,13 @@ def _extract_pose_json(mesh_data, image, debug_scale=False):
     raw_output = mesh_data.get("raw_output", {}) if isinstance(mesh_data, dict) else {}
     img_h = int(image.shape[1]) if hasattr(image, "shape") and len(image.shape) > 1 else 0
     img_w = int(image.shape[2]) if hasattr(image, "shape") and len(image.shape) > 2 else 0
-    pose_json = {
+    pose_json = _pose_data_from_output(raw_output, img_h, img_w, debug_scale=debug_scale)
+    return json.dumps(pose_json, ensure_ascii=False, indent=2)
+
+
+def _pose_data_from_output(raw_output, img_h, img_w, debug_scale=False):
+    """Serializable pose dict for one estimator output (the pose_json layout)."""
+    return {
         "body_pose_params": _to_serializable(raw_output.get("body_pose_params")),
         "hand_pose_params": _to_serializable(raw_output.get("hand_pose_params")),
         "global_rot": _to_serializable(raw_output.get("global_rot")),
@@ -1316,7 +1385,6 @@ def _extract_pose_json(mesh_data, image, debug_scale=False):
         },
         "_debug_scale": bool(debug_scale),
     }
-    return json.dumps(pose_json, ensure_ascii=False, indent=2)
 
 
 def _to_batched_tensor(value, device, width=None):
@@ -1333,66 +1401,201 @@ def _to_batched_tensor(value, device, width=None):
     return tensor
 
 
-def _render_mesh_software(vertices, faces, cam_t, focal_length, image):
-    h, w = image.shape[:2]
+# Software renderer tuning. Pixels are sampled on a SUPERSAMPLE x SUPERSAMPLE
+# grid and box-filtered, which stands in for the anti-aliased polygon edges of
+# the old per-face fill. Candidate pixels are processed in face chunks of at
+# most MAX_CANDIDATES so one near-camera triangle cannot exhaust memory.
+_SOFTWARE_RENDER_SUPERSAMPLE = 2
+_SOFTWARE_RENDER_MAX_CANDIDATES = 1 << 22
+_SOFTWARE_RENDER_LIGHT = np.array([0.25, -0.35, 1.0], dtype=np.float32)
+_SOFTWARE_RENDER_LIGHT /= np.linalg.norm(_SOFTWARE_RENDER_LIGHT) + 1e-8
+_SOFTWARE_RENDER_BASE_COLOR = np.array([198, 214, 220], dtype=np.float32)
+
+
+def _project_mesh_view(vertices, cam_t, focal_length, width, height):
+    """Camera-space vertices and their pixel positions for one view."""
     verts = np.asarray(vertices, dtype=np.float32).copy()
-    if verts.ndim == 3:
-        verts = verts[0]
     if verts.ndim != 2 or verts.shape[-1] != 3:
         raise ValueError(f"Expected vertices with shape [V,3], got {verts.shape}")
     cam = np.asarray(cam_t, dtype=np.float32).reshape(3)
-    faces = np.asarray(faces, dtype=np.int32)
 
     # Match the original SAM3DBody viewer convention.
     verts[:, 1] *= -1.0
     verts[:, 2] *= -1.0
-
-    verts[:, 0] += cam[0]
-    verts[:, 1] += cam[1]
-    verts[:, 2] += cam[2]
+    verts += cam
 
     z = np.maximum(verts[:, 2], 1e-4)
-    x = (verts[:, 0] * focal_length / z) + (w * 0.5)
-    y = (verts[:, 1] * focal_length / z) + (h * 0.5)
-    pts2d = np.stack([x, y], axis=1)
+    x = (verts[:, 0] * focal_length / z) + (width * 0.5)
+    y = (verts[:, 1] * focal_length / z) + (height * 0.5)
+    return verts, np.stack([x, y], axis=1)
 
-    out = image.astype(np.float32).copy()
-    light_dir = np.array([0.25, -0.35, 1.0], dtype=np.float32)
-    light_dir /= np.linalg.norm(light_dir) + 1e-8
-    base_color = np.array([198, 214, 220], dtype=np.float32)
 
-    face_depth = verts[faces][:, :, 2].mean(axis=1)
-    order = np.argsort(face_depth)[::-1]
+def _shade_mesh_faces(verts, pts2d, faces, width, height):
+    """Flat face colors plus the mask of faces that survive culling.
 
-    for idx in order:
-        tri = faces[idx]
-        tri_3d = verts[tri]
-        tri_2d = pts2d[tri]
+    Drops faces with non-finite projections, degenerate normals, back faces
+    and faces entirely off one image edge — the same tests the per-face
+    loop applied, evaluated for every face at once.
+    """
+    tri_3d = verts[faces]
+    tri_2d = pts2d[faces]
+    with np.errstate(invalid="ignore", over="ignore"):
+        normal = np.cross(tri_3d[:, 1] - tri_3d[:, 0], tri_3d[:, 2] - tri_3d[:, 0])
+        n_norm = np.linalg.norm(normal, axis=1)
+        visible = np.isfinite(tri_2d).all(axis=(1, 2)) & (n_norm >= 1e-8)
+        normal /= np.maximum(n_norm, 1e-8)[:, None]
+        visible &= normal[:, 2] < 0
+        poly = np.round(tri_2d)
+        visible &= ~(
+            (poly[..., 0] < 0).all(axis=1)
+            | (poly[..., 0] >= width).all(axis=1)
+            | (poly[..., 1] < 0).all(axis=1)
+            | (poly[..., 1] >= height).all(axis=1)
+        )
+        shade = np.clip(-(normal @ _SOFTWARE_RENDER_LIGHT), 0.15, 1.0)
+    colors = np.clip(_SOFTWARE_RENDER_BASE_COLOR * (0.55 + 0.45 * shade[:, None]), 0, 255)
+    return visible, np.nan_to_num(colors).astype(np.uint8)
 
-        if np.any(~np.isfinite(tri_2d)):
-            continue
 
-        v1 = tri_3d[1] - tri_3d[0]
-        v2 = tri_3d[2] - tri_3d[0]
-        normal = np.cross(v1, v2)
-        n_norm = np.linalg.norm(normal)
-        if n_norm < 1e-8:
-            continue
-        normal /= n_norm
+def _rasterize_faces(tri_2d, tri_z, width, height):
+    """Z-buffered triangle coverage; returns the winning face per pixel (-1 = none).
 
-        # Cull backfaces.
-        if normal[2] >= 0:
+    Each face expands to the pixel centers inside its clipped bounding box,
+    edge functions keep the covered ones, and perspective-correct 1/z picks
+    the nearest face per pixel — all as flat NumPy arrays, in face chunks.
+    """
+    depth = np.zeros(height * width, dtype=np.float32)
+    face_ids = np.full(height * width, -1, dtype=np.int32)
+    if len(tri_2d) == 0:
+        return face_ids.reshape(height, width)
+
+    tri_2d = np.asarray(tri_2d, dtype=np.float32)
+    x0 = np.clip(np.ceil(tri_2d[..., 0].min(axis=1) - 0.5), 0, width).astype(np.int32)
+    x1 = np.clip(np.floor(tri_2d[..., 0].max(axis=1) - 0.5), -1, width - 1).astype(np.int32)
+    y0 = np.clip(np.ceil(tri_2d[..., 1].min(axis=1) - 0.5), 0, height).astype(np.int32)
+    y1 = np.clip(np.floor(tri_2d[..., 1].max(axis=1) - 0.5), -1, height - 1).astype(np.int32)
+    box_w = np.maximum(x1 - x0 + 1, 0)
+    counts = box_w.astype(np.int64) * np.maximum(y1 - y0 + 1, 0)
+    a, b, c = tri_2d[:, 0], tri_2d[:, 1], tri_2d[:, 2]
+    area = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+    counts[np.abs(area) < 1e-12] = 0
+    # Per-face edge equations: w_k(x, y) = (ex_k * y - ey_k * x + k_k) / area.
+    ex = np.stack([c[:, 0] - b[:, 0], a[:, 0] - c[:, 0]], axis=1)
+    ey = np.stack([c[:, 1] - b[:, 1], a[:, 1] - c[:, 1]], axis=1)
+    origin = np.stack([b, c], axis=1)
+    offset = ey * origin[..., 0] - ex * origin[..., 1]
+    inv_area = 1.0 / np.where(np.abs(area) < 1e-12, 1.0, area)
+    inv_z = (1.0 / np.maximum(np.asarray(tri_z, dtype=np.float32), 1e-4)).astype(np.float32)
+
+    ends = np.cumsum(counts)
+    start = 0
+    while start < len(counts):
+        # Largest run of faces whose candidates fit the chunk budget (at
+        # least one face, however large).
+        limit = (ends[start - 1] if start else 0) + _SOFTWARE_RENDER_MAX_CANDIDATES
+        stop = max(start + 1, int(np.searchsorted(ends, limit, side="right")))
+        chunk = np.arange(start, stop)
+        start = stop
+        chunk = chunk[counts[chunk] > 0]
+        if not len(chunk):
             continue
-
-        shade = np.clip(-float(np.dot(normal, light_dir)), 0.15, 1.0)
-        color = np.clip(base_color * (0.55 + 0.45 * shade), 0, 255).astype(np.uint8)
-
-        poly = np.round(tri_2d).astype(np.int32).reshape((-1, 1, 2))
-        if np.all(poly[:, 0, 0] < 0) or np.all(poly[:, 0, 0] >= w) or np.all(poly[:, 0, 1] < 0) or np.all(poly[:, 0, 1] >= h):
+        chunk_counts = counts[chunk]
+        face = np.repeat(chunk.astype(np.int32), chunk_counts)
+        local = np.arange(len(face), dtype=np.int32) - np.repeat(
+            (np.cumsum(chunk_counts) - chunk_counts).astype(np.int32), chunk_counts
+        )
+        width_of = box_w[face]
+        py = local // width_of
+        px = x0[face] + (local - py * width_of)
+        py += y0[face]
+        sx = px.astype(np.float32) + 0.5
+        sy = py.astype(np.float32) + 0.5
+        scale = inv_area[face]
+        w0 = (ex[face, 0] * sy - ey[face, 0] * sx + offset[face, 0]) * scale
+        w1 = (ex[face, 1] * sy - ey[face, 1] * sx + offset[face, 1]) * scale
+        w2 = 1.0 - w0 - w1
+        inside = (w0 >= -1e-6) & (w1 >= -1e-6) & (w2 >= -1e-6)
+        if not inside.any():
             continue
-        cv2.fillConvexPoly(out, poly, color=tuple(int(c) for c in color.tolist()), lineType=cv2.LINE_AA)
+        face, w0, w1, w2 = face[inside], w0[inside], w1[inside], w2[inside]
+        pixel = py[inside].astype(np.int64) * width + px[inside]
+        near = np.maximum(
+            w0 * inv_z[face, 0] + w1 * inv_z[face, 1] + w2 * inv_z[face, 2], 0.0
+        ).astype(np.float32)
+
+        # Nearest candidate per pixel inside the chunk, then against the
+        # buffer. Non-negative float32 bit patterns sort like their values,
+        # so one int64 key orders by pixel, then nearest first; the stable
+        # sort and strict ``>`` give depth ties to the lower face index.
+        key = (pixel << 32) | (0xFFFFFFFF - near.view(np.uint32).astype(np.int64))
+        order = np.argsort(key, kind="stable")
+        pixel, near, face = pixel[order], near[order], face[order]
+        first = np.ones(len(pixel), dtype=bool)
+        first[1:] = pixel[1:] != pixel[:-1]
+        pixel, near, face = pixel[first], near[first], face[first]
+        closer = near > depth[pixel]
+        depth[pixel[closer]] = near[closer]
+        face_ids[pixel[closer]] = face[closer]
+    return face_ids.reshape(height, width)
+
+
+def _render_mesh_software_batch(vertices, faces, cam_t, focal_length, image,
+                                supersample=_SOFTWARE_RENDER_SUPERSAMPLE):
+    """Render several views of one mesh topology in one call.
+
+    ``vertices`` is [N,V,3] (one posed mesh per view) and ``cam_t`` is [N,3]
+    or a single [3] camera shared by every view. ``focal_length`` is a
+    scalar or one value per view, and ``image`` is one [H,W,3] background
+    or one per view. Returns [N,H,W,3] uint8.
+    """
+    verts_all = np.asarray(vertices, dtype=np.float32)
+    if verts_all.ndim == 2:
+        verts_all = verts_all[None]
+    views = len(verts_all)
+    cams = np.broadcast_to(np.asarray(cam_t, dtype=np.float32).reshape(-1, 3), (views, 3))
+    focals = np.broadcast_to(np.asarray(focal_length, dtype=np.float32).reshape(-1), (views,))
+    backgrounds = np.asarray(image)
+    if backgrounds.ndim == 3:
+        backgrounds = np.broadcast_to(backgrounds, (views,) + backgrounds.shape)
+    faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+    scale = max(1, int(supersample))
+    h, w = backgrounds.shape[1:3]
+
+    rendered = np.empty((views, h, w, 3), dtype=np.uint8)
+    for view in range(views):
+        verts, pts2d = _project_mesh_view(verts_all[view], cams[view], float(focals[view]), w, h)
+        visible, colors = _shade_mesh_faces(verts, pts2d, faces, w, h)
+        kept = faces[visible]
+        face_ids = _rasterize_faces(
+            pts2d[kept] * scale,
+            verts[kept][:, :, 2],
+            w * scale,
+            h * scale,
+        )
+        # Average the subsamples of each output pixel: covered ones take
+        # their face color, uncovered ones the background.
+        background = backgrounds[view].astype(np.float32)
+        palette = colors[visible].astype(np.float32)
+        accumulated = np.zeros((h, w, 3), dtype=np.float32)
+        for dy in range(scale):
+            for dx in range(scale):
+                ids = face_ids[dy::scale, dx::scale]
+                covered = ids >= 0
+                sample = background.copy()
+                sample[covered] = palette[ids[covered]]
+                accumulated += sample
+        accumulated /= scale * scale
+        rendered[view] = np.clip(np.rint(accumulated), 0, 255).astype(np.uint8)
+    return rendered
+
 
-    return np.clip(out, 0, 255).astype(np.uint8)
+def _render_mesh_software(vertices, faces, cam_t, focal_length, image):
+    verts = np.asarray(vertices, dtype=np.float32)
+    if verts.ndim == 3:
+        verts = verts[0]
+    if verts.ndim != 2 or verts.shape[-1] != 3:
+        raise ValueError(f"Expected vertices with shape [V,3], got {verts.shape}")
+    return _render_mesh_software_batch(verts[None], faces, cam_t, focal_length, image)[0]
 
 
 class SAM3DBodyProcessToJson:
@@ -1475,7 +1678,9 @@ class SAM3DBodyProcessToJson:
             fov_estimator=None,
         )
 
-        img_bgr = comfy_image_to_numpy(image)
+        # The estimator takes the RGB frame directly; the old temp-JPEG
+        # hand-off re-encoded every import lossily and decoded it again.
+        img_rgb = comfy_image_to_rgb_numpy(image)
         mask_np = None
         bboxes = None
         bbox_source = None
@@ -1489,7 +1694,7 @@ class SAM3DBodyProcessToJson:
             progress.update("Step 3/6: Body bounds extracted from mask.", 54)
         else:
             progress.update("Step 3/6: Segmenting the person before pose reconstruction...", 38)
-            mask_np, bboxes = auto_mask_bgr(img_bgr)
+            mask_np, bboxes = auto_mask_bgr(cv2.cvtColor(img_rgb, cv2.COLOR_RGB2BGR))
             bbox_source = "auto_mask"
 
         debug_scale = _scale_debug_enabled(debug_scale)
@@ -1499,29 +1704,22 @@ class SAM3DBodyProcessToJson:
                 mask_coverage = round(float(np.mean(mask_np > 0.5)), 6)
             _scale_debug_log(
                 "process.input",
-                image_size=[int(img_bgr.shape[1]), int(img_bgr.shape[0])],
+                image_size=[int(img_rgb.shape[1]), int(img_rgb.shape[0])],
                 bbox_source=bbox_source,
                 bbox=_debug_bbox_block(bboxes[0] if bboxes is not None and len(bboxes) else None),
                 mask_coverage=mask_coverage,
                 inference_type=str(inference_type),
             )
 
-        with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp:
-            cv2.imwrite(tmp.name, img_bgr)
-            tmp_path = tmp.name
-        try:
-            progress.update("Step 4/6: Running SAM 3D Body pose reconstruction...", 60)
-            outputs = estimator.process_one_image(
-                tmp_path,
-                bboxes=bboxes,
-                masks=mask_np,
-                bbox_thr=bbox_threshold,
-                use_mask=(mask_np is not None),
-                inference_type=inference_type,
-            )
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        progress.update("Step 4/6: Running SAM 3D Body pose reconstruction...", 60)
+        outputs = estimator.process_one_image(
+            img_rgb,
+            bboxes=bboxes,
+            masks=mask_np,
+            bbox_thr=bbox_threshold,
+            use_mask=(mask_np is not None),
+            inference_type=inference_type,
+        )
 
         if not outputs:
             raise RuntimeError("No people detected in image")
@@ -1676,6 +1874,116 @@ class SAM3DBodySettingBodyPresetJson:
         return (json.dumps(settings, ensure_ascii=False, indent=2),)
 
 
+# Render-node result caches. Iterative framing re-queues the render node
+# with only the camera widgets or the background changed, so it is split in
+# two layers: the deformed mesh, keyed by everything that shapes it (model,
+# pose_json, canonical body preset, pose_adjust, preset pack), and the
+# rendered frame, keyed additionally by the camera controls and background.
+# Each layer is a byte-bounded LRU of read-only arrays with hit/miss
+# counters; the lock guards entries, byte totals, and counters.
+_RENDER_MESH_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_RENDER_IMAGE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_RENDER_CACHE_LOCK = threading.Lock()
+_RENDER_CACHE = {
+    layer: {"entries": OrderedDict(), "bytes": 0, "max_bytes": max_bytes, "hits": 0, "misses": 0}
+    for layer, max_bytes in (
+        ("mesh", _RENDER_MESH_CACHE_MAX_BYTES),
+        ("image", _RENDER_IMAGE_CACHE_MAX_BYTES),
+    )
+}
+
+
+def _render_digest(*parts) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            digest.update(repr((part.dtype.str, part.shape)).encode())
+            digest.update(np.ascontiguousarray(part).data)
+        else:
+            digest.update(json.dumps(part, sort_keys=True, default=str).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _preset_signature(presets_dir: str) -> list:
+    """(name, size, mtime_ns) of every file in the preset pack, so editing
+    a region JSON or the blend-shape npz changes the render cache key."""
+    try:
+        entries = [entry for entry in os.scandir(presets_dir) if entry.is_file()]
+    except OSError:
+        return []
+    signature = []
+    for entry in sorted(entries, key=lambda item: item.name):
+        stat = entry.stat()
+        signature.append((entry.name, stat.st_size, stat.st_mtime_ns))
+    return signature
+
+
+def _render_cache_lookup(layer: str, key):
+    """Return the cached value for ``key`` or None. A None key (caching
+    disabled for this call) is neither a hit nor a miss."""
+    if key is None:
+        return None
+    with _RENDER_CACHE_LOCK:
+        cache = _RENDER_CACHE[layer]
+        value = cache["entries"].get(key)
+        if value is None:
+            cache["misses"] += 1
+            return None
+        cache["entries"].move_to_end(key)
+        cache["hits"] += 1
+        return value[1]
+
+
+def _render_cache_store(layer: str, key, arrays: tuple) -> None:
+    """Cache a tuple of arrays, frozen read-only so a hit cannot be
+    mutated in place by its consumer."""
+    if key is None:
+        return
+    for array in arrays:
+        array.setflags(write=False)
+    size = sum(int(array.nbytes) for array in arrays)
+    with _RENDER_CACHE_LOCK:
+        cache = _RENDER_CACHE[layer]
+        if size > cache["max_bytes"]:
+            return
+        previous = cache["entries"].pop(key, None)
+        if previous is not None:
+            cache["bytes"] -= previous[0]
+        cache["entries"][key] = (size, arrays)
+        cache["bytes"] += size
+        while cache["bytes"] > cache["max_bytes"]:
+            evicted, _arrays = cache["entries"].popitem(last=False)[1]
+            cache["bytes"] -= evicted
+
+
+def render_cache_stats() -> dict:
+    """Per-layer entry count, bytes, budget, hits, misses, and hit rate of
+    the render-node caches for this process."""
+    with _RENDER_CACHE_LOCK:
+        stats = {}
+        for layer, cache in _RENDER_CACHE.items():
+            lookups = cache["hits"] + cache["misses"]
+            stats[layer] = {
+                "entries": len(cache["entries"]),
+                "bytes": cache["bytes"],
+                "max_bytes": cache["max_bytes"],
+                "hits": cache["hits"],
+                "misses": cache["misses"],
+                "hit_rate": cache["hits"] / lookups if lookups else 0.0,
+            }
+        return stats
+
+
+def clear_render_cache() -> None:
+    with _RENDER_CACHE_LOCK:
+        for cache in _RENDER_CACHE.values():
+            cache["entries"].clear()
+            cache["bytes"] = 0
+            cache["hits"] = 0
+            cache["misses"] = 0
+
+
 class SAM3DBodyRenderFromPoseAndBodyPresetJson:
     """Render a posed body to an image. Pose data comes from
     ``pose_json`` (Process Image to Pose JSON / Pose Editor), body shape
@@ -1715,79 +2023,28 @@ class SAM3DBodyRenderFromPoseAndBodyPresetJson:
     FUNCTION = "render"
     CATEGORY = "SAM3DBody/render"
 
-    def render(self, model, pose_json, body_preset_json,
-               offset_x=0.0, offset_y=0.0, scale_offset=1.0,
-               camera_yaw_deg=0.0, camera_pitch_deg=0.0,
-               width=1024, height=1024, pose_adjust=0.0,
-               debug_scale=False,
-               background_image=None):
-        # Parse body_preset_json. Missing / malformed → MHR neutral body
-        # (all defaults), so an empty input still produces a sensible
-        # render rather than crashing.
-        try:
-            body_preset = json.loads(body_preset_json) if body_preset_json and body_preset_json.strip() else {}
-        except Exception as exc:
-            print(f"[SAM3DBody] body_preset_json parse failed: {exc}; using empty preset")
-            body_preset = {}
-        body_params  = body_preset.get("body_params")  or {}
-        bone_lengths = body_preset.get("bone_lengths") or {}
-        blendshape_sliders = {
-            str(k): float(v) for k, v in (body_preset.get("blendshapes") or {}).items()
-        }
-
-        body_fat              = float(body_params.get("fat", 0.0))
-        body_muscle           = float(body_params.get("muscle", 0.0))
-        body_fat_muscle       = float(body_params.get("fat_muscle", 0.0))
-        body_limb_girth       = float(body_params.get("limb_girth", 0.0))
-        body_limb_muscle      = float(body_params.get("limb_muscle", 0.0))
-        body_limb_fat         = float(body_params.get("limb_fat", 0.0))
-        body_chest_shoulder   = float(body_params.get("chest_shoulder", 0.0))
-        body_waist_hip        = float(body_params.get("waist_hip", 0.0))
-        body_thigh_calf       = float(body_params.get("thigh_calf", 0.0))
-
-        bone_torso = float(bone_lengths.get("torso", 1.0))
-        bone_neck  = float(bone_lengths.get("neck",  1.0))
-        bone_arm   = float(bone_lengths.get("arm",   1.0))
-        bone_leg   = float(bone_lengths.get("leg",   1.0))
-
-        # settings_json is the body_preset_json equivalent for the current
-        # render — handy as a debug echo / for downstream nodes that
-        # want the canonicalised body description.
-        settings = {
-            "body_params": {
-                "fat":            body_fat,
-                "muscle":         body_muscle,
-                "fat_muscle":     body_fat_muscle,
-                "limb_girth":     body_limb_girth,
-                "limb_muscle":    body_limb_muscle,
-                "limb_fat":       body_limb_fat,
-                "chest_shoulder": body_chest_shoulder,
-                "waist_hip":      body_waist_hip,
-                "thigh_calf":     body_thigh_calf,
-            },
-            "bone_lengths": {
-                "torso": bone_torso,
-                "neck":  bone_neck,
-                "arm":   bone_arm,
-                "leg":   bone_leg,
-            },
-            "blendshapes": {
-                k: float(v) for k, v in sorted(blendshape_sliders.items())
-            },
-        }
-        try:
-            lean_strength = float(pose_adjust)
-        except (TypeError, ValueError):
-            lean_strength = _POSE_ADJUST_DEFAULT
-
-        try:
-            payload = json.loads(pose_json) if pose_json else {}
-        except Exception:
-            payload = {}
-        debug_scale = _scale_debug_enabled(debug_scale, payload)
-        loaded = _load_sam3d_model(model)
-        sam_3d_model = loaded["model"]
-        device = torch.device(loaded["device"])
+    def _build_posed_mesh(self, sam_3d_model, device, payload, settings,
+                          lean_strength, presets_dir, debug_scale=False):
+        """MHR forward pass plus the body-preset deformations (bone-length
+        normalization, blend shapes, bone scaling, lean correction).
+        Returns the posed ``(vertices, faces)`` the camera fit and the
+        rasterizer consume."""
+        body_params = settings["body_params"]
+        bone_lengths = settings["bone_lengths"]
+        blendshape_sliders = settings["blendshapes"]
+        body_fat            = body_params["fat"]
+        body_muscle         = body_params["muscle"]
+        body_fat_muscle     = body_params["fat_muscle"]
+        body_limb_girth     = body_params["limb_girth"]
+        body_limb_muscle    = body_params["limb_muscle"]
+        body_limb_fat       = body_params["limb_fat"]
+        body_chest_shoulder = body_params["chest_shoulder"]
+        body_waist_hip      = body_params["waist_hip"]
+        body_thigh_calf     = body_params["thigh_calf"]
+        bone_torso = bone_lengths["torso"]
+        bone_neck  = bone_lengths["neck"]
+        bone_arm   = bone_lengths["arm"]
+        bone_leg   = bone_lengths["leg"]
 
         mhr_head = sam_3d_model.head_pose
         global_rot = _to_batched_tensor(payload.get("global_rot"), device, width=3)
@@ -1942,8 +2199,6 @@ class SAM3DBodyRenderFromPoseAndBodyPresetJson:
         # Face / neck blend-shapes (FBX-derived morph targets). Shapes may
         # span multiple FBX objects (e.g. neck_lengthen on head+neck+chest);
         # each object's delta is applied to its corresponding MHR region.
-        from ..preset_pack import active_pack_dir as _pack_dir
-        presets_dir = str(_pack_dir())
         bs_npz_path = os.path.join(presets_dir, "face_blendshapes.npz")
         bs_sliders = {k: float(v) for k, v in blendshape_sliders.items()}
         if any(v != 0.0 for v in bs_sliders.values()):
@@ -2007,6 +2262,87 @@ class SAM3DBodyRenderFromPoseAndBodyPresetJson:
                     "posed_joint_rots": corrected_rots.tolist(),
                     "posed_joint_coords": corrected_coords.tolist(),
                 }
+        # ``corrected_pose_json`` is the rig-space twin of the mesh lean
+        # correction; the render node only needs the mesh.
+        del corrected_pose_json
+        return vertices, faces
+
+    def render(self, model, pose_json, body_preset_json,
+               offset_x=0.0, offset_y=0.0, scale_offset=1.0,
+               camera_yaw_deg=0.0, camera_pitch_deg=0.0,
+               width=1024, height=1024, pose_adjust=0.0,
+               debug_scale=False,
+               background_image=None):
+        # Parse body_preset_json. Missing / malformed → MHR neutral body
+        # (all defaults), so an empty input still produces a sensible
+        # render rather than crashing.
+        try:
+            body_preset = json.loads(body_preset_json) if body_preset_json and body_preset_json.strip() else {}
+        except Exception as exc:
+            print(f"[SAM3DBody] body_preset_json parse failed: {exc}; using empty preset")
+            body_preset = {}
+        body_params  = body_preset.get("body_params")  or {}
+        bone_lengths = body_preset.get("bone_lengths") or {}
+        blendshape_sliders = {
+            str(k): float(v) for k, v in (body_preset.get("blendshapes") or {}).items()
+        }
+
+        body_fat              = float(body_params.get("fat", 0.0))
+        body_muscle           = float(body_params.get("muscle", 0.0))
+        body_fat_muscle       = float(body_params.get("fat_muscle", 0.0))
+        body_limb_girth       = float(body_params.get("limb_girth", 0.0))
+        body_limb_muscle      = float(body_params.get("limb_muscle", 0.0))
+        body_limb_fat         = float(body_params.get("limb_fat", 0.0))
+        body_chest_shoulder   = float(body_params.get("chest_shoulder", 0.0))
+        body_waist_hip        = float(body_params.get("waist_hip", 0.0))
+        body_thigh_calf       = float(body_params.get("thigh_calf", 0.0))
+
+        bone_torso = float(bone_lengths.get("torso", 1.0))
+        bone_neck  = float(bone_lengths.get("neck",  1.0))
+        bone_arm   = float(bone_lengths.get("arm",   1.0))
+        bone_leg   = float(bone_lengths.get("leg",   1.0))
+
+        # settings_json is the body_preset_json equivalent for the current
+        # render — handy as a debug echo / for downstream nodes that
+        # want the canonicalised body description.
+        settings = {
+            "body_params": {
+                "fat":            body_fat,
+                "muscle":         body_muscle,
+                "fat_muscle":     body_fat_muscle,
+                "limb_girth":     body_limb_girth,
+                "limb_muscle":    body_limb_muscle,
+                "limb_fat":       body_limb_fat,
+                "chest_shoulder": body_chest_shoulder,
+                "waist_hip":      body_waist_hip,
+                "thigh_calf":     body_thigh_calf,
+            },
+            "bone_lengths": {
+                "torso": bone_torso,
+                "neck":  bone_neck,
+                "arm":   bone_arm,
+                "leg":   bone_leg,
+            },
+            "blendshapes": {
+                k: float(v) for k, v in sorted(blendshape_sliders.items())
+            },
+        }
+        try:
+            lean_strength = float(pose_adjust)
+        except (TypeError, ValueError):
+            lean_strength = _POSE_ADJUST_DEFAULT
+
+        try:
+            payload = json.loads(pose_json) if pose_json else {}
+        except Exception:
+            payload = {}
+        debug_scale = _scale_debug_enabled(debug_scale, payload)
+        loaded = _load_sam3d_model(model)
+        sam_3d_model = loaded["model"]
+        device = torch.device(loaded["device"])
+
+        from ..preset_pack import active_pack_dir as _pack_dir
+        presets_dir = str(_pack_dir())
 
         if background_image is not None:
             bg_bgr = comfy_image_to_numpy(background_image)
@@ -2016,6 +2352,35 @@ class SAM3DBodyRenderFromPoseAndBodyPresetJson:
             render_w = int(payload.get("image_size", {}).get("width") or width or 1024)
             bg_bgr = np.zeros((render_h, render_w, 3), dtype=np.uint8)
 
+        # Debug runs always recompute so every stage is logged.
+        mesh_key = image_key = None
+        if not debug_scale:
+            mesh_key = _render_digest(
+                loaded.get("ckpt_path", ""), loaded.get("mhr_path", ""),
+                pose_json or "", settings, float(lean_strength),
+                presets_dir, _preset_signature(presets_dir),
+            )
+            image_key = _render_digest(
+                mesh_key,
+                [float(offset_x), float(offset_y), float(scale_offset),
+                 float(camera_yaw_deg), float(camera_pitch_deg),
+                 render_w, render_h],
+                bg_bgr if background_image is not None else None,
+            )
+        cached_image = _render_cache_lookup("image", image_key)
+        if cached_image is not None:
+            return (numpy_to_comfy_image(cached_image[0]),)
+
+        cached_mesh = _render_cache_lookup("mesh", mesh_key)
+        if cached_mesh is not None:
+            vertices, faces = cached_mesh
+        else:
+            vertices, faces = self._build_posed_mesh(
+                sam_3d_model, device, payload, settings,
+                lean_strength, presets_dir, debug_scale=debug_scale,
+            )
+            _render_cache_store("mesh", mesh_key, (vertices, faces))
+
         # Camera + focal: preserve the pose_json's original composition
         # while neutralizing its body-type dependence.
         #
@@ -2203,12 +2568,12 @@ class SAM3DBodyRenderFromPoseAndBodyPresetJson:
         )
         # Autosave is owned by SAM3DBodySettingBodyPresetJson now — render
         # operates purely on the supplied body_preset_json, so there's no
-        # ambient slider state to persist here. ``settings`` and
-        # ``corrected_pose_json`` are computed above for side effects
-        # (mesh / camera composition); they're not returned because
-        # the previous ``settings_json`` output proved redundant in
-        # practice — downstream nodes already see body_preset_json directly.
-        del settings, corrected_pose_json
+        # ambient slider state to persist here. ``settings`` is the
+        # canonical body description the mesh cache is keyed by; it's not
+        # returned because the previous ``settings_json`` output proved
+        # redundant in practice — downstream nodes already see
+        # body_preset_json directly.
+        _render_cache_store("image", image_key, (rendered_bgr,))
         return (numpy_to_comfy_image(rendered_bgr),)
 
 
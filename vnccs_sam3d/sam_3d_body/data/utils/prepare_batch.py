@@ -18,13 +18,20 @@ def prepare_batch(
     masks_score=None,
     cam_int=None,
 ):
-    """A helper function to prepare data batch for SAM 3D Body model inference."""
+    """A helper function to prepare data batch for SAM 3D Body model inference.
+
+    ``img`` may also be a list of same-sized frames, one per box, so several
+    frames of a clip can share one forward pass.
+    """
+    frames = img if isinstance(img, (list, tuple)) else None
+    if frames is not None:
+        img = frames[0]
     height, width = img.shape[:2]
 
     # construct batch data samples
     data_list = []
     for idx in range(boxes.shape[0]):
-        data_info = dict(img=img)
+        data_info = dict(img=frames[idx] if frames is not None else img)
         data_info["bbox"] = boxes[idx]  # shape (4,)
         data_info["bbox_format"] = "xyxy"
 
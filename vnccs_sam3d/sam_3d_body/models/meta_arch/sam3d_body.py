@@ -1211,7 +1211,10 @@ class SAM3DBody(BaseModel):
             - hand: inference with hand decoder only (only hand output)
         """
 
-        height, width = img.shape[:2]
+        # ``img`` is either one frame or a list of same-sized frames with one
+        # person each (see prepare_batch); hand crops follow the same layout.
+        frames = img if isinstance(img, (list, tuple)) else None
+        height, width = (img[0] if frames is not None else img).shape[:2]
         cam_int = batch["cam_int"].clone()
 
         if inference_type == "body":
@@ -1235,7 +1238,10 @@ class SAM3DBody(BaseModel):
 
         # Step 2. Re-run with each hand
         ## Left... Flip image & box
-        flipped_img = img[:, ::-1]
+        if frames is not None:
+            flipped_img = [frame[:, ::-1] for frame in frames]
+        else:
+            flipped_img = img[:, ::-1]
         tmp = left_xyxy.copy()
         left_xyxy[:, 0] = width - tmp[:, 2] - 1
         left_xyxy[:, 2] = width - tmp[:, 0] - 1
@@ -19,6 +19,21 @@ from .utils import recursive_to
 from torchvision.transforms import ToTensor
 
 
+def _tensor_to_rgb_uint8(img: torch.Tensor) -> np.ndarray:
+    """Quantize an RGB image tensor on its own device and copy it out once.
+
+    Accepts HxWxC or 1xHxWxC tensors, either uint8 or float in [0, 1] (the
+    ComfyUI IMAGE layout). The crop/affine transforms run on host arrays, so
+    only the uint8 image crosses the device boundary.
+    """
+    if img.ndim == 4:
+        img = img[0]
+    img = img[..., :3]
+    if img.dtype != torch.uint8:
+        img = (img.clamp(0.0, 1.0) * 255.0).to(torch.uint8)
+    return np.ascontiguousarray(img.cpu().numpy())
+
+
 class SAM3DBodyEstimator:
     def __init__(
         self,
@@ -57,7 +72,7 @@ class SAM3DBodyEstimator:
     @torch.no_grad()
     def process_one_image(
         self,
-        img: Union[str, np.ndarray],
+        img: Union[str, np.ndarray, torch.Tensor],
         bboxes: Optional[np.ndarray] = None,
         masks: Optional[np.ndarray] = None,
         cam_int: Optional[np.ndarray] = None,
@@ -71,7 +86,8 @@ class SAM3DBodyEstimator:
         Perform model prediction in top-down format: assuming input is a full image.
 
         Args:
-            img: Input image (path or numpy array)
+            img: Input image: a path (decoded as BGR), an RGB uint8 numpy
+                array, or an RGB image tensor (uint8 or float in [0, 1])
             bboxes: Optional pre-computed bounding boxes
             masks: Optional pre-computed masks (numpy array). If provided, SAM2 will be skipped.
             det_cat_id: Detection category ID
@@ -93,6 +109,9 @@ class SAM3DBodyEstimator:
         if type(img) == str:
             img = load_image(img, backend="cv2", image_format="bgr")
             image_format = "bgr"
+        elif isinstance(img, torch.Tensor):
+            img = _tensor_to_rgb_uint8(img)
+            image_format = "rgb"
         else:
             image_format = "rgb"
         height, width = img.shape[:2]
@@ -163,6 +182,69 @@ class SAM3DBodyEstimator:
         else:
             cam_int = batch["cam_int"].clone()
 
+        return self._run_inference(img, batch, masks, inference_type)
+
+    @torch.no_grad()
+    def process_frames(
+        self,
+        frames,
+        bboxes: np.ndarray,
+        masks: Optional[list] = None,
+        inference_type: str = "full",
+    ):
+        """
+        Run one forward pass over several same-sized frames of a clip.
+
+        Each frame contributes exactly one person, so the backbone, body and
+        hand decoders see one mini-batch instead of one call per frame.
+
+        Args:
+            frames: Sequence of RGB uint8 arrays or RGB image tensors
+            bboxes: One xyxy box per frame, shape (F, 4)
+            masks: Optional per-frame HxW masks; ``None`` entries (or no list)
+                run that frame without mask conditioning
+            inference_type: Same as ``process_one_image``
+
+        Returns one output dict per frame, in input order.
+        """
+        self.batch = None
+        self.image_embeddings = None
+        self.output = None
+        self.prev_prompt = []
+        self.is_crop = True
+
+        frames = [
+            _tensor_to_rgb_uint8(frame) if isinstance(frame, torch.Tensor) else frame
+            for frame in frames
+        ]
+        if not frames:
+            return []
+        height, width = frames[0].shape[:2]
+        if any(frame.shape[:2] != (height, width) for frame in frames):
+            raise ValueError("process_frames needs frames of one size")
+        boxes = np.asarray(bboxes, dtype=np.float32).reshape(-1, 4)
+        if len(boxes) != len(frames):
+            raise ValueError("process_frames needs exactly one bbox per frame")
+
+        # Frames without a mask get the same zero mask / zero score that
+        # prepare_batch uses for unmasked inference; the model gates mask
+        # conditioning per person on the score.
+        batch_masks = None
+        masks_score = None
+        if masks is not None and any(mask is not None for mask in masks):
+            batch_masks = np.zeros((len(frames), height, width, 1), dtype=np.uint8)
+            masks_score = np.zeros(len(frames), dtype=np.float32)
+            for idx, mask in enumerate(masks):
+                if mask is not None:
+                    batch_masks[idx] = np.asarray(mask).reshape(height, width, 1).astype(np.uint8)
+                    masks_score[idx] = 1.0
+
+        batch = prepare_batch(frames, self.transform, boxes, batch_masks, masks_score)
+        batch = recursive_to(batch, self.device)
+        self.model._initialize_batch(batch)
+        return self._run_inference(frames, batch, batch_masks, inference_type)
+
+    def _run_inference(self, img, batch, masks, inference_type):
         outputs = self.model.run_inference(
             img,
             batch,
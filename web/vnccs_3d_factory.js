@@ -16,6 +16,7 @@ const ENDPOINTS = Object.freeze({
     weightsDownload: `${API_BASE}/weights/download`,
     scenes: `${API_BASE}/scenes`,
     scene: sceneId => `${API_BASE}/scenes/${encodeURIComponent(sceneId)}`,
+    sceneDelta: sceneId => `${API_BASE}/scenes/${encodeURIComponent(sceneId)}/delta`,
     reference: sceneId => `${API_BASE}/scenes/${encodeURIComponent(sceneId)}/reference`,
     skydome: sceneId => `${API_BASE}/scenes/${encodeURIComponent(sceneId)}/skydome`,
     preview: sceneId => `${API_BASE}/scenes/${encodeURIComponent(sceneId)}/preview`,
@@ -27,6 +28,7 @@ const ENDPOINTS = Object.freeze({
     job: jobId => `${API_BASE}/jobs/${encodeURIComponent(jobId)}`,
     cancelJob: jobId => `${API_BASE}/jobs/${encodeURIComponent(jobId)}/cancel`,
     jobLog: jobId => `${API_BASE}/jobs/${encodeURIComponent(jobId)}/log`,
+    jobEvents: jobId => `${API_BASE}/jobs/${encodeURIComponent(jobId)}/events`,
     libraryItems: `${LIBRARY_BASE}/items`,
     libraryItem: assetId => `${LIBRARY_BASE}/items/${encodeURIComponent(assetId)}`,
     libraryLoad: assetId => `${LIBRARY_BASE}/items/${encodeURIComponent(assetId)}/load`,
@@ -45,6 +47,7 @@ const MAX_IMAGE_BYTES = 32 * 1024 * 1024;
 const MAX_PLY_BYTES = 2 * 1024 * 1024 * 1024;
 const MAX_SKYDOME_BYTES = 64 * 1024 * 1024;
 const TERMINAL = new Set(["completed", "failed", "cancelled"]);
+const DECODE_MEMORY_OPTIONS = [0, 2048, 512];
 const DEFAULT_SETTINGS = Object.freeze({
     name: "",
     steps: 20,
@@ -52,6 +55,7 @@ const DEFAULT_SETTINGS = Object.freeze({
     num_gaussians: 131072,
     conditioning_resolution: 1024,
     prevent_upscale: false,
+    decode_memory_mb: 0,
     remove_background: true,
     splat_cache_limit_gb: 32,
     seed: 0,
@@ -165,6 +169,7 @@ const ICONS = Object.freeze({
     ungroup: `<svg viewBox="0 0 24 24"><rect x="3" y="5" width="8" height="8" rx="1"/><rect x="13" y="11" width="8" height="8" rx="1"/><path d="M8 16H5v-3m11-5h3v3"/></svg>`,
     chevron: `<svg viewBox="0 0 24 24"><path d="m9 6 6 6-6 6"/></svg>`,
     dice: `<svg viewBox="0 0 24 24" aria-hidden="true"><rect x="4" y="4" width="16" height="16" rx="3.5"/><circle cx="8.5" cy="8.5" r="1.4" class="fill"/><circle cx="15.5" cy="8.5" r="1.4" class="fill"/><circle cx="12" cy="12" r="1.4" class="fill"/><circle cx="8.5" cy="15.5" r="1.4" class="fill"/><circle cx="15.5" cy="15.5" r="1.4" class="fill"/></svg>`,
+    density: `<svg viewBox="0 0 24 24" aria-hidden="true"><circle cx="6" cy="6" r="1.5" class="fill"/><circle cx="12" cy="6" r="1.5" class="fill"/><circle cx="18" cy="6" r="1.5" class="fill"/><circle cx="6" cy="12" r="1.5" class="fill"/><circle cx="12" cy="12" r="1.5" class="fill"/><circle cx="18" cy="12" r="1.5" class="fill"/><circle cx="6" cy="18" r="1.5" class="fill"/><circle cx="12" cy="18" r="1.5" class="fill"/><circle cx="18" cy="18" r="1.5" class="fill"/></svg>`,
     camera: `<svg viewBox="0 0 24 24"><path d="M4 7.5h3l1.4-2h7.2l1.4 2h3v11H4v-11Z"/><circle cx="12" cy="13" r="3.5"/></svg>`,
     cameraAdd: `<svg viewBox="0 0 24 24"><path d="M3 8h3l1.5-2h7L16 8h2v4"/><path d="M12 19H3V8m16 7v6m-3-3h6"/><circle cx="10" cy="13" r="3"/></svg>`,
 });
@@ -175,7 +180,7 @@ function installStyles() {
     const link = document.createElement("link");
     link.id = "vnccs-3d-factory-styles";
     link.rel = "stylesheet";
-    link.href = new URL("./vnccs_3d_factory.css?v=20260726.2", import.meta.url).href;
+    link.href = new URL("./vnccs_3d_factory.css?v=20260726.3", import.meta.url).href;
     document.head.appendChild(link);
 }
 
@@ -271,6 +276,88 @@ function sleep(milliseconds) {
     return new Promise(resolve => setTimeout(resolve, milliseconds));
 }
 
+// Server-sent job progress. next() resolves with the newest pushed update,
+// or null after a quiet timeout or once the stream is gone, so callers can
+// fall back to a full job fetch.
+function openJobEvents(url) {
+    if (typeof EventSource !== "function") return null;
+    const source = new EventSource(url);
+    let latest = null;
+    let waiter = null;
+    let failed = false;
+    const deliver = value => {
+        if (waiter) {
+            const resolve = waiter;
+            waiter = null;
+            resolve(value);
+        } else {
+            latest = value;
+        }
+    };
+    source.addEventListener("progress", event => {
+        try {
+            deliver(JSON.parse(event.data));
+        } catch {
+            // A malformed frame only costs one update; the next fetch recovers.
+        }
+    });
+    source.addEventListener("error", () => {
+        if (source.readyState !== EventSource.CLOSED) return;
+        failed = true;
+        deliver(null);
+    });
+    return {
+        get failed() {
+            return failed;
+        },
+        next(timeout = 15000) {
+            if (latest || failed) {
+                const value = latest;
+                latest = null;
+                return Promise.resolve(value);
+            }
+            return new Promise(resolve => {
+                const timer = setTimeout(() => {
+                    waiter = null;
+                    resolve(null);
+                }, timeout);
+                waiter = value => {
+                    clearTimeout(timer);
+                    resolve(value);
+                };
+            });
+        },
+        close() {
+            source.close();
+        },
+    };
+}
+
+// JSON-Patch style operations turning the last saved scene payload into the
+// current one, or null when objects were added or removed and the full
+// payload has to be sent.
+function sceneDeltaOps(previous, next) {
+    const same = (left, right) => JSON.stringify(left) === JSON.stringify(right);
+    const ops = [];
+    for (const key of ["name", "render", "lighting", "skydome", "camera", "cameras", "layers"]) {
+        if (next[key] !== undefined && !same(previous[key], next[key])) {
+            ops.push({ op: "replace", path: `/${key}`, value: next[key] });
+        }
+    }
+    const before = new Map(previous.objects.map(item => [item.object_id, item]));
+    if (before.size !== next.objects.length) return null;
+    for (const item of next.objects) {
+        const old = before.get(item.object_id);
+        if (!old) return null;
+        for (const field of ["name", "transform", "visible"]) {
+            if (!same(old[field], item[field])) {
+                ops.push({ op: "replace", path: `/objects/${item.object_id}/${field}`, value: item[field] });
+            }
+        }
+    }
+    return ops;
+}
+
 function randomLayerId() {
     const bytes = new Uint8Array(16);
     crypto.getRandomValues(bytes);
@@ -357,6 +444,7 @@ class Factory3DWidget {
         this._lightingApplyTimer = 0;
         this._searchRenderFrame = 0;
         this._sceneSaveSerial = Promise.resolve();
+        this._savedScenePayload = null;
         this._previewSaveSerial = Promise.resolve();
         this._restoreSerial = Promise.resolve();
         this._resizeFrame = 0;
@@ -1868,6 +1956,7 @@ class Factory3DWidget {
                 formatBytes(this.capabilities.weights.installed_bytes),
                 `${Number(this.settings.conditioning_resolution) || 1024}²`,
                 this.settings.prevent_upscale ? "native cap" : "",
+                Number(this.settings.decode_memory_mb) > 0 ? "tiled decode" : "",
             ].filter(Boolean).join(" · ")
             : "Weights are not installed";
     }
@@ -2589,6 +2678,29 @@ class Factory3DWidget {
             event.stopPropagation();
             void this.duplicateObject(item.object_id, duplicate);
         });
+        // Imported PLY objects have no reference image or latent to reuse.
+        const regenerate = importedPly
+            ? null
+            : button("vnccs-i3s__button vnccs-i3s__button--quiet vnccs-i3s__icon-button", "", "dice");
+        if (regenerate) {
+            regenerate.title = "Regenerate with new seed";
+            regenerate.disabled = Boolean(this.currentJobId);
+            regenerate.addEventListener("click", event => {
+                event.stopPropagation();
+                void this.regenerateObject(item);
+            });
+        }
+        const redensify = item.latent_checkpoint
+            ? button("vnccs-i3s__button vnccs-i3s__button--quiet vnccs-i3s__icon-button", "", "density")
+            : null;
+        if (redensify) {
+            redensify.title = "Re-decode at the selected Gaussian count";
+            redensify.disabled = Boolean(this.currentJobId);
+            redensify.addEventListener("click", event => {
+                event.stopPropagation();
+                void this.redensifyObject(item);
+            });
+        }
         const remove = button(
             "vnccs-i3s__button vnccs-i3s__button--quiet vnccs-i3s__button--danger vnccs-i3s__icon-button",
             "",
@@ -2599,11 +2711,12 @@ class Factory3DWidget {
             event.stopPropagation();
             this.confirmDeleteObject(item.object_id);
         });
-        for (const control of [visibility, exportObject, duplicate, remove]) {
+        const controls = [visibility, exportObject, regenerate, redensify, duplicate, remove].filter(Boolean);
+        for (const control of controls) {
             control.setAttribute("aria-label", control.title);
             control.addEventListener("dblclick", event => event.stopPropagation());
         }
-        actions.append(visibility, exportObject, duplicate, remove);
+        actions.append(...controls);
         card.append(thumbnail, copy, actions);
         card.addEventListener("click", event => {
             if (event.target.closest("button,input")) return;
@@ -3068,11 +3181,21 @@ class Factory3DWidget {
         const sceneId = this.sceneId;
         const payload = this._scenePayload();
         const operation = this._sceneSaveSerial.then(async () => {
-            const updated = await this._fetchJSON(ENDPOINTS.scene(sceneId), {
-                method: "PATCH",
-                headers: { "Content-Type": "application/json" },
-                body: JSON.stringify(payload),
-            });
+            // Only what changed since the last acknowledged save is sent; the
+            // server journals it instead of rewriting the whole scene.
+            const saved = this._savedScenePayload;
+            const ops = saved?.sceneId === sceneId && saved.scene === this.scene
+                ? sceneDeltaOps(saved.payload, payload)
+                : null;
+            this._savedScenePayload = null;
+            const updated = await this._fetchJSON(
+                ops ? ENDPOINTS.sceneDelta(sceneId) : ENDPOINTS.scene(sceneId),
+                {
+                    method: "PATCH",
+                    headers: { "Content-Type": "application/json" },
+                    body: JSON.stringify(ops ? { ops } : payload),
+                },
+            );
             if (this.sceneId === sceneId && this.scene) {
                 this.scene.revision = updated.revision;
                 this.scene.render_revision = updated.render_revision;
@@ -3085,6 +3208,11 @@ class Factory3DWidget {
                 );
                 this.scene.lighting = updated.lighting || this.scene.lighting;
                 this.scene.skydome = updated.skydome || this.scene.skydome;
+                const revisions = new Map((updated.objects || []).map(item => [item.object_id, item.revision]));
+                for (const item of this.scene.objects || []) {
+                    if (revisions.has(item.object_id)) item.revision = revisions.get(item.object_id);
+                }
+                this._savedScenePayload = { sceneId, scene: this.scene, payload };
             }
             this._scheduleStateSave(0);
             return updated;
@@ -3320,6 +3448,7 @@ class Factory3DWidget {
             "guidance_scale",
             "num_gaussians",
             "conditioning_resolution",
+            "decode_memory_mb",
             "seed",
         ]) {
             form.append(key, String(this.settings[key]));
@@ -3334,6 +3463,60 @@ class Factory3DWidget {
         }
     }
 
+    async regenerateObject(item) {
+        if (this.currentJobId || !this.sceneId || !item) return;
+        const capabilities = this.capabilities || await this.loadCapabilities();
+        if (!capabilities?.weights?.ready) {
+            this.openModelSetup();
+            return;
+        }
+        // The object's own settings are reused; only the seed changes, so the
+        // backend can serve the prepared image and encoder features from cache.
+        const form = new FormData();
+        form.append("source_object_id", item.object_id);
+        form.append("name", item.name || "Object");
+        for (const key of ["steps", "guidance_scale", "num_gaussians", "conditioning_resolution"]) {
+            form.append(key, String(item.settings[key]));
+        }
+        form.append("seed", String(generateRandomSeed()));
+        form.append("decode_memory_mb", String(this.settings.decode_memory_mb));
+        form.append("prevent_upscale", item.settings.prevent_upscale ? "1" : "0");
+        form.append("remove_background", item.settings.remove_background ? "1" : "0");
+        try {
+            const job = await this._fetchJSON(ENDPOINTS.generate(this.sceneId), { method: "POST", body: form });
+            await this._monitorJob(job.job_id);
+        } catch (error) {
+            if (!error?.factoryErrorShown) this._showError("Regeneration failed", error);
+        }
+    }
+
+    async redensifyObject(item) {
+        if (this.currentJobId || !this.sceneId || !item?.latent_checkpoint) return;
+        const count = Number(this.settings.num_gaussians);
+        if (count === Number(item.settings?.num_gaussians)) {
+            this.toast("Choose a different Gaussian count in the TripoSplat panel first.", "error");
+            return;
+        }
+        // Only the decoder runs; densities decoded before are swapped in without
+        // touching the GPU.
+        try {
+            const job = await this._fetchJSON(
+                `${ENDPOINTS.scene(this.sceneId)}/objects/${encodeURIComponent(item.object_id)}/redensify`,
+                {
+                    method: "POST",
+                    headers: { "Content-Type": "application/json" },
+                    body: JSON.stringify({
+                        num_gaussians: count,
+                        decode_memory_mb: this.settings.decode_memory_mb,
+                    }),
+                },
+            );
+            await this._monitorJob(job.job_id);
+        } catch (error) {
+            if (!error?.factoryErrorShown) this._showError("Re-densify failed", error);
+        }
+    }
+
     async importPly(file) {
         if (!file || this.currentJobId || this.importingPly) return;
         if (!/\.ply$/i.test(String(file.name || ""))) {
@@ -3389,9 +3572,33 @@ class Factory3DWidget {
         this._setProgress(true, 0, "Queued", "");
         this._setStatus("Working", "working");
         let previous = "";
+        let streamedObjects = 0;
+        const events = openJobEvents(ENDPOINTS.jobEvents(jobId));
         try {
             while (!this.destroyed && token === this.currentJobToken) {
-                const job = await this._fetchJSON(ENDPOINTS.job(jobId));
+                // Pushed updates carry progress only; terminal states and
+                // newly committed objects still read the full job.
+                const update = events && !events.failed ? await events.next() : null;
+                const job = update
+                    && !TERMINAL.has(update.status)
+                    && !(Number(update.object_count) > streamedObjects)
+                    ? update
+                    : await this._fetchJSON(ENDPOINTS.job(jobId));
+                const finishedObjects = Array.isArray(job.objects) ? job.objects.length : 0;
+                if (
+                    job.kind === "generation"
+                    && !TERMINAL.has(job.status)
+                    && finishedObjects > streamedObjects
+                    && job.scene_id === this.sceneId
+                ) {
+                    // Multi-image jobs commit objects one by one; show each
+                    // as soon as it lands instead of waiting for the batch.
+                    streamedObjects = finishedObjects;
+                    await this._applyScene(
+                        await this._fetchJSON(ENDPOINTS.scene(job.scene_id)),
+                        { preserveSource: true },
+                    );
+                }
                 const signature = `${job.stage}|${job.progress}|${job.message}|${job.detail}`;
                 if (signature !== previous) {
                     previous = signature;
@@ -3430,6 +3637,14 @@ class Factory3DWidget {
                             await this._applyScene(scene, { preserveSource: true });
                             this._scheduleStateSave(0);
                             this.toast("Object added to the scene.", "success");
+                        } else if (job.kind === "redensify") {
+                            this._setStatus("Loading result", "working");
+                            await this._applyScene(job.result.scene, { preserveSource: true });
+                            this._setStatus("Complete", "success");
+                            this.toast(
+                                `Object re-decoded at ${Number(job.result.num_gaussians).toLocaleString()} Gaussians.`,
+                                "success",
+                            );
                         } else if (job.kind === "weights") {
                             this._setStatus("Complete", "success");
                             await this.loadCapabilities();
@@ -3446,7 +3661,7 @@ class Factory3DWidget {
                     error.job = job;
                     throw error;
                 }
-                await sleep(600);
+                if (!events || events.failed) await sleep(600);
             }
         } catch (error) {
             this._setStatus("Failed", "error");
@@ -3454,6 +3669,7 @@ class Factory3DWidget {
             if (error && typeof error === "object") error.factoryErrorShown = true;
             throw error;
         } finally {
+            events?.close();
             if (token === this.currentJobToken) {
                 this.currentJobId = "";
                 this._setProgress(false);
@@ -4738,6 +4954,9 @@ class Factory3DWidget {
         let preventUpscale = Boolean(
             draftSettings?.prevent_upscale ?? this.settings.prevent_upscale,
         );
+        const initialDecodeMemory = Number(
+            draftSettings?.decode_memory_mb ?? this.settings.decode_memory_mb,
+        ) || 0;
         let cacheStatus = safeObject(capabilities?.splat_cache);
         let cacheLimitGB = Math.round(clamp(
             draftSettings?.splat_cache_limit_gb
@@ -4856,6 +5075,53 @@ class Factory3DWidget {
         upscaleSwitch.setAttribute("aria-checked", String(preventUpscale));
         upscaleControl.append(upscaleCopy, upscaleSwitch);
         const effective = element("div", "vnccs-i3s__conditioning-summary");
+
+        const decodeMemoryLabel = element("div", "vnccs-i3s__label", "Gaussian decoder memory");
+        const decodeMemoryList = element("div", "vnccs-i3s__resolution-list");
+        const decodeMemoryOptions = [
+            {
+                value: 0,
+                title: "Full attention",
+                badge: "Default",
+                description: "Fastest decode; VRAM grows with the square of the Gaussian count.",
+            },
+            {
+                value: 2048,
+                title: "Tiled · 2 GiB",
+                badge: "Low memory",
+                description: "Same result in attention tiles of at most 2 GiB.",
+            },
+            {
+                value: 512,
+                title: "Tiled · 512 MiB",
+                badge: "Lowest memory",
+                description: "Smallest tiles for 524K/1M targets on limited VRAM; slower.",
+            },
+        ];
+        for (const option of decodeMemoryOptions) {
+            const choice = element("label", "vnccs-i3s__resolution-option");
+            const input = element("input");
+            input.type = "radio";
+            input.name = "vnccs-triposplat-decode-memory";
+            input.value = String(option.value);
+            input.checked = option.value === initialDecodeMemory;
+            const copy = element("span", "vnccs-i3s__resolution-copy");
+            const title = element("span", "vnccs-i3s__resolution-title");
+            title.append(
+                element("span", "", option.title),
+                element(
+                    "span",
+                    `vnccs-i3s__resolution-badge${option.value ? " is-experimental" : ""}`,
+                    option.badge,
+                ),
+            );
+            copy.append(
+                title,
+                element("span", "vnccs-i3s__resolution-description", option.description),
+            );
+            choice.append(input, element("span", "vnccs-i3s__resolution-radio"), copy);
+            decodeMemoryList.appendChild(choice);
+        }
         const cache = element(
             "section",
             "vnccs-i3s__setup-block vnccs-i3s__setup-block--cache",
@@ -4970,6 +5236,9 @@ class Factory3DWidget {
         const currentDraft = () => ({
             conditioning_resolution: selectedResolution(),
             prevent_upscale: preventUpscale,
+            decode_memory_mb: Number(
+                decodeMemoryList.querySelector("input:checked")?.value || 0,
+            ),
             splat_cache_limit_gb: cacheLimitGB,
         });
         const updateSummary = () => {
@@ -5006,6 +5275,8 @@ class Factory3DWidget {
             resolutionList,
             upscaleControl,
             effective,
+            decodeMemoryLabel,
+            decodeMemoryList,
         );
         body.append(models, inference, cache);
 
@@ -5057,8 +5328,10 @@ class Factory3DWidget {
                 if (this.capabilities) this.capabilities.splat_cache = cacheResult;
                 this.settings.conditioning_resolution = draft.conditioning_resolution;
                 this.settings.prevent_upscale = draft.prevent_upscale;
+                this.settings.decode_memory_mb = draft.decode_memory_mb;
                 this.settings.splat_cache_limit_gb = draft.splat_cache_limit_gb;
                 this._syncTripoSummary();
+                this._syncDensityMode();
                 this._syncSettings();
                 this._renderObjects();
                 this._scheduleStateSave(0);
@@ -5242,8 +5515,11 @@ class Factory3DWidget {
         const experimental = count >= 524288;
         const extreme = count >= 1048576;
         this.els.densityNote.hidden = !experimental;
+        const tiled = Number(this.settings.decode_memory_mb) > 0;
         this.els.densityNote.textContent = extreme
-            ? "Extreme 4× density. Full-attention decode may exhaust even high-VRAM GPUs."
+            ? tiled
+                ? "Extreme 4× density. Tiled decode bounds attention memory but takes longer."
+                : "Extreme 4× density. Full-attention decode may exhaust even high-VRAM GPUs; try a tiled decoder in TripoSplat settings."
             : "Experimental 2× density. Requires substantially more VRAM and decode time.";
         this.els.density.closest(".vnccs-i3s__field")?.classList.toggle("is-experimental", experimental);
         this.els.density.closest(".vnccs-i3s__field")?.classList.toggle("is-extreme", extreme);
@@ -5339,6 +5615,11 @@ class Factory3DWidget {
                 this.settings.conditioning_resolution = Number(this.settings.conditioning_resolution);
             }
             this.settings.prevent_upscale = this.settings.prevent_upscale === true;
+            if (!DECODE_MEMORY_OPTIONS.includes(Number(this.settings.decode_memory_mb))) {
+                this.settings.decode_memory_mb = 0;
+            } else {
+                this.settings.decode_memory_mb = Number(this.settings.decode_memory_mb);
+            }
             delete this.settings.export_format;
             this.settings.splat_cache_limit_gb = Math.round(clamp(
                 this.settings.splat_cache_limit_gb,
@@ -32,7 +32,9 @@ import {
 } from "./vnccs_pose_characters.mjs?v=20260802.3";
 import {
     MAX_VIDEO_POSE_SAMPLES,
+    VIDEO_POSE_BATCH_FRAMES,
     canvasToBlob,
+    chunkVideoCaptureSchedule,
     clampVideoCaptureFps,
     clampVideoTimelineViewport,
     computeVideoCaptureSchedule,
@@ -42,6 +44,7 @@ import {
     drawVideoCover,
     fitVideoTimelineSelection,
     isLikelyVideoFile,
+    readNdjsonStream,
     reduceVideoPoseKeyframes,
     seekVideo,
     stabilizeVideoPoseSequence,
@@ -9275,6 +9278,48 @@ class PoseStudioWidget {
         return poseData;
     }
 
+    async requestSAM3DPosesForFrames(frames, {
+        taskId = null,
+        signal = null,
+        track = null,
+        fileNames = [],
+        onFrame = null,
+    } = {}) {
+        const form = new FormData();
+        form.append("task_id", taskId || `video-${Date.now()}-${Math.random().toString(16).slice(2)}`);
+        if (track) form.append("track", JSON.stringify(track));
+        frames.forEach((frame, index) => {
+            form.append("frame", frame, fileNames[index] || `video_frame_${String(index).padStart(5, "0")}.jpg`);
+        });
+        const response = await api.fetchApi("/vnccs/sam3d/process_video_to_pose_json", {
+            method: "POST",
+            body: form,
+            signal,
+        });
+        if (!response.ok) {
+            const result = await response.json().catch(() => null);
+            throw new Error(result?.error || `HTTP ${response.status}`);
+        }
+        const poses = new Array(frames.length).fill(null);
+        let nextTrack = track;
+        let finished = false;
+        for await (const line of readNdjsonStream(response.body)) {
+            if (line.status === "error") throw new Error(line.error || "SAM 3D Body video import failed.");
+            if (line.status === "complete") {
+                finished = true;
+                continue;
+            }
+            if (!line.pose_data || line.index < 0 || line.index >= poses.length) continue;
+            poses[line.index] = line.pose_data;
+            nextTrack = line.track || null;
+            onFrame?.(line);
+        }
+        if (!finished || poses.some(pose => !pose)) {
+            throw new Error("SAM 3D Body video import ended before every frame was reconstructed.");
+        }
+        return { poses, track: nextTrack };
+    }
+
     async importSAM3DImageAsPose(file) {
         if (!this.viewer || !this.viewer.isInitialized()) {
             throw new Error("Pose viewer is not ready.");
@@ -9565,64 +9610,92 @@ class PoseStudioWidget {
         const captureSchedule = computeVideoCaptureSchedule(plan, captureStep);
         if (captureSchedule.sampleCount < 2) throw new Error("Video capture requires at least two pose samples.");
 
-        try {
-            video.pause();
-            for (let index = 0; index < captureSchedule.times.length; index++) {
+        const count = captureSchedule.sampleCount;
+        const taskId = `video-${Date.now()}-${Math.random().toString(16).slice(2)}`;
+        const chunks = chunkVideoCaptureSchedule(captureSchedule, VIDEO_POSE_BATCH_FRAMES);
+        const captureChunk = async chunk => {
+            const blobs = [];
+            for (let offset = 0; offset < chunk.times.length; offset++) {
                 if (signal?.aborted) throw new DOMException("Video import cancelled.", "AbortError");
-                const time = captureSchedule.times[index];
-                const sourceFrame = captureSchedule.frameIndices[index];
+                const index = chunk.start + offset;
                 onProgress?.({
                     index,
-                    count: captureSchedule.sampleCount,
-                    time,
-                    progress: (index / captureSchedule.sampleCount) * 95,
+                    count,
+                    time: chunk.times[offset],
+                    progress: (index / count) * 95,
                     phase: "capture",
                 });
-                const frameBlob = await this.captureVideoFrameBlob(video, time, captureCanvas, signal);
-                const taskId = `video-${Date.now()}-${index}-${Math.random().toString(16).slice(2)}`;
-                onProgress?.({
-                    index,
-                    count: captureSchedule.sampleCount,
-                    time,
-                    progress: ((index + 0.15) / captureSchedule.sampleCount) * 95,
-                    phase: "pose",
-                });
-                const poseData = await this.requestSAM3DPoseForImage(frameBlob, {
+                blobs.push(await this.captureVideoFrameBlob(video, chunk.times[offset], captureCanvas, signal));
+            }
+            return blobs;
+        };
+
+        try {
+            video.pause();
+            // Each chunk is reconstructed server-side in one batched request
+            // (shared model, tracked boxes instead of per-frame masking). The
+            // next chunk is captured while the current one is in flight; the
+            // returned track carries box tracking across requests.
+            let track = null;
+            let blobs = chunks.length ? await captureChunk(chunks[0]) : [];
+            for (let chunkIndex = 0; chunkIndex < chunks.length; chunkIndex++) {
+                const chunk = chunks[chunkIndex];
+                const request = this.requestSAM3DPosesForFrames(blobs, {
                     taskId,
                     signal,
-                    fileName: `video_frame_${String(sourceFrame).padStart(5, "0")}.jpg`,
-                });
-                const fitData = await this.prepareSAM3DRenderFit(poseData, {
-                    signal,
-                    reportError: false,
-                });
-                const poseForImport = fitData?.poseData || poseData;
-                const applied = this.viewer.applySAM3DImport(
-                    poseForImport,
-                    this._shoulderYOffset || 0
-                );
-                if (!applied) throw new Error(`Failed to apply captured pose at ${this.formatVideoTime(time)}.`);
-                if (fitData?.meshData) this.applySAM3DMeshOverlayFit(fitData.meshData, poseForImport);
-
-                const capturedPose = this.stripSceneCameraFromPose(this.viewer.getPose());
-                capturedPose.prompt = prompt;
-                poses.push(capturedPose);
-                lastPoseData = poseForImport;
-                lastMeshData = fitData?.meshData || null;
-                onProgress?.({
-                    index: index + 1,
-                    count: captureSchedule.sampleCount,
-                    time,
-                    progress: ((index + 1) / captureSchedule.sampleCount) * 95,
-                    phase: "complete",
+                    track,
+                    fileNames: chunk.frameIndices.map(frame => `video_frame_${String(frame).padStart(5, "0")}.jpg`),
+                    onFrame: line => onProgress?.({
+                        index: chunk.start + line.index,
+                        count,
+                        time: chunk.times[line.index],
+                        progress: ((chunk.start + line.index + 0.5) / count) * 95,
+                        phase: "pose",
+                    }),
                 });
+                // Surface failures at the await below, not as unhandled rejections.
+                request.catch(() => {});
+                blobs = chunkIndex + 1 < chunks.length ? await captureChunk(chunks[chunkIndex + 1]) : [];
+                const result = await request;
+                track = result.track;
+
+                for (let offset = 0; offset < result.poses.length; offset++) {
+                    if (signal?.aborted) throw new DOMException("Video import cancelled.", "AbortError");
+                    const index = chunk.start + offset;
+                    const time = chunk.times[offset];
+                    const poseData = result.poses[offset];
+                    const fitData = await this.prepareSAM3DRenderFit(poseData, {
+                        signal,
+                        reportError: false,
+                    });
+                    const poseForImport = fitData?.poseData || poseData;
+                    const applied = this.viewer.applySAM3DImport(
+                        poseForImport,
+                        this._shoulderYOffset || 0
+                    );
+                    if (!applied) throw new Error(`Failed to apply captured pose at ${this.formatVideoTime(time)}.`);
+                    if (fitData?.meshData) this.applySAM3DMeshOverlayFit(fitData.meshData, poseForImport);
+
+                    const capturedPose = this.stripSceneCameraFromPose(this.viewer.getPose());
+                    capturedPose.prompt = prompt;
+                    poses.push(capturedPose);
+                    lastPoseData = poseForImport;
+                    lastMeshData = fitData?.meshData || null;
+                    onProgress?.({
+                        index: index + 1,
+                        count,
+                        time,
+                        progress: ((index + 1) / count) * 95,
+                        phase: "complete",
+                    });
 
-                // Let layout, controls and cancellation paint between expensive frames.
-                await new Promise(resolve => (
-                    typeof requestAnimationFrame === "function"
-                        ? requestAnimationFrame(() => resolve())
-                        : setTimeout(resolve, 0)
-                ));
+                    // Let layout, controls and cancellation paint between expensive frames.
+                    await new Promise(resolve => (
+                        typeof requestAnimationFrame === "function"
+                            ? requestAnimationFrame(() => resolve())
+                            : setTimeout(resolve, 0)
+                    ));
+                }
             }
 
             if (poses.length < 2) throw new Error("Video capture produced fewer than two pose frames.");
@@ -11,6 +11,11 @@ export const VIDEO_FILE_EXTENSIONS = new Set([
 
 export const MAX_VIDEO_POSE_SAMPLES = 600;
 
+// Frames uploaded per batched SAM 3D Body request. The server splits each
+// request into its own GPU mini-batches; this only bounds how long the first
+// poses take to arrive and how much capture overlaps reconstruction.
+export const VIDEO_POSE_BATCH_FRAMES = 16;
+
 export const VIDEO_STABILIZATION_PRESETS = Object.freeze({
     off: Object.freeze({ radius: 0, strength: 0, thresholdDegrees: Infinity, jerkLimitDegrees: Infinity }),
     light: Object.freeze({ radius: 1, strength: 0.18, thresholdDegrees: 2, jerkLimitDegrees: 12 }),
@@ -116,6 +121,50 @@ export function computeVideoCaptureSchedule(plan, keyframeStepValue = 1) {
     };
 }
 
+/**
+ * Split a capture schedule into upload batches that keep the schedule's
+ * order. Each batch records its offset so streamed per-frame results can be
+ * mapped back to schedule indices.
+ */
+export function chunkVideoCaptureSchedule(schedule, batchSizeValue = VIDEO_POSE_BATCH_FRAMES) {
+    const times = Array.isArray(schedule?.times) ? schedule.times : [];
+    const frameIndices = Array.isArray(schedule?.frameIndices) ? schedule.frameIndices : [];
+    const batchSize = Math.max(1, Math.floor(finiteNumber(batchSizeValue, VIDEO_POSE_BATCH_FRAMES)));
+    const chunks = [];
+    for (let start = 0; start < times.length; start += batchSize) {
+        chunks.push({
+            start,
+            times: times.slice(start, start + batchSize),
+            frameIndices: frameIndices.slice(start, start + batchSize),
+        });
+    }
+    return chunks;
+}
+
+/** Yield parsed objects from a newline-delimited JSON byte stream. */
+export async function* readNdjsonStream(body) {
+    const reader = body.getReader();
+    const decoder = new TextDecoder();
+    let buffered = "";
+    try {
+        while (true) {
+            const { value, done } = await reader.read();
+            buffered += done ? decoder.decode() : decoder.decode(value, { stream: true });
+            let newline = buffered.indexOf("\n");
+            while (newline >= 0) {
+                const line = buffered.slice(0, newline).trim();
+                buffered = buffered.slice(newline + 1);
+                if (line) yield JSON.parse(line);
+                newline = buffered.indexOf("\n");
+            }
+            if (done) break;
+        }
+        if (buffered.trim()) yield JSON.parse(buffered);
+    } finally {
+        reader.releaseLock();
+    }
+}
+
 const COMMON_VIDEO_FRAME_RATES = Object.freeze([
     1, 2, 5, 8, 10, 12, 15, 18, 20,
     23.976, 24, 25, 29.97, 30,